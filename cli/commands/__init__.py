@@ -2,19 +2,28 @@
 CLI Commands Package
 
 All command implementations for the AgentSwarm CLI.
+
+Command modules are imported on first attribute access, so running one
+command only loads that command's dependencies.
 """
 
-from . import completion as completion_tool
-from . import config as config_tool
-from . import history as history_tool
-from . import info as info_tool
-from . import interactive as interactive_tool
-from . import list as list_tools
-from . import performance
-from . import run as run_tool
-from . import test as test_tool
-from . import validate as validate_tool
-from . import workflow as workflow_tool
+import importlib
+
+# Public attribute name -> command module
+_COMMAND_MODULES = {
+    "completion_tool": "completion",
+    "config_tool": "config",
+    "daemon_tool": "daemon",
+    "history_tool": "history",
+    "info_tool": "info",
+    "interactive_tool": "interactive",
+    "list_tools": "list",
+    "performance": "performance",
+    "run_tool": "run",
+    "test_tool": "test",
+    "validate_tool": "validate",
+    "workflow_tool": "workflow",
+}
 
 __all__ = [
     "list_tools",
@@ -28,4 +37,16 @@ __all__ = [
     "history_tool",
     "completion_tool",
     "performance",
+    "daemon_tool",
 ]
+
+
+def __getattr__(name: str):
+    """Import a command module on first access."""
+    module_name = _COMMAND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    globals()[name] = module
+    return module
@@ -0,0 +1,61 @@
+"""
+Daemon command implementation
+
+Starts, stops and inspects the background tool-runner daemon.
+"""
+
+import json
+import sys
+
+from ..daemon import DAEMON_AVAILABLE, DaemonClient, start_daemon
+
+
+def execute(args) -> int:
+    """
+    Execute the daemon command.
+
+    Args:
+        args: Command arguments with:
+            - action: Daemon action (start, stop, status)
+            - idle_timeout: Seconds without requests before the daemon exits
+
+    Returns:
+        Exit code
+    """
+    if not DAEMON_AVAILABLE:
+        print("Error: the daemon requires Unix domain sockets", file=sys.stderr)
+        return 1
+
+    client = DaemonClient()
+
+    if args.action == "start":
+        if client.is_running():
+            print(f"Daemon already running ({client.socket_path})")
+            return 0
+        try:
+            start_daemon(idle_timeout=args.idle_timeout)
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        print(f"Daemon started ({client.socket_path})")
+        return 0
+
+    if args.action == "stop":
+        if not client.is_running():
+            print("Daemon is not running")
+            return 0
+        client.stop()
+        print("Daemon stopped")
+        return 0
+
+    if args.action == "status":
+        if not client.is_running():
+            print("Daemon is not running")
+            return 1
+        status = client.status()
+        status.pop("success", None)
+        print(json.dumps(status, indent=2))
+        return 0
+
+    print(f"Error: unknown daemon action '{args.action}'", file=sys.stderr)
+    return 1
@@ -4,61 +4,36 @@ Info command implementation
 Shows detailed information about a specific tool.
 """
 
-import importlib
 import inspect
 import json
 import sys
-from pathlib import Path
 from typing import Any, Dict
 
 import yaml
 
+from shared.tool_index import default_tools_path, get_tool_index, load_tool_class
+
 from ..utils.formatters import format_json, format_yaml
 
 
 def get_tool_info(tool_name: str) -> Dict[str, Any]:
     """Get detailed information about a tool."""
-    tools_dir = Path(__file__).parent.parent.parent / "tools"
-
-    # Find the tool file
-    tool_file = None
-    category = None
-
-    for category_dir in tools_dir.iterdir():
-        if not category_dir.is_dir() or category_dir.name.startswith("_"):
-            continue
-
-        potential_file = category_dir / f"{tool_name}.py"
-        if potential_file.exists():
-            tool_file = potential_file
-            category = category_dir.name
-            break
-
-    if not tool_file:
+    entry = get_tool_index().get(tool_name)
+    if entry is None:
         raise FileNotFoundError(f"Tool '{tool_name}' not found")
 
-    # Import the tool module
+    # Import only the tool's own module
     try:
-        module_path = f"tools.{category}.{tool_name}"
-        module = importlib.import_module(module_path)
-
-        # Find the tool class (should be a subclass of BaseTool)
-        tool_class = None
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if hasattr(obj, "tool_name") and not name.startswith("_"):
-                tool_class = obj
-                break
-
-        if not tool_class:
-            raise ValueError(f"No valid tool class found in {tool_name}")
+        tool_class = load_tool_class(entry)
 
         # Extract information
         info = {
             "name": tool_name,
-            "category": category,
+            "category": entry.category,
             "class_name": tool_class.__name__,
             "description": inspect.getdoc(tool_class) or "No description available",
-            "path": str(tool_file),
+            "path": str(default_tools_path() / entry.path),
+            "dependencies": entry.dependencies,
             "fields": {},
         }
 
@@ -6,46 +6,33 @@ Lists all available tools with optional filtering and formatting.
 
 import json
 import sys
-from pathlib import Path
 from typing import Any, Dict, List
 
 import yaml
 
+from shared.tool_index import default_tools_path, get_tool_index
+
 from ..utils.formatters import format_json, format_table, format_yaml
 
 
 def get_all_tools() -> Dict[str, List[Dict[str, Any]]]:
-    """Discover all tools organized by category."""
-    tools_dir = Path(__file__).parent.parent.parent / "tools"
-    categories = {}
+    """List all tools organized by category (from the tool index, no imports)."""
+    tools_dir = default_tools_path()
+    categories: Dict[str, List[Dict[str, Any]]] = {}
 
     if not tools_dir.exists():
         return {}
 
-    for category_dir in sorted(tools_dir.iterdir()):
-        if not category_dir.is_dir() or category_dir.name.startswith("_"):
-            continue
-
-        category_name = category_dir.name
-        tools = []
-
-        for tool_file in sorted(category_dir.glob("*.py")):
-            if tool_file.name.startswith("_"):
-                continue
-
-            tool_name = tool_file.stem
-            tools.append(
-                {
-                    "name": tool_name,
-                    "category": category_name,
-                    "path": str(tool_file),
-                }
-            )
-
-        if tools:
-            categories[category_name] = tools
+    for name, entry in sorted(get_tool_index().items()):
+        categories.setdefault(entry.category, []).append(
+            {
+                "name": name,
+                "category": entry.category,
+                "path": str(tools_dir / entry.path),
+            }
+        )
 
-    return categories
+    return dict(sorted(categories.items()))
 
 
 def execute(args) -> int:
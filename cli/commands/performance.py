@@ -10,12 +10,12 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from ...shared.dashboard import (
+from shared.dashboard import (
     export_dashboard_html,
     export_dashboard_json,
     generate_dashboard_data,
 )
-from ...shared.monitoring import get_monitor
+from shared.monitoring import get_monitor
 
 
 def execute(args) -> int:
@@ -4,17 +4,15 @@ Run command implementation
 Executes a tool with provided parameters.
 """
 
-import importlib
-import inspect
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import yaml
+from shared.tool_index import get_tool_index, load_tool_class
 
-from ..utils.interactive import prompt_for_params
-from ..utils.validators import validate_params
+from ..daemon import DaemonClient, DaemonResponseError, start_daemon
 
 
 def load_params_from_file(file_path: str) -> Dict[str, Any]:
@@ -25,62 +23,123 @@ def load_params_from_file(file_path: str) -> Dict[str, Any]:
 
     with open(path, "r") as f:
         if path.suffix in [".yaml", ".yml"]:
+            import yaml
+
             return yaml.safe_load(f)
         else:
             return json.load(f)
 
 
 def get_tool_class(tool_name: str):
-    """Import and return the tool class."""
-    tools_dir = Path(__file__).parent.parent.parent / "tools"
+    """Look the tool up in the tool index and import only its module."""
+    entry = get_tool_index().get(tool_name)
+    if entry is None:
+        raise FileNotFoundError(f"Tool '{tool_name}' not found")
 
-    # Find the tool file
-    tool_file = None
-    category = None
+    return load_tool_class(entry)
 
-    for category_dir in tools_dir.iterdir():
-        if not category_dir.is_dir() or category_dir.name.startswith("_"):
-            continue
 
-        potential_file = category_dir / f"{tool_name}.py"
-        if potential_file.exists():
-            tool_file = potential_file
-            category = category_dir.name
-            break
+def load_params(params_arg: Optional[str]) -> Dict[str, Any]:
+    """Parse --params as inline JSON or @file."""
+    if not params_arg:
+        return {}
+    if params_arg.startswith("@"):
+        return load_params_from_file(params_arg[1:])
+    return json.loads(params_arg)
+
+
+def write_output(result: Any, args) -> None:
+    """Format a tool result and print it or save it to --output."""
+    if args.format == "json":
+        output = json.dumps(result, indent=2)
+    elif args.format == "yaml":
+        import yaml
+
+        output = yaml.dump(result, default_flow_style=False)
+    else:
+        output = str(result)
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.write_text(output)
+        print(f"Output saved to: {args.output}")
+    else:
+        print(output)
+
+
+def get_daemon_client(args) -> Optional[DaemonClient]:
+    """
+    Return a client when the run should go to the daemon.
+
+    Runs are forwarded when a daemon is already running, or when --daemon
+    asks to start one. --no-daemon and AGENTSWARM_NO_DAEMON=1 opt out;
+    interactive runs always stay local because they prompt from the tool schema.
+    """
+    if args.interactive or getattr(args, "no_daemon", False):
+        return None
+    if os.getenv("AGENTSWARM_NO_DAEMON", "").lower() in ("1", "true", "yes"):
+        return None
+
+    if getattr(args, "daemon", False):
+        try:
+            return start_daemon()
+        except RuntimeError as e:
+            print(f"Warning: {e}; running locally", file=sys.stderr)
+            return None
+
+    client = DaemonClient()
+    return client if client.is_running() else None
 
-    if not tool_file:
-        raise FileNotFoundError(f"Tool '{tool_name}' not found")
 
-    # Import the tool module
-    module_path = f"tools.{category}.{tool_name}"
-    module = importlib.import_module(module_path)
+def run_in_daemon(client: DaemonClient, args, params: Dict[str, Any]) -> Optional[int]:
+    """
+    Run the tool in the daemon.
 
-    # Find the tool class
-    for name, obj in inspect.getmembers(module, inspect.isclass):
-        if hasattr(obj, "tool_name") and not name.startswith("_"):
-            return obj
+    Returns:
+        Exit code, or None if the run must fall back to the local process
+    """
+    try:
+        response = client.run_tool(args.tool, params)
+    except ConnectionError as e:
+        # The request never reached the daemon, so running here runs the tool once
+        print(f"Warning: daemon unavailable ({e}); running locally", file=sys.stderr)
+        return None
+    except DaemonResponseError as e:
+        # The daemon may already have run the tool; running it again could repeat side effects
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
 
-    raise ValueError(f"No valid tool class found in {tool_name}")
+    if response.get("fallback"):
+        return None
+    if not response.get("success"):
+        print(f"Error: {response.get('error')}", file=sys.stderr)
+        return 1
+
+    print(f"\nRunning {args.tool} (daemon)...\n")
+    write_output(response["result"], args)
+    return 0
 
 
 def execute(args) -> int:
     """Execute the run command."""
     try:
+        client = get_daemon_client(args)
+        if client is not None:
+            exit_code = run_in_daemon(client, args, load_params(args.params))
+            if exit_code is not None:
+                return exit_code
+
+        from ..utils.interactive import prompt_for_params
+        from ..utils.validators import validate_params
+
         tool_class = get_tool_class(args.tool)
 
         # Get parameters
-        params = {}
-
         if args.interactive:
             # Interactive mode - prompt for parameters
             params = prompt_for_params(tool_class)
-        elif args.params:
-            # Load from file or parse JSON
-            if args.params.startswith("@"):
-                file_path = args.params[1:]
-                params = load_params_from_file(file_path)
-            else:
-                params = json.loads(args.params)
+        else:
+            params = load_params(args.params)
 
         # Validate parameters
         try:
@@ -94,22 +153,7 @@ def execute(args) -> int:
         tool_instance = tool_class(**params)
         result = tool_instance.run()
 
-        # Format output
-        if args.format == "json":
-            output = json.dumps(result, indent=2)
-        elif args.format == "yaml":
-            output = yaml.dump(result, default_flow_style=False)
-        else:
-            output = str(result)
-
-        # Print or save output
-        if args.output:
-            output_path = Path(args.output)
-            output_path.write_text(output)
-            print(f"Output saved to: {args.output}")
-        else:
-            print(output)
-
+        write_output(result, args)
         return 0
 
     except FileNotFoundError as e:
@@ -86,13 +86,13 @@ def validate_tool(args):
 
 def validate_all(args):
     """Validate all tools in the tools directory"""
-    validator = ToolValidator()
+    validator = ToolValidator(use_cache=not getattr(args, "no_cache", False))
     tools_dir = Path(getattr(args, "tools_dir", "tools"))
     min_score = getattr(args, "min_score", 70)
 
     console.print(f"[bold]Validating all tools in {tools_dir}...[/bold]\n")
 
-    results = validator.validate_all_tools(tools_dir)
+    results = validator.validate_all_tools(tools_dir, workers=getattr(args, "jobs", None))
 
     # Display summary
     validator.display_summary(results)
@@ -4,44 +4,26 @@ Test command implementation
 Tests tools with mock data to verify functionality.
 """
 
-import importlib
-import inspect
 import os
 import sys
-from pathlib import Path
 from typing import Any, Dict, List
 
+from shared.tool_index import ToolIndexEntry, get_tool_index, load_tool_class
 
-def get_all_tool_classes(verbose: bool = False) -> List[tuple]:
-    """Get all tool classes."""
-    tools_dir = Path(__file__).parent.parent.parent / "tools"
-    tool_classes = []
+from ..runner import (
+    DEFAULT_TIMEOUT,
+    ERROR,
+    FAILED,
+    PASSED,
+    SKIPPED,
+    RunCache,
+    ToolRunResult,
+    run_parallel,
+    skipped_result,
+    write_junit,
+)
 
-    for category_dir in tools_dir.iterdir():
-        if not category_dir.is_dir() or category_dir.name.startswith("_"):
-            continue
-
-        for tool_file in category_dir.glob("*.py"):
-            if tool_file.name.startswith("_"):
-                continue
-
-            tool_name = tool_file.stem
-            category = category_dir.name
-
-            try:
-                module_path = f"tools.{category}.{tool_name}"
-                module = importlib.import_module(module_path)
-
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if hasattr(obj, "tool_name") and not name.startswith("_"):
-                        tool_classes.append((tool_name, category, obj))
-                        break
-
-            except Exception as e:
-                if verbose:
-                    print(f"Warning: Could not import {tool_name}: {e}")
-
-    return tool_classes
+STATUS_MARKS = {PASSED: "✓ PASS", FAILED: "✗ FAIL", ERROR: "✗ ERROR", SKIPPED: "- SKIP"}
 
 
 def test_single_tool(tool_name: str, tool_class: type, verbose: bool = False) -> Dict[str, Any]:
@@ -85,61 +67,75 @@ def test_single_tool(tool_name: str, tool_class: type, verbose: bool = False) ->
     return result
 
 
+def run_tool_test(entry: ToolIndexEntry) -> Dict[str, Any]:
+    """Test one indexed tool (runs in a worker process)."""
+    result = test_single_tool(entry.name, load_tool_class(entry))
+    # Tool output may not be picklable; the summary only needs the outcome
+    result["output"] = None
+    return result
+
+
+def print_result(result: ToolRunResult, verbose: bool = False) -> None:
+    """Print one streamed result."""
+    line = f"  {STATUS_MARKS[result.status]}  {result.tool} ({result.duration:.2f}s)"
+    if result.message and (verbose or result.status in (FAILED, ERROR)):
+        line += f": {result.message.splitlines()[0]}"
+    print(line, flush=True)
+
+
 def execute(args) -> int:
     """Execute the test command."""
     try:
-        # Enable mock mode
+        # Enable mock mode (inherited by the worker processes)
         if args.mock:
             os.environ["USE_MOCK_APIS"] = "true"
 
-        results = []
-        passed = 0
-        failed = 0
+        index = get_tool_index()
+        results: List[ToolRunResult] = []
 
         if args.tool:
             # Test single tool
-            tools_dir = Path(__file__).parent.parent.parent / "tools"
-            tool_class = None
-            category = None
-
-            for category_dir in tools_dir.iterdir():
-                if not category_dir.is_dir() or category_dir.name.startswith("_"):
-                    continue
-
-                potential_file = category_dir / f"{args.tool}.py"
-                if potential_file.exists():
-                    category = category_dir.name
-                    module_path = f"tools.{category}.{args.tool}"
-                    module = importlib.import_module(module_path)
-
-                    for name, obj in inspect.getmembers(module, inspect.isclass):
-                        if hasattr(obj, "tool_name") and not name.startswith("_"):
-                            tool_class = obj
-                            break
-                    break
-
-            if not tool_class:
+            entry = index.get(args.tool)
+            if entry is None:
                 print(f"Tool '{args.tool}' not found", file=sys.stderr)
                 return 1
-
-            result = test_single_tool(args.tool, tool_class, args.verbose)
-            results.append(result)
-
+            entries = [entry]
         else:
             # Test all tools
             print("Testing all tools...\n")
-            tool_classes = get_all_tool_classes(args.verbose)
+            entries = [index[name] for name in sorted(index)]
+
+        # A full sweep skips tools that are unchanged since their last green run
+        cache = RunCache(f"test:mock={bool(args.mock)}")
+        use_cache = not args.tool and not getattr(args, "force", False)
+        to_run = []
+        for entry in entries:
+            if use_cache and cache.is_green(entry):
+                results.append(skipped_result(entry))
+            else:
+                to_run.append(entry)
+
+        if results:
+            print(f"Skipping {len(results)} unchanged tools (use --force to rerun)\n")
+
+        for result in run_parallel(
+            run_tool_test,
+            to_run,
+            workers=getattr(args, "jobs", None),
+            timeout=getattr(args, "timeout", DEFAULT_TIMEOUT),
+        ):
+            print_result(result, args.verbose)
+            cache.record(index[result.tool], result)
+            results.append(result)
 
-            for tool_name, category, tool_class in tool_classes:
-                result = test_single_tool(tool_name, tool_class, args.verbose)
-                results.append(result)
+        cache.save()
 
-        # Count results
-        for result in results:
-            if result["success"]:
-                passed += 1
-            else:
-                failed += 1
+        if getattr(args, "junit", None):
+            write_junit(results, args.junit, "agentswarm test")
+
+        passed = sum(1 for r in results if r.status == PASSED)
+        skipped = sum(1 for r in results if r.status == SKIPPED)
+        failed = len(results) - passed - skipped
 
         # Print summary
         print(f"\n{'=' * 60}")
@@ -148,12 +144,15 @@ def execute(args) -> int:
         print(f"Total:   {len(results)}")
         print(f"Passed:  {passed} ✓")
         print(f"Failed:  {failed} ✗")
+        if skipped:
+            print(f"Skipped: {skipped} (unchanged)")
 
         if failed > 0:
             print(f"\nFailed tests:")
             for result in results:
-                if not result["success"]:
-                    print(f"  - {result['tool']}: {result['error']}")
+                if not result.ok:
+                    message = (result.message or "").splitlines()
+                    print(f"  - {result.tool}: {message[0] if message else result.status}")
 
         return 0 if failed == 0 else 1
 
@@ -9,11 +9,40 @@ import importlib
 import inspect
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
-
-
-def validate_tool_file(tool_path: Path, strict: bool = False) -> Dict[str, Any]:
-    """Validate a single tool file."""
+from typing import Any, Dict, List, Optional
+
+from shared.tool_index import ToolIndexEntry, default_tools_path, get_index_errors, get_tool_index
+
+from ..runner import (
+    DEFAULT_TIMEOUT,
+    FAILED,
+    PASSED,
+    SKIPPED,
+    RunCache,
+    ToolRunResult,
+    run_parallel,
+    skipped_result,
+    write_junit,
+)
+
+
+def _has_attribute(tool_class: type, name: str) -> bool:
+    """Check a class attribute, including pydantic fields (hidden from hasattr in v2)."""
+    return hasattr(tool_class, name) or name in getattr(tool_class, "model_fields", {})
+
+
+def validate_tool_file(
+    tool_path: Path,
+    strict: bool = False,
+    module_path: Optional[str] = None,
+    class_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Validate a single tool file.
+
+    module_path defaults to tools.<parent>.<stem>; class_name (from the tool
+    index) selects the tool class instead of searching the module for one.
+    """
     result = {
         "tool": tool_path.stem,
         "path": str(tool_path),
@@ -75,28 +104,28 @@ def validate_tool_file(tool_path: Path, strict: bool = False) -> Dict[str, Any]:
 
         # Try to import and validate class
         try:
-            category = tool_path.parent.name
-            tool_name = tool_path.stem
-            module_path = f"tools.{category}.{tool_name}"
+            if module_path is None:
+                module_path = f"tools.{tool_path.parent.name}.{tool_path.stem}"
             module = importlib.import_module(module_path)
 
             # Find tool class
-            tool_class = None
+            tool_class = getattr(module, class_name, None) if class_name else None
             for name, obj in inspect.getmembers(module, inspect.isclass):
-                if hasattr(obj, "tool_name") and not name.startswith("_"):
-                    tool_class = obj
+                if tool_class is not None:
                     break
+                if _has_attribute(obj, "tool_name") and not name.startswith("_"):
+                    tool_class = obj
 
             if not tool_class:
                 result["errors"].append("No valid tool class found")
                 result["valid"] = False
             else:
                 # Check for required attributes
-                if not hasattr(tool_class, "tool_name"):
+                if not _has_attribute(tool_class, "tool_name"):
                     result["errors"].append("Missing 'tool_name' attribute")
                     result["valid"] = False
 
-                if not hasattr(tool_class, "tool_category"):
+                if not _has_attribute(tool_class, "tool_category"):
                     result["warnings"].append("Missing 'tool_category' attribute")
 
                 # Check for _execute method
@@ -118,66 +147,116 @@ def validate_tool_file(tool_path: Path, strict: bool = False) -> Dict[str, Any]:
     return result
 
 
+def validate_entry(entry: ToolIndexEntry, strict: bool = False) -> Dict[str, Any]:
+    """Validate one indexed tool (runs in a worker process)."""
+    result = validate_tool_file(
+        default_tools_path() / entry.path, strict, entry.module, entry.class_name
+    )
+    result["success"] = result["valid"]
+    result["error"] = "; ".join(result["errors"]) or None
+    return result
+
+
+def parse_failures(tool: Optional[str] = None) -> List[ToolRunResult]:
+    """Failed results for tool files the index could not parse (optionally one tool's)."""
+    results = []
+    for rel_path, error in sorted(get_index_errors().items()):
+        parts = Path(rel_path).with_suffix("").parts
+        if tool is not None and parts[-1] != tool:
+            continue
+        results.append(
+            ToolRunResult(
+                tool=parts[-1],
+                category=parts[0] if len(parts) > 1 else "unknown",
+                module=".".join(("tools",) + parts),
+                status=FAILED,
+                message=error,
+                details={"path": str(default_tools_path() / rel_path), "errors": [error]},
+            )
+        )
+    return results
+
+
+def print_result(result: ToolRunResult) -> None:
+    """Print one streamed result with its errors and warnings."""
+    if result.status == SKIPPED:
+        print(f"- {result.tool} (unchanged)\n", flush=True)
+        return
+
+    print(f"{'✓' if result.status == PASSED else '✗'} {result.tool}")
+
+    errors = result.details.get("errors")
+    if errors is None and result.message:
+        # Timed out or crashed before producing a report
+        errors = [result.message.splitlines()[0]]
+    for error in errors or []:
+        print(f"  ERROR: {error}")
+
+    for warning in result.details.get("warnings", []):
+        print(f"  WARNING: {warning}")
+
+    print(flush=True)
+
+
 def execute(args) -> int:
     """Execute the validate command."""
     try:
-        tools_dir = Path(__file__).parent.parent.parent / "tools"
-        results = []
-        valid_count = 0
-        invalid_count = 0
+        index = get_tool_index()
+        results: List[ToolRunResult] = []
 
         if args.tool:
             # Validate single tool
-            tool_file = None
-            for category_dir in tools_dir.iterdir():
-                if not category_dir.is_dir() or category_dir.name.startswith("_"):
-                    continue
-
-                potential_file = category_dir / f"{args.tool}.py"
-                if potential_file.exists():
-                    tool_file = potential_file
-                    break
-
-            if not tool_file:
-                print(f"Tool '{args.tool}' not found", file=sys.stderr)
+            entry = index.get(args.tool)
+            if entry is None:
+                failures = parse_failures(args.tool)
+                if not failures:
+                    print(f"Tool '{args.tool}' not found", file=sys.stderr)
+                    return 1
+                # The tool's file does not parse, so the index has no entry for it
+                for result in failures:
+                    print_result(result)
                 return 1
 
-            result = validate_tool_file(tool_file, args.strict)
-            results.append(result)
+            entries = [entry]
 
         else:
-            # Validate all tools
+            # Validate all tools; files the index cannot parse fail outright
             print("Validating all tools...\n")
-
-            for category_dir in sorted(tools_dir.iterdir()):
-                if not category_dir.is_dir() or category_dir.name.startswith("_"):
-                    continue
-
-                for tool_file in sorted(category_dir.glob("*.py")):
-                    if tool_file.name.startswith("_"):
-                        continue
-
-                    result = validate_tool_file(tool_file, args.strict)
-                    results.append(result)
-
-        # Print results
-        for result in results:
-            if result["valid"]:
-                valid_count += 1
-                print(f"✓ {result['tool']}")
+            entries = [index[name] for name in sorted(index)]
+            for result in parse_failures():
+                print_result(result)
+                results.append(result)
+
+        # A full sweep skips tools that are unchanged since their last green run
+        cache = RunCache(f"validate:strict={bool(args.strict)}")
+        use_cache = not args.tool and not getattr(args, "force", False)
+        to_run = []
+        for entry in entries:
+            if use_cache and cache.is_green(entry):
+                results.append(skipped_result(entry))
+                print_result(results[-1])
             else:
-                invalid_count += 1
-                print(f"✗ {result['tool']}")
+                to_run.append(entry)
+
+        for result in run_parallel(
+            validate_entry,
+            to_run,
+            workers=getattr(args, "jobs", None),
+            timeout=getattr(args, "timeout", DEFAULT_TIMEOUT),
+            options={"strict": args.strict},
+        ):
+            print_result(result)
+            cache.record(index[result.tool], result)
+            results.append(result)
 
-            if result["errors"]:
-                for error in result["errors"]:
-                    print(f"  ERROR: {error}")
+        cache.save()
 
-            if result["warnings"]:
-                for warning in result["warnings"]:
-                    print(f"  WARNING: {warning}")
+        if getattr(args, "junit", None):
+            write_junit(results, args.junit, "agentswarm validate")
 
-            print()
+        valid_count = sum(1 for r in results if r.ok)
+        invalid_count = len(results) - valid_count
+        skipped = sum(1 for r in results if r.status == SKIPPED)
 
         # Print summary
         print(f"{'=' * 60}")
@@ -186,6 +265,8 @@ def execute(args) -> int:
         print(f"Total:   {len(results)}")
         print(f"Valid:   {valid_count} ✓")
         print(f"Invalid: {invalid_count} ✗")
+        if skipped:
+            print(f"Skipped: {skipped} (unchanged, use --force to rerun)")
 
         return 0 if invalid_count == 0 else 1
 
@@ -0,0 +1,561 @@
+"""
+Tool-runner Daemon for AgentSwarm CLI
+
+Keeps tool modules, caches, HTTP connection pools and the performance
+monitor warm in one background process, so repeated ``agentswarm run``
+calls skip the import and set-up cost. The CLI talks to it over a local
+Unix socket with one JSON request and one JSON response per connection.
+
+The daemon is opt-in: start it with ``agentswarm daemon start`` (or
+``agentswarm run --daemon``). While it is running, ``agentswarm run``
+forwards to it; it exits on its own after ``idle_timeout`` seconds without
+requests. Runs from another working directory or environment are sent back
+to the client, and a tool whose sources changed is re-imported.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT = 600.0
+DEFAULT_START_TIMEOUT = 15.0
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+DAEMON_AVAILABLE = hasattr(socket, "AF_UNIX")
+
+# Variables that differ between shells without changing what a tool does
+ENV_IGNORED = frozenset(
+    {
+        "_",
+        "PWD",
+        "OLDPWD",
+        "SHLVL",
+        "PYTHONPATH",  # start_daemon() prepends the project root
+        "TERM",
+        "TERM_SESSION_ID",
+        "COLUMNS",
+        "LINES",
+        "WINDOWID",
+        "TMUX_PANE",
+        "SSH_TTY",
+        "GPG_TTY",
+        "AGENTSWARM_DAEMON_SOCKET",
+        "AGENTSWARM_NO_DAEMON",
+    }
+)
+
+
+class DaemonResponseError(RuntimeError):
+    """The request reached the daemon, but no valid response came back."""
+
+
+def get_daemon_dir() -> Path:
+    """Get the directory holding the daemon socket and log."""
+    daemon_dir = Path.home() / ".agentswarm"
+    daemon_dir.mkdir(parents=True, exist_ok=True)
+    return daemon_dir
+
+
+def get_socket_path() -> Path:
+    """Get the daemon socket path (``AGENTSWARM_DAEMON_SOCKET`` overrides it)."""
+    override = os.getenv("AGENTSWARM_DAEMON_SOCKET")
+    if override:
+        return Path(override)
+    return get_daemon_dir() / "daemon.sock"
+
+
+def _read_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """Read one newline-terminated JSON message."""
+    chunks = []
+    size = 0
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        newline = chunk.find(b"\n")
+        if newline != -1:
+            chunks.append(chunk[:newline])
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > MAX_REQUEST_BYTES:
+            raise ValueError("Message too large")
+
+    data = b"".join(chunks)
+    if not data:
+        return None
+    return json.loads(data)
+
+
+def _write_message(sock: socket.socket, message: Dict[str, Any]) -> None:
+    """Write one newline-terminated JSON message."""
+    sock.sendall(json.dumps(message, default=str).encode("utf-8") + b"\n")
+
+
+def env_fingerprint(environ: Optional[Mapping[str, str]] = None) -> str:
+    """Hash of the environment tools run with (API keys, USE_MOCK_APIS, ...), minus ENV_IGNORED."""
+    environ = os.environ if environ is None else environ
+    digest = hashlib.sha256()
+    for key in sorted(environ):
+        if key not in ENV_IGNORED:
+            digest.update(f"{key}={environ[key]}\0".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def _source_stamp(tool_dir: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """(name, mtime_ns, size) of the non-test .py files in a tool directory."""
+    stamp = []
+    try:
+        with os.scandir(tool_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".py") and not entry.name.startswith("test_"):
+                    st = entry.stat()
+                    stamp.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    return tuple(sorted(stamp))
+
+
+def _unload_tool_package(module: str, tool_dir: Path) -> None:
+    """Forget a tool's package so the next import reads its sources again."""
+    package = module.rpartition(".")[0]
+    for name in [m for m in sys.modules if m == package or m.startswith(package + ".")]:
+        del sys.modules[name]
+    # Bytecode is only checked against whole-second mtimes and the size
+    for path in tool_dir.glob("*.py"):
+        Path(importlib.util.cache_from_source(str(path))).unlink(missing_ok=True)
+    importlib.invalidate_caches()
+
+
+class DaemonClient:
+    """Client side of the daemon protocol. Imports nothing heavy."""
+
+    def __init__(self, socket_path: Optional[Path] = None, timeout: Optional[float] = None):
+        """
+        Initialize the client.
+
+        Args:
+            socket_path: Daemon socket (defaults to get_socket_path())
+            timeout: Socket timeout in seconds (None waits for long-running tools)
+        """
+        self.socket_path = Path(socket_path) if socket_path else get_socket_path()
+        self.timeout = timeout
+
+    def request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send one request and wait for its response.
+
+        Raises:
+            ConnectionError: If the request did not reach the daemon
+            DaemonResponseError: If it did, but the response was lost or unreadable
+                (the daemon may have acted on the request)
+        """
+        if not DAEMON_AVAILABLE:
+            raise ConnectionError("Unix sockets are not supported on this platform")
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            try:
+                sock.connect(str(self.socket_path))
+                # A partly sent request is not valid JSON, so the daemon drops it
+                _write_message(sock, message)
+            except (FileNotFoundError, ConnectionRefusedError) as e:
+                raise ConnectionError(f"Daemon not running at {self.socket_path}") from e
+            except OSError as e:
+                raise ConnectionError(f"Could not reach the daemon: {e}") from e
+
+            try:
+                response = _read_message(sock)
+            except (OSError, ValueError) as e:
+                raise DaemonResponseError(f"No valid response from the daemon: {e}") from e
+        finally:
+            sock.close()
+
+        if response is None:
+            raise DaemonResponseError("Daemon closed the connection without a response")
+        return response
+
+    def is_running(self) -> bool:
+        """Check whether a daemon answers on the socket."""
+        if not DAEMON_AVAILABLE or not self.socket_path.exists():
+            return False
+        try:
+            response = DaemonClient(self.socket_path, timeout=2.0).request({"action": "ping"})
+        except (ConnectionError, DaemonResponseError):
+            return False
+        return bool(response.get("success"))
+
+    def run_tool(self, tool: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a tool in the daemon (or get a fallback response if it must run here)."""
+        return self.request(
+            {
+                "action": "run",
+                "tool": tool,
+                "params": params,
+                "cwd": os.getcwd(),
+                "env": env_fingerprint(),
+            }
+        )
+
+    def status(self) -> Dict[str, Any]:
+        """Get daemon status."""
+        return self.request({"action": "status"})
+
+    def stop(self) -> Dict[str, Any]:
+        """Ask the daemon to shut down."""
+        return self.request({"action": "stop"})
+
+
+def start_daemon(
+    socket_path: Optional[Path] = None,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    wait: float = DEFAULT_START_TIMEOUT,
+) -> DaemonClient:
+    """
+    Start a detached daemon process unless one is already running.
+
+    The daemon inherits the current working directory and environment.
+
+    Args:
+        socket_path: Daemon socket (defaults to get_socket_path())
+        idle_timeout: Seconds without requests before the daemon exits
+        wait: Seconds to wait for the daemon to accept connections
+
+    Returns:
+        Client connected to the running daemon
+
+    Raises:
+        RuntimeError: If the daemon does not come up in time
+    """
+    if not DAEMON_AVAILABLE:
+        raise RuntimeError("The daemon requires Unix domain sockets")
+
+    client = DaemonClient(socket_path)
+    if client.is_running():
+        return client
+
+    project_root = str(Path(__file__).resolve().parent.parent)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [project_root, env.get("PYTHONPATH")]))
+
+    log_path = get_daemon_dir() / "daemon.log"
+    with open(log_path, "ab") as log_file:
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "cli.daemon",
+                "--socket",
+                str(client.socket_path),
+                "--idle-timeout",
+                str(idle_timeout),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            env=env,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if client.is_running():
+            return client
+        if process.poll() is not None:
+            break
+        time.sleep(0.05)
+
+    raise RuntimeError(f"Daemon failed to start (see {log_path})")
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    """Handle one connection: one request, one response."""
+
+    def handle(self):
+        daemon: ToolDaemon = self.server.tool_daemon
+        daemon._begin_request()
+        try:
+            try:
+                request = _read_message(self.request)
+            except (ValueError, json.JSONDecodeError) as e:
+                _write_message(self.request, {"success": False, "error": f"Bad request: {e}"})
+                return
+            if request is None:
+                return
+            _write_message(self.request, daemon.handle(request))
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Client disconnected before the response was sent")
+        finally:
+            daemon._end_request()
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server; one thread per client connection."""
+
+    daemon_threads = True
+
+
+class ToolDaemon:
+    """Background process that runs tools for CLI clients."""
+
+    def __init__(
+        self, socket_path: Optional[Path] = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    ):
+        """
+        Initialize the daemon.
+
+        Args:
+            socket_path: Socket to listen on (defaults to get_socket_path())
+            idle_timeout: Seconds without requests before exiting (0 disables)
+        """
+        self.socket_path = Path(socket_path) if socket_path else get_socket_path()
+        self.idle_timeout = idle_timeout
+        self.started_at = time.time()
+        self.requests_served = 0
+
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._loaded: Dict[str, Tuple[Tuple[str, int, int], ...]] = {}
+        self._active = 0
+        self._last_activity = time.monotonic()
+        self._server: Optional[_Server] = None
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch a request to its action."""
+        action = request.get("action")
+        if action == "ping":
+            return {"success": True, "pid": os.getpid()}
+        if action == "status":
+            return {"success": True, **self.status()}
+        if action == "run":
+            return self._run_tool(request)
+        if action == "stop":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"success": True}
+        return {"success": False, "error": f"Unknown action: {action}"}
+
+    def status(self) -> Dict[str, Any]:
+        """Describe the running daemon."""
+        from shared.tool_index import get_tool_index
+
+        loaded = sorted(
+            name for name, entry in get_tool_index().items() if entry.module in sys.modules
+        )
+        with self._lock:
+            active = self._active
+            idle = time.monotonic() - self._last_activity if not active else 0.0
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "cwd": os.getcwd(),
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "idle_seconds": round(idle, 1),
+            "idle_timeout": self.idle_timeout,
+            "requests_served": self.requests_served,
+            "active_requests": active,
+            "loaded_tools": loaded,
+        }
+
+    def _load_tool(self, tool_name: str) -> Any:
+        """
+        Import a tool's class, again if its sources changed since the last run.
+
+        Raises:
+            FileNotFoundError: If the tool is not in the tool index
+        """
+        from shared.tool_index import default_tools_path, get_tool_index, load_tool_class
+
+        with self._load_lock:
+            entry = get_tool_index().get(tool_name)
+            stamp = _source_stamp(default_tools_path() / entry.directory) if entry else None
+            if entry is None or self._loaded.get(tool_name, stamp) != stamp:
+                # New or edited tool: re-read the index and drop the old modules
+                entry = get_tool_index(refresh=True).get(tool_name)
+                if entry is None:
+                    raise FileNotFoundError(f"Tool '{tool_name}' not found")
+                tool_dir = default_tools_path() / entry.directory
+                if tool_name in self._loaded:
+                    logger.info(f"Sources of {tool_name} changed, re-importing")
+                    _unload_tool_package(entry.module, tool_dir)
+                stamp = _source_stamp(tool_dir)
+
+            tool_class = load_tool_class(entry)
+            self._loaded[tool_name] = stamp
+            return tool_class
+
+    def _run_tool(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate parameters, run the tool and return its result."""
+        from .utils.validators import validate_params
+
+        tool_name = request.get("tool")
+        params = request.get("params") or {}
+
+        # Relative paths in tool parameters resolve against the daemon's working
+        # directory, which is process-wide; let the client run those calls itself
+        cwd = request.get("cwd")
+        if cwd and os.path.realpath(cwd) != os.path.realpath(os.getcwd()):
+            return {
+                "success": False,
+                "fallback": True,
+                "error": f"Daemon runs in {os.getcwd()}, not {cwd}",
+            }
+
+        # Likewise the environment (API keys, USE_MOCK_APIS, ...) is the one the
+        # daemon started with
+        env = request.get("env")
+        if env and env != env_fingerprint():
+            return {
+                "success": False,
+                "fallback": True,
+                "error": "Daemon environment differs from the client's",
+            }
+
+        try:
+            tool_class = self._load_tool(tool_name)
+        except FileNotFoundError as e:
+            return {"success": False, "error": str(e)}
+        except Exception as e:
+            # A tool module that fails to import must not take the connection down
+            logger.exception(f"Failed to load tool {tool_name} in daemon")
+            return {"success": False, "error": f"Failed to load tool '{tool_name}': {e}"}
+
+        try:
+            validate_params(tool_class, params)
+        except Exception as e:
+            return {"success": False, "error": f"Parameter validation failed: {e}"}
+
+        with self._lock:
+            self.requests_served += 1
+
+        start = time.perf_counter()
+        try:
+            result = tool_class(**params).run()
+        except Exception as e:
+            logger.exception(f"Tool {tool_name} failed in daemon")
+            return {"success": False, "error": f"Error running tool: {e}"}
+
+        return {
+            "success": True,
+            "result": result,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+        }
+
+    def _begin_request(self) -> None:
+        with self._lock:
+            self._active += 1
+            self._last_activity = time.monotonic()
+
+    def _end_request(self) -> None:
+        with self._lock:
+            self._active -= 1
+            self._last_activity = time.monotonic()
+
+    def _warm_up(self) -> None:
+        """Build the tool index and create the shared singletons once."""
+        from shared.cache import get_global_cache_manager
+        from shared.http_client import HTTPClient
+        from shared.monitoring import get_monitor
+        from shared.tool_index import get_tool_index
+
+        get_tool_index()
+        get_global_cache_manager()
+        HTTPClient()
+        get_monitor()
+
+    def _watch_idle(self) -> None:
+        """Shut the server down after idle_timeout seconds without requests."""
+        interval = min(1.0, self.idle_timeout / 4)
+        while self._server is not None:
+            time.sleep(interval)
+            with self._lock:
+                idle = not self._active and (
+                    time.monotonic() - self._last_activity > self.idle_timeout
+                )
+            if idle:
+                logger.info(f"Idle for {self.idle_timeout:.0f}s, shutting down")
+                self.shutdown()
+                return
+
+    def _bind(self) -> _Server:
+        """Bind the socket, replacing a stale one left by a crashed daemon."""
+        if self.socket_path.exists():
+            if DaemonClient(self.socket_path).is_running():
+                raise RuntimeError(f"A daemon is already running at {self.socket_path}")
+            self.socket_path.unlink()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        old_umask = os.umask(0o077)
+        try:
+            server = _Server(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        server.tool_daemon = self
+        return server
+
+    def serve_forever(self) -> None:
+        """Serve requests until stopped or idle."""
+        self._server = self._bind()
+        logger.info(f"Daemon {os.getpid()} listening on {self.socket_path}")
+
+        self._warm_up()
+        if self.idle_timeout > 0:
+            threading.Thread(target=self._watch_idle, daemon=True).start()
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._server = None
+            try:
+                self.socket_path.unlink()
+            except FileNotFoundError:
+                pass
+            logger.info("Daemon stopped")
+
+    def shutdown(self) -> None:
+        """Stop serve_forever(); must be called from another thread."""
+        server = self._server
+        if server is not None:
+            server.shutdown()
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Daemon process entry point (started by start_daemon())."""
+    parser = argparse.ArgumentParser(description="AgentSwarm tool-runner daemon")
+    parser.add_argument("--socket", help="Socket path")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help="Seconds without requests before exiting (0 disables)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    try:
+        ToolDaemon(Path(args.socket) if args.socket else None, args.idle_timeout).serve_forever()
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
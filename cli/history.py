@@ -2,12 +2,20 @@
 Command History Tracking for AgentSwarm CLI
 
 Tracks all CLI commands for replay and analysis.
+
+History is an append-only SQLite table in WAL mode (~/.agentswarm/history.db),
+so adding a command is a single insert, lookups by id, command, tool and time
+use indexes, and concurrent CLI processes can write without losing entries.
+A legacy history.json is imported on first use.
 """
 
 import json
+import os
+import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from rich import box
 from rich.console import Console
@@ -15,37 +23,153 @@ from rich.table import Table
 
 console = Console()
 
+MAX_ENTRIES = 1000
+
+_COLUMNS = "id, timestamp, command, tool, params, success, error, duration"
+
 
 class CommandHistory:
     """Manage command history for AgentSwarm CLI."""
 
-    def __init__(self):
-        """Initialize command history."""
-        self.history_dir = Path.home() / ".agentswarm"
-        self.history_dir.mkdir(parents=True, exist_ok=True)
-        self.history_file = self.history_dir / "history.json"
-
-        # Load existing history
-        self.history = self._load_history()
+    def __init__(self, history_dir: Optional[Path] = None, max_entries: int = MAX_ENTRIES):
+        """
+        Initialize command history.
 
-    def _load_history(self) -> List[Dict[str, Any]]:
-        """Load command history from file."""
+        Args:
+            history_dir: Directory holding history.db (default: ~/.agentswarm)
+            max_entries: Number of most recent entries to keep
+        """
+        self.history_dir = Path(history_dir) if history_dir else Path.home() / ".agentswarm"
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.history_dir / "history.db"
+        self.history_file = self.history_dir / "history.json"  # legacy format
+        self.max_entries = max_entries
+
+        self._init_db()
+        self._migrate_legacy_history()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection; commits on success and always closes."""
+        # A generous busy timeout lets concurrent CLI processes queue for the write lock
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        """Initialize SQLite database schema."""
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    command TEXT NOT NULL,
+                    tool TEXT,
+                    params TEXT,
+                    success INTEGER NOT NULL,
+                    error TEXT,
+                    duration REAL
+                )
+            """
+            )
+
+            # Indexes for filtered, newest-first lookups
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history(timestamp)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_history_command ON history(command, timestamp)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_history_tool ON history(tool, timestamp)")
+
+    def _migrate_legacy_history(self) -> None:
+        """Import entries from the old history.json and retire the file."""
         if not self.history_file.exists():
-            return []
+            return
 
+        # Claim the file first so two CLI processes never import it twice
+        claimed = self.history_file.with_name(f"history.json.{os.getpid()}.migrating")
         try:
-            with open(self.history_file, "r") as f:
-                return json.load(f)
-        except Exception:
-            return []
+            os.rename(self.history_file, claimed)
+        except FileNotFoundError:
+            return
 
-    def _save_history(self):
-        """Save command history to file."""
         try:
-            with open(self.history_file, "w") as f:
-                json.dump(self.history, f, indent=2)
+            with open(claimed, "r") as f:
+                entries = json.load(f)
         except Exception as e:
-            console.print(f"[red]Error saving history: {e}[/red]")
+            # Keep the unreadable file for inspection, but do not leave it claimed
+            unreadable = self.history_file.with_name("history.json.unreadable")
+            try:
+                os.replace(claimed, unreadable)
+            except OSError:
+                unreadable = claimed
+            console.print(f"[yellow]Could not read legacy history {unreadable}: {e}[/yellow]")
+            return
+
+        # The old format reused ids once it was trimmed; keep the first of each
+        seen_ids = set()
+        rows = []
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict) or not entry.get("command"):
+                continue
+            entry_id = entry.get("id")
+            if not isinstance(entry_id, int) or entry_id in seen_ids:
+                entry_id = None
+            seen_ids.add(entry_id)
+            rows.append(
+                (
+                    entry_id,
+                    entry.get("timestamp") or datetime.now().isoformat(),
+                    entry["command"],
+                    entry.get("tool"),
+                    json.dumps(entry.get("params") or {}),
+                    1 if entry.get("success", True) else 0,
+                    entry.get("error"),
+                    entry.get("duration"),
+                )
+            )
+
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    f"INSERT OR IGNORE INTO history ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._trim(conn)
+        except sqlite3.Error as e:
+            os.rename(claimed, self.history_file)
+            console.print(f"[red]Error migrating history: {e}[/red]")
+            return
+
+        os.replace(claimed, self.history_file.with_name("history.json.migrated"))
+
+    def _trim(self, conn: sqlite3.Connection) -> None:
+        """Drop entries older than the newest max_entries (a rowid range delete)."""
+        conn.execute(
+            "DELETE FROM history WHERE id <= (SELECT MAX(id) FROM history) - ?",
+            (self.max_entries,),
+        )
+
+    @staticmethod
+    def _row_to_entry(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a database row to a history entry."""
+        entry = dict(row)
+        entry["params"] = json.loads(entry["params"]) if entry["params"] else {}
+        entry["success"] = bool(entry["success"])
+        return entry
+
+    @property
+    def history(self) -> List[Dict[str, Any]]:
+        """All retained entries, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT {_COLUMNS} FROM history ORDER BY id").fetchall()
+        return [self._row_to_entry(row) for row in rows]
 
     def add_command(
         self,
@@ -55,7 +179,7 @@ class CommandHistory:
         success: bool = True,
         error: Optional[str] = None,
         duration: Optional[float] = None,
-    ):
+    ) -> Dict[str, Any]:
         """
         Add a command to history.
 
@@ -66,9 +190,12 @@ class CommandHistory:
             success: Whether command succeeded
             error: Error message if failed
             duration: Execution duration in seconds
+
+        Returns:
+            The stored entry
         """
         entry = {
-            "id": len(self.history) + 1,
+            "id": None,
             "timestamp": datetime.now().isoformat(),
             "command": command,
             "tool": tool,
@@ -78,13 +205,30 @@ class CommandHistory:
             "duration": duration,
         }
 
-        self.history.append(entry)
-
-        # Keep only last 1000 entries
-        if len(self.history) > 1000:
-            self.history = self.history[-1000:]
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    """
+                    INSERT INTO history
+                    (timestamp, command, tool, params, success, error, duration)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                    (
+                        entry["timestamp"],
+                        command,
+                        tool,
+                        json.dumps(entry["params"], default=str),
+                        1 if success else 0,
+                        error,
+                        duration,
+                    ),
+                )
+                entry["id"] = cursor.lastrowid
+                self._trim(conn)
+        except sqlite3.Error as e:
+            console.print(f"[red]Error saving history: {e}[/red]")
 
-        self._save_history()
+        return entry
 
     def get_history(
         self,
@@ -92,6 +236,8 @@ class CommandHistory:
         command_filter: Optional[str] = None,
         tool_filter: Optional[str] = None,
         success_only: bool = False,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get command history with filters.
@@ -101,30 +247,45 @@ class CommandHistory:
             command_filter: Filter by command type
             tool_filter: Filter by tool name
             success_only: Only return successful commands
+            since: Only return commands run at or after this time
+            until: Only return commands run before this time
 
         Returns:
-            List of history entries
+            List of history entries, newest first
         """
-        filtered = self.history
+        clauses = []
+        values: List[Any] = []
 
-        # Apply filters
         if command_filter:
-            filtered = [e for e in filtered if e.get("command") == command_filter]
+            clauses.append("command = ?")
+            values.append(command_filter)
 
         if tool_filter:
-            filtered = [e for e in filtered if e.get("tool") == tool_filter]
+            clauses.append("tool = ?")
+            values.append(tool_filter)
 
         if success_only:
-            filtered = [e for e in filtered if e.get("success")]
+            clauses.append("success = 1")
+
+        if since:
+            clauses.append("timestamp >= ?")
+            values.append(since.isoformat())
 
-        # Sort by timestamp (newest first)
-        filtered = sorted(filtered, key=lambda x: x.get("timestamp", ""), reverse=True)
+        if until:
+            clauses.append("timestamp < ?")
+            values.append(until.isoformat())
 
-        # Apply limit
+        query = f"SELECT {_COLUMNS} FROM history"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY timestamp DESC, id DESC"
         if limit:
-            filtered = filtered[:limit]
+            query += " LIMIT ?"
+            values.append(limit)
 
-        return filtered
+        with self._connect() as conn:
+            rows = conn.execute(query, values).fetchall()
+        return [self._row_to_entry(row) for row in rows]
 
     def get_by_id(self, entry_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -136,16 +297,17 @@ class CommandHistory:
         Returns:
             History entry or None if not found
         """
-        for entry in self.history:
-            if entry.get("id") == entry_id:
-                return entry
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM history WHERE id = ?", (entry_id,)
+            ).fetchone()
 
-        return None
+        return self._row_to_entry(row) if row else None
 
     def clear(self):
         """Clear all command history."""
-        self.history = []
-        self._save_history()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM history")
 
     def replay_command(self, entry_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -175,35 +337,33 @@ class CommandHistory:
         Returns:
             Statistics dictionary
         """
-        if not self.history:
-            return {
-                "total_commands": 0,
-                "success_rate": 0.0,
-                "most_used_tools": [],
-                "most_used_commands": [],
-            }
-
-        total = len(self.history)
-        successful = sum(1 for e in self.history if e.get("success"))
-
-        # Count tool usage
-        tool_counts = {}
-        for entry in self.history:
-            tool = entry.get("tool")
-            if tool:
-                tool_counts[tool] = tool_counts.get(tool, 0) + 1
-
-        # Count command usage
-        command_counts = {}
-        for entry in self.history:
-            cmd = entry.get("command")
-            if cmd:
-                command_counts[cmd] = command_counts.get(cmd, 0) + 1
-
-        # Sort by usage
-        most_used_tools = sorted(tool_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-
-        most_used_commands = sorted(command_counts.items(), key=lambda x: x[1], reverse=True)
+        with self._connect() as conn:
+            total, successful = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(success), 0) FROM history"
+            ).fetchone()
+
+            if not total:
+                return {
+                    "total_commands": 0,
+                    "success_rate": 0.0,
+                    "most_used_tools": [],
+                    "most_used_commands": [],
+                }
+
+            most_used_tools = conn.execute(
+                """
+                SELECT tool, COUNT(*) AS count FROM history
+                WHERE tool IS NOT NULL AND tool != ''
+                GROUP BY tool ORDER BY count DESC LIMIT 10
+            """
+            ).fetchall()
+
+            most_used_commands = conn.execute(
+                """
+                SELECT command, COUNT(*) AS count FROM history
+                GROUP BY command ORDER BY count DESC
+            """
+            ).fetchall()
 
         return {
             "total_commands": total,
@@ -6,26 +6,43 @@ Main entry point for the command-line interface.
 """
 
 import argparse
+import logging
 import sys
 from typing import Optional
 
-from .commands import (
-    completion_tool,
-    config_tool,
-    history_tool,
-    info_tool,
-    interactive_tool,
-    list_tools,
-)
-from .commands import performance as performance_cmd
-from .commands import (
-    run_tool,
-    test_tool,
-    validate_tool,
-    workflow_tool,
-)
+from . import commands
 from .version import __version__
 
+# Subcommand -> attribute of cli.commands (the module is imported only when run)
+COMMANDS = {
+    "interactive": "interactive_tool",
+    "list": "list_tools",
+    "info": "info_tool",
+    "run": "run_tool",
+    "test": "test_tool",
+    "validate": "validate_tool",
+    "config": "config_tool",
+    "workflow": "workflow_tool",
+    "history": "history_tool",
+    "completion": "completion_tool",
+    "performance": "performance",
+    "daemon": "daemon_tool",
+}
+
+
+def add_runner_arguments(parser: argparse.ArgumentParser) -> None:
+    """Options shared by commands that run a check per tool in parallel."""
+    parser.add_argument(
+        "-j", "--jobs", type=int, help="Tools to run at once (default: CPU count, up to 8)"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=60, help="Seconds per tool before it is killed"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Rerun tools unchanged since their last green run"
+    )
+    parser.add_argument("--junit", metavar="FILE", help="Write JUnit XML results to FILE")
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create the main argument parser."""
@@ -48,6 +65,7 @@ Examples:
   agentswarm completion install            # Install shell auto-completion
   agentswarm config --show                 # Show current configuration
   agentswarm performance                   # Show performance overview
+  agentswarm daemon start                  # Keep tools warm for repeated runs
 
 For more information, visit: https://github.com/agency-ai-solutions/agentswarm-tools
         """,
@@ -88,6 +106,13 @@ For more information, visit: https://github.com/agency-ai-solutions/agentswarm-t
     run_parser.add_argument(
         "-f", "--format", choices=["json", "yaml", "text"], default="json", help="Output format"
     )
+    run_daemon = run_parser.add_mutually_exclusive_group()
+    run_daemon.add_argument(
+        "--daemon", action="store_true", help="Start the tool daemon if needed and run in it"
+    )
+    run_daemon.add_argument(
+        "--no-daemon", action="store_true", help="Run in this process even if a daemon is running"
+    )
 
     # Test command
     test_parser = subparsers.add_parser("test", help="Test a tool")
@@ -96,6 +121,7 @@ For more information, visit: https://github.com/agency-ai-solutions/agentswarm-t
         "-m", "--mock", action="store_true", default=True, help="Use mock mode (default: True)"
     )
     test_parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+    add_runner_arguments(test_parser)
 
     # Validate command
     validate_parser = subparsers.add_parser("validate", help="Validate tools")
@@ -103,6 +129,7 @@ For more information, visit: https://github.com/agency-ai-solutions/agentswarm-t
         "tool", nargs="?", help="Tool name (optional, validates all if omitted)"
     )
     validate_parser.add_argument("--strict", action="store_true", help="Strict validation mode")
+    add_runner_arguments(validate_parser)
 
     # Config command
     config_parser = subparsers.add_parser("config", help="Manage configuration")
@@ -213,6 +240,16 @@ For more information, visit: https://github.com/agency-ai-solutions/agentswarm-t
         "-d", "--days", type=int, default=7, help="Number of days to analyze (default: 7)"
     )
 
+    # Daemon command
+    daemon_parser = subparsers.add_parser("daemon", help="Manage the background tool-runner daemon")
+    daemon_parser.add_argument("action", choices=["start", "stop", "status"], help="Daemon action")
+    daemon_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=600,
+        help="Seconds without requests before the daemon exits (default: 600, 0 disables)",
+    )
+
     return parser
 
 
@@ -225,32 +262,18 @@ def main(argv: Optional[list] = None) -> int:
         parser.print_help()
         return 0
 
+    if args.command not in COMMANDS:
+        parser.print_help()
+        return 1
+
+    # Tool modules log through the standard logging module; configure it here
+    # rather than as a side effect of importing shared.base
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
     try:
-        if args.command == "interactive":
-            return interactive_tool.execute(args)
-        elif args.command == "list":
-            return list_tools.execute(args)
-        elif args.command == "info":
-            return info_tool.execute(args)
-        elif args.command == "run":
-            return run_tool.execute(args)
-        elif args.command == "test":
-            return test_tool.execute(args)
-        elif args.command == "validate":
-            return validate_tool.execute(args)
-        elif args.command == "config":
-            return config_tool.execute(args)
-        elif args.command == "workflow":
-            return workflow_tool.execute(args)
-        elif args.command == "history":
-            return history_tool.execute(args)
-        elif args.command == "completion":
-            return completion_tool.execute(args)
-        elif args.command == "performance":
-            return performance_cmd.execute(args)
-        else:
-            parser.print_help()
-            return 1
+        return getattr(commands, COMMANDS[args.command]).execute(args)
 
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user.")
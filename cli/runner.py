@@ -0,0 +1,344 @@
+"""
+Parallel Tool Runner for AgentSwarm CLI
+
+Runs a per-tool check (``agentswarm test`` / ``agentswarm validate``) for many
+tools at once. Every tool gets its own short-lived process, so a tool that
+hangs is killed at its timeout and a tool that leaks state cannot affect the
+next one. Results stream back as they finish.
+
+Green results are remembered by source hash (~/.agentswarm/run_cache.json), so
+a sweep only reruns tools whose files, or the shared package, changed since
+their last green run. Results can be written as JUnit XML next to the pytest
+reports in test-results/.
+"""
+
+import hashlib
+import importlib
+import json
+import multiprocessing
+import os
+import socket
+import time
+import traceback
+import xml.etree.ElementTree as ET
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from shared.tool_index import ToolIndexEntry, default_tools_path
+
+DEFAULT_TIMEOUT = 60.0
+
+# Outcome of one tool run
+PASSED = "passed"
+FAILED = "failed"
+ERROR = "error"  # timeout or crashed worker
+SKIPPED = "skipped"  # unchanged since the last green run
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Sources every result depends on: the shared package and the checks themselves
+CHECKER_SOURCES = ("shared/*.py", "cli/**/*.py", "sdk/validator.py")
+
+
+@dataclass
+class ToolRunResult:
+    """Result of running a check for one tool."""
+
+    tool: str
+    category: str
+    module: str
+    status: str
+    duration: float = 0.0
+    message: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the tool passed (or was skipped as unchanged)."""
+        return self.status in (PASSED, SKIPPED)
+
+
+def default_workers() -> int:
+    """Default number of concurrent tool processes."""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def _start_method() -> str:
+    """Prefer fork: children inherit the parent's already-imported modules."""
+    return "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _child_main(conn, func: Callable, entry: ToolIndexEntry, options: Dict[str, Any]) -> None:
+    """Run func(entry, **options) in the child and send back (ok, payload)."""
+    try:
+        conn.send((True, func(entry, **options)))
+    except BaseException as e:  # report everything, including SystemExit from tools
+        conn.send((False, f"{type(e).__name__}: {e}\n{traceback.format_exc()}"))
+    finally:
+        conn.close()
+
+
+@dataclass
+class _Job:
+    entry: ToolIndexEntry
+    process: Any
+    conn: Any
+    started: float
+
+
+def run_parallel(
+    func: Callable[..., Dict[str, Any]],
+    entries: Iterable[ToolIndexEntry],
+    workers: Optional[int] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    options: Optional[Dict[str, Any]] = None,
+    preload: Iterable[str] = ("shared.base",),
+) -> Iterator[ToolRunResult]:
+    """
+    Run func for each tool in its own process and yield results as they finish.
+
+    func must be a module-level function taking (entry, **options) and
+    returning a dict with a boolean "success" and an optional "error".
+
+    Args:
+        func: Per-tool check
+        entries: Tools to run
+        workers: Maximum concurrent processes (default: CPU count, up to 8)
+        timeout: Seconds before a tool's process is killed (0 disables)
+        options: Keyword arguments passed to func
+        preload: Modules imported once in the parent so forked children start warm
+
+    Yields:
+        ToolRunResult per tool, in completion order
+    """
+    ctx = multiprocessing.get_context(_start_method())
+    if ctx.get_start_method() == "fork":
+        for module in preload:
+            importlib.import_module(module)
+
+    workers = workers or default_workers()
+    options = options or {}
+    pending = deque(entries)
+    running: List[_Job] = []
+
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                entry = pending.popleft()
+                parent_conn, child_conn = ctx.Pipe(duplex=False)
+                process = ctx.Process(
+                    target=_child_main, args=(child_conn, func, entry, options), daemon=True
+                )
+                process.start()
+                child_conn.close()
+                running.append(_Job(entry, process, parent_conn, time.monotonic()))
+
+            # Wake for the first finished job or the nearest deadline
+            wait_for = None
+            if timeout:
+                now = time.monotonic()
+                wait_for = max(0.0, min(job.started + timeout - now for job in running))
+            ready = wait([job.conn for job in running], timeout=wait_for)
+
+            now = time.monotonic()
+            for job in list(running):
+                if job.conn in ready:
+                    result = _collect(job, now)
+                elif timeout and now - job.started >= timeout:
+                    job.process.kill()
+                    result = _result(job, now, ERROR, f"Timed out after {timeout:g}s")
+                else:
+                    continue
+
+                running.remove(job)
+                job.conn.close()
+                job.process.join()
+                yield result
+    finally:
+        for job in running:
+            job.process.kill()
+            job.process.join()
+
+
+def _collect(job: _Job, now: float) -> ToolRunResult:
+    """Read a finished job's payload."""
+    try:
+        ok, payload = job.conn.recv()
+    except EOFError:
+        job.process.join()
+        return _result(job, now, ERROR, f"Worker exited with code {job.process.exitcode}")
+
+    if not ok:
+        return _result(job, now, ERROR, payload)
+
+    status = PASSED if payload.get("success") else FAILED
+    return _result(job, now, status, payload.get("error"), payload)
+
+
+def _result(
+    job: _Job,
+    now: float,
+    status: str,
+    message: Optional[str],
+    details: Optional[Dict[str, Any]] = None,
+) -> ToolRunResult:
+    return ToolRunResult(
+        tool=job.entry.name,
+        category=job.entry.category,
+        module=job.entry.module,
+        status=status,
+        duration=now - job.started,
+        message=message,
+        details=details or {},
+    )
+
+
+def skipped_result(entry: ToolIndexEntry) -> ToolRunResult:
+    """Result for a tool that is unchanged since its last green run."""
+    return ToolRunResult(
+        tool=entry.name,
+        category=entry.category,
+        module=entry.module,
+        status=SKIPPED,
+        message="Unchanged since last green run",
+    )
+
+
+class RunCache:
+    """
+    Source hashes of tools at their last green run, per suite.
+
+    A tool's hash covers the non-test .py files in its directory plus the
+    CHECKER_SOURCES, so changes to shared code or to the CLI and validator
+    that run the checks rerun everything.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        suite: str,
+        cache_path: Optional[Path] = None,
+        tools_path: Optional[Path] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            suite: Cache namespace, including any options that change results
+            cache_path: JSON file (default: ~/.agentswarm/run_cache.json)
+            tools_path: Tools root (default: the repository tools/ directory)
+        """
+        if cache_path is None:
+            cache_dir = Path.home() / ".agentswarm"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path = cache_dir / "run_cache.json"
+
+        self.suite = suite
+        self.cache_path = Path(cache_path)
+        self.tools_path = Path(tools_path) if tools_path else default_tools_path()
+        self._data = self._load()
+        self._green: Dict[str, str] = self._data.setdefault("suites", {}).setdefault(suite, {})
+        self._checker_hash: Optional[str] = None
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {"version": self.VERSION}
+        if data.get("version") != self.VERSION:
+            return {"version": self.VERSION}
+        return data
+
+    def _checker_fingerprint(self) -> str:
+        if self._checker_hash is None:
+            files = {path for pattern in CHECKER_SOURCES for path in PROJECT_ROOT.glob(pattern)}
+            self._checker_hash = _hash_files(sorted(files))
+        return self._checker_hash
+
+    def source_hash(self, entry: ToolIndexEntry) -> str:
+        """Hash of the tool's sources and the checker sources."""
+        tool_dir = (self.tools_path / entry.path).parent
+        files = sorted(p for p in tool_dir.glob("*.py") if not p.name.startswith("test_"))
+        return _hash_files(files, seed=self._checker_fingerprint())
+
+    def is_green(self, entry: ToolIndexEntry) -> bool:
+        """Whether the tool passed with its current sources."""
+        return self._green.get(entry.name) == self.source_hash(entry)
+
+    def record(self, entry: ToolIndexEntry, result: ToolRunResult) -> None:
+        """Remember a passing result; forget the tool otherwise."""
+        if result.status == PASSED:
+            self._green[entry.name] = self.source_hash(entry)
+        elif result.status != SKIPPED:
+            self._green.pop(entry.name, None)
+
+    def save(self) -> None:
+        """Write the cache atomically."""
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self._data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.cache_path)
+
+
+def _hash_files(paths: Iterable[Path], seed: str = "") -> str:
+    digest = hashlib.sha256(seed.encode("utf-8"))
+    for path in paths:
+        digest.update(path.name.encode("utf-8"))
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+def write_junit(results: List[ToolRunResult], output_path: Path, suite_name: str) -> None:
+    """
+    Write results as JUnit XML (the layout pytest uses for test-results/).
+
+    Each tool is one testcase with classname set to its module; failures map to
+    <failure>, timeouts and crashes to <error>, and unchanged tools to <skipped>.
+    """
+    counts = {status: 0 for status in (FAILED, ERROR, SKIPPED)}
+    for result in results:
+        if result.status in counts:
+            counts[result.status] += 1
+
+    testsuites = ET.Element("testsuites", name=suite_name)
+    testsuite = ET.SubElement(
+        testsuites,
+        "testsuite",
+        name=suite_name,
+        errors=str(counts[ERROR]),
+        failures=str(counts[FAILED]),
+        skipped=str(counts[SKIPPED]),
+        tests=str(len(results)),
+        time=f"{sum(r.duration for r in results):.3f}",
+        timestamp=datetime.now().astimezone().isoformat(),
+        hostname=socket.gethostname(),
+    )
+
+    for result in sorted(results, key=lambda r: r.module):
+        testcase = ET.SubElement(
+            testsuite,
+            "testcase",
+            classname=result.module,
+            name=result.tool,
+            time=f"{result.duration:.3f}",
+        )
+        message = result.message or ""
+        if result.status == FAILED:
+            ET.SubElement(testcase, "failure", message=message.split("\n", 1)[0]).text = message
+        elif result.status == ERROR:
+            ET.SubElement(testcase, "error", message=message.split("\n", 1)[0]).text = message
+        elif result.status == SKIPPED:
+            ET.SubElement(testcase, "skipped", message=message)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(testsuites).write(output_path, encoding="utf-8", xml_declaration=True)
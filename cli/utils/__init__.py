@@ -1,9 +1,19 @@
 """
 CLI Utilities Package
 
-Helper functions for CLI operations.
+Helper functions for CLI operations. Submodules are imported on first access.
 """
 
-from . import formatters, interactive, validators
+import importlib
 
 __all__ = ["formatters", "validators", "interactive"]
+
+
+def __getattr__(name: str):
+    """Import a utility submodule on first access."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{name}", __name__)
+    globals()[name] = module
+    return module
@@ -12,12 +12,13 @@ Or programmatically:
     server.run()
 """
 
+from .catalog import CatalogEntry, ToolCatalog
 from .config import MCPConfig
 from .server import MCPServer, main
 from .tools import ToolRegistry
 
 __version__ = "1.0.0"
-__all__ = ["MCPServer", "MCPConfig", "ToolRegistry", "main"]
+__all__ = ["MCPServer", "MCPConfig", "ToolRegistry", "ToolCatalog", "CatalogEntry", "main"]
 
 
 if __name__ == "__main__":
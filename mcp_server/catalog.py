@@ -0,0 +1,246 @@
+"""
+Precomputed Tool Catalog for MCP Server
+
+Discovering tools imports every tool module (pulling in matplotlib, PIL,
+Google clients, ...) and builds each JSON schema before the server can
+answer ``initialize``. The catalog stores the result of that walk as a JSON
+manifest (tool name -> module, class, schema, description) so that:
+
+- tools/list is served straight from the manifest
+- tool modules are imported lazily on the first tools/call
+- only tools whose schema-relevant source changed are re-imported
+
+Tool directories come from the shared static tool index
+(``shared.tool_index``), which finds tools without importing them. An entry is
+rebuilt only when the tool's module, class or schema hash (docstring and
+class-level field declarations) changes; edits to method bodies do not
+invalidate the cached schema.
+
+Build or refresh the catalog ahead of time with:
+    python -m mcp_server.catalog [--rebuild]
+"""
+
+import importlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from shared.tool_index import ToolIndexEntry
+
+logger = logging.getLogger(__name__)
+
+# Bump when the manifest layout or schema generation changes
+CATALOG_VERSION = 2
+
+
+def default_catalog_path() -> Path:
+    """Default manifest location (~/.agentswarm/mcp_tool_catalog.json)."""
+    return Path.home() / ".agentswarm" / "mcp_tool_catalog.json"
+
+
+@dataclass
+class CatalogEntry:
+    """
+    Catalog record for one tool.
+
+    Stands in for the tool class in ``ToolRegistry.discover_tools()`` results;
+    call ``load()`` to import the module and get the class.
+    """
+
+    tool_name: str
+    tool_category: str
+    module: str
+    class_name: str
+    description: str
+    schema: Dict[str, Any]
+    _tool_class: Any = field(default=None, repr=False, compare=False)
+
+    def load(self) -> Any:
+        """Import the tool module (once) and return the tool class."""
+        if self._tool_class is None:
+            module = importlib.import_module(self.module)
+            self._tool_class = getattr(module, self.class_name)
+        return self._tool_class
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the manifest."""
+        data = asdict(self)
+        data.pop("_tool_class")
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CatalogEntry":
+        """Create entry from a manifest record."""
+        return cls(**data)
+
+
+class ToolCatalog:
+    """
+    On-disk manifest of discovered MCP tools.
+
+    Example:
+        ```python
+        catalog = ToolCatalog(registry)
+        tools = catalog.load_or_build()  # {tool_name: CatalogEntry}
+        ```
+    """
+
+    def __init__(self, registry, path: Optional[Path] = None):
+        """
+        Initialize catalog.
+
+        Args:
+            registry: ToolRegistry used to walk categories and build schemas
+            path: Manifest path (defaults to ~/.agentswarm/mcp_tool_catalog.json)
+        """
+        self.registry = registry
+        self.path = Path(path) if path else default_catalog_path()
+
+    def load_or_build(self, rebuild: bool = False) -> Dict[str, CatalogEntry]:
+        """
+        Return catalog entries, re-importing only tools whose schema changed.
+
+        Args:
+            rebuild: Ignore the existing manifest and re-import everything
+
+        Returns:
+            Dict mapping tool_name -> CatalogEntry
+        """
+        manifest = None if rebuild else self._read_manifest()
+        cached_dirs = manifest["dirs"] if manifest else {}
+
+        dirs: Dict[str, Dict[str, Any]] = {}
+        reimported = 0
+
+        for category, index_entry in self._scan_index():
+            rel_dir = index_entry.directory
+            fingerprint = self._fingerprint(index_entry)
+
+            cached = cached_dirs.get(rel_dir)
+            if cached and cached["fingerprint"] == fingerprint and cached["category"] == category:
+                dirs[rel_dir] = cached
+                continue
+
+            reimported += 1
+            dirs[rel_dir] = {
+                "category": category,
+                "fingerprint": fingerprint,
+                "tool": self._build_entry(category, self.registry.tools_dir / rel_dir),
+            }
+
+        stale = manifest is None or reimported > 0 or set(dirs) != set(cached_dirs)
+        if stale:
+            logger.info(f"Tool catalog refreshed ({reimported} tool directories re-imported)")
+            self._write_manifest(dirs)
+
+        tools: Dict[str, CatalogEntry] = {}
+        for record in dirs.values():
+            if record["tool"]:
+                entry = CatalogEntry.from_dict(record["tool"])
+                tools[entry.tool_name] = entry
+        return tools
+
+    def _scan_index(self) -> List[tuple]:
+        """List (category, ToolIndexEntry) pairs in discovery order, without importing."""
+        pairs = []
+        for category in self.registry.config.enabled_categories:
+            for index_entry in self.registry._iter_index_entries(category):
+                pairs.append((category, index_entry))
+        return pairs
+
+    @staticmethod
+    def _fingerprint(index_entry: ToolIndexEntry) -> str:
+        """Identify the schema-relevant state of a tool."""
+        return f"{index_entry.module}:{index_entry.class_name}:{index_entry.schema_hash}"
+
+    def _build_entry(self, category: str, tool_dir: Path) -> Optional[Dict[str, Any]]:
+        """Import one tool directory and record its metadata and schema."""
+        try:
+            tool_class = self.registry._load_tool_from_directory(tool_dir)
+            if not tool_class:
+                return None
+
+            schema = self.registry.generate_tool_schema(tool_class)
+            return CatalogEntry(
+                tool_name=schema["name"],
+                tool_category=getattr(tool_class, "tool_category", category),
+                module=tool_class.__module__,
+                class_name=tool_class.__name__,
+                description=schema["description"],
+                schema=schema,
+            ).to_dict()
+
+        except Exception as e:
+            logger.error(f"  Failed to catalog tool from {tool_dir}: {e}")
+            return None
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        """Load the manifest if it exists and matches this tree and config."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable tool catalog {self.path}: {e}")
+            return None
+
+        if (
+            manifest.get("version") != CATALOG_VERSION
+            or manifest.get("tools_dir") != str(self.registry.tools_dir)
+            or manifest.get("categories") != list(self.registry.config.enabled_categories)
+        ):
+            return None
+
+        return manifest
+
+    def _write_manifest(self, dirs: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically write the manifest."""
+        manifest = {
+            "version": CATALOG_VERSION,
+            "tools_dir": str(self.registry.tools_dir),
+            "categories": list(self.registry.config.enabled_categories),
+            "built_at": time.time(),
+            "dirs": dirs,
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, separators=(",", ":"), default=str)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write tool catalog {self.path}: {e}")
+
+
+def main():
+    """Build or refresh the tool catalog and report timings."""
+    import argparse
+
+    from .config import MCPConfig
+    from .tools import ToolRegistry
+
+    parser = argparse.ArgumentParser(description="Build the MCP tool catalog")
+    parser.add_argument("--rebuild", action="store_true", help="Re-import every tool")
+    parser.add_argument("--config", help="Path to MCP config.json")
+    args = parser.parse_args()
+
+    config = MCPConfig.load_from_file(args.config)
+    registry = ToolRegistry(config)
+    catalog = ToolCatalog(registry, config.tool_catalog_path)
+
+    start = time.time()
+    tools = catalog.load_or_build(rebuild=args.rebuild)
+    elapsed_ms = (time.time() - start) * 1000
+
+    print(f"Catalog: {catalog.path}")
+    print(f"Tools: {len(tools)} ({elapsed_ms:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,15 @@ class MCPConfig:
         enable_analytics: Enable analytics tracking
         enable_caching: Enable response caching
         log_level: Logging level
+        max_concurrent_requests: Maximum tools/call requests executed concurrently
+        request_timeout: Per-request timeout for tools/call in seconds (0 = no timeout)
+        use_tool_catalog: Serve tools from the cached catalog and import tools lazily
+        tool_catalog_path: Catalog manifest path (default: ~/.agentswarm/mcp_tool_catalog.json)
+        max_inline_bytes: Largest tool result returned inline; larger results are
+            spilled to payload_dir and returned as a resource URI (0 = never spill)
+        payload_dir: Spill directory (default: ~/.agentswarm/mcp_payloads)
+        progress_interval: Seconds between progress notifications for tools/call
+            requests that carry a progressToken (0 = disabled)
     """
 
     server_name: str = "agentswarm-tools"
@@ -36,6 +45,13 @@ class MCPConfig:
     enable_analytics: bool = True
     enable_caching: bool = True
     log_level: str = "INFO"
+    max_concurrent_requests: int = 8
+    request_timeout: float = 300.0
+    use_tool_catalog: bool = True
+    tool_catalog_path: Optional[str] = None
+    max_inline_bytes: int = 1_000_000
+    payload_dir: Optional[str] = None
+    progress_interval: float = 5.0
 
     def __post_init__(self):
         """Initialize default categories if not provided."""
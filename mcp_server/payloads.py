@@ -0,0 +1,198 @@
+"""
+Response Payload Handling for MCP Server
+
+Tool results can be large (base64 chart images, transcripts, scraped pages).
+This module keeps them cheap to send:
+
+- Compact serialization (no indentation), using orjson when it is installed
+- Spill-to-file: results above ``max_inline_bytes`` are written under the
+  payload directory and replaced by a small envelope holding a preview and a
+  ``resource_uri`` that clients fetch with ``resources/read`` (and can
+  discover with ``resources/list``)
+"""
+
+import json
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import unquote, urlparse
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Characters of the serialized payload kept inline when it is spilled
+PREVIEW_CHARS = 2000
+
+# Spilled payloads older than this are removed on the next spill
+PAYLOAD_TTL_SECONDS = 24 * 3600
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize to compact JSON.
+
+    Uses orjson when available; falls back to the json module for values
+    orjson rejects (e.g. integers above 64 bits).
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except (TypeError, ValueError):
+            pass
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def default_payload_dir() -> Path:
+    """Default spill directory (~/.agentswarm/mcp_payloads)."""
+    return Path.home() / ".agentswarm" / "mcp_payloads"
+
+
+class PayloadStore:
+    """
+    Spills oversized tool results to disk and serves them back as resources.
+
+    Example:
+        ```python
+        store = PayloadStore(max_inline_bytes=1_000_000)
+        text, size_bytes = store.render("chart_tool", result)
+        ```
+    """
+
+    URI_SCHEME = "file"
+    MIME_TYPE = "application/json"
+
+    def __init__(self, max_inline_bytes: int = 1_000_000, payload_dir: Optional[str] = None):
+        """
+        Initialize payload store.
+
+        Args:
+            max_inline_bytes: Largest serialized result returned inline (0 = never spill)
+            payload_dir: Spill directory (defaults to ~/.agentswarm/mcp_payloads)
+        """
+        self.max_inline_bytes = max_inline_bytes
+        self.payload_dir = Path(payload_dir) if payload_dir else default_payload_dir()
+
+    def render(self, tool_name: str, result: Any) -> tuple:
+        """
+        Serialize a tool result for a text content block.
+
+        Args:
+            tool_name: Tool that produced the result
+            result: Tool result
+
+        Returns:
+            Tuple of (text, size_bytes) where size_bytes is the full serialized size
+        """
+        text = dumps(result)
+        size_bytes = len(text.encode("utf-8"))
+
+        if not self.max_inline_bytes or size_bytes <= self.max_inline_bytes:
+            return text, size_bytes
+
+        try:
+            path = self._spill(tool_name, text)
+        except OSError as e:
+            logger.warning(f"Could not spill {size_bytes} byte result of {tool_name}: {e}")
+            return text, size_bytes
+
+        logger.info(f"Spilled {size_bytes} byte result of {tool_name} to {path}")
+        envelope = {
+            "truncated": True,
+            "size_bytes": size_bytes,
+            "resource_uri": path.as_uri(),
+            "mime_type": self.MIME_TYPE,
+            "preview": text[:PREVIEW_CHARS],
+        }
+        return dumps(envelope), size_bytes
+
+    def list(self) -> Dict[str, Any]:
+        """
+        List spilled payloads as MCP resources, newest first.
+
+        Returns:
+            MCP resources/list result
+        """
+        entries = []
+        try:
+            with os.scandir(self.payload_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, Path(entry.path)))
+        except FileNotFoundError:
+            pass
+
+        cutoff = time.time() - PAYLOAD_TTL_SECONDS
+        resources = [
+            {
+                "uri": path.as_uri(),
+                "name": path.name,
+                "mimeType": self.MIME_TYPE,
+                "size": size,
+            }
+            for mtime, size, path in sorted(entries, key=lambda e: e[0], reverse=True)
+            if mtime >= cutoff
+        ]
+        return {"resources": resources}
+
+    def read(self, uri: str) -> Dict[str, Any]:
+        """
+        Read a spilled payload as an MCP resource.
+
+        Args:
+            uri: ``file://`` URI returned in a spill envelope
+
+        Returns:
+            MCP resources/read result
+
+        Raises:
+            ValueError: If the URI does not point at a payload in this store
+        """
+        parsed = urlparse(uri)
+        if parsed.scheme != self.URI_SCHEME:
+            raise ValueError(f"Unsupported resource URI: {uri}")
+
+        path = Path(unquote(parsed.path)).resolve()
+        if path.parent != self.payload_dir.resolve() or not path.is_file():
+            raise ValueError(f"Resource not found: {uri}")
+
+        return {
+            "contents": [
+                {"uri": uri, "mimeType": self.MIME_TYPE, "text": path.read_text(encoding="utf-8")}
+            ]
+        }
+
+    def _spill(self, tool_name: str, text: str) -> Path:
+        """Write a payload to the spill directory and return its path."""
+        self.payload_dir.mkdir(parents=True, exist_ok=True)
+        self._cleanup()
+
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in tool_name)
+        path = self.payload_dir / f"{safe_name}-{uuid.uuid4().hex}.json"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def _cleanup(self) -> None:
+        """Remove payloads older than PAYLOAD_TTL_SECONDS."""
+        cutoff = time.time() - PAYLOAD_TTL_SECONDS
+        with os.scandir(self.payload_dir) as it:
+            for entry in it:
+                try:
+                    if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    continue
@@ -6,16 +6,30 @@ and access to 100+ AgentSwarm tools.
 
 Protocol: JSON-RPC 2.0 over stdio transport
 Spec: https://modelcontextprotocol.io/docs/specification
+
+Requests are read continuously and dispatched on an asyncio event loop.
+tools/call requests run concurrently on a bounded thread pool, so a slow
+tool never blocks ping, tools/list or other calls. Responses are written as
+they complete and correlated by request id.
+
+Results are serialized compactly; results larger than ``max_inline_bytes``
+are spilled to disk and returned as a preview plus a resource URI that can be
+fetched with resources/read (and listed with resources/list).
 """
 
+import asyncio
 import json
 import logging
 import sys
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from .config import MCPConfig
+from .payloads import PayloadStore, dumps
 from .tools import ToolRegistry
 
 # Configure logging
@@ -38,6 +52,9 @@ class MCPServer:
     Handles:
     - tools/list: List all available tools
     - tools/call: Execute a tool with parameters
+    - resources/list: List spilled (oversized) tool results
+    - resources/read: Fetch a spilled (oversized) tool result
+    - notifications/cancelled: Cancel an in-flight request
     - Error handling per MCP specification
     - Request/response formatting
     """
@@ -45,6 +62,9 @@ class MCPServer:
     VERSION = "1.0.0"
     PROTOCOL_VERSION = "2024-11-05"
 
+    # JSON-RPC error code for requests that exceed request_timeout
+    REQUEST_TIMEOUT_CODE = -32001
+
     def __init__(self, config: Optional[MCPConfig] = None):
         """
         Initialize MCP server.
@@ -55,6 +75,11 @@ class MCPServer:
         self.config = config or MCPConfig()
         self.tool_registry = ToolRegistry(self.config)
         self.request_counter = 0
+        self._counter_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Dict[Any, asyncio.Task] = {}
+        self._write_lock = threading.Lock()
+        self.payloads = PayloadStore(self.config.max_inline_bytes, self.config.payload_dir)
 
         logger.info(f"MCP Server v{self.VERSION} initializing...")
         logger.info(f"Tool categories enabled: {self.config.enabled_categories}")
@@ -75,12 +100,14 @@ class MCPServer:
         Returns:
             JSON-RPC 2.0 response
         """
-        self.request_counter += 1
+        with self._counter_lock:
+            self.request_counter += 1
+            request_number = self.request_counter
         request_id = request.get("id")
         method = request.get("method")
         params = request.get("params", {})
 
-        logger.info(f"Request #{self.request_counter}: {method} (id={request_id})")
+        logger.info(f"Request #{request_number}: {method} (id={request_id})")
 
         try:
             # Route request to appropriate handler
@@ -90,6 +117,10 @@ class MCPServer:
                 result = self._handle_list_tools(params)
             elif method == "tools/call":
                 result = self._handle_call_tool(params)
+            elif method == "resources/list":
+                result = self._handle_list_resources(params)
+            elif method == "resources/read":
+                result = self._handle_read_resource(params)
             elif method == "ping":
                 result = {"status": "ok", "timestamp": datetime.utcnow().isoformat()}
             else:
@@ -110,7 +141,10 @@ class MCPServer:
         return {
             "protocolVersion": self.PROTOCOL_VERSION,
             "serverInfo": {"name": "agentswarm-tools", "version": self.VERSION},
-            "capabilities": {"tools": {"listChanged": False}},
+            "capabilities": {
+                "tools": {"listChanged": False},
+                "resources": {"subscribe": False, "listChanged": False},
+            },
         }
 
     def _handle_list_tools(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -161,10 +195,10 @@ class MCPServer:
         try:
             result = self.tool_registry.execute_tool(tool_class, arguments)
 
-            # Format response per MCP spec
-            return {
-                "content": [{"type": "text", "text": json.dumps(result, indent=2, default=str)}]
-            }
+            # Format response per MCP spec (large results are spilled to a resource)
+            text, size_bytes = self.payloads.render(tool_name, result)
+            self._record_response_size(tool_name, size_bytes)
+            return {"content": [{"type": "text", "text": text}]}
 
         except Exception as e:
             logger.error(f"Error executing tool {tool_name}: {e}\n{traceback.format_exc()}")
@@ -176,10 +210,48 @@ class MCPServer:
             }
 
             return {
-                "content": [{"type": "text", "text": json.dumps(error_result, indent=2)}],
+                "content": [{"type": "text", "text": dumps(error_result)}],
                 "isError": True,
             }
 
+    def _handle_list_resources(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle resources/list request.
+
+        Returns the spilled tool results that can still be read.
+        """
+        return self.payloads.list()
+
+    def _handle_read_resource(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle resources/read request.
+
+        Only payloads spilled by this server can be read.
+
+        Args:
+            params: Must contain 'uri'
+
+        Returns:
+            Resource contents
+        """
+        uri = params.get("uri")
+        if not uri:
+            raise ValueError("Missing required parameter: uri")
+
+        return self.payloads.read(uri)
+
+    def _record_response_size(self, tool_name: str, size_bytes: int) -> None:
+        """Record serialized result size in performance monitoring."""
+        if not self.config.enable_analytics:
+            return
+
+        try:
+            from shared.monitoring import record_response_size
+
+            record_response_size(tool_name, size_bytes, source="mcp")
+        except Exception as e:
+            logger.debug(f"Could not record response size for {tool_name}: {e}")
+
     def _success_response(self, request_id: Any, result: Any) -> Dict[str, Any]:
         """
         Create JSON-RPC 2.0 success response.
@@ -213,48 +285,175 @@ class MCPServer:
 
         Reads JSON-RPC requests from stdin and writes responses to stdout.
         """
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            logger.info("MCP Server shutting down (keyboard interrupt)")
+        except Exception as e:
+            logger.error(f"Fatal error: {e}\n{traceback.format_exc()}")
+            sys.exit(1)
+
+    async def run_async(self):
+        """
+        Serve requests from stdin until EOF.
+
+        Each request is dispatched as its own task; responses are written in
+        completion order. On EOF, in-flight requests are allowed to finish.
+        """
         logger.info(f"MCP Server v{self.VERSION} started")
         logger.info(f"Ready to serve {len(self.tools)} tools")
 
+        loop = asyncio.get_running_loop()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.max_concurrent_requests),
+            thread_name_prefix="mcp-tool",
+        )
+
         # Send ready signal
         sys.stderr.write("MCP Server ready\n")
         sys.stderr.flush()
 
         try:
-            for line in sys.stdin:
-                line = line.strip()
+            while True:
+                line = await loop.run_in_executor(None, sys.stdin.readline)
                 if not line:
-                    continue
+                    break
 
-                try:
-                    # Parse request
-                    request = json.loads(line)
+                line = line.strip()
+                if line:
+                    self._handle_line(line)
 
-                    # Handle request
-                    response = self.handle_request(request)
+            if self._in_flight:
+                logger.info(f"Waiting for {len(self._in_flight)} in-flight requests")
+                await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
 
-                    # Send response
-                    output = json.dumps(response)
-                    print(output)
-                    sys.stdout.flush()
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
-                except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON: {e}")
-                    error_response = self._error_response(None, -32700, "Parse error: Invalid JSON")
-                    print(json.dumps(error_response))
-                    sys.stdout.flush()
+    def _handle_line(self, line: str) -> None:
+        """Parse one stdin line and dispatch it without waiting for the result."""
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON: {e}")
+            self._write_message(self._error_response(None, -32700, "Parse error: Invalid JSON"))
+            return
+
+        if not isinstance(request, dict):
+            self._write_message(self._error_response(None, -32600, "Invalid request"))
+            return
+
+        # Notifications carry no id and never get a response
+        if "id" not in request:
+            self._handle_notification(request)
+            return
+
+        request_id = request["id"]
+        task = asyncio.create_task(self._dispatch(request))
+        self._in_flight[request_id] = task
+        task.add_done_callback(lambda _: self._forget(request_id, task))
+
+    def _forget(self, request_id: Any, task: asyncio.Task) -> None:
+        """Drop a finished task from the in-flight table (unless the id was reused)."""
+        if self._in_flight.get(request_id) is task:
+            del self._in_flight[request_id]
+
+    def _handle_notification(self, notification: Dict[str, Any]) -> None:
+        """
+        Handle a JSON-RPC notification.
 
-                except Exception as e:
-                    logger.error(f"Error processing request: {e}\n{traceback.format_exc()}")
-                    error_response = self._error_response(None, -32603, f"Internal error: {str(e)}")
-                    print(json.dumps(error_response))
-                    sys.stdout.flush()
+        notifications/cancelled cancels the matching in-flight request; no
+        response is sent for a cancelled request. A tool already running on
+        the pool cannot be interrupted, but its result is discarded.
+        """
+        method = notification.get("method")
+        params = notification.get("params") or {}
+
+        if method == "notifications/cancelled":
+            request_id = params.get("requestId")
+            task = self._in_flight.get(request_id)
+            if task:
+                logger.info(f"Cancelling request id={request_id}: {params.get('reason', '')}")
+                task.cancel()
+            else:
+                logger.debug(f"Cancel for unknown or finished request id={request_id}")
+        else:
+            logger.debug(f"Ignoring notification: {method}")
 
-        except KeyboardInterrupt:
-            logger.info("MCP Server shutting down (keyboard interrupt)")
+    async def _dispatch(self, request: Dict[str, Any]) -> None:
+        """Handle one request and write its response when done."""
+        request_id = request.get("id")
+
+        if request.get("method") != "tools/call":
+            # initialize/ping/tools/list are cheap; answer inline
+            self._write_message(self.handle_request(request))
+            return
+
+        loop = asyncio.get_running_loop()
+        timeout = self.config.request_timeout or None
+        progress = self._start_progress(request)
+
+        try:
+            response = await asyncio.wait_for(
+                loop.run_in_executor(self._executor, self.handle_request, request),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Request id={request_id} timed out after {timeout}s")
+            response = self._error_response(
+                request_id, self.REQUEST_TIMEOUT_CODE, f"Request timed out after {timeout}s"
+            )
+        except asyncio.CancelledError:
+            logger.info(f"Request id={request_id} cancelled")
+            raise
         except Exception as e:
-            logger.error(f"Fatal error: {e}\n{traceback.format_exc()}")
-            sys.exit(1)
+            logger.error(f"Error processing request: {e}\n{traceback.format_exc()}")
+            response = self._error_response(request_id, -32603, f"Internal error: {str(e)}")
+        finally:
+            if progress:
+                progress.cancel()
+
+        self._write_message(response)
+
+    def _start_progress(self, request: Dict[str, Any]) -> Optional[asyncio.Task]:
+        """Start progress heartbeats if the client sent a progressToken."""
+        params = request.get("params") or {}
+        token = (params.get("_meta") or {}).get("progressToken")
+        if token is None or not self.config.progress_interval:
+            return None
+
+        return asyncio.create_task(self._send_progress(token, params.get("name")))
+
+    async def _send_progress(self, token: Any, tool_name: Optional[str]) -> None:
+        """
+        Emit notifications/progress every progress_interval seconds.
+
+        Tools do not report fractional progress, so ``progress`` is the
+        elapsed time in seconds and no ``total`` is sent.
+        """
+        start = time.monotonic()
+        while True:
+            await asyncio.sleep(self.config.progress_interval)
+            elapsed = round(time.monotonic() - start, 1)
+            self._write_message(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "notifications/progress",
+                    "params": {
+                        "progressToken": token,
+                        "progress": elapsed,
+                        "message": f"{tool_name} running for {elapsed}s",
+                    },
+                }
+            )
+
+    def _write_message(self, message: Dict[str, Any]) -> None:
+        """Write one JSON-RPC message line to stdout."""
+        line = dumps(message) + "\n"
+        with self._write_lock:
+            sys.stdout.write(line)
+            sys.stdout.flush()
 
 
 def main():
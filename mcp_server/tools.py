@@ -3,7 +3,7 @@ Tool Discovery and Adaptation for MCP Server
 
 Discovers all AgentSwarm tools and adapts them to MCP format.
 Handles:
-- Auto-discovery from tool directories
+- Auto-discovery from tool directories (served from a cached catalog)
 - Pydantic schema to JSON Schema conversion
 - Tool execution and parameter mapping
 """
@@ -14,7 +14,7 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Iterator, List, Optional, Type, Union
 
 from pydantic import Field
 from pydantic.fields import FieldInfo
@@ -23,6 +23,9 @@ from pydantic.fields import FieldInfo
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from shared.base import BaseTool
+from shared.tool_index import ToolIndexEntry, get_tool_index
+
+from .catalog import CatalogEntry, ToolCatalog
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +51,7 @@ class ToolRegistry:
         self.config = config
         self.tools_dir = self._get_tools_directory()
         self._tool_cache = {}
+        self.catalog = ToolCatalog(self, getattr(config, "tool_catalog_path", None))
 
     def _get_tools_directory(self) -> Path:
         """Get absolute path to tools directory."""
@@ -59,21 +63,27 @@ class ToolRegistry:
 
         return tools_dir
 
-    def discover_tools(self) -> Dict[str, Type[BaseTool]]:
+    def discover_tools(self) -> Dict[str, Union[Type[BaseTool], CatalogEntry]]:
         """
         Discover all available tools from enabled categories.
 
+        With ``use_tool_catalog`` enabled (default) tools come from the cached
+        catalog: values are CatalogEntry objects whose modules are imported on
+        first use, and only changed tool directories are re-imported.
+
         Returns:
-            Dict mapping tool_name -> tool_class
+            Dict mapping tool_name -> tool_class (or CatalogEntry)
         """
         if self._tool_cache:
             return self._tool_cache
 
-        tools = {}
-
-        for category in self.config.enabled_categories:
-            category_tools = self._discover_category_tools(category)
-            tools.update(category_tools)
+        if getattr(self.config, "use_tool_catalog", False):
+            tools = self.catalog.load_or_build()
+        else:
+            tools = {}
+            for category in self.config.enabled_categories:
+                category_tools = self._discover_category_tools(category)
+                tools.update(category_tools)
 
         self._tool_cache = tools
         return tools
@@ -98,20 +108,7 @@ class ToolRegistry:
 
         logger.info(f"Discovering tools in category: {category} ({category_path})")
 
-        # Walk through category directory
-        for tool_dir in category_path.rglob("*"):
-            if not tool_dir.is_dir():
-                continue
-
-            # Skip __pycache__ and hidden directories
-            if tool_dir.name.startswith("__") or tool_dir.name.startswith("."):
-                continue
-
-            # Look for __init__.py
-            init_file = tool_dir / "__init__.py"
-            if not init_file.exists():
-                continue
-
+        for tool_dir in self._iter_tool_dirs(category):
             # Try to load tool
             try:
                 tool_class = self._load_tool_from_directory(tool_dir)
@@ -126,6 +123,41 @@ class ToolRegistry:
 
         return tools
 
+    def _iter_index_entries(self, category: str) -> Iterator[ToolIndexEntry]:
+        """
+        Yield shared tool index entries under a category path (no imports).
+
+        Args:
+            category: Category name
+
+        Yields:
+            ToolIndexEntry objects, one per tool directory, in path order
+        """
+        category_path = self._get_category_path(category)
+        if not category_path or not category_path.exists():
+            return
+
+        prefix = category_path.relative_to(self.tools_dir).as_posix() + "/"
+        seen = set()
+        index = get_tool_index(self.tools_dir)
+        for entry in sorted(index.values(), key=lambda e: e.path):
+            if entry.path.startswith(prefix) and entry.directory not in seen:
+                seen.add(entry.directory)
+                yield entry
+
+    def _iter_tool_dirs(self, category: str) -> Iterator[Path]:
+        """
+        Yield tool directories for a category (no imports).
+
+        Args:
+            category: Category name
+
+        Yields:
+            Tool directories from the shared tool index
+        """
+        for entry in self._iter_index_entries(category):
+            yield self.tools_dir / entry.directory
+
     def _get_category_path(self, category: str) -> Optional[Path]:
         """
         Get filesystem path for a category.
@@ -202,18 +234,24 @@ class ToolRegistry:
 
         return None
 
-    def generate_tool_schema(self, tool_class: Type[BaseTool]) -> Dict[str, Any]:
+    def generate_tool_schema(
+        self, tool_class: Union[Type[BaseTool], CatalogEntry]
+    ) -> Dict[str, Any]:
         """
         Generate MCP tool schema from AgentSwarm tool.
 
         Converts Pydantic model to JSON Schema format per MCP spec.
+        Catalog entries return their precomputed schema without importing.
 
         Args:
-            tool_class: Tool class
+            tool_class: Tool class or CatalogEntry
 
         Returns:
             MCP tool schema dict
         """
+        if isinstance(tool_class, CatalogEntry):
+            return tool_class.schema
+
         # Get tool metadata
         tool_name = getattr(tool_class, "tool_name", tool_class.__name__)
         description = tool_class.__doc__ or f"AgentSwarm tool: {tool_name}"
@@ -376,12 +414,14 @@ class ToolRegistry:
 
         return False
 
-    def execute_tool(self, tool_class: Type[BaseTool], arguments: Dict[str, Any]) -> Any:
+    def execute_tool(
+        self, tool_class: Union[Type[BaseTool], CatalogEntry], arguments: Dict[str, Any]
+    ) -> Any:
         """
         Execute a tool with given arguments.
 
         Args:
-            tool_class: Tool class to execute
+            tool_class: Tool class (or CatalogEntry, imported on first call)
             arguments: Tool arguments
 
         Returns:
@@ -409,6 +449,9 @@ class ToolRegistry:
             ]
         }
 
+        if isinstance(tool_class, CatalogEntry):
+            tool_class = tool_class.load()
+
         # Create tool instance
         tool_instance = tool_class(**filtered_args)
 
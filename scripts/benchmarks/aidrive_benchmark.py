@@ -0,0 +1,112 @@
+"""
+AI Drive storage benchmark.
+
+Times, against a fresh chunk store:
+
+- uploading --files files of --size MiB, each a shared base plus a few edited
+  chunks, and the space deduplication saves;
+- uploading and reading back compressible text with and without compression;
+- reading a 4 KiB range from the middle of a file against reading the whole
+  file and slicing it (what the previous base64 download path had to do).
+
+Usage:
+    python scripts/benchmarks/aidrive_benchmark.py [--files 8] [--size 16]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools.infrastructure.storage.aidrive_tool.blob_store import (  # noqa: E402
+    ZSTD_AVAILABLE,
+    BlobStore,
+)
+
+MIB = 1024 * 1024
+
+
+def timed(label: str, size: int, run) -> float:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {elapsed * 1000:>9.1f} ms {size / MIB / elapsed:>9.1f} MiB/s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the AI Drive chunk store")
+    parser.add_argument("--files", type=int, default=8, help="Near-duplicate files to upload")
+    parser.add_argument("--size", type=int, default=16, help="File size in MiB")
+    args = parser.parse_args()
+
+    size = args.size * MIB
+    base = bytearray(os.urandom(size))
+    text = b"".join(
+        b"%08d INFO request handled in %d ms\n" % (n, n % 97) for n in range(size // 40)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = BlobStore(Path(tmp) / "drive")
+
+        print(f"\n{'=' * 72}")
+        print(f"Upload: {args.files} files of {args.size} MiB sharing most chunks")
+        print(f"{'=' * 72}")
+
+        def upload_variants() -> None:
+            for n in range(args.files):
+                variant = bytearray(base)
+                variant[n * MIB : n * MIB + 16] = os.urandom(16)
+                store.put_bytes(f"variant-{n}", bytes(variant))
+
+        timed(f"put {args.files} near-duplicate files", size * args.files, upload_variants)
+        usage = store.usage()
+        print(
+            f"  logical {usage['logical_bytes'] / MIB:.0f} MiB, "
+            f"stored {usage['unique_bytes'] / MIB:.0f} MiB "
+            f"({usage['logical_bytes'] / usage['unique_bytes']:.1f}x deduplication)"
+        )
+        timed("read one file back", size, lambda: store.read_bytes("variant-0"))
+
+        codec = "zstd" if ZSTD_AVAILABLE else "zlib"
+        print(f"\n{'=' * 72}")
+        print(f"Compressible text: {len(text) / MIB:.0f} MiB log lines ({codec})")
+        print(f"{'=' * 72}")
+        for compress in (False, True):
+            label = "compressed" if compress else "raw"
+            # A store per mode, so the second upload is not deduplicated away
+            text_store = BlobStore(Path(tmp) / f"text-{label}")
+            info = {}
+            timed(
+                f"put {label}",
+                len(text),
+                lambda: info.update(text_store.put_bytes("log", text, compress)),
+            )
+            timed(f"read {label}", len(text), lambda: text_store.read_bytes("log"))
+            print(f"  stored {info['stored_bytes'] / MIB:.1f} MiB")
+
+        print(f"\n{'=' * 72}")
+        print(f"Ranged read: 4 KiB from the middle of a {args.size} MiB file (mean of 100)")
+        print(f"{'=' * 72}")
+        middle = size // 2
+        for label, read in (
+            (
+                "whole file, then slice",
+                lambda: store.read_bytes("variant-0")[middle : middle + 4096],
+            ),
+            ("read_bytes(offset, length)", lambda: store.read_bytes("variant-0", middle, 4096)),
+        ):
+            start = time.perf_counter()
+            for _ in range(100):
+                assert len(read()) == 4096
+            mean_us = (time.perf_counter() - start) / 100 * 1e6
+            print(f"  {label:<42} {mean_us:>9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+CLI cold-start regression benchmark.
+
+Runs ``python -X importtime -m cli.main <command>`` in fresh processes and
+reports, per command, the import time spent from ``cli`` onwards (interpreter
+startup and ``site`` are excluded), wall-clock time, and the heaviest
+top-level imports. Exits non-zero when a command fails or exceeds its import
+budget, so it can run in CI.
+
+Usage:
+    python scripts/benchmarks/cli_startup_benchmark.py [--runs 5] [--budget-scale 1.0]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# (label, argv, import budget in ms)
+COMMANDS: List[Tuple[str, List[str], float]] = [
+    ("--help", ["--help"], 50.0),
+    ("list", ["list", "--format", "json"], 80.0),
+    ("info", ["info", "text_formatter", "--format", "json"], 400.0),
+    ("run", ["run", "text_formatter", "-p", '{"text": "hello", "operations": ["upper"]}'], 400.0),
+]
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)")
+
+
+@dataclass
+class StartupSample:
+    """One process run."""
+
+    import_ms: float
+    wall_ms: float
+    top_imports: Dict[str, float]
+
+
+def parse_importtime(stderr: str) -> Tuple[float, Dict[str, float]]:
+    """
+    Sum top-level import time from the first ``cli`` import onwards.
+
+    Returns:
+        Tuple of (total import ms, {top-level module: cumulative ms})
+    """
+    top: Dict[str, float] = {}
+    started = False
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+
+        cumulative_us, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        if indent != 1:
+            continue
+        if name.split(".")[0] == "cli":
+            started = True
+        if started:
+            top[name] = top.get(name, 0.0) + cumulative_us / 1000
+    return sum(top.values()), top
+
+
+def run_command(argv: List[str]) -> StartupSample:
+    """Run one CLI process and collect timings."""
+    env = dict(os.environ, USE_MOCK_APIS="true", ANALYTICS_ENABLED="false")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "cli.main"] + argv,
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        # A failing command exits early, so its timings would look like a speedup
+        errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        raise SystemExit(
+            f"cli.main {' '.join(argv)} exited with {proc.returncode}:\n" + "\n".join(errors)
+        )
+    import_ms, top = parse_importtime(proc.stderr)
+    return StartupSample(import_ms=import_ms, wall_ms=wall_ms, top_imports=top)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark CLI cold start against budgets")
+    parser.add_argument("--runs", type=int, default=5, help="Processes per command")
+    parser.add_argument(
+        "--budget-scale", type=float, default=1.0, help="Multiply budgets (slow CI machines)"
+    )
+    parser.add_argument("--top", type=int, default=3, help="Heaviest imports to show")
+    args = parser.parse_args()
+
+    print(f"\n{'='*78}")
+    print(f"CLI Cold Start ({args.runs} runs, median)")
+    print(f"{'='*78}")
+    print(f"{'Command':<10} {'Imports (ms)':>13} {'Budget (ms)':>12} {'Wall (ms)':>10}  Status")
+    print("-" * 78)
+
+    over_budget = []
+    for label, argv, budget in COMMANDS:
+        budget *= args.budget_scale
+        samples = [run_command(argv) for _ in range(args.runs)]
+        import_ms = statistics.median(s.import_ms for s in samples)
+        wall_ms = statistics.median(s.wall_ms for s in samples)
+
+        status = "ok" if import_ms <= budget else "OVER BUDGET"
+        if import_ms > budget:
+            over_budget.append(label)
+        print(f"{label:<10} {import_ms:>13.1f} {budget:>12.1f} {wall_ms:>10.1f}  {status}")
+
+        heaviest = sorted(samples[-1].top_imports.items(), key=lambda kv: kv[1], reverse=True)
+        for name, ms in heaviest[: args.top]:
+            print(f"{'':<12}{name:<40} {ms:>8.1f} ms")
+
+    if over_budget:
+        print(f"\nOver budget: {', '.join(over_budget)}")
+        return 1
+
+    print("\nAll commands within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""
+Edit engine benchmark: MultieditTool and EditTool on a large file.
+
+Generates a source-like file of --size-mb megabytes and a random mix of
+--edits line inserts, deletes and replaces, then times:
+
+- the previous MultieditTool algorithm (re-split and re-join the whole
+  content per line edit, str.replace per replace) on the first --naive-edits
+  edits, extrapolated to the full count, since it is quadratic;
+- apply_edits + atomic_write for all edits, checking that it produces the
+  same content as the previous algorithm for the shared prefix of edits;
+- a unique EditTool replacement, the previous way (decode, count, replace,
+  diff lines, rewrite) and through the engine.
+
+Usage:
+    python scripts/benchmarks/edit_benchmark.py [--size-mb 50] [--edits 1000] [--naive-edits 20]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.edit_engine import (  # noqa: E402
+    Edit,
+    apply_edits,
+    atomic_write,
+    changed_lines,
+    find_occurrences,
+    read_file,
+    splice,
+)
+
+WORDS = ["alpha", "beta", "gamma", "delta", "value", "result", "config", "handler", "item"]
+
+
+def generate_file(path: Path, size_mb: int, seed: int = 0) -> int:
+    """Write roughly size_mb of Python-like lines; returns the line count."""
+    rng = random.Random(seed)
+    target = size_mb * 1024 * 1024
+    written = 0
+    lines = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < target:
+            block = "".join(
+                f"    {rng.choice(WORDS)}_{i} = {rng.choice(WORDS)}({rng.randint(0, 999)})\n"
+                for i in range(lines, lines + 10000)
+            )
+            f.write(block)
+            written += len(block)
+            lines += 10000
+    return lines
+
+
+def generate_edits(count: int, lines: int, seed: int = 0) -> List[Edit]:
+    """About 45% inserts, 45% deletes, 10% single-line replaces."""
+    rng = random.Random(seed)
+    edits = []
+    for i in range(count):
+        kind = rng.random()
+        if kind < 0.45:
+            edits.append(Edit("insert", line=rng.randrange(lines), text=f"    # note {i}"))
+        elif kind < 0.9:
+            edits.append(Edit("delete", line=rng.randrange(lines)))
+        else:
+            edits.append(Edit("replace", search=f"_{rng.randrange(lines)} =", replace="_x ="))
+    return edits
+
+
+def previous_multiedit(content: str, edits: List[Edit]) -> str:
+    """The MultieditTool algorithm before the edit engine."""
+    for edit in edits:
+        if edit.action == "replace":
+            content = content.replace(edit.search, edit.replace)
+        elif edit.action == "insert":
+            split = content.splitlines(keepends=True)
+            if edit.line >= len(split):
+                split.append(edit.text + "\n")
+            else:
+                split.insert(edit.line, edit.text + "\n")
+            content = "".join(split)
+        else:
+            split = content.splitlines(keepends=True)
+            if edit.line < len(split):
+                del split[edit.line]
+            content = "".join(split)
+    return content
+
+
+def previous_edit(path: Path, old: str, new: str) -> int:
+    """The EditTool algorithm before the edit engine."""
+    with open(path, "r", encoding="utf-8") as f:
+        original = f.read()
+    occurrences = original.count(old)
+    updated = original.replace(old, new, 1)
+    original_lines = original.splitlines()
+    new_lines = updated.splitlines()
+    changed = sum(1 for a, b in zip(original_lines, new_lines) if a != b)
+    changed += abs(len(original_lines) - len(new_lines))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(updated)
+    return occurrences
+
+
+def engine_edit(path: Path, old: str, new: str) -> int:
+    data = read_file(str(path))
+    offsets = find_occurrences(data, old.encode(), limit=2)
+    atomic_write(str(path), splice(data, offsets[:1], len(old.encode()), new.encode()))
+    changed_lines(data, offsets[:1], old.encode(), new.encode())
+    return len(offsets)
+
+
+def timed(run):
+    start = time.perf_counter()
+    result = run()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the edit engine")
+    parser.add_argument("--size-mb", type=int, default=50, help="File size in MB")
+    parser.add_argument("--edits", type=int, default=1000, help="Edits per MultieditTool call")
+    parser.add_argument(
+        "--naive-edits", type=int, default=20, help="Edits timed with the previous algorithm"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "big.py"
+        print(f"Generating {args.size_mb} MB file...")
+        lines = generate_file(path, args.size_mb)
+        edits = generate_edits(args.edits, lines)
+        original = path.read_bytes()
+        naive_count = min(args.naive_edits, len(edits))
+
+        naive_ms, expected = timed(
+            lambda: previous_multiedit(original.decode(), edits[:naive_count])
+        )
+        prefix = apply_edits(original, edits[:naive_count])
+        prefix_ok = b"".join(bytes(c) for c in prefix.chunks) == expected.encode()
+
+        def engine_run() -> None:
+            result = apply_edits(read_file(str(path)), edits)
+            atomic_write(str(path), result.chunks)
+
+        engine_ms, _ = timed(engine_run)
+        extrapolated_ms = naive_ms / max(naive_count, 1) * len(edits)
+
+        path.write_bytes(original)
+        unique = "_12345 ="
+        previous_edit_ms, _ = timed(lambda: previous_edit(path, unique, "_y ="))
+        path.write_bytes(original)
+        engine_edit_ms, _ = timed(lambda: engine_edit(path, unique, "_y ="))
+
+        print(f"\n{'='*72}")
+        print(f"Edits on a {len(original) / 1024 / 1024:.0f} MB file ({lines} lines)")
+        print(f"{'='*72}")
+        print(f"{'Mode':<44} {'Time (ms)':>12}")
+        print("-" * 72)
+        print(f"{f'MultiEdit, previous ({naive_count} edits)':<44} {naive_ms:>12.0f}")
+        print(
+            f"{f'MultiEdit, previous ({len(edits)} edits, extrapolated)':<44} "
+            f"{extrapolated_ms:>12.0f}"
+        )
+        marker = "" if prefix_ok else "  RESULTS DIFFER"
+        label = f"MultiEdit, engine ({len(edits)} edits, incl. write)"
+        print(f"{label:<44} {engine_ms:>12.0f}{marker}")
+        print(f"{'Edit, previous (unique replace)':<44} {previous_edit_ms:>12.0f}")
+        print(f"{'Edit, engine (unique replace)':<44} {engine_edit_ms:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+File format conversion throughput benchmark.
+
+Generates --rows rows of mixed-type data as CSV, converts it into every
+tabular source format the installed packages support, then times every
+supported (source, target) pair and prints input MiB/s and rows/s.
+
+Finally converts --files copies of the CSV to JSON one after another and
+with convert_files() in parallel processes.
+
+Usage:
+    python scripts/benchmarks/format_converter_benchmark.py [--rows 200000] [--files 8]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools.infrastructure.storage.file_format_converter.converters import (  # noqa: E402
+    ARROW_AVAILABLE,
+    ROW_READERS,
+    ConversionJob,
+    convert_file,
+    convert_files,
+    get_converter,
+)
+
+MIB = 1024 * 1024
+TABULAR = ["csv", "tsv", "json", "jsonl", "parquet", "xlsx", "md"]
+
+
+def write_source(path: Path, rows: int) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "name", "amount", "active", "comment"])
+        for n in range(rows):
+            writer.writerow([n, f"user-{n % 5000}", f"{n * 0.37:.2f}", n % 3 == 0, f"note {n}, ok"])
+
+
+def available(source: str, target: str) -> bool:
+    converter = get_converter(source, target)
+    return converter is not None and not converter.missing_dependencies()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark file format conversions")
+    parser.add_argument("--rows", type=int, default=200000, help="Rows in the source data")
+    parser.add_argument("--files", type=int, default=8, help="Files for the parallel run")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel processes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sources = {"csv": tmp / "source.csv"}
+        write_source(sources["csv"], args.rows)
+        for fmt in TABULAR:
+            if fmt != "csv" and fmt in ROW_READERS | {"parquet": None} and available("csv", fmt):
+                sources[fmt] = tmp / f"source.{fmt}"
+                convert_file(ConversionJob(str(sources["csv"]), str(sources[fmt]), "csv", fmt))
+
+        engine = "Arrow batches" if ARROW_AVAILABLE else "row batches (pyarrow not installed)"
+        print(f"\n{'=' * 72}")
+        print(f"Conversions of {args.rows} rows, {engine}")
+        print(f"{'=' * 72}")
+        print(f"{'pair':<20} {'in MiB':>8} {'out MiB':>8} {'ms':>9} {'MiB/s':>8} {'rows/s':>11}")
+
+        for source, path in sources.items():
+            for target in TABULAR:
+                if target == source or not available(source, target):
+                    continue
+                out = tmp / f"out.{source}.{target}"
+                result = convert_file(ConversionJob(str(path), str(out), source, target))
+                print(
+                    f"{source + ' -> ' + target:<20} {result.bytes_in / MIB:>8.1f} "
+                    f"{result.bytes_out / MIB:>8.1f} {result.seconds * 1000:>9.1f} "
+                    f"{result.bytes_in / MIB / result.seconds:>8.1f} "
+                    f"{result.units / result.seconds:>11,.0f}"
+                )
+                out.unlink()
+
+        print(f"\n{'=' * 72}")
+        print(f"{args.files} files csv -> json, sequential vs parallel")
+        print(f"{'=' * 72}")
+        jobs = []
+        for n in range(args.files):
+            copy = tmp / f"part{n}.csv"
+            os.link(sources["csv"], copy)
+            jobs.append(ConversionJob(str(copy), str(tmp / f"part{n}.json"), "csv", "json"))
+
+        start = time.perf_counter()
+        for job in jobs:
+            convert_file(job)
+        sequential_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = convert_files(jobs, args.workers)
+        parallel_s = time.perf_counter() - start
+        assert all(r.error is None for r in results), [r.error for r in results]
+
+        print(f"{'One after another':<44} {sequential_s * 1000:>9.1f} ms")
+        print(f"{'convert_files()':<44} {parallel_s * 1000:>9.1f} ms")
+        print("-" * 72)
+        print(f"Parallel speedup:      {sequential_s / parallel_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+GrepTool search engine benchmark over a generated source tree.
+
+Generates a corpus of small Python-like files (a few of them large enough to
+be memory-mapped), then times a naive read + re.search scan against
+SearchEngine in-process and with a process pool, and checks that all modes
+find the same files.
+
+Usage:
+    python scripts/benchmarks/grep_benchmark.py [--files 100000] [--runs 3] [--workers N]
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools.infrastructure.execution.grep_tool.search_engine import (  # noqa: E402
+    SearchEngine,
+    SearchSpec,
+    default_workers,
+)
+
+FILES_PER_DIR = 500
+WORDS = ["alpha", "beta", "gamma", "delta", "value", "result", "config", "handler", "item"]
+
+
+def generate_corpus(root: Path, files: int, seed: int = 0) -> List[Path]:
+    """Write the corpus; about 1% of files contain the needle, 0.1% are large."""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(files):
+        directory = root / f"pkg_{i // FILES_PER_DIR:04d}"
+        directory.mkdir(exist_ok=True)
+        lines = [
+            f"def {rng.choice(WORDS)}_{j}({rng.choice(WORDS)}):\n"
+            f"    return {rng.choice(WORDS)} + {j}\n"
+            for j in range(rng.randint(5, 40) * (200 if i % 1000 == 999 else 1))
+        ]
+        if i % 100 == 0:
+            lines.insert(rng.randrange(len(lines)), "    # TODO: handle needle_case here\n")
+        path = directory / f"module_{i}.py"
+        path.write_text("".join(lines))
+        paths.append(path)
+    return paths
+
+
+def naive_search(paths: List[Path], pattern: re.Pattern) -> List[str]:
+    """The pre-engine approach: decode every file and run the regex."""
+    found = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            if pattern.search(f.read()):
+                found.append(str(path))
+    return found
+
+
+def measure(run: Callable[[], List[str]], runs: int) -> Tuple[float, List[str]]:
+    """Median wall time in ms and the last result."""
+    timings: List[float] = []
+    results: List[str] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        results = run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the GrepTool search engine")
+    parser.add_argument("--files", type=int, default=100000, help="Files in the corpus")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per mode")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="Process pool size")
+    parser.add_argument("--pattern", default=r"TODO: handle \w+_case", help="Regex to search")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Generating {args.files} files...")
+        paths = generate_corpus(Path(tmp), args.files)
+        pattern = re.compile(args.pattern)
+        spec = SearchSpec(pattern=args.pattern)
+
+        modes = [
+            ("Naive read + re", lambda: naive_search(paths, pattern)),
+            (
+                "Engine, in-process",
+                lambda: [m.path for m in SearchEngine(spec, workers=1).search(paths)],
+            ),
+            (
+                f"Engine, {args.workers} workers",
+                lambda: [m.path for m in SearchEngine(spec, workers=args.workers).search(paths)],
+            ),
+        ]
+
+        print(f"\n{'='*70}")
+        print(f"Grep: {args.files} files, /{args.pattern}/ ({args.runs} runs, median)")
+        print(f"{'='*70}")
+        print(f"{'Mode':<28} {'Matches':>8} {'Total (ms)':>12} {'Files/s':>12}")
+        print("-" * 70)
+
+        baseline = None
+        for name, run in modes:
+            median_ms, results = measure(run, args.runs)
+            baseline = baseline if baseline is not None else results
+            marker = "" if results == baseline else "  RESULTS DIFFER"
+            rate = args.files / (median_ms / 1000) if median_ms else 0.0
+            print(f"{name:<28} {len(results):>8} {median_ms:>12.1f} {rate:>12.0f}{marker}")
+
+
+if __name__ == "__main__":
+    main()
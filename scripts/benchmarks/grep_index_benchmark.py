@@ -0,0 +1,131 @@
+"""
+GrepTool trigram index benchmark over a generated source tree.
+
+Builds the persistent trigram index for a generated corpus (see
+grep_benchmark.py), then compares query latency of a full scan (walk + search
+every file, as GrepTool does without use_index) with an indexed query
+(refresh + candidate lookup + regex verification), and checks that both find
+the same files. Also reports the cost of refreshing after edits.
+
+Usage:
+    python scripts/benchmarks/grep_index_benchmark.py [--files 100000] [--runs 3]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from grep_benchmark import generate_corpus  # noqa: E402
+
+from shared.file_walker import RACY_WINDOW_NS, FileWalker  # noqa: E402
+from tools.infrastructure.execution.grep_tool.search_engine import (  # noqa: E402
+    SearchEngine,
+    SearchSpec,
+)
+from tools.infrastructure.execution.grep_tool.trigram_index import TrigramIndex  # noqa: E402
+
+PATTERNS = [
+    ("Rare literal", r"TODO: handle \w+_case", 0),
+    ("Identifier", r"def handler_1\b", 0),
+    ("Alternation", r"needle_case|alpha_7\(", 0),
+    ("Case-insensitive", r"todo: HANDLE", re.IGNORECASE),
+    ("Not indexable", r"\d{2}\)", 0),
+]
+
+
+def full_scan(root: str, pattern: str, flags: int) -> List[str]:
+    """Walk and search every file."""
+    paths = [entry.path for entry in FileWalker(root)]
+    spec = SearchSpec(pattern=pattern, flags=flags)
+    return [m.path for m in SearchEngine(spec, workers=1).search(paths)]
+
+
+def indexed_scan(index: TrigramIndex, root: str, pattern: str, flags: int) -> List[str]:
+    """Refresh the index and search only candidate files."""
+    paths, candidates = index.candidates(pattern, flags)
+    files = [os.path.join(root, p) for p in paths if candidates is None or p in candidates]
+    spec = SearchSpec(pattern=pattern, flags=flags)
+    return [m.path for m in SearchEngine(spec, workers=1).search(files)]
+
+
+def measure(run: Callable[[], List[str]], runs: int) -> Tuple[float, List[str]]:
+    """Median wall time in ms and the last result."""
+    timings: List[float] = []
+    results: List[str] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        results = run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the GrepTool trigram index")
+    parser.add_argument("--files", type=int, default=100000, help="Files in the corpus")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per query")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "corpus")
+        os.mkdir(root)
+        print(f"Generating {args.files} files...")
+        paths = generate_corpus(Path(root), args.files)
+        # Files modified within the racy window are re-read on the next refresh
+        time.sleep(RACY_WINDOW_NS / 1e9)
+
+        index = TrigramIndex(root, index_path=Path(tmp) / "index.db")
+        start = time.perf_counter()
+        index.refresh()
+        build_s = time.perf_counter() - start
+        index_mb = (Path(tmp) / "index.db").stat().st_size / 1024 / 1024
+        corpus_mb = sum(p.stat().st_size for p in paths) / 1024 / 1024
+
+        print(f"\n{'='*78}")
+        print(f"Grep index: {args.files} files ({args.runs} runs, median)")
+        print(f"{'='*78}")
+        print(f"Build: {build_s:.1f}s, index {index_mb:.1f} MB for {corpus_mb:.1f} MB of source\n")
+        print(
+            f"{'Query':<20} {'Matches':>8} {'Full scan (ms)':>15} "
+            f"{'Indexed (ms)':>13} {'Speedup':>9}"
+        )
+        print("-" * 78)
+
+        for name, pattern, flags in PATTERNS:
+            full_ms, full = measure(lambda: full_scan(root, pattern, flags), args.runs)
+            indexed_ms, indexed = measure(
+                lambda: indexed_scan(index, root, pattern, flags), args.runs
+            )
+            marker = "" if indexed == full else "  RESULTS DIFFER"
+            speedup = full_ms / indexed_ms if indexed_ms else 0.0
+            print(
+                f"{name:<20} {len(full):>8} {full_ms:>15.1f} {indexed_ms:>13.1f} "
+                f"{speedup:>8.1f}x{marker}"
+            )
+
+        # Refresh cost: nothing changed, then 1% of files edited
+        unchanged_ms, _ = measure(index.refresh, args.runs)
+        edited = paths[:: max(1, len(paths) // 100)]
+        future = time.time_ns() + 5_000_000_000
+        for path in edited:
+            path.write_text(path.read_text() + "# edited\n")
+            os.utime(path, ns=(future, future))
+        start = time.perf_counter()
+        index.refresh()
+        edited_ms = (time.perf_counter() - start) * 1000
+
+        print("-" * 78)
+        print(f"Refresh, no changes:        {unchanged_ms:>10.1f} ms")
+        print(f"Refresh, {len(edited)} files edited: {edited_ms:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+MCP server cold-start benchmark.
+
+Starts a fresh Python process per run and measures the time until the server
+has answered ``initialize`` and ``tools/list``, with eager discovery (every
+tool module imported) versus the cached tool catalog (lazy imports).
+
+Usage:
+    python scripts/benchmarks/mcp_startup_benchmark.py [--runs 3]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Runs inside the child process; prints one JSON line with timings
+CHILD_SCRIPT = """
+import json, logging, sys, time
+start = time.perf_counter()
+from mcp_server.config import MCPConfig
+from mcp_server.server import MCPServer
+logging.disable(logging.CRITICAL)
+config = MCPConfig(use_tool_catalog={use_catalog}, tool_catalog_path={catalog_path!r})
+server = MCPServer(config)
+server.handle_request({{"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {{}}}})
+ready = time.perf_counter()
+listing = server.handle_request({{"jsonrpc": "2.0", "id": 2, "method": "tools/list"}})
+listed = time.perf_counter()
+print(json.dumps({{
+    "initialize_ms": (ready - start) * 1000,
+    "tools_list_ms": (listed - start) * 1000,
+    "tools": len(listing["result"]["tools"]),
+    "modules": len(sys.modules),
+}}))
+"""
+
+
+def run_child(use_catalog: bool, catalog_path: str) -> Dict[str, float]:
+    """Start one server process and return its timings."""
+    script = CHILD_SCRIPT.format(use_catalog=use_catalog, catalog_path=catalog_path)
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(name: str, runs: List[Dict[str, float]]) -> None:
+    """Print median timings for a set of runs."""
+    init_ms = statistics.median(r["initialize_ms"] for r in runs)
+    list_ms = statistics.median(r["tools_list_ms"] for r in runs)
+    print(
+        f"{name:<28} {init_ms:>14.1f} {list_ms:>14.1f} "
+        f"{runs[0]['tools']:>7} {runs[0]['modules']:>9}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MCP server cold start")
+    parser.add_argument("--runs", type=int, default=3, help="Processes per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog_path = os.path.join(tmp, "catalog.json")
+
+        print(f"\n{'='*78}")
+        print(f"MCP Server Cold Start ({args.runs} runs, median)")
+        print(f"{'='*78}")
+        print(
+            f"{'Mode':<28} {'initialize (ms)':>14} {'tools/list (ms)':>14} "
+            f"{'Tools':>7} {'Modules':>9}"
+        )
+        print("-" * 78)
+
+        eager = [run_child(False, catalog_path) for _ in range(args.runs)]
+        summarize("Eager discovery", eager)
+
+        build = [run_child(True, catalog_path)]
+        summarize("Catalog (first build)", build)
+
+        cached = [run_child(True, catalog_path) for _ in range(args.runs)]
+        summarize("Catalog (warm manifest)", cached)
+
+
+if __name__ == "__main__":
+    main()
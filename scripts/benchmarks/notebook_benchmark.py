@@ -0,0 +1,165 @@
+"""
+NotebookEditTool benchmark on a large notebook with embedded image outputs.
+
+Generates a notebook of --cells cells where every --image-every-th code cell
+carries a base64 PNG-sized output, for roughly --size-mb megabytes, then
+times:
+
+- the previous edit path (json.load, linear scan for the cell id,
+  json.dump with indent=1) for one replace;
+- NotebookDocument for one replace, cold (index scan) and warm (index cached
+  from the previous save);
+- a batch of --batch replaces in one load/save, against --batch runs of the
+  previous path (extrapolated from one);
+- externalizing outputs above 64 KB.
+
+Each result is checked against the previous path with json.load.
+
+Usage:
+    python scripts/benchmarks/notebook_benchmark.py [--size-mb 200] [--cells 5000] [--batch 50]
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools.infrastructure.execution.notebook_edit_tool import (  # noqa: E402
+    notebook_document,
+)
+from tools.infrastructure.execution.notebook_edit_tool.notebook_document import (  # noqa: E402
+    ORJSON_AVAILABLE,
+    NotebookDocument,
+)
+
+
+def generate_notebook(path: Path, size_mb: int, cells: int, image_every: int) -> Dict[str, Any]:
+    """Write a notebook of about size_mb with cells cells; returns it."""
+    rng = random.Random(0)
+    images = max(1, cells // image_every)
+    image_bytes = size_mb * 1024 * 1024 * 3 // 4 // images
+    image = base64.b64encode(rng.randbytes(image_bytes)).decode("ascii")
+    notebook: Dict[str, Any] = {"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 5}
+    for i in range(cells):
+        cell: Dict[str, Any] = {
+            "cell_type": "code",
+            "execution_count": i,
+            "id": f"cell{i}",
+            "metadata": {},
+            "outputs": [],
+            "source": [f"x_{i} = compute({i})\n", f"plot(x_{i})"],
+        }
+        if i % image_every == 0:
+            cell["outputs"].append(
+                {
+                    "data": {"image/png": image, "text/plain": ["<Figure>"]},
+                    "metadata": {},
+                    "output_type": "display_data",
+                }
+            )
+        notebook["cells"].append(cell)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(notebook, f, indent=1)
+    return notebook
+
+
+def previous_edit(path: Path, cell_id: str, source: str) -> None:
+    """The previous NotebookEditTool replace."""
+    with open(path, "r", encoding="utf-8") as f:
+        notebook = json.load(f)
+    for cell in notebook["cells"]:
+        if cell.get("id") == cell_id:
+            cell["source"] = [source]
+            break
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(notebook, f, indent=1)
+
+
+def document_edit(path: Path, edits: Dict[str, str]) -> None:
+    """Replace cell sources through NotebookDocument in one load/save."""
+    document = NotebookDocument.open(str(path))
+    for cell_id, source in edits.items():
+        document.set_source(document.find(cell_id), [source])
+    document.save()
+
+
+def timed(label: str, run) -> float:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<48} {elapsed * 1000:>10.1f} ms")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark NotebookEditTool editing")
+    parser.add_argument("--size-mb", type=int, default=200, help="Approximate notebook size")
+    parser.add_argument("--cells", type=int, default=5000, help="Cells in the notebook")
+    parser.add_argument("--image-every", type=int, default=25, help="Cells per image output")
+    parser.add_argument("--batch", type=int, default=50, help="Edits in the batch run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp) / "base.ipynb"
+        print(f"Generating {args.size_mb} MB notebook with {args.cells} cells...")
+        generate_notebook(base, args.size_mb, args.cells, args.image_every)
+        size_mb = base.stat().st_size / 1024 / 1024
+        rng = random.Random(1)
+        target = f"cell{args.cells // 2}"
+        batch = {f"cell{rng.randrange(args.cells)}": f"y = {i}" for i in range(args.batch)}
+
+        print(f"\n{'=' * 62}")
+        print(f"Notebook edit: {size_mb:.0f} MB, {args.cells} cells (orjson: {ORJSON_AVAILABLE})")
+        print(f"{'=' * 62}")
+
+        previous = Path(tmp) / "previous.ipynb"
+        current = Path(tmp) / "current.ipynb"
+        shutil.copy(base, previous)
+        shutil.copy(base, current)
+
+        old_s = timed("Previous: one replace", lambda: previous_edit(previous, target, "z = 1"))
+        notebook_document._indexes.clear()
+        cold_s = timed(
+            "Document: one replace, cold index", lambda: document_edit(current, {target: "z = 1"})
+        )
+        warm_s = timed(
+            "Document: one replace, cached index", lambda: document_edit(current, {target: "z = 2"})
+        )
+        previous_edit(previous, target, "z = 2")
+        with open(previous) as f, open(current) as g:
+            assert json.load(f) == json.load(g), "single edit results differ"
+
+        batch_s = timed(
+            f"Document: batch of {args.batch} replaces",
+            lambda: document_edit(current, batch),
+        )
+        print(
+            f"{'Previous: ' + str(args.batch) + ' replaces (extrapolated)':<48} "
+            f"{old_s * args.batch * 1000:>10.1f} ms"
+        )
+
+        def externalize() -> None:
+            document = NotebookDocument.open(str(current))
+            document.limit_outputs(64 * 1024, "externalize", Path(tmp) / "outputs")
+            document.save()
+
+        timed("Document: externalize outputs > 64 KB", externalize)
+        print(f"Size after externalizing: {os.path.getsize(current) / 1024 / 1024:.1f} MB")
+
+        print("-" * 62)
+        print(f"One replace speedup:   cold {old_s / cold_s:.1f}x, cached {old_s / warm_s:.1f}x")
+        print(f"Batch speedup:         {old_s * args.batch / batch_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Parallel pipeline benchmark.
+
+Measures Pipeline.map fan-out (workers=/executor=) and ParallelPipeline
+branch execution against sequential execution for I/O-bound and CPU-bound
+step functions.
+
+Usage:
+    python scripts/benchmarks/parallel_pipeline_benchmark.py [--items 64] [--workers 8]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from typing import Any, Callable, List, Optional
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.pipeline import ParallelPipeline, Pipeline  # noqa: E402
+
+logging.getLogger("shared.pipeline").setLevel(logging.WARNING)
+logging.getLogger("shared.batch").setLevel(logging.WARNING)
+
+
+# Step functions live at module level so they can be pickled to a process pool
+
+
+def io_bound(item: int) -> int:
+    """Simulate an API call (~20ms of blocking I/O)."""
+    time.sleep(0.02)
+    return item * 2
+
+
+def cpu_bound(item: int) -> int:
+    """Burn CPU (~10-20ms of pure Python arithmetic)."""
+    return sum(i * i for i in range(100_000 + item))
+
+
+def load_items(count: int) -> List[int]:
+    """Return the benchmark input."""
+    return list(range(count))
+
+
+def io_branch(data: Any) -> int:
+    """ParallelPipeline branch body for the I/O-bound case."""
+    return sum(io_bound(i) for i in range(10))
+
+
+def cpu_branch(data: Any) -> int:
+    """ParallelPipeline branch body for the CPU-bound case."""
+    return sum(cpu_bound(i) for i in range(10))
+
+
+def time_map(func: Callable, items: int, workers: Optional[int], executor: str = "thread") -> float:
+    """Time a load -> map pipeline in milliseconds."""
+    pipeline = (
+        Pipeline("map-bench")
+        .add_step("load", load_items, count=items)
+        .map("work", func, workers=workers, executor=executor)
+    )
+    start = time.time()
+    result = pipeline.execute()
+    elapsed = (time.time() - start) * 1000
+    assert result["success"], result["error"]
+    assert len(result["result"]) == items
+    return elapsed
+
+
+def time_parallel(branch: Callable, branches: int, workers: int, executor: str) -> float:
+    """Time a ParallelPipeline with identical branches in milliseconds."""
+    parallel = ParallelPipeline("branch-bench", max_workers=workers, executor=executor)
+    for i in range(branches):
+        parallel.add_pipeline(Pipeline(f"branch-{i}").add_step("work", branch))
+    start = time.time()
+    result = parallel.execute(initial_data=0)
+    elapsed = (time.time() - start) * 1000
+    assert result["success"], result["results"]
+    return elapsed
+
+
+def print_row(label: str, baseline_ms: float, elapsed_ms: float) -> None:
+    """Print a benchmark row with speedup over baseline."""
+    print(f"{label:<40} {elapsed_ms:>12.1f} {baseline_ms / elapsed_ms:>10.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark parallel pipeline execution")
+    parser.add_argument("--items", type=int, default=64, help="Items per map step")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Workers")
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"Parallel Pipeline Benchmark ({args.items} items, {args.workers} workers)")
+    print(f"{'='*70}")
+    print(f"{'Case':<40} {'Time (ms)':>12} {'Speedup':>11}")
+    print("-" * 70)
+
+    for name, func in (("I/O-bound", io_bound), ("CPU-bound", cpu_bound)):
+        sequential = time_map(func, args.items, workers=None)
+        print_row(f"map {name} sequential", sequential, sequential)
+        print_row(
+            f"map {name} threads",
+            sequential,
+            time_map(func, args.items, workers=args.workers, executor="thread"),
+        )
+        print_row(
+            f"map {name} processes",
+            sequential,
+            time_map(func, args.items, workers=args.workers, executor="process"),
+        )
+
+    branches = args.workers
+    for name, branch in (("I/O-bound", io_branch), ("CPU-bound", cpu_branch)):
+        sequential = time_parallel(branch, branches, workers=1, executor="thread")
+        print_row(f"{branches} branches {name} sequential", sequential, sequential)
+        print_row(
+            f"{branches} branches {name} threads",
+            sequential,
+            time_parallel(branch, branches, workers=args.workers, executor="thread"),
+        )
+        print_row(
+            f"{branches} branches {name} processes",
+            sequential,
+            time_parallel(branch, branches, workers=args.workers, executor="process"),
+        )
+
+
+if __name__ == "__main__":
+    main()
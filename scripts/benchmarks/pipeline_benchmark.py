@@ -0,0 +1,143 @@
+"""
+Pipeline execution benchmark.
+
+Compares eager and streaming Pipeline execution over a large generated
+dataset and reports total time, time-to-first-result and peak traced memory.
+
+Usage:
+    python scripts/benchmarks/pipeline_benchmark.py [--rows 100000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.pipeline import Pipeline
+
+logging.getLogger("shared.pipeline").setLevel(logging.WARNING)
+
+
+@dataclass
+class BenchmarkResult:
+    """Result from a benchmark run."""
+
+    name: str
+    rows: int
+    total_ms: float
+    time_to_first_result_ms: float
+    peak_memory_mb: float
+
+
+def generate_rows(count: int) -> Iterator[Dict[str, Any]]:
+    """Generate synthetic order rows."""
+    for i in range(count):
+        yield {"id": i, "customer": f"customer-{i % 1000}", "amount": (i % 97) - 10}
+
+
+def build_pipeline(name: str, rows: int) -> Pipeline:
+    """Build the benchmark pipeline (load -> filter -> map -> map -> reduce)."""
+    return (
+        Pipeline(name)
+        .add_function("load", lambda: list(generate_rows(rows)))
+        .filter("positive", lambda row: row["amount"] > 0)
+        .map("enrich", lambda row: {**row, "amount_cents": row["amount"] * 100})
+        .map("amount", lambda row: row["amount_cents"])
+        .reduce("total", lambda acc, x: acc + x, initial=0)
+    )
+
+
+def benchmark_eager(rows: int) -> BenchmarkResult:
+    """Run the pipeline with list materialization between steps."""
+    pipeline = build_pipeline("eager", rows)
+
+    tracemalloc.start()
+    result = pipeline.execute()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert result["success"], result["error"]
+    return BenchmarkResult(
+        name="Eager",
+        rows=rows,
+        total_ms=result["duration_ms"],
+        # Nothing is available until the final step finishes
+        time_to_first_result_ms=result["duration_ms"],
+        peak_memory_mb=peak / 1024 / 1024,
+    )
+
+
+def benchmark_streaming(rows: int, chunk_size: int, max_buffered_chunks: int) -> BenchmarkResult:
+    """Run the pipeline in streaming mode from a lazy source."""
+    pipeline = build_pipeline("streaming", rows).streaming_mode(
+        chunk_size=chunk_size, max_buffered_chunks=max_buffered_chunks, track_memory=True
+    )
+    # Swap the list-building source for a generator
+    pipeline.steps[0].func = lambda: generate_rows(rows)
+
+    result = pipeline.execute()
+    assert result["success"], result["error"]
+
+    stats = result["streaming"]
+    return BenchmarkResult(
+        name=f"Streaming (chunk={chunk_size}, buffer={max_buffered_chunks})",
+        rows=rows,
+        total_ms=result["duration_ms"],
+        time_to_first_result_ms=stats["time_to_first_result_ms"],
+        peak_memory_mb=stats["peak_memory_bytes"] / 1024 / 1024,
+    )
+
+
+def benchmark_time_to_first_item(rows: int) -> float:
+    """Measure how long stream() takes to yield the first item without a reduce."""
+    pipeline = (
+        Pipeline("first-item")
+        .streaming_mode(chunk_size=100)
+        .add_function("load", lambda: generate_rows(rows))
+        .map("slow_enrich", lambda row: {**row, "score": sum(range(200))})
+    )
+
+    start = time.time()
+    stream = pipeline.stream()
+    next(stream)
+    elapsed = (time.time() - start) * 1000
+    stream.close()
+    return elapsed
+
+
+def print_result(result: BenchmarkResult) -> None:
+    """Print a single result row."""
+    print(
+        f"{result.name:<42} {result.total_ms:>10.1f} "
+        f"{result.time_to_first_result_ms:>12.1f} {result.peak_memory_mb:>10.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark eager vs streaming pipelines")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows to generate")
+    args = parser.parse_args()
+
+    print(f"\n{'='*80}")
+    print(f"Pipeline Benchmark ({args.rows:,} rows)")
+    print(f"{'='*80}")
+    print(f"{'Mode':<42} {'Total (ms)':>10} {'First (ms)':>12} {'Peak (MB)':>10}")
+    print("-" * 80)
+
+    print_result(benchmark_eager(args.rows))
+    print_result(benchmark_streaming(args.rows, chunk_size=1000, max_buffered_chunks=0))
+    print_result(benchmark_streaming(args.rows, chunk_size=1000, max_buffered_chunks=4))
+
+    first_ms = benchmark_time_to_first_item(args.rows)
+    print(f"\nstream() time to first item without reduce: {first_ms:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
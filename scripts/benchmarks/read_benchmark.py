@@ -0,0 +1,110 @@
+"""
+ReadTool ranged read benchmark over a generated log file.
+
+Writes a log of --lines lines, then times reading a 50-line window near the
+end of it: the pre-index approach (iterate the file up to the window), the
+first ReadTool read (which builds the line-offset index), later reads that
+reuse the cached index, and a tail read. Checks that all return the same
+lines.
+
+Usage:
+    python scripts/benchmarks/read_benchmark.py [--lines 5000000] [--runs 3]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import shared.line_index as line_index  # noqa: E402
+from tools.infrastructure.execution.read_tool import ReadTool  # noqa: E402
+
+WINDOW = 50
+
+
+def generate_log(path: Path, lines: int) -> None:
+    """Write a log with varied line lengths."""
+    with open(path, "w", encoding="utf-8") as f:
+        for start in range(0, lines, 100000):
+            f.write(
+                "".join(
+                    f"2024-01-01T00:00:00 INFO worker-{i % 7} request {i} handled in {i % 997} ms\n"
+                    for i in range(start, min(start + 100000, lines))
+                )
+            )
+
+
+def naive_read(path: Path, offset: int) -> List[str]:
+    """The pre-index approach: iterate every line up to the window."""
+    with open(path, "r", encoding="utf-8") as f:
+        window = islice(f, offset - 1, offset - 1 + WINDOW)
+        return [f"{idx}: {line.rstrip()}" for idx, line in enumerate(window, start=offset)]
+
+
+def tool_read(path: Path, **kwargs) -> List[str]:
+    return ReadTool(file_path=str(path), **kwargs)._process()[0]
+
+
+def measure(run: Callable[[], List[str]], runs: int) -> Tuple[float, List[str]]:
+    """Median wall time in ms and the last result."""
+    timings: List[float] = []
+    results: List[str] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        results = run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ReadTool ranged reads")
+    parser.add_argument("--lines", type=int, default=5000000, help="Lines in the log")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "app.log"
+        print(f"Generating {args.lines} lines...")
+        generate_log(path, args.lines)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        offset = max(1, args.lines - 1000)
+
+        naive_ms, expected = measure(lambda: naive_read(path, offset), args.runs)
+        start = time.perf_counter()
+        first = tool_read(path, offset=offset, limit=WINDOW)
+        first_ms = (time.perf_counter() - start) * 1000
+        cached_ms, cached = measure(lambda: tool_read(path, offset=offset, limit=WINDOW), args.runs)
+        tail_ms, tail = measure(lambda: tool_read(path, tail=WINDOW), args.runs)
+
+        print(f"\n{'='*70}")
+        print(
+            f"Read {WINDOW} lines at line {offset} of {args.lines} ({size_mb:.0f} MB, "
+            f"{args.runs} runs, median)"
+        )
+        print(f"{'='*70}")
+        print(f"{'Mode':<36} {'Time (ms)':>12}")
+        print("-" * 70)
+        for name, ms, result in [
+            ("Iterate to offset (before)", naive_ms, expected),
+            ("ReadTool, first read (builds index)", first_ms, first),
+            ("ReadTool, cached index", cached_ms, cached),
+        ]:
+            marker = "" if result == expected else "  RESULTS DIFFER"
+            print(f"{name:<36} {ms:>12.2f}{marker}")
+        tail_marker = "" if tail[-1].startswith(f"{args.lines}: ") else "  WRONG LINES"
+        print(f"{'ReadTool, tail':<36} {tail_ms:>12.2f}{tail_marker}")
+        print(
+            f"\nIndex checkpoints: {len(line_index._indexes[os.path.realpath(path)].block_offsets)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Tool registry cold-start benchmark.
+
+Starts a fresh Python process per run and measures shared.registry discovery
+time and peak RSS with eager imports (lazy=False) versus the static tool
+index (cold and warm), plus the cost of the first get_tool() call.
+
+Usage:
+    python scripts/benchmarks/registry_benchmark.py [--runs 3] [--tool text_formatter]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Runs inside the child process; prints one JSON line with timings
+CHILD_SCRIPT = """
+import json, logging, resource, sys, time
+start = time.perf_counter()
+from shared.registry import tool_registry
+logging.disable(logging.CRITICAL)
+imported = time.perf_counter()
+count = tool_registry.discover_tools(lazy={lazy}, index_path={index_path!r})
+discovered = time.perf_counter()
+tool_class = tool_registry.get_tool({tool!r})
+loaded = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "discover_ms": (discovered - imported) * 1000,
+    "get_tool_ms": (loaded - discovered) * 1000,
+    "tools": count,
+    "found": tool_class is not None,
+    "modules": len(sys.modules),
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}}))
+"""
+
+
+def run_child(lazy: bool, index_path: str, tool: str) -> Dict[str, float]:
+    """Start one process and return its timings."""
+    script = CHILD_SCRIPT.format(lazy=lazy, index_path=index_path, tool=tool)
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(name: str, runs: List[Dict[str, float]]) -> None:
+    """Print median timings for a set of runs."""
+
+    def median(key: str) -> float:
+        return statistics.median(r[key] for r in runs)
+
+    print(
+        f"{name:<24} {median('discover_ms'):>13.1f} {median('get_tool_ms'):>13.1f} "
+        f"{runs[0]['tools']:>6} {runs[0]['modules']:>8} {median('rss_mb'):>9.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark tool registry cold start")
+    parser.add_argument("--runs", type=int, default=3, help="Processes per mode")
+    parser.add_argument("--tool", default="text_formatter", help="Tool passed to get_tool()")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = os.path.join(tmp, "tool_index.json")
+
+        print(f"\n{'='*78}")
+        print(f"Tool Registry Cold Start ({args.runs} runs, median)")
+        print(f"{'='*78}")
+        print(
+            f"{'Mode':<24} {'discover (ms)':>13} {'get_tool (ms)':>13} "
+            f"{'Tools':>6} {'Modules':>8} {'RSS (MB)':>9}"
+        )
+        print("-" * 78)
+
+        eager = [run_child(False, index_path, args.tool) for _ in range(args.runs)]
+        summarize("Eager imports", eager)
+
+        os.remove(index_path)
+        cold = [run_child(True, index_path, args.tool)]
+        summarize("Lazy (cold index)", cold)
+
+        warm = [run_child(True, index_path, args.tool) for _ in range(args.runs)]
+        summarize("Lazy (warm index)", warm)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+BashTool session benchmark.
+
+Times:
+
+- --commands short commands through subprocess.run(shell=True) (the previous
+  BashTool path) against the same commands in one persistent session;
+- polling a background job that prints --lines lines: reading everything
+  collected so far on each poll (the cost of rescanning) against reading
+  only new output from the last offset.
+
+Usage:
+    python scripts/benchmarks/shell_benchmark.py [--commands 200] [--lines 200000]
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.shell_sessions import ShellManager  # noqa: E402
+
+
+def timed(label: str, run) -> float:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<48} {elapsed * 1000:>10.1f} ms")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark BashTool shell sessions")
+    parser.add_argument("--commands", type=int, default=200, help="Short commands to run")
+    parser.add_argument("--lines", type=int, default=200000, help="Lines printed by the job")
+    parser.add_argument("--polls", type=int, default=50, help="Polls while the job runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = ShellManager(spill_dir=Path(tmp))
+        command = "echo $((1 + 1))"
+
+        print(f"\n{'=' * 62}")
+        print(f"Shell commands: {args.commands} x '{command}'")
+        print(f"{'=' * 62}")
+
+        def previous() -> None:
+            for _ in range(args.commands):
+                out = subprocess.run(command, shell=True, capture_output=True, text=True)
+                assert out.stdout == "2\n"
+
+        def session() -> None:
+            for _ in range(args.commands):
+                assert manager.run(command).stdout.getvalue() == b"2\n"
+
+        manager.run("true")  # start the session outside the timing
+        old_s = timed("subprocess.run per command", previous)
+        new_s = timed("Persistent session", session)
+
+        print(f"\n{'=' * 62}")
+        print(f"Background job: {args.lines} lines, {args.polls} polls")
+        print(f"{'=' * 62}")
+
+        script = f"for i in $(seq 1 {args.lines}); do echo line $i; done"
+        interval = 0.02
+
+        def rescan() -> float:
+            job = manager.start(script)
+            spent = 0.0
+            for _ in range(args.polls):
+                start = time.perf_counter()
+                job.stdout.read_lines(0, 1 << 40, final=not job.running)
+                spent += time.perf_counter() - start
+                time.sleep(interval)
+            job.wait()
+            return spent
+
+        def incremental() -> float:
+            job = manager.start(script)
+            offset = 0
+            spent = 0.0
+            lines = 0
+            for _ in range(args.polls):
+                start = time.perf_counter()
+                batch, offset, _ = job.stdout.read_lines(offset, 1 << 40, final=not job.running)
+                spent += time.perf_counter() - start
+                lines += len(batch)
+                time.sleep(interval)
+            job.wait()
+            batch, offset, _ = job.stdout.read_lines(offset, 1 << 40, final=True)
+            assert lines + len(batch) == args.lines
+            return spent
+
+        rescan_s = rescan()
+        incremental_s = incremental()
+        print(f"{'Read all output on every poll':<48} {rescan_s * 1000:>10.1f} ms")
+        print(f"{'Read from last offset':<48} {incremental_s * 1000:>10.1f} ms")
+        manager.shutdown()
+
+        print("-" * 62)
+        print(f"Command speedup:       {old_s / new_s:.1f}x")
+        print(f"Polling speedup:       {rescan_s / max(incremental_s, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Task queue throughput benchmark.
+
+Times, against a fresh SQLite queue (or Redis with --backend redis):
+
+- --tasks enqueues one at a time against enqueue_many batches of --batch;
+- dequeue + complete latency with the queue --depth tasks deep, to show the
+  cost does not grow with queue length;
+- --producers processes enqueueing --tasks tasks in batches while
+  --consumers processes lease batches of --batch and complete them.
+
+Every task must be completed exactly once.
+
+Usage:
+    python scripts/benchmarks/task_queue_benchmark.py [--tasks 20000]
+        [--producers 4] [--consumers 4]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.task_queue import RedisTaskQueue, SQLiteTaskQueue, TaskQueue  # noqa: E402
+
+
+def open_queue(backend: str, path: str) -> TaskQueue:
+    if backend == "redis":
+        url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        return RedisTaskQueue.from_url(url, prefix="agentswarm:benchmark:")
+    return SQLiteTaskQueue(Path(path))
+
+
+def timed(label: str, count: int, run) -> float:
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {elapsed * 1000:>9.1f} ms {count / elapsed:>10.0f} tasks/s")
+    return elapsed
+
+
+def produce(backend: str, path: str, queue_name: str, tasks: int, batch: int) -> None:
+    queue = open_queue(backend, path)
+    for start in range(0, tasks, batch):
+        items = [{"n": n} for n in range(start, min(start + batch, tasks))]
+        queue.enqueue_many(queue_name, items, priority=1 + start % 10)
+
+
+def consume(backend: str, path: str, queue_name: str, batch: int, done, total: int) -> None:
+    queue = open_queue(backend, path)
+    idle_since = None
+    while True:
+        tasks = queue.dequeue(queue_name, count=batch, worker_id=str(os.getpid()))
+        if not tasks:
+            with done.get_lock():
+                if done.value >= total:
+                    return
+            idle_since = idle_since or time.monotonic()
+            if time.monotonic() - idle_since > 30:
+                return
+            time.sleep(0.001)
+            continue
+        idle_since = None
+        for task in tasks:
+            queue.complete(queue_name, task["task_id"], task["lease_id"])
+        with done.get_lock():
+            done.value += len(tasks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark task queue throughput")
+    parser.add_argument("--backend", choices=["sqlite", "redis"], default="sqlite")
+    parser.add_argument("--tasks", type=int, default=20000, help="Tasks per run")
+    parser.add_argument("--batch", type=int, default=50, help="Enqueue/dequeue batch size")
+    parser.add_argument("--producers", type=int, default=4, help="Producer processes")
+    parser.add_argument("--consumers", type=int, default=4, help="Consumer processes")
+    parser.add_argument("--depth", type=int, default=100000, help="Deepest queue to sample")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "queue.db")
+        queue = open_queue(args.backend, path)
+
+        print(f"\n{'=' * 72}")
+        print(f"Task queue ({args.backend}): {args.tasks} tasks, batch {args.batch}")
+        print(f"{'=' * 72}")
+
+        def single() -> None:
+            for n in range(args.tasks):
+                queue.enqueue("single", {"n": n})
+
+        def bulk() -> None:
+            for start in range(0, args.tasks, args.batch):
+                queue.enqueue_many("bulk", [{"n": n} for n in range(start, start + args.batch)])
+
+        single_s = timed("enqueue one at a time", args.tasks, single)
+        bulk_s = timed(f"enqueue_many, batches of {args.batch}", args.tasks, bulk)
+        queue.clear("single")
+        queue.clear("bulk")
+
+        print("\nDequeue + complete latency by queue depth (mean of 200):")
+        depth = 1000
+        while depth <= args.depth:
+            queue.clear("depth")
+            for start in range(0, depth, 1000):
+                queue.enqueue_many(
+                    "depth", [{"n": n} for n in range(start, start + 1000)], 1 + start % 10
+                )
+            start = time.perf_counter()
+            for _ in range(200):
+                (task,) = queue.dequeue("depth")
+                queue.complete("depth", task["task_id"], task["lease_id"])
+            mean_us = (time.perf_counter() - start) / 200 * 1e6
+            print(f"  depth {depth:>8}: {mean_us:>8.1f} us")
+            depth *= 10
+        queue.clear("depth")
+
+        print(
+            f"\n{args.producers} producers / {args.consumers} consumers, "
+            f"{args.tasks} tasks in batches of {args.batch}:"
+        )
+        done = multiprocessing.Value("i", 0)
+        per_producer = args.tasks // args.producers
+        total = per_producer * args.producers
+        processes = [
+            multiprocessing.Process(
+                target=produce, args=(args.backend, path, "work", per_producer, args.batch)
+            )
+            for _ in range(args.producers)
+        ] + [
+            multiprocessing.Process(
+                target=consume, args=(args.backend, path, "work", args.batch, done, total)
+            )
+            for _ in range(args.consumers)
+        ]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        stats = queue.stats("work")
+        assert stats["completed"] == total, stats
+        assert stats["pending"] == stats["in_progress"] == 0, stats
+        print(f"  {total} tasks in {elapsed:.2f} s: {total / elapsed:,.0f} tasks/s end to end")
+        queue.clear("work")
+
+        print("-" * 72)
+        print(f"Bulk enqueue speedup:  {single_s / bulk_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+SDK validator benchmark over the full tools/ tree.
+
+Times ToolValidator.validate_all_tools() without the result cache (serial and
+with a process pool) and with a warm content-hash cache, and checks that all
+modes produce identical results.
+
+Usage:
+    python scripts/benchmarks/validator_benchmark.py [--runs 3] [--workers N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from sdk.validator import ToolValidator, ValidationResult  # noqa: E402
+
+
+def summarize(results: Dict[str, ValidationResult]) -> Dict[str, Tuple]:
+    """Comparable view of a result set."""
+    return {
+        name: (r.passed, r.score, [(i.severity, i.message, i.line_number) for i in r.issues])
+        for name, r in results.items()
+    }
+
+
+def measure(run: Callable[[], Dict[str, ValidationResult]], runs: int) -> Tuple[float, Dict]:
+    """Median wall time in ms and the last result set."""
+    timings: List[float] = []
+    results: Dict[str, ValidationResult] = {}
+    for _ in range(runs):
+        start = time.perf_counter()
+        results = run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sdk.validator over tools/")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per mode")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Process pool size"
+    )
+    parser.add_argument("--tools-dir", default=str(PROJECT_ROOT / "tools"), help="Tools tree")
+    args = parser.parse_args()
+
+    tools_dir = Path(args.tools_dir)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "validator_cache.json"
+
+        modes = [
+            (
+                "No cache, serial",
+                lambda: ToolValidator(use_cache=False).validate_all_tools(tools_dir, workers=1),
+            ),
+            (
+                f"No cache, {args.workers} workers",
+                lambda: ToolValidator(use_cache=False).validate_all_tools(
+                    tools_dir, workers=args.workers
+                ),
+            ),
+            (
+                "Warm cache",
+                lambda: ToolValidator(cache_path=cache_path).validate_all_tools(
+                    tools_dir, workers=args.workers
+                ),
+            ),
+        ]
+
+        # Fill the cache so the warm mode only measures hits
+        ToolValidator(cache_path=cache_path).validate_all_tools(tools_dir, workers=1)
+
+        print(f"\n{'='*70}")
+        print(f"SDK Validator: {tools_dir} ({args.runs} runs, median)")
+        print(f"{'='*70}")
+        print(f"{'Mode':<28} {'Tools':>6} {'Total (ms)':>12} {'Per tool (ms)':>14}")
+        print("-" * 70)
+
+        baseline = None
+        for name, run in modes:
+            median_ms, results = measure(run, args.runs)
+            summary = summarize(results)
+            baseline = baseline or summary
+            marker = "" if summary == baseline else "  RESULTS DIFFER"
+            per_tool = median_ms / len(results) if results else 0.0
+            print(f"{name:<28} {len(results):>6} {median_ms:>12.1f} {per_tool:>14.2f}{marker}")
+
+
+if __name__ == "__main__":
+    main()
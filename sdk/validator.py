@@ -5,9 +5,12 @@ Validates tools against Agency Swarm standards and best practices.
 """
 
 import ast
+import hashlib
+import json
 import os
 import re
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -15,8 +18,16 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from shared.tool_index import get_index_errors, get_tool_index
+
 console = Console()
 
+# Bump whenever a check changes so cached results are recomputed
+VALIDATOR_VERSION = "2"
+
+# Below this many uncached files a process pool costs more than it saves
+MIN_PARALLEL_FILES = 8
+
 
 @dataclass
 class ValidationIssue:
@@ -54,6 +65,85 @@ class ValidationResult:
         return len(self.errors) > 0
 
 
+class _ToolClassVisitor(ast.NodeVisitor):
+    """Single pass over a module that finds the class inheriting from BaseTool."""
+
+    def __init__(self):
+        self.tool_class: Optional[ast.ClassDef] = None
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        if any(isinstance(base, ast.Name) and base.id == "BaseTool" for base in node.bases):
+            self.tool_class = node
+        self.generic_visit(node)
+
+
+class ValidationCache:
+    """
+    File-level validation issues keyed on content hash and validator version.
+
+    Stored as JSON (default: ~/.agentswarm/validator_cache.json). Only entries
+    used since the cache was loaded are written back, so it never grows past
+    the current tree.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        if cache_path is None:
+            cache_dir = Path.home() / ".agentswarm"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path = cache_dir / "validator_cache.json"
+
+        self.cache_path = Path(cache_path)
+        self._entries = self._load()
+        self._used: Dict[str, List[Dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, List[Dict[str, Any]]]:
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != VALIDATOR_VERSION:
+            return {}
+        return data.get("entries", {})
+
+    @staticmethod
+    def key(content: str) -> str:
+        """Cache key for a file's content."""
+        return hashlib.sha256(f"{VALIDATOR_VERSION}\0{content}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[ValidationIssue]]:
+        """Cached issues for a content key, or None."""
+        issues = self._entries.get(key)
+        if issues is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used[key] = issues
+        return [ValidationIssue(**issue) for issue in issues]
+
+    def put(self, key: str, issues: List[ValidationIssue]) -> None:
+        """Store issues for a content key."""
+        self._entries[key] = self._used[key] = [asdict(issue) for issue in issues]
+
+    def save(self) -> None:
+        """Write entries used since loading (atomic replace)."""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"version": VALIDATOR_VERSION, "entries": self._used}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            console.print(f"[yellow]Could not save validation cache: {e}[/yellow]")
+
+
+def _check_source(content: str) -> List[ValidationIssue]:
+    """Run the file-level checks on one source (process pool entry point)."""
+    return ToolValidator(use_cache=False)._check_source(content)
+
+
 class ToolValidator:
     """Validates tools against Agency Swarm standards"""
 
@@ -82,6 +172,25 @@ class ToolValidator:
         (r'tool_category:\s*str\s*=\s*["\']', "Must define tool_category"),
     ]
 
+    def __init__(self, use_cache: bool = True, cache_path: Optional[Path] = None):
+        """
+        Initialize the validator.
+
+        Args:
+            use_cache: Reuse results for files whose content is unchanged
+            cache_path: Cache file (default: ~/.agentswarm/validator_cache.json)
+        """
+        self.use_cache = use_cache
+        self.cache_path = cache_path
+        self._cache: Optional[ValidationCache] = None
+
+    @property
+    def cache(self) -> Optional[ValidationCache]:
+        """Result cache, loaded on first use (None when caching is disabled)."""
+        if self.use_cache and self._cache is None:
+            self._cache = ValidationCache(self.cache_path)
+        return self._cache
+
     def validate_tool(self, tool_path: Path) -> ValidationResult:
         """
         Validate a tool.
@@ -92,58 +201,159 @@ class ToolValidator:
         Returns:
             ValidationResult with issues and score
         """
-        issues = []
+        result = self._validate_paths([Path(tool_path)], workers=1)[0]
+        if self.cache:
+            self.cache.save()
+        return result
+
+    def validate_all_tools(
+        self, tools_dir: Path, workers: Optional[int] = None
+    ) -> Dict[str, ValidationResult]:
+        """
+        Validate all tools in a directory.
+
+        Files whose content is unchanged since a previous run are served from
+        the cache; the rest are checked in a process pool.
+
+        Args:
+            tools_dir: Path to tools directory
+            workers: Worker processes for uncached files (default: CPU count)
+
+        Returns:
+            Dict mapping tool names to validation results
+        """
+        # Tool directories come from the shared tool index (one per tool module),
+        # plus directories of files it could not parse, which must fail here
+        tool_dirs = {entry.directory for entry in get_tool_index(tools_dir).values()}
+        tool_dirs.update(
+            Path(rel_path).parent.as_posix() for rel_path in get_index_errors(tools_dir)
+        )
+        paths = [Path(tools_dir) / rel_dir for rel_dir in sorted(tool_dirs)]
+
+        results = {
+            path.name: result for path, result in zip(paths, self._validate_paths(paths, workers))
+        }
+        if self.cache:
+            self.cache.save()
 
-        # Find tool file
+        return results
+
+    def _validate_paths(
+        self, tool_paths: List[Path], workers: Optional[int]
+    ) -> List[ValidationResult]:
+        """Read each tool file once, check uncached sources, then assemble results."""
+        sources: List[Tuple[Path, Optional[str], Optional[ValidationResult]]] = []
+        pending: Dict[str, str] = {}
+        file_issues: Dict[str, List[ValidationIssue]] = {}
+
+        for tool_path in tool_paths:
+            tool_file, content, failure = self._read_tool_source(tool_path)
+            if failure is not None:
+                sources.append((tool_path, None, failure))
+                continue
+
+            key = ValidationCache.key(content)
+            cached = self.cache.get(key) if self.cache else None
+            if cached is not None:
+                file_issues[key] = cached
+            else:
+                pending[key] = content
+            sources.append((tool_path, key, None))
+
+        for key, issues in zip(pending, self._check_sources(list(pending.values()), workers)):
+            file_issues[key] = issues
+            if self.cache:
+                self.cache.put(key, issues)
+
+        results = []
+        for tool_path, key, failure in sources:
+            if failure is not None:
+                results.append(failure)
+            else:
+                results.append(self._build_result(tool_path, list(file_issues[key])))
+        return results
+
+    def _check_sources(
+        self, contents: List[str], workers: Optional[int]
+    ) -> List[List[ValidationIssue]]:
+        """Check sources, in a process pool when there are enough of them."""
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(contents) < MIN_PARALLEL_FILES:
+            return [self._check_source(content) for content in contents]
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(contents))) as pool:
+            chunksize = max(1, len(contents) // (workers * 4))
+            return list(pool.map(_check_source, contents, chunksize=chunksize))
+
+    def _read_tool_source(
+        self, tool_path: Path
+    ) -> Tuple[Optional[Path], Optional[str], Optional[ValidationResult]]:
+        """Locate and read the tool file; returns a failed result if that is impossible."""
         if tool_path.is_dir():
             # Find main tool file
             tool_file = self._find_tool_file(tool_path)
             if not tool_file:
-                issues.append(
-                    ValidationIssue(
-                        severity="error",
-                        category="structure",
-                        message=f"No tool file found in {tool_path}",
-                    )
+                issue = ValidationIssue(
+                    severity="error",
+                    category="structure",
+                    message=f"No tool file found in {tool_path}",
                 )
-                return ValidationResult(tool_path=tool_path, passed=False, issues=issues, score=0)
+                return None, None, self._failed(tool_path, issue)
         else:
             tool_file = tool_path
 
         # Read file content
         try:
-            content = tool_file.read_text()
+            return tool_file, tool_file.read_text(), None
         except Exception as e:
-            issues.append(
-                ValidationIssue(
-                    severity="error", category="structure", message=f"Cannot read file: {e}"
-                )
+            issue = ValidationIssue(
+                severity="error", category="structure", message=f"Cannot read file: {e}"
             )
-            return ValidationResult(tool_path=tool_path, passed=False, issues=issues, score=0)
+            return tool_file, None, self._failed(tool_path, issue)
+
+    @staticmethod
+    def _failed(tool_path: Path, issue: ValidationIssue) -> ValidationResult:
+        return ValidationResult(tool_path=tool_path, passed=False, issues=[issue], score=0)
+
+    def _check_source(self, content: str) -> List[ValidationIssue]:
+        """
+        Parse the source once and run every file-level check on that tree.
 
+        A syntax error is returned as the only issue.
+        """
         # Parse AST
         try:
             tree = ast.parse(content)
         except SyntaxError as e:
-            issues.append(
+            return [
                 ValidationIssue(
                     severity="error",
                     category="syntax",
                     message=f"Syntax error: {e}",
                     line_number=e.lineno,
                 )
-            )
-            return ValidationResult(tool_path=tool_path, passed=False, issues=issues, score=0)
+            ]
+
+        visitor = _ToolClassVisitor()
+        visitor.visit(tree)
+        tool_class = visitor.tool_class
 
         # Run validation checks
-        issues.extend(self._check_structure(tree, content))
+        issues = []
+        issues.extend(self._check_structure(tool_class))
         issues.extend(self._check_security(content))
-        issues.extend(self._check_documentation(tree, content))
-        issues.extend(self._check_parameters(tree))
+        issues.extend(self._check_documentation(tool_class))
+        issues.extend(self._check_parameters(tool_class))
         issues.extend(self._check_test_block(content))
         issues.extend(self._check_error_handling(tree, content))
+        return issues
 
-        # Check for supporting files
+    def _build_result(self, tool_path: Path, issues: List[ValidationIssue]) -> ValidationResult:
+        """Add directory-level checks to the file issues and score the tool."""
+        if any(issue.category == "syntax" for issue in issues):
+            return ValidationResult(tool_path=tool_path, passed=False, issues=issues, score=0)
+
+        # Check for supporting files (not cached: they do not affect the file hash)
         if tool_path.is_dir():
             issues.extend(self._check_supporting_files(tool_path))
 
@@ -155,41 +365,6 @@ class ToolValidator:
 
         return ValidationResult(tool_path=tool_path, passed=passed, issues=issues, score=score)
 
-    def validate_all_tools(self, tools_dir: Path) -> Dict[str, ValidationResult]:
-        """
-        Validate all tools in a directory.
-
-        Args:
-            tools_dir: Path to tools directory
-
-        Returns:
-            Dict mapping tool names to validation results
-        """
-        results = {}
-
-        # Find all tool directories
-        for category_dir in tools_dir.iterdir():
-            if not category_dir.is_dir() or category_dir.name.startswith("."):
-                continue
-
-            for subcategory_dir in category_dir.iterdir():
-                if not subcategory_dir.is_dir() or subcategory_dir.name.startswith("."):
-                    continue
-
-                for tool_dir in subcategory_dir.iterdir():
-                    if not tool_dir.is_dir() or tool_dir.name.startswith("."):
-                        continue
-
-                    # Skip if __pycache__
-                    if tool_dir.name == "__pycache__":
-                        continue
-
-                    # Validate tool
-                    result = self.validate_tool(tool_dir)
-                    results[tool_dir.name] = result
-
-        return results
-
     def _find_tool_file(self, tool_dir: Path) -> Optional[Path]:
         """Find main tool file in directory"""
         # Look for .py file matching directory name
@@ -204,20 +379,10 @@ class ToolValidator:
 
         return None
 
-    def _check_structure(self, tree: ast.AST, content: str) -> List[ValidationIssue]:
+    def _check_structure(self, tool_class: Optional[ast.ClassDef]) -> List[ValidationIssue]:
         """Check tool structure"""
         issues = []
 
-        # Find tool class
-        tool_class = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Check if inherits from BaseTool
-                for base in node.bases:
-                    if isinstance(base, ast.Name) and base.id == "BaseTool":
-                        tool_class = node
-                        break
-
         if not tool_class:
             issues.append(
                 ValidationIssue(
@@ -310,19 +475,10 @@ class ToolValidator:
 
         return issues
 
-    def _check_documentation(self, tree: ast.AST, content: str) -> List[ValidationIssue]:
+    def _check_documentation(self, tool_class: Optional[ast.ClassDef]) -> List[ValidationIssue]:
         """Check documentation completeness"""
         issues = []
 
-        # Find tool class
-        tool_class = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                for base in node.bases:
-                    if isinstance(base, ast.Name) and base.id == "BaseTool":
-                        tool_class = node
-                        break
-
         if not tool_class:
             return issues
 
@@ -371,19 +527,10 @@ class ToolValidator:
 
         return issues
 
-    def _check_parameters(self, tree: ast.AST) -> List[ValidationIssue]:
+    def _check_parameters(self, tool_class: Optional[ast.ClassDef]) -> List[ValidationIssue]:
         """Check parameter definitions"""
         issues = []
 
-        # Find tool class
-        tool_class = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                for base in node.bases:
-                    if isinstance(base, ast.Name) and base.id == "BaseTool":
-                        tool_class = node
-                        break
-
         if not tool_class:
             return issues
 
@@ -2,9 +2,12 @@
 AgentSwarm Tools - Shared Utilities
 
 This package contains shared utilities and base classes for all tools.
+
+BaseTool is imported on first access so that lightweight modules such as
+shared.tool_index or shared.errors can be used without loading pydantic,
+analytics, caching and monitoring.
 """
 
-from .base import BaseTool
 from .errors import (
     APIError,
     AuthenticationError,
@@ -28,3 +31,12 @@ __all__ = [
     "AuthenticationError",
     "ConfigurationError",
 ]
+
+
+def __getattr__(name: str):
+    """Import BaseTool on first access."""
+    if name == "BaseTool":
+        from .base import BaseTool
+
+        return BaseTool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -35,11 +35,6 @@ from .analytics import AnalyticsEvent, EventType, record_event
 from .errors import ToolError, ValidationError
 from .security import get_rate_limiter
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-
 
 class AsyncBaseTool(AgencyBaseTool):
     """
@@ -12,7 +12,7 @@ import uuid
 import warnings
 from abc import abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 # Import from Agency Swarm
 try:
@@ -31,16 +31,50 @@ except ImportError:
             pass
 
 
-from .analytics import AnalyticsEvent, EventType, record_event
-from .cache import CacheManager, get_global_cache_manager, make_cache_key
 from .errors import ToolError, ValidationError
-from .monitoring import record_performance_metric
-from .security import get_rate_limiter
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+if TYPE_CHECKING:
+    from .analytics import AnalyticsEvent, EventType
+    from .cache import CacheManager
+
+# Analytics, caching, monitoring and rate limiting are imported on first use so
+# that importing a tool (e.g. to list or validate it) does not load psutil,
+# sqlite or cache backends. The wrappers keep the names patchable on this module.
+
+
+def record_event(event: "AnalyticsEvent") -> None:
+    """Record an analytics event (shared.analytics.record_event)."""
+    from .analytics import record_event as _record_event
+
+    _record_event(event)
+
+
+def get_global_cache_manager() -> "CacheManager":
+    """Get the global cache manager (shared.cache.get_global_cache_manager)."""
+    from .cache import get_global_cache_manager as _get_global_cache_manager
+
+    return _get_global_cache_manager()
+
+
+def make_cache_key(*args: Any, **kwargs: Any) -> str:
+    """Build a cache key (shared.cache.make_cache_key)."""
+    from .cache import make_cache_key as _make_cache_key
+
+    return _make_cache_key(*args, **kwargs)
+
+
+def record_performance_metric(*args: Any, **kwargs: Any) -> None:
+    """Record a performance metric (shared.monitoring.record_performance_metric)."""
+    from .monitoring import record_performance_metric as _record_performance_metric
+
+    _record_performance_metric(*args, **kwargs)
+
+
+def get_rate_limiter() -> Any:
+    """Get the global rate limiter (shared.security.get_rate_limiter)."""
+    from .security import get_rate_limiter as _get_rate_limiter
+
+    return _get_rate_limiter()
 
 
 class BaseTool(AgencyBaseTool):
@@ -108,7 +142,7 @@ class BaseTool(AgencyBaseTool):
         self._user_id: Optional[str] = data.get("user_id")
         self._logger = logging.getLogger(f"agentswarm.tools.{self.tool_name}")
         self._start_time: Optional[float] = None
-        self._cache_manager: Optional[CacheManager] = None
+        self._cache_manager: Optional["CacheManager"] = None
         self._init_cache()
 
         # Enable exception re-raising in test mode
@@ -145,6 +179,8 @@ class BaseTool(AgencyBaseTool):
         Note:
             This method wraps _execute() with all the framework features.
         """
+        from .analytics import EventType
+
         self._start_time = time.time()
         cache_hit = False
         error_type = None
@@ -311,18 +347,22 @@ class BaseTool(AgencyBaseTool):
         except Exception as e:
             # Record rate limit event
             if self._enable_analytics:
+                from .analytics import EventType
+
                 self._record_event(EventType.RATE_LIMIT)
             raise
 
     def _record_event(
         self,
-        event_type: EventType,
+        event_type: "EventType",
         success: bool = True,
         error_code: Optional[str] = None,
         error_message: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Record analytics event."""
+        from .analytics import AnalyticsEvent
+
         duration_ms = None
         if self._start_time:
             duration_ms = (time.time() - self._start_time) * 1000
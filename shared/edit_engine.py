@@ -0,0 +1,431 @@
+"""
+Single-pass file edit engine shared by MultieditTool and EditTool
+
+Edits are parsed and validated once, then applied to the file's bytes without
+re-splitting or re-joining the content per edit:
+
+- Line inserts and deletes rewrite a short list of segments, each either a
+  range of original lines (located through a sparse LineIndex) or inserted
+  text. The cost per edit depends on the number of edits, not the file size.
+- Replaces whose search and replacement contain no newline cannot change
+  line numbering, so they are deferred to when the output is produced. One
+  regex scan then finds the lines containing any deferred search string, and
+  only those lines are rewritten. Each replace only touches segments that
+  existed when it was issued. Other replaces (across lines, or emptying an unterminated last
+  line) are applied to the materialized content at their point in the
+  sequence.
+- The result is a list of chunks (mostly zero-copy views of the original)
+  written to a temporary file in the target's directory and moved into place
+  with os.replace.
+
+Edits keep the sequential semantics of the original MultieditTool: line
+numbers are 0-based and refer to the content after all previous edits,
+inserts past the end append (terminating an unterminated last line first),
+deletes past the end are ignored, and a replace substitutes every occurrence.
+Lines are split on b"\\n". Text is encoded as UTF-8, and "\\n" in edit text is
+written as "\\r\\n" in files that use CRLF.
+"""
+
+import errno
+import os
+import re
+import stat
+import tempfile
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from shared.errors import ValidationError
+from shared.line_index import LineIndex
+
+Chunk = Union[bytes, memoryview]
+
+
+@dataclass(frozen=True)
+class Edit:
+    """One parsed edit; `line` is 0-based."""
+
+    action: str
+    line: Optional[int] = None
+    text: str = ""
+    search: str = ""
+    replace: str = ""
+
+
+@dataclass
+class EditResult:
+    """Output of apply_edits."""
+
+    chunks: List[Chunk]
+    replacements: int = 0
+    total_lines: int = 0
+
+
+def parse_edits(raw_edits: Sequence[Dict[str, Any]], tool_name: Optional[str] = None) -> List[Edit]:
+    """
+    Validate MultieditTool edit dicts and convert them to Edits.
+
+    Raises:
+        ValidationError: For an unknown action, a missing or negative line
+            index, or a replace without a search string
+    """
+    edits: List[Edit] = []
+    for raw in raw_edits:
+        if not isinstance(raw, dict) or "action" not in raw:
+            raise ValidationError(
+                "Each edit must contain an action", tool_name=tool_name, details={"edit": raw}
+            )
+        action = raw["action"]
+        if action == "replace":
+            search = raw.get("search", "")
+            replace = raw.get("replace", "")
+            if not isinstance(search, str) or not search or not isinstance(replace, str):
+                raise ValidationError(
+                    "Replace edits need a non-empty search string and a replace string",
+                    tool_name=tool_name,
+                    details=raw,
+                )
+            edits.append(Edit(action, search=search, replace=replace))
+        elif action in ("insert", "delete"):
+            line = raw.get("line")
+            if not isinstance(line, int) or isinstance(line, bool) or line < 0:
+                raise ValidationError(
+                    f"Invalid line index for {action}", tool_name=tool_name, details=raw
+                )
+            text = raw.get("text", "")
+            if not isinstance(text, str):
+                raise ValidationError(
+                    "Insert text must be a string", tool_name=tool_name, details=raw
+                )
+            edits.append(Edit(action, line=line, text=text))
+        else:
+            raise ValidationError(
+                f"Unknown edit action: {action}", tool_name=tool_name, details=raw
+            )
+    return edits
+
+
+def detect_newline(data: bytes) -> bytes:
+    """b"\\r\\n" if the first line of data ends with CRLF, else b"\\n"."""
+    newline = data.find(b"\n")
+    return b"\r\n" if newline > 0 and data[newline - 1 : newline] == b"\r" else b"\n"
+
+
+def encode_text(text: str, newline: bytes = b"\n") -> bytes:
+    """Encode edit text for a file using the given line ending."""
+    if newline == b"\r\n":
+        text = text.replace("\r\n", "\n").replace("\n", "\r\n")
+    return text.encode("utf-8")
+
+
+class _Lines:
+    """Original lines [start, stop) (0-based)."""
+
+    __slots__ = ("start", "stop")
+
+    def __init__(self, start: int, stop: int) -> None:
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+
+class _Text:
+    """Inserted lines, each ending with a newline, added by edit `seq`."""
+
+    __slots__ = ("lines", "seq")
+
+    def __init__(self, lines: List[bytes], seq: int) -> None:
+        self.lines = lines
+        self.seq = seq
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+
+@dataclass
+class _Replace:
+    seq: int
+    search: bytes
+    replace: bytes
+    count: int = 0
+
+
+@dataclass
+class _Document:
+    """Original data plus the edits applied so far."""
+
+    data: bytes
+    newline: bytes = b"\n"
+    index: LineIndex = field(init=False)
+    segments: List[Union[_Lines, _Text]] = field(init=False)
+    replaces: List[_Replace] = field(default_factory=list)
+    total_lines: int = 0
+    sizes: List[int] = field(init=False)
+    # A line was appended, so an unterminated original last line gets a newline
+    terminate_last: bool = False
+
+    def __post_init__(self) -> None:
+        self.index = LineIndex.build(self.data)
+        self.total_lines = self.index.total_lines
+        self.segments = [_Lines(0, self.total_lines)] if self.total_lines else []
+        # Line count of each segment, kept in step with segments
+        self.sizes = [self.total_lines] if self.total_lines else []
+
+    def locate(self, line: int) -> Tuple[int, int]:
+        """Segment holding a current 0-based line, and the line's offset in it."""
+        ends = list(accumulate(self.sizes))
+        position = bisect_right(ends, line)
+        return position, line - (ends[position] - self.sizes[position])
+
+    def insert(self, line: int, lines: List[bytes], seq: int) -> None:
+        text = _Text(lines, seq)
+        if line >= self.total_lines:
+            self._replace_segments(len(self.segments), len(self.segments), [text])
+            self.terminate_last = True
+        else:
+            position, offset = self.locate(line)
+            self._replace_segments(
+                position, position + 1, _split(self.segments[position], offset, offset, [text])
+            )
+        self.total_lines += len(lines)
+
+    def delete(self, line: int) -> None:
+        if line >= self.total_lines:
+            return
+        position, offset = self.locate(line)
+        self._replace_segments(
+            position, position + 1, _split(self.segments[position], offset, offset + 1, [])
+        )
+        self.total_lines -= 1
+
+    def _replace_segments(
+        self, start: int, stop: int, segments: List[Union[_Lines, _Text]]
+    ) -> None:
+        self.segments[start:stop] = segments
+        self.sizes[start:stop] = [len(s) for s in segments]
+
+    def empties_last_line(self, op: _Replace) -> bool:
+        """Whether a deferred replace would empty (and so drop) an unterminated last line."""
+        tail = self.segments[-1] if self.segments else None
+        if (
+            self.terminate_last
+            or not isinstance(tail, _Lines)
+            or tail.stop != self.index.total_lines
+            or self.data[-1:] in (b"", b"\n")
+        ):
+            return False
+        line = self.data[self.index.line_start(self.data, self.index.total_lines) :]
+        for r in (*self.replaces, op):
+            line = line.replace(r.search, r.replace)
+        return not line
+
+    def chunks(self) -> Iterator[Chunk]:
+        """Produce the edited content, running deferred replaces per segment."""
+        view = memoryview(self.data)
+        open_end = self.data[-1:] not in (b"", b"\n")
+        # One scan finds the lines any deferred replace could change
+        searches = re.compile(b"|".join(re.escape(r.search) for r in self.replaces))
+        last = len(self.segments) - 1
+        line_starts: Dict[int, int] = {}
+        for position, segment in enumerate(self.segments):
+            if isinstance(segment, _Lines):
+                start = line_starts.pop(segment.start, None)
+                if start is None:
+                    start = self.index.line_start(self.data, segment.start + 1)
+                end = self.index.line_start(self.data, segment.stop + 1)
+                line_starts[segment.stop] = end
+                if self.replaces:
+                    yield from _replace_lines(view, start, end, searches, self.replaces)
+                else:
+                    yield view[start:end]
+                # Only the original last line can lack a newline
+                if (
+                    open_end
+                    and segment.stop == self.index.total_lines
+                    and (position < last or self.terminate_last)
+                ):
+                    yield self.newline
+            else:
+                chunk = b"".join(segment.lines)
+                replaces = [r for r in self.replaces if r.seq > segment.seq]
+                yield _run_replaces(chunk, replaces) if replaces else chunk
+
+
+def _split(
+    segment: Union[_Lines, _Text], cut_start: int, cut_stop: int, middle: List[_Text]
+) -> List[Union[_Lines, _Text]]:
+    """Replace lines [cut_start, cut_stop) of a segment with `middle`."""
+    if isinstance(segment, _Lines):
+        head: Union[_Lines, _Text] = _Lines(segment.start, segment.start + cut_start)
+        tail: Union[_Lines, _Text] = _Lines(segment.start + cut_stop, segment.stop)
+    else:
+        head = _Text(segment.lines[:cut_start], segment.seq)
+        tail = _Text(segment.lines[cut_stop:], segment.seq)
+    return [s for s in (head, *middle, tail) if len(s)]
+
+
+def _replace_lines(
+    view: memoryview, start: int, end: int, searches: "re.Pattern[bytes]", replaces: List[_Replace]
+) -> Iterator[Chunk]:
+    """
+    Run replaces over view[start:end], touching only lines that contain a search.
+
+    A line with no search string in it cannot gain one from replaces that
+    do not span lines, so all other lines are passed through as views.
+    """
+    data = view.obj
+    pos = start
+    for match in searches.finditer(data, start, end):
+        if match.start() < pos:
+            continue  # line already replaced
+        line_start = data.rfind(b"\n", start, match.start()) + 1 or start
+        line_end = data.find(b"\n", match.end(), end)
+        line_end = end if line_end == -1 else line_end + 1
+        if line_start > pos:
+            yield view[pos:line_start]
+        yield _run_replaces(bytes(view[line_start:line_end]), replaces)
+        pos = line_end
+    if pos < end:
+        yield view[pos:end]
+
+
+def _run_replaces(chunk: bytes, replaces: Iterable[_Replace]) -> bytes:
+    for op in replaces:
+        replaced = chunk.replace(op.search, op.replace)
+        if len(op.search) != len(op.replace):
+            op.count += (len(replaced) - len(chunk)) // (len(op.replace) - len(op.search))
+        elif replaced != chunk:
+            op.count += chunk.count(op.search)
+        chunk = replaced
+    return chunk
+
+
+def apply_edits(data: bytes, edits: Sequence[Edit]) -> EditResult:
+    """
+    Apply parsed edits, in order, to file contents.
+
+    Returns:
+        EditResult whose chunks concatenate to the edited content
+    """
+    newline = detect_newline(data)
+    doc = _Document(data, newline)
+    replacements = 0
+
+    for seq, edit in enumerate(edits):
+        if edit.action == "insert":
+            encoded = encode_text(edit.text, newline) + newline
+            lines = [part + b"\n" for part in encoded.split(b"\n")[:-1]]
+            doc.insert(edit.line, lines, seq)
+        elif edit.action == "delete":
+            doc.delete(edit.line)
+        else:
+            op = _Replace(
+                seq, encode_text(edit.search, newline), encode_text(edit.replace, newline)
+            )
+            if b"\n" in op.search or b"\n" in op.replace or doc.empties_last_line(op):
+                # May change line numbering: materialize and replace now
+                content = b"".join(doc.chunks())
+                replacements += sum(r.count for r in doc.replaces)
+                replacements += content.count(op.search)
+                doc = _Document(content.replace(op.search, op.replace), newline)
+            else:
+                doc.replaces.append(op)
+
+    chunks = list(doc.chunks())
+    replacements += sum(op.count for op in doc.replaces)
+    return EditResult(chunks=chunks, replacements=replacements, total_lines=doc.total_lines)
+
+
+def find_occurrences(data: bytes, search: bytes, limit: Optional[int] = None) -> List[int]:
+    """Offsets of non-overlapping occurrences of search, at most `limit` of them."""
+    offsets: List[int] = []
+    pos = data.find(search)
+    while pos != -1 and (limit is None or len(offsets) < limit):
+        offsets.append(pos)
+        pos = data.find(search, pos + len(search))
+    return offsets
+
+
+def splice(data: bytes, offsets: Sequence[int], length: int, replacement: bytes) -> List[Chunk]:
+    """Chunks of data with `length` bytes at each offset replaced."""
+    view = memoryview(data)
+    chunks: List[Chunk] = []
+    pos = 0
+    for offset in offsets:
+        chunks.append(view[pos:offset])
+        chunks.append(replacement)
+        pos = offset + length
+    chunks.append(view[pos:])
+    return chunks
+
+
+def changed_lines(data: bytes, offsets: Sequence[int], search: bytes, replacement: bytes) -> int:
+    """
+    Lines changed by replacing search at each offset.
+
+    Counts distinct lines of the result that contain replacement text, plus
+    lines removed when the replacement spans fewer lines than the search.
+    """
+    search_breaks = search.count(b"\n")
+    replacement_breaks = replacement.count(b"\n")
+    changed = 0
+    removed = 0
+    line = 0  # 0-based line of the current offset, in the result
+    pos = 0
+    last_counted = -1
+    for offset in offsets:
+        line += data.count(b"\n", pos, offset)
+        first = max(line, last_counted + 1)
+        last = line + replacement_breaks
+        changed += max(0, last - first + 1)
+        last_counted = max(last_counted, last)
+        removed += max(0, search_breaks - replacement_breaks)
+        # Continue counting from the end of this occurrence, in result lines
+        line = last
+        pos = offset + len(search)
+    return changed + removed
+
+
+def read_file(path: str) -> bytes:
+    """Read a file's bytes."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def atomic_write(path: str, chunks: Iterable[Chunk]) -> None:
+    """
+    Replace a file's contents atomically.
+
+    Writes to a temporary file in the same directory (so the rename never
+    crosses filesystems), keeps the original permission bits and moves it
+    into place with os.replace. Symlinks are written through. A read-only
+    target raises PermissionError as a direct write would.
+    """
+    path = os.path.realpath(path)
+    try:
+        mode: Optional[int] = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    if mode is not None and not os.access(path, os.W_OK):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), path)
+
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
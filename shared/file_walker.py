@@ -0,0 +1,540 @@
+"""
+Ignore-aware directory walker for AgentSwarm Tools Framework.
+
+Walks a tree with ``os.scandir`` and yields files lazily, pruning ignored
+directories before descending into them:
+
+- VCS metadata (.git, .hg, .svn) is never walked
+- With ``respect_ignore`` (the default), .gitignore and .ignore files are
+  honored (including those of parent directories up to the repository root),
+  and dependency/cache directories and virtualenvs are skipped
+- Hidden files and directories are skipped unless ``include_hidden``
+
+Directory listings can be persisted per walk root (default:
+~/.agentswarm/file_lists/) so repeated walks of a large, mostly unchanged tree
+only stat each directory instead of listing it. A listing is reused while the
+directory's mtime is unchanged. Tools enable this with
+FILE_LIST_CACHE_ENABLED=true.
+
+Example:
+    ```python
+    from shared.file_walker import FileListCache, FileWalker
+
+    for entry in FileWalker("/path/to/repo", cache=FileListCache("/path/to/repo")):
+        print(entry.rel_path, entry.stat().st_mtime)
+    ```
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Bump when the file list cache layout changes
+CACHE_VERSION = 1
+
+# Never walked
+VCS_DIRS = frozenset({".git", ".hg", ".svn"})
+
+# Skipped when respecting ignore rules, in addition to .gitignore/.ignore
+DEFAULT_SKIP_DIRS = frozenset(
+    {
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".tox",
+        ".nox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        "site-packages",
+    }
+)
+
+# Ignore files read in each directory, lowest precedence first
+IGNORE_FILES = (".gitignore", ".ignore")
+
+# Listings of directories modified this recently are not cached: a change
+# within the same mtime tick would go unnoticed
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def default_cache_dir() -> Path:
+    """Default file list cache location (~/.agentswarm/file_lists)."""
+    return Path.home() / ".agentswarm" / "file_lists"
+
+
+def _translate_glob(pattern: str, hidden_wildcards: bool = True) -> str:
+    """
+    Translate one glob path component (no '/') into a regex.
+
+    Args:
+        pattern: Component such as '*.py' or 'test_?[0-9]'
+        hidden_wildcards: Whether a leading wildcard may match a leading '.'
+    """
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        i += 1
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "\\" and i < n:
+            out.append(re.escape(pattern[i]))
+            i += 1
+        elif char == "[":
+            end = i
+            if end < n and pattern[end] in "!^":
+                end += 1
+            if end < n and pattern[end] == "]":
+                end += 1
+            end = pattern.find("]", end)
+            if end == -1:
+                out.append("\\[")
+                continue
+            body = pattern[i:end].replace("\\", "\\\\").replace("[", "\\[")
+            if body[:1] in ("!", "^"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        else:
+            out.append(re.escape(char))
+
+    regex = "".join(out)
+    if not hidden_wildcards and not pattern.startswith("."):
+        regex = r"(?!\.)" + regex
+    return regex
+
+
+class IgnoreRules:
+    """
+    Compiled rules of one .gitignore-style file.
+
+    Supports comments, negation (``!``), directory-only rules (trailing ``/``),
+    anchored rules (a ``/`` before the end) and ``**``.
+    """
+
+    def __init__(self, lines: List[str], base: str = ""):
+        """
+        Initialize rules.
+
+        Args:
+            lines: Lines of the ignore file
+            base: Directory of the ignore file, relative to the walk's top
+                directory, with a trailing '/' (empty for the top itself)
+        """
+        self.base = base
+        # (regex, negated, directory only, matches full relative path)
+        self.rules: List[Tuple[re.Pattern, bool, bool, bool]] = []
+        for line in lines:
+            rule = self._compile(line)
+            if rule:
+                self.rules.append(rule)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], base: str = "") -> Optional["IgnoreRules"]:
+        """Load rules from a file, or None if it is missing or has no rules."""
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                rules = cls(f.read().splitlines(), base)
+        except OSError:
+            return None
+        return rules if rules.rules else None
+
+    @staticmethod
+    def _compile(line: str) -> Optional[Tuple[re.Pattern, bool, bool, bool]]:
+        if not line.strip() or line.startswith("#"):
+            return None
+        # Trailing spaces are ignored unless escaped
+        line = re.sub(r"(?<!\\) +$", "", line)
+
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith(("\\!", "\\#")):
+            line = line[1:]
+
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            return None
+
+        anchored = "/" in line
+        parts = line.lstrip("/").split("/")
+        pieces = []
+        for i, part in enumerate(parts):
+            last = i == len(parts) - 1
+            if part == "**":
+                pieces.append(".*" if last else "(?:.*/)?")
+            else:
+                pieces.append(_translate_glob(part) + ("" if last else "/"))
+
+        return re.compile("".join(pieces) + r"\Z", re.DOTALL), negated, dir_only, anchored
+
+    def match(self, rel_path: str, name: str, is_dir: bool) -> Optional[bool]:
+        """
+        Decide whether a path is ignored by these rules.
+
+        Args:
+            rel_path: Path relative to the walk's top directory (posix)
+            name: Last component of rel_path
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True (ignored), False (re-included by a '!' rule), or None (no rule matched)
+        """
+        if self.base:
+            if not rel_path.startswith(self.base):
+                return None
+            rel_path = rel_path[len(self.base) :]
+
+        for regex, negated, dir_only, anchored in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path if anchored else name):
+                return not negated
+        return None
+
+
+@dataclass(slots=True)
+class WalkEntry:
+    """A file (or directory, with include_dirs) found by FileWalker."""
+
+    path: str
+    rel_path: str
+    name: str
+    is_dir: bool = False
+    _entry: Optional[os.DirEntry] = None
+
+    def stat(self) -> os.stat_result:
+        """Stat the path, reusing the os.scandir result when available."""
+        if self._entry is not None:
+            return self._entry.stat()
+        return os.stat(self.path)
+
+
+class FileListCache:
+    """
+    Persisted directory listings for one walk root.
+
+    Each directory's (files, subdirectories) listing is stored with the
+    directory's mtime and reused while the mtime is unchanged.
+    """
+
+    def __init__(self, root: Union[str, Path], cache_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize cache.
+
+        Args:
+            root: Walk root the listings belong to
+            cache_path: Cache file (defaults to ~/.agentswarm/file_lists/<hash>.json)
+        """
+        self.root = str(Path(root).resolve())
+        if cache_path:
+            self.cache_path = Path(cache_path)
+        else:
+            digest = hashlib.sha1(self.root.encode("utf-8")).hexdigest()[:12]
+            self.cache_path = default_cache_dir() / f"{digest}.json"
+
+        self.hits = 0
+        self.misses = 0
+        self._dirs: Dict[str, List] = self._read()
+        self._seen: set = set()
+        self._dirty = False
+
+    def listing(self, rel_dir: str, mtime_ns: int) -> Optional[Tuple[List[str], List[str]]]:
+        """Cached (files, dirs) for a directory, if its mtime is unchanged."""
+        self._seen.add(rel_dir)
+        cached = self._dirs.get(rel_dir)
+        if cached and cached[0] == mtime_ns:
+            self.hits += 1
+            return cached[1], cached[2]
+        self.misses += 1
+        return None
+
+    def store(self, rel_dir: str, mtime_ns: int, files: List[str], dirs: List[str]) -> None:
+        """Record a fresh listing (skipped if the directory changed very recently)."""
+        if time.time_ns() - mtime_ns < RACY_WINDOW_NS:
+            self._dirs.pop(rel_dir, None)
+            return
+        self._dirs[rel_dir] = [mtime_ns, files, dirs]
+        self._dirty = True
+
+    def save(self, complete: bool = False) -> None:
+        """
+        Atomically write the cache file if anything changed.
+
+        Args:
+            complete: The walk visited the whole tree, so directories not seen
+                this time no longer exist (or are ignored) and are dropped
+        """
+        if complete and set(self._dirs) - self._seen:
+            self._dirs = {d: v for d, v in self._dirs.items() if d in self._seen}
+            self._dirty = True
+        if not self._dirty:
+            return
+
+        data = {"version": CACHE_VERSION, "root": self.root, "dirs": self._dirs}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write file list cache {self.cache_path}: {e}")
+
+    def _read(self) -> Dict[str, List]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable file list cache {self.cache_path}: {e}")
+            return {}
+
+        if data.get("version") != CACHE_VERSION or data.get("root") != self.root:
+            return {}
+        return data.get("dirs", {})
+
+
+def file_list_cache_for(root: Union[str, Path]) -> Optional[FileListCache]:
+    """FileListCache for root if FILE_LIST_CACHE_ENABLED is set, else None."""
+    if os.getenv("FILE_LIST_CACHE_ENABLED", "false").lower() in ("1", "true", "yes"):
+        return FileListCache(root)
+    return None
+
+
+class FileWalker:
+    """
+    Lazily walk a directory tree, skipping ignored files and directories.
+
+    Files are yielded depth-first, sorted by name within each directory,
+    each directory's files before its subdirectories. With include_dirs, a
+    directory is yielded right before its contents.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        respect_ignore: bool = True,
+        include_hidden: bool = False,
+        include_dirs: bool = False,
+        max_depth: Optional[int] = None,
+        skip_dirs: frozenset = DEFAULT_SKIP_DIRS,
+        cache: Optional[FileListCache] = None,
+    ):
+        """
+        Initialize walker.
+
+        Args:
+            root: Directory to walk
+            respect_ignore: Honor .gitignore/.ignore files and skip_dirs
+            include_hidden: Also walk names starting with '.' (VCS dirs are always skipped)
+            include_dirs: Also yield directories (before their contents)
+            max_depth: Deepest level yielded (1 = entries directly in root)
+            skip_dirs: Directory names skipped when respecting ignore rules
+            cache: Persisted directory listings to reuse
+        """
+        self.root = str(root)
+        self.respect_ignore = respect_ignore
+        self.include_hidden = include_hidden
+        self.include_dirs = include_dirs
+        self.max_depth = max_depth
+        self.skip_dirs = skip_dirs if respect_ignore else frozenset()
+        self.cache = cache
+        self.dirs_walked = 0
+
+    def __iter__(self) -> Iterator[WalkEntry]:
+        return self.walk()
+
+    def walk(self) -> Iterator[WalkEntry]:
+        """Yield entries under root; closing the iterator early stops the walk."""
+        prefix, rules = self._parent_rules() if self.respect_ignore else ("", ())
+        # (absolute dir, path relative to root, depth, applicable ignore rules,
+        # entry to yield once the directory is known not to be a virtualenv)
+        stack = [(self.root, "", 0, rules, None)]
+        complete = False
+
+        try:
+            while stack:
+                directory, rel_dir, depth, rules, dir_entry = stack.pop()
+                listing = self._list(directory, rel_dir)
+                if listing is None:
+                    continue
+                files, dirs, entries = listing
+                self.dirs_walked += 1
+
+                if self.respect_ignore:
+                    if rel_dir and "pyvenv.cfg" in files:
+                        continue  # virtualenv under a name not in skip_dirs
+                    rules = self._with_local_rules(directory, prefix + rel_dir, files, rules)
+                if dir_entry is not None:
+                    yield dir_entry
+
+                dir_prefix = os.path.join(directory, "")
+                depth += 1
+                descend = self.max_depth is None or depth < self.max_depth
+                subdirs = []
+                for name in dirs:
+                    if self._skip(name, rel_dir, prefix, rules, True):
+                        continue
+                    entry = None
+                    if self.include_dirs:
+                        path = dir_prefix + name
+                        entry = WalkEntry(path, rel_dir + name, name, True, entries.get(name))
+                        if not descend:
+                            yield entry
+                    if descend:
+                        subdirs.append((name, entry))
+
+                for name in files:
+                    if self._skip(name, rel_dir, prefix, rules, False):
+                        continue
+                    yield WalkEntry(
+                        dir_prefix + name, rel_dir + name, name, False, entries.get(name)
+                    )
+
+                for name, entry in reversed(subdirs):
+                    stack.append((dir_prefix + name, f"{rel_dir}{name}/", depth, rules, entry))
+            complete = True
+        finally:
+            if self.cache is not None:
+                self.cache.save(complete=complete and self.max_depth is None)
+
+    def _list(
+        self, directory: str, rel_dir: str
+    ) -> Optional[Tuple[List[str], List[str], Dict[str, os.DirEntry]]]:
+        """Sorted (files, dirs, DirEntry by name) of a directory, or None if unreadable."""
+        mtime_ns = None
+        if self.cache is not None:
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                return None
+            cached = self.cache.listing(rel_dir, mtime_ns)
+            if cached is not None:
+                return cached[0], cached[1], {}
+
+        files, dirs, entries = [], [], {}
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                        if is_dir and entry.is_symlink():
+                            continue  # not followed, avoids cycles
+                    except OSError:
+                        continue
+                    (dirs if is_dir else files).append(entry.name)
+                    entries[entry.name] = entry
+        except OSError as e:
+            logger.debug(f"Cannot scan {directory}: {e}")
+            return None
+
+        files.sort()
+        dirs.sort()
+        if self.cache is not None:
+            self.cache.store(rel_dir, mtime_ns, files, dirs)
+        return files, dirs, entries
+
+    def _skip(self, name: str, rel_dir: str, prefix: str, rules: Tuple, is_dir: bool) -> bool:
+        if is_dir and name in VCS_DIRS:
+            return True
+        if not self.include_hidden and name.startswith("."):
+            return True
+        if is_dir and name in self.skip_dirs:
+            return True
+        if rules:
+            rel_path = prefix + rel_dir + name
+            for ignore in reversed(rules):
+                ignored = ignore.match(rel_path, name, is_dir)
+                if ignored is not None:
+                    return ignored
+        return False
+
+    @staticmethod
+    def _with_local_rules(directory: str, base: str, files: List[str], rules: Tuple) -> Tuple:
+        """Rules for a directory: the inherited rules plus its own ignore files."""
+        for ignore_file in IGNORE_FILES:
+            if ignore_file in files:
+                local = IgnoreRules.from_file(os.path.join(directory, ignore_file), base)
+                if local:
+                    rules = rules + (local,)
+        return rules
+
+    def _parent_rules(self) -> Tuple[str, Tuple]:
+        """
+        Ignore rules of parent directories up to the enclosing repository root.
+
+        Returns:
+            (root's path relative to the repository root with a trailing '/',
+            rules of the parent directories, outermost first)
+        """
+        root = Path(self.root).resolve()
+        chain = [root, *root.parents]
+        for top_index, directory in enumerate(chain):
+            if (directory / ".git").exists():
+                break
+        else:
+            return "", ()  # not inside a repository
+        if top_index == 0:
+            return "", ()  # root's own ignore files are read during the walk
+
+        top = chain[top_index]
+        rules = ()
+        for parent in reversed(chain[1 : top_index + 1]):
+            rel = parent.relative_to(top).as_posix()
+            base = "" if rel == "." else f"{rel}/"
+            for ignore_file in IGNORE_FILES:
+                local = IgnoreRules.from_file(parent / ignore_file, base)
+                if local:
+                    rules = rules + (local,)
+        return f"{root.relative_to(top).as_posix()}/", rules
+
+
+def glob_regex(pattern: str) -> re.Pattern:
+    """
+    Compile a glob pattern ('**' for any number of directories) into a regex
+    matched against posix paths relative to the search root.
+
+    Like glob.glob, wildcards do not match a leading '.' unless the pattern
+    component itself starts with '.'.
+    """
+    parts = pattern.split("/")
+    pieces = []
+    for i, part in enumerate(parts):
+        last = i == len(parts) - 1
+        if part == "**":
+            pieces.append(r"(?:(?!\.)[^/]+(?:/(?!\.)[^/]+)*)?" if last else r"(?:(?!\.)[^/]+/)*")
+        else:
+            pieces.append(_translate_glob(part, hidden_wildcards=False) + ("" if last else "/"))
+    return re.compile("".join(pieces) + r"\Z", re.DOTALL)
+
+
+def split_glob(pattern: str) -> Tuple[str, str, Optional[int]]:
+    """
+    Split a relative glob pattern for walking.
+
+    Returns:
+        (literal leading directories to start the walk from, the rest of the
+        pattern, the depth the rest can match or None if it contains '**')
+    """
+    parts = [p for p in pattern.split("/") if p not in ("", ".")]
+    literal = []
+    while len(parts) > 1 and not re.search(r"[*?\[]", parts[0]):
+        literal.append(parts.pop(0))
+    depth = None if "**" in parts else len(parts)
+    return "/".join(literal), "/".join(parts), depth
@@ -0,0 +1,224 @@
+"""
+Sparse line-offset index over file contents
+
+Used by ReadTool to serve line ranges of memory-mapped files and by the edit
+engine to locate edited lines. The index holds the byte offset and line
+number of the first line starting at or after every BLOCK_BYTES boundary.
+Building it is one pass of bytes.count over the data; after that, any line is
+found by a bisect over the checkpoints plus a scan of at most one block, so
+reading line 5,000,000 costs about the same as reading line 1.
+
+Data is anything that supports find/rfind and slicing to bytes: an mmap or a
+bytes object.
+
+Indexes are kept in process, keyed by real path and validated against the
+file's mtime and size. When a file only grew (an appended log), scanning
+resumes from its last checkpoint. Files of one block or less are indexed on
+each read without caching.
+
+Lines are split on b"\\n"; a trailing newline does not start another line.
+"""
+
+import mmap
+import os
+import threading
+import zlib
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
+
+Buffer = Union[bytes, mmap.mmap]
+
+# Distance in bytes between index checkpoints (the most a lookup scans)
+BLOCK_BYTES = 64 * 1024
+
+# Ranges at most this long are split into lines to find one; longer ones are halved
+SPLIT_BYTES = 4096
+
+# Bytes at the start of the file compared before extending an index
+HEAD_FINGERPRINT_BYTES = 4096
+
+# Indexes kept in process (least recently used are dropped)
+MAX_CACHED_INDEXES = 64
+
+
+class LineIndex:
+    """Checkpoints (line number, byte offset) at least BLOCK_BYTES apart."""
+
+    __slots__ = (
+        "size",
+        "mtime_ns",
+        "total_lines",
+        "block_lines",
+        "block_offsets",
+        "_head_crc",
+        "_tail_crc",
+    )
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.mtime_ns = 0
+        self.total_lines = 0
+        # 1-based number of the first line of each block and where it starts
+        self.block_lines = array("Q")
+        self.block_offsets = array("Q")
+        self._head_crc = 0
+        self._tail_crc = 0
+
+    @classmethod
+    def build(cls, data: Buffer, mtime_ns: int = 0) -> "LineIndex":
+        """Index data in one pass."""
+        index = cls()
+        index._scan(data, 0, 1, mtime_ns)
+        return index
+
+    def is_current(self, st: os.stat_result) -> bool:
+        """Whether the file is unchanged since indexing."""
+        return st.st_mtime_ns == self.mtime_ns and st.st_size == self.size
+
+    def extended(self, data: Buffer, mtime_ns: int) -> Optional["LineIndex"]:
+        """
+        A copy re-indexed only past the last checkpoint, for a file that grew.
+
+        The file is treated as appended to when its first bytes and the bytes
+        of the last (partial) block are unchanged. Returns None if the index
+        has to be rebuilt instead.
+        """
+        if len(data) <= self.size or not self.block_offsets:
+            return None
+        if self._head_crc != _crc(data, 0, HEAD_FINGERPRINT_BYTES):
+            return None
+        resume_offset = self.block_offsets[-1]
+        if self._tail_crc != _crc(data, resume_offset, self.size):
+            return None
+
+        index = LineIndex()
+        index.block_lines = self.block_lines[:-1]
+        index.block_offsets = self.block_offsets[:-1]
+        index._scan(data, resume_offset, self.block_lines[-1], mtime_ns)
+        return index
+
+    def line_start(self, data: Buffer, line: int) -> int:
+        """Byte offset where a 1-based line starts (the data size past the end)."""
+        if line > self.total_lines:
+            return self.size
+        block = bisect_right(self.block_lines, line) - 1
+        pos = self.block_offsets[block]
+        skip = line - self.block_lines[block]
+        if not skip:
+            return pos
+        # Blocks end on a line boundary, so the block holds all skipped lines.
+        # Halve the range by counting until it is small enough to split.
+        end = self.block_offsets[block + 1] if block + 1 < len(self.block_offsets) else self.size
+        while end - pos > SPLIT_BYTES:
+            middle = (pos + end) // 2
+            newlines = data[pos:middle].count(b"\n")
+            if newlines >= skip:
+                end = middle
+            else:
+                pos = middle
+                skip -= newlines
+        chunk = data[pos:end]
+        return pos + len(chunk) - len(chunk.split(b"\n", skip)[-1])
+
+    def line_at(self, data: Buffer, offset: int) -> Tuple[int, int]:
+        """The 1-based line containing a byte offset, and where that line starts."""
+        block = bisect_right(self.block_offsets, offset) - 1
+        block_start = self.block_offsets[block]
+        line = self.block_lines[block] + data[block_start:offset].count(b"\n")
+        start = data.rfind(b"\n", block_start, offset) + 1 or block_start
+        return line, start
+
+    def _scan(self, data: Buffer, pos: int, line: int, mtime_ns: int) -> None:
+        """Add checkpoints from pos (the start of `line`) to the end of the data."""
+        size = len(data)
+        while pos < size:
+            self.block_lines.append(line)
+            self.block_offsets.append(pos)
+            end = min(pos + BLOCK_BYTES, size)
+            if end < size:
+                newline = data.find(b"\n", end - 1)
+                end = size if newline == -1 else newline + 1
+            line += data[pos:end].count(b"\n")
+            pos = end
+
+        ends_open = size > 0 and data[size - 1 : size] != b"\n"
+        self.total_lines = line - 1 + int(ends_open)
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self._head_crc = _crc(data, 0, HEAD_FINGERPRINT_BYTES)
+        self._tail_crc = _crc(data, self.block_offsets[-1], size) if self.block_offsets else 0
+
+
+def _crc(data: Buffer, start: int, end: int) -> int:
+    return zlib.crc32(data[start:end])
+
+
+def read_lines(
+    data: Buffer,
+    start: int,
+    max_lines: Optional[int],
+    max_bytes: int,
+    end: Optional[int] = None,
+) -> Tuple[List[str], int, bool]:
+    """
+    Decode whole lines from byte offset `start`.
+
+    Stops after max_lines lines, at byte offset `end` (finishing the line it
+    falls in), or before the line that would take the total over max_bytes.
+    A first line longer than max_bytes is cut at max_bytes.
+
+    Returns:
+        (lines without their line endings, offset after the last line, truncated)
+    """
+    size = len(data)
+    stop = size if end is None else min(end, size)
+    lines: List[str] = []
+    pos = start
+    used = 0
+    while pos < stop and (max_lines is None or len(lines) < max_lines):
+        newline = data.find(b"\n", pos)
+        line_end = size if newline == -1 else newline + 1
+        length = line_end - pos
+        if used + length > max_bytes:
+            if not lines:
+                lines.append(_decode(data[pos : pos + max_bytes]))
+            return lines, pos, True
+        lines.append(_decode(data[pos:line_end]))
+        used += length
+        pos = line_end
+    return lines, pos, False
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace").rstrip()
+
+
+_indexes: "OrderedDict[str, LineIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_line_index(path: str, mm: mmap.mmap, st: os.stat_result) -> LineIndex:
+    """Cached index for a mapped file, extended or rebuilt if the file changed."""
+    if st.st_size <= BLOCK_BYTES:
+        return LineIndex.build(mm, st.st_mtime_ns)
+
+    key = os.path.realpath(path)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+
+    if index is not None and index.is_current(st):
+        return index
+    index = index.extended(mm, st.st_mtime_ns) if index is not None else None
+    if index is None:
+        index = LineIndex.build(mm, st.st_mtime_ns)
+
+    with _indexes_lock:
+        _indexes[key] = index
+        _indexes.move_to_end(key)
+        while len(_indexes) > MAX_CACHED_INDEXES:
+            _indexes.popitem(last=False)
+    return index
@@ -8,16 +8,30 @@ Provides unified interface for 100+ LLM providers with:
 - Cost tracking and logging
 - Rate limit handling
 - Streaming support
+- Async and batched completions with per-provider concurrency and
+  tokens-per-minute budgets, and optional hedged requests
+- Response cache with exact-match and embedding-similarity tiers
 """
 
+import asyncio
+import atexit
+import concurrent.futures
 import json
 import logging
+import math
 import os
+import sqlite3
+import threading
 import time
+import weakref
+from array import array
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Iterator, List, Optional, Union
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
 try:
     import litellm
@@ -31,15 +45,31 @@ except ImportError:
     LITELLM_AVAILABLE = False
     litellm = None
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+from .cache import generate_cache_key
 from .errors import (
     APIError,
     AuthenticationError,
     RateLimitError,
     TimeoutError,
+    ToolError,
 )
 
 logger = logging.getLogger(__name__)
 
+# Recent cost records kept in memory (totals are aggregated separately)
+MAX_COST_RECORDS = 1000
+
+# Cost records buffered before a batched write to the metrics database
+COST_FLUSH_BATCH = 50
+
 
 class TaskType(Enum):
     """Types of LLM tasks."""
@@ -83,7 +113,7 @@ class LLMResponse:
     metadata: Dict[str, Any] = field(default_factory=dict)  # Additional metadata
 
 
-@dataclass
+@dataclass(slots=True)
 class CostTrackingRecord:
     """Record of LLM costs for analytics."""
 
@@ -100,6 +130,370 @@ class CostTrackingRecord:
     error_message: Optional[str] = None
     user_id: Optional[str] = None
     request_id: Optional[str] = None
+    cached: bool = False  # Served from the response cache
+    cost_saved: float = 0.0  # Cost of the original request a cache hit replaced
+
+
+@dataclass
+class ProviderLimits:
+    """Client-side limits for concurrent requests to one provider."""
+
+    max_concurrency: int = 8  # Requests in flight at once
+    tokens_per_minute: Optional[int] = None  # Prompt + completion tokens (None = unlimited)
+
+
+DEFAULT_PROVIDER_LIMITS = ProviderLimits()
+
+
+class TokenBudget:
+    """
+    Tokens-per-minute budget shared by all requests to a provider.
+
+    A token bucket that refills continuously at tokens_per_minute / 60 per
+    second. Requests reserve an estimate up front and settle against the
+    actual usage once the response arrives. Thread-safe and usable from any
+    event loop.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        """
+        Initialize budget.
+
+        Args:
+            tokens_per_minute: Tokens allowed per minute
+        """
+        self.capacity = float(tokens_per_minute)
+        self._rate = tokens_per_minute / 60.0
+        self._available = self.capacity
+        self._last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._available = min(
+            self.capacity, self._available + (now - self._last_update) * self._rate
+        )
+        self._last_update = now
+
+    @property
+    def available(self) -> float:
+        """Tokens that can be reserved right now."""
+        with self._lock:
+            self._refill()
+            return self._available
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until tokens can be reserved, then reserve them."""
+        # A single request larger than the whole budget waits for a full bucket
+        tokens = min(float(tokens), self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self._available >= tokens:
+                    self._available -= tokens
+                    return
+                wait_time = (tokens - self._available) / self._rate
+            logger.debug(f"Token budget: waiting {wait_time:.2f}s for {tokens:.0f} tokens")
+            await asyncio.sleep(wait_time)
+
+    def settle(self, reserved: int, used: int) -> None:
+        """Correct a reservation with the tokens actually used."""
+        with self._lock:
+            self._refill()
+            self._available = min(self.capacity, self._available + reserved - used)
+
+
+class LLMResponseCache:
+    """
+    Response cache for chat completions.
+
+    Exact tier: an in-memory LRU keyed on a hash of (model, messages,
+    temperature, params). Semantic tier (optional): an on-disk SQLite vector
+    index (~/.agentswarm/llm_cache.db) that returns a cached response when a
+    new conversation's embedding is close enough to a cached one for the same
+    model and params. Both tiers expire entries after ttl seconds and keep at
+    most max_entries, evicting the least recently used.
+
+    Only requests with temperature <= max_temperature (default 0) are cached,
+    since sampled responses are not meant to repeat.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl: int = 3600,
+        max_temperature: float = 0.0,
+        semantic: bool = False,
+        similarity_threshold: float = 0.95,
+        embedding_model: str = "text-embedding-3-small",
+        embed_fn: Optional[Callable[[str], List[float]]] = None,
+        index_path: Optional[Path] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum entries per tier (LRU eviction)
+            ttl: Seconds an entry stays valid
+            max_temperature: Highest temperature whose responses are cached
+            semantic: Enable the embedding-similarity tier
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            embedding_model: LiteLLM embedding model for the semantic tier
+            embed_fn: Custom text -> vector function (replaces embedding_model)
+            index_path: SQLite file for the semantic tier
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_temperature = max_temperature
+        self.semantic = semantic
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        self.embed_fn = embed_fn or self._litellm_embed
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.index_path = None
+        if semantic:
+            if index_path is None:
+                cache_dir = Path.home() / ".agentswarm"
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                index_path = cache_dir / "llm_cache.db"
+            self.index_path = Path(index_path)
+            self._init_index()
+
+    def cacheable(self, temperature: float, stream: bool = False) -> bool:
+        """Whether a request with these settings may be served from the cache."""
+        return not stream and temperature <= self.max_temperature
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        params: Dict[str, Any],
+    ) -> str:
+        """Canonical hash of a request."""
+        return generate_cache_key(
+            "chat_completion",
+            (),
+            {"model": model, "messages": messages, "temperature": temperature, "params": params},
+        )
+
+    @staticmethod
+    def make_scope(model: str, temperature: float, params: Dict[str, Any]) -> str:
+        """Hash of everything except the messages; semantic hits must share it."""
+        return LLMResponseCache.make_key(model, [], temperature, params)
+
+    def get(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        params: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Returns:
+            Cached response payload with "cache_tier" (and "similarity" for
+            semantic hits), or None
+        """
+        return self.lookup(model, messages, temperature, params)[0]
+
+    def lookup(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        params: Dict[str, Any],
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[array]]:
+        """
+        Look up a cached response, keeping the embedding a semantic miss computed.
+
+        Returns:
+            (payload or None as from get(), embedding to pass to put() so a
+            miss is embedded only once; None unless the semantic tier missed)
+        """
+        key = self.make_key(model, messages, temperature, params)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return {**entry[1], "cache_tier": "exact"}, None
+            if entry:
+                del self._entries[key]
+
+        embedding = None
+        if self.semantic:
+            embedding = self._embed(messages)
+            payload = self._semantic_get(self.make_scope(model, temperature, params), embedding)
+            if payload is not None:
+                with self._lock:
+                    self.hits += 1
+                    self.semantic_hits += 1
+                return payload, None
+
+        with self._lock:
+            self.misses += 1
+        return None, embedding
+
+    def put(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        params: Dict[str, Any],
+        payload: Dict[str, Any],
+        embedding: Optional[array] = None,
+    ) -> None:
+        """Store a response payload in both tiers (embedding: from lookup(), if any)."""
+        key = self.make_key(model, messages, temperature, params)
+
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        if self.semantic:
+            if embedding is None:
+                embedding = self._embed(messages)
+            self._semantic_put(key, self.make_scope(model, temperature, params), embedding, payload)
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._entries.clear()
+        if self.semantic:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM responses")
+
+    # Semantic tier
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection; commits on success and always closes."""
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_index(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    scope TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    payload TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_scope ON responses(scope)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used)"
+            )
+
+    @staticmethod
+    def _conversation_text(messages: List[Dict[str, Any]]) -> str:
+        return "\n".join(f"{m.get('role', '')}: {m.get('content', '')}" for m in messages)
+
+    def _litellm_embed(self, text: str) -> List[float]:
+        response = litellm.embedding(model=self.embedding_model, input=[text])
+        return response.data[0]["embedding"]
+
+    def _embed(self, messages: List[Dict[str, Any]]) -> Optional[array]:
+        """Unit-length float32 embedding of a conversation, or None on failure."""
+        try:
+            vector = array("f", self.embed_fn(self._conversation_text(messages)))
+        except Exception as e:
+            logger.warning(f"Embedding for semantic cache failed: {e}")
+            return None
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return array("f", (x / norm for x in vector))
+
+    def _semantic_get(self, scope: str, query: Optional[array]) -> Optional[Dict[str, Any]]:
+        if query is None:
+            return None
+
+        now = time.time()
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, embedding FROM responses WHERE scope = ? AND expires_at > ?",
+                (scope, now),
+            ).fetchall()
+            # Entries from a different embedding model have another dimension
+            rows = [row for row in rows if len(row[1]) == len(query.tobytes())]
+            if not rows:
+                return None
+
+            similarities = _dot_products(query, [row[1] for row in rows])
+            best = max(range(len(rows)), key=similarities.__getitem__)
+            if similarities[best] < self.similarity_threshold:
+                return None
+
+            key = rows[best][0]
+            conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            payload = conn.execute("SELECT payload FROM responses WHERE key = ?", (key,)).fetchone()
+
+        return {
+            **json.loads(payload[0]),
+            "cache_tier": "semantic",
+            "similarity": round(similarities[best], 4),
+        }
+
+    def _semantic_put(
+        self,
+        key: str,
+        scope: str,
+        vector: Optional[array],
+        payload: Dict[str, Any],
+    ) -> None:
+        if vector is None:
+            return
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, scope, vector.tobytes(), json.dumps(payload), now + self.ttl, now),
+            )
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            conn.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+
+def _dot_products(query: array, blobs: List[bytes]) -> List[float]:
+    """Dot product of a float32 vector with each float32 blob (cosine for unit vectors)."""
+    if NUMPY_AVAILABLE:
+        matrix = np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(blobs), -1)
+        return (matrix @ np.frombuffer(query.tobytes(), dtype=np.float32)).tolist()
+
+    results = []
+    for blob in blobs:
+        vector = array("f")
+        vector.frombytes(blob)
+        results.append(sum(a * b for a, b in zip(query, vector)))
+    return results
 
 
 # Default model configurations with actual pricing
@@ -235,6 +629,11 @@ class LLMClient:
         enable_cost_tracking: bool = True,
         max_retries: int = 3,
         timeout: int = 60,
+        provider_limits: Optional[Dict[str, ProviderLimits]] = None,
+        hedge_after: Optional[float] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        max_cost_records: int = MAX_COST_RECORDS,
+        persist_costs: bool = False,
     ):
         """
         Initialize LLM client.
@@ -245,6 +644,13 @@ class LLMClient:
             enable_cost_tracking: Track costs for analytics
             max_retries: Maximum retry attempts
             timeout: Request timeout in seconds
+            provider_limits: Per-provider concurrency and TPM limits for async calls
+            hedge_after: Seconds before an async call also tries the next fallback
+                model (None = no hedging)
+            response_cache: Cache for low-temperature chat completions
+            max_cost_records: Recent cost records kept in cost_records
+            persist_costs: Also write cost records to the metrics database
+                (~/.agentswarm/metrics.db) in batches
         """
         if not LITELLM_AVAILABLE:
             raise ImportError("LiteLLM is not installed. Install with: pip install litellm>=1.30.0")
@@ -254,7 +660,28 @@ class LLMClient:
         self.enable_cost_tracking = enable_cost_tracking
         self.max_retries = max_retries
         self.timeout = timeout
-        self.cost_records: List[CostTrackingRecord] = []
+        self.cost_records: Deque[CostTrackingRecord] = deque(maxlen=max_cost_records)
+        self.persist_costs = persist_costs
+
+        # Running totals over all records, including those rotated out of cost_records
+        self._total_cost = 0.0
+        self._total_cost_saved = 0.0
+        self._cost_by_model: Dict[str, float] = {}
+        self._cost_by_provider: Dict[str, float] = {}
+        self._pending_costs: List[CostTrackingRecord] = []
+        self._cost_lock = threading.Lock()
+        if persist_costs:
+            atexit.register(self.flush_cost_records)
+        self.provider_limits = provider_limits or {}
+        self.hedge_after = hedge_after
+        self.response_cache = response_cache
+
+        # asyncio semaphores belong to one event loop; budgets are loop-independent
+        self._semaphores: "weakref.WeakKeyDictionary[Any, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._budgets: Dict[str, Optional[TokenBudget]] = {}
+        self._limits_lock = threading.Lock()
 
         # Configure LiteLLM
         litellm.set_verbose = os.getenv("LITELLM_VERBOSE", "false").lower() == "true"
@@ -294,6 +721,15 @@ class LLMClient:
         if not self.enable_fallback:
             models_to_try = [model]
 
+        cache_params = {"max_tokens": max_tokens, **kwargs}
+        use_cache = self.response_cache is not None and self.response_cache.cacheable(
+            temperature, stream
+        )
+        if use_cache:
+            hit, embedding = self.response_cache.lookup(model, messages, temperature, cache_params)
+            if hit is not None:
+                return self._cached_response(hit, start_time)
+
         last_error = None
 
         for attempt, current_model in enumerate(models_to_try):
@@ -310,75 +746,378 @@ class LLMClient:
                     **kwargs,
                 )
 
-                latency_ms = (time.time() - start_time) * 1000
-
                 if stream:
                     # Return streaming iterator
-                    return self._stream_response(response, current_model, start_time)
-
-                # Parse response
-                content = response.choices[0].message.content
-                usage = response.usage.__dict__ if hasattr(response, "usage") else {}
+                    return self._stream_response(response, current_model, start_time, messages)
 
-                # Calculate cost
-                cost = self._calculate_cost(
+                result = self._build_chat_response(
+                    response,
                     current_model,
-                    TaskType.CHAT_COMPLETION,
-                    usage.get("prompt_tokens", 0),
-                    usage.get("completion_tokens", 0),
+                    start_time,
+                    {"attempt": attempt + 1, "fallback_used": attempt > 0},
                 )
-
-                # Track cost
-                if self.enable_cost_tracking:
-                    self._record_cost(
-                        model=current_model,
-                        task_type=TaskType.CHAT_COMPLETION,
-                        input_tokens=usage.get("prompt_tokens", 0),
-                        output_tokens=usage.get("completion_tokens", 0),
-                        cost=cost,
-                        latency_ms=latency_ms,
+                if use_cache:
+                    self.response_cache.put(
+                        model,
+                        messages,
+                        temperature,
+                        cache_params,
+                        self._cache_payload(result),
+                        embedding,
                     )
+                return result
 
-                logger.info(
-                    f"Chat completion successful with {current_model}. "
-                    f"Cost: ${cost:.6f}, Latency: {latency_ms:.0f}ms"
+            except Exception as e:
+                last_error = self._convert_error(e, current_model)
+
+        self._fail_chat_completion(model, last_error)
+
+    async def achat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "gpt-3.5-turbo",
+        fallback_models: Optional[List[str]] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        hedge_after: Optional[float] = None,
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Generate chat completion asynchronously.
+
+        Requests wait for a slot under their provider's concurrency limit and
+        tokens-per-minute budget. Fallback models are tried when a model
+        fails; with hedging, the next fallback model is also started when a
+        request has not answered within hedge_after seconds, and the first
+        successful response wins.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            model: Primary model to use
+            fallback_models: List of fallback models if primary fails or is slow
+            temperature: Sampling temperature (0-2)
+            max_tokens: Maximum tokens to generate
+            hedge_after: Hedging threshold in seconds (default: client setting)
+            **kwargs: Additional model-specific parameters
+
+        Returns:
+            LLMResponse
+
+        Raises:
+            APIError: If all models fail
+        """
+        start_time = time.time()
+        models_to_try = [model] + (fallback_models or [])
+
+        if not self.enable_fallback:
+            models_to_try = [model]
+
+        if hedge_after is None:
+            hedge_after = self.hedge_after
+
+        cache_params = {"max_tokens": max_tokens, **kwargs}
+        use_cache = self.response_cache is not None and self.response_cache.cacheable(temperature)
+        if use_cache:
+            hit, embedding = await self._acache_call(
+                self.response_cache.lookup, model, messages, temperature, cache_params
+            )
+            if hit is not None:
+                return self._cached_response(hit, start_time)
+
+        candidates = deque(enumerate(models_to_try))
+        running: Dict[asyncio.Task, str] = {}
+        hedges = 0
+        last_error: Optional[ToolError] = None
+
+        def launch() -> None:
+            attempt, current_model = candidates.popleft()
+            logger.info(f"Attempting async chat completion with model: {current_model}")
+            task = asyncio.ensure_future(
+                self._acompletion_once(
+                    current_model,
+                    messages,
+                    temperature,
+                    max_tokens,
+                    start_time,
+                    {"attempt": attempt + 1, "fallback_used": attempt > 0},
+                    **kwargs,
+                )
+            )
+            running[task] = current_model
+
+        launch()
+        try:
+            while running:
+                wait_for = hedge_after if candidates and hedge_after is not None else None
+                done, _ = await asyncio.wait(
+                    running, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED
                 )
 
-                return LLMResponse(
-                    content=content,
+                if not done:
+                    # Slow response: race the next fallback model against it
+                    logger.info(f"No response after {hedge_after:g}s, hedging with next model")
+                    hedges += 1
+                    launch()
+                    continue
+
+                for task in done:
+                    running.pop(task)
+                    try:
+                        response = task.result()
+                    except ToolError as e:
+                        last_error = e
+                        continue
+                    response.metadata["hedged"] = hedges > 0
+                    if use_cache:
+                        await self._acache_call(
+                            self.response_cache.put,
+                            model,
+                            messages,
+                            temperature,
+                            cache_params,
+                            self._cache_payload(response),
+                            embedding,
+                        )
+                    return response
+
+                if candidates and len(running) == 0:
+                    launch()
+        finally:
+            for task in running:
+                task.cancel()
+
+        self._fail_chat_completion(model, last_error)
+
+    def batch_chat_completion(
+        self,
+        list_of_messages: List[List[Dict[str, str]]],
+        concurrency: int = 8,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[Union[LLMResponse, ToolError]]:
+        """
+        Run many chat completions concurrently from synchronous code.
+
+        Args:
+            list_of_messages: One message list per completion
+            concurrency: Maximum completions in flight (provider limits also apply)
+            return_exceptions: Return errors in place of failed responses
+                instead of raising the first one
+            **kwargs: Arguments for achat_completion (model, fallback_models, ...)
+
+        Returns:
+            Responses in the same order as list_of_messages
+
+        Raises:
+            APIError: If a completion fails and return_exceptions is False
+        """
+        coro = self.abatch_chat_completion(
+            list_of_messages,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+            **kwargs,
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # Called from inside an event loop: run the batch on its own loop
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    async def abatch_chat_completion(
+        self,
+        list_of_messages: List[List[Dict[str, str]]],
+        concurrency: int = 8,
+        return_exceptions: bool = False,
+        **kwargs,
+    ) -> List[Union[LLMResponse, ToolError]]:
+        """
+        Run many chat completions concurrently.
+
+        Args:
+            list_of_messages: One message list per completion
+            concurrency: Maximum completions in flight (provider limits also apply)
+            return_exceptions: Return errors in place of failed responses
+                instead of raising the first one
+            **kwargs: Arguments for achat_completion (model, fallback_models, ...)
+
+        Returns:
+            Responses in the same order as list_of_messages
+
+        Raises:
+            APIError: If a completion fails and return_exceptions is False
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run_one(messages: List[Dict[str, str]]) -> LLMResponse:
+            async with semaphore:
+                return await self.achat_completion(messages, **kwargs)
+
+        results = await asyncio.gather(
+            *(run_one(messages) for messages in list_of_messages), return_exceptions=True
+        )
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+        return results
+
+    async def _acompletion_once(
+        self,
+        current_model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        start_time: float,
+        metadata: Dict[str, Any],
+        **kwargs,
+    ) -> LLMResponse:
+        """One async request under its provider's concurrency and token limits."""
+        provider = self._get_provider(current_model)
+        budget = self._get_budget(provider)
+        reserved = self._estimate_request_tokens(messages, max_tokens)
+        used = 0
+
+        if budget:
+            await budget.acquire(reserved)
+        try:
+            async with self._get_semaphore(provider):
+                response = await acompletion(
                     model=current_model,
-                    provider=self._get_provider(current_model),
-                    usage=usage,
-                    cost=cost,
-                    latency_ms=latency_ms,
-                    metadata={"attempt": attempt + 1, "fallback_used": attempt > 0},
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=self.timeout,
+                    **kwargs,
                 )
+            result = self._build_chat_response(response, current_model, start_time, metadata)
+            used = result.usage.get("prompt_tokens", 0) + result.usage.get("completion_tokens", 0)
+            return result
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            raise self._convert_error(e, current_model) from e
+        finally:
+            if budget:
+                budget.settle(reserved, used)
+
+    def _build_chat_response(
+        self, response: Any, model: str, start_time: float, metadata: Dict[str, Any]
+    ) -> LLMResponse:
+        """Parse a completion response and track its cost."""
+        latency_ms = (time.time() - start_time) * 1000
 
-            except LiteLLMRateLimitError as e:
-                last_error = RateLimitError(
-                    f"Rate limit exceeded for {current_model}: {e}",
-                    retry_after=60,
-                )
-                logger.warning(f"Rate limit hit for {current_model}, trying next model...")
+        # Parse response
+        content = response.choices[0].message.content
+        usage = response.usage.__dict__ if hasattr(response, "usage") else {}
 
-            except LiteLLMAuthError as e:
-                last_error = AuthenticationError(
-                    f"Authentication failed for {current_model}: {e}",
-                    api_name=current_model,
-                )
-                logger.warning(f"Auth error for {current_model}, trying next model...")
+        # Calculate cost
+        cost = self._calculate_cost(
+            model,
+            TaskType.CHAT_COMPLETION,
+            usage.get("prompt_tokens", 0),
+            usage.get("completion_tokens", 0),
+        )
 
-            except LiteLLMTimeout as e:
-                last_error = TimeoutError(
-                    f"Request timeout for {current_model}: {e}", timeout=self.timeout
-                )
-                logger.warning(f"Timeout for {current_model}, trying next model...")
+        # Track cost
+        if self.enable_cost_tracking:
+            self._record_cost(
+                model=model,
+                task_type=TaskType.CHAT_COMPLETION,
+                input_tokens=usage.get("prompt_tokens", 0),
+                output_tokens=usage.get("completion_tokens", 0),
+                cost=cost,
+                latency_ms=latency_ms,
+            )
 
-            except Exception as e:
-                last_error = APIError(f"Error with {current_model}: {e}", api_name=current_model)
-                logger.warning(f"Error with {current_model}: {e}, trying next model...")
+        logger.info(
+            f"Chat completion successful with {model}. "
+            f"Cost: ${cost:.6f}, Latency: {latency_ms:.0f}ms"
+        )
 
-        # All models failed
+        return LLMResponse(
+            content=content,
+            model=model,
+            provider=self._get_provider(model),
+            usage=usage,
+            cost=cost,
+            latency_ms=latency_ms,
+            metadata=metadata,
+        )
+
+    async def _acache_call(self, func: Callable, *args: Any) -> Any:
+        """Run a cache call, off the event loop when the semantic tier may block."""
+        if self.response_cache.semantic:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    @staticmethod
+    def _cache_payload(response: LLMResponse) -> Dict[str, Any]:
+        """Fields of a response kept in the response cache."""
+        return {
+            "content": response.content,
+            "model": response.model,
+            "provider": response.provider,
+            "usage": dict(response.usage),
+            "cost": response.cost,
+        }
+
+    def _cached_response(self, hit: Dict[str, Any], start_time: float) -> LLMResponse:
+        """Build a response from a cache hit and record the cost it saved."""
+        latency_ms = (time.time() - start_time) * 1000
+
+        if self.enable_cost_tracking:
+            self._record_cost(
+                model=hit["model"],
+                task_type=TaskType.CHAT_COMPLETION,
+                latency_ms=latency_ms,
+                cached=True,
+                cost_saved=hit["cost"],
+            )
+
+        logger.info(
+            f"Chat completion served from {hit['cache_tier']} cache. Saved: ${hit['cost']:.6f}"
+        )
+
+        metadata = {"cached": True, "cache_tier": hit["cache_tier"]}
+        if "similarity" in hit:
+            metadata["similarity"] = hit["similarity"]
+
+        return LLMResponse(
+            content=hit["content"],
+            model=hit["model"],
+            provider=hit["provider"],
+            usage=hit["usage"],
+            cost=0.0,
+            latency_ms=latency_ms,
+            metadata=metadata,
+        )
+
+    def _convert_error(self, error: Exception, model: str) -> ToolError:
+        """Map a LiteLLM exception to the framework's error types."""
+        if isinstance(error, LiteLLMRateLimitError):
+            logger.warning(f"Rate limit hit for {model}, trying next model...")
+            return RateLimitError(f"Rate limit exceeded for {model}: {error}", retry_after=60)
+
+        if isinstance(error, LiteLLMAuthError):
+            logger.warning(f"Auth error for {model}, trying next model...")
+            return AuthenticationError(
+                f"Authentication failed for {model}: {error}", api_name=model
+            )
+
+        if isinstance(error, LiteLLMTimeout):
+            logger.warning(f"Timeout for {model}, trying next model...")
+            return TimeoutError(f"Request timeout for {model}: {error}", timeout=self.timeout)
+
+        logger.warning(f"Error with {model}: {error}, trying next model...")
+        return APIError(f"Error with {model}: {error}", api_name=model)
+
+    def _fail_chat_completion(self, model: str, last_error: Optional[ToolError]) -> None:
+        """Record and raise the error for a completion where all models failed."""
         error_msg = f"All models failed. Last error: {last_error}"
         logger.error(error_msg)
 
@@ -392,6 +1131,34 @@ class LLMClient:
 
         raise APIError(error_msg, api_name="llm_client")
 
+    def get_provider_limits(self, provider: str) -> ProviderLimits:
+        """Limits that apply to async requests for a provider."""
+        return self.provider_limits.get(provider, DEFAULT_PROVIDER_LIMITS)
+
+    def _get_semaphore(self, provider: str) -> asyncio.Semaphore:
+        """Concurrency limit for a provider on the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._limits_lock:
+            semaphores = self._semaphores.setdefault(loop, {})
+            if provider not in semaphores:
+                limits = self.get_provider_limits(provider)
+                semaphores[provider] = asyncio.Semaphore(max(1, limits.max_concurrency))
+            return semaphores[provider]
+
+    def _get_budget(self, provider: str) -> Optional[TokenBudget]:
+        """Tokens-per-minute budget for a provider, if one is configured."""
+        with self._limits_lock:
+            if provider not in self._budgets:
+                tpm = self.get_provider_limits(provider).tokens_per_minute
+                self._budgets[provider] = TokenBudget(tpm) if tpm else None
+            return self._budgets[provider]
+
+    @staticmethod
+    def _estimate_request_tokens(messages: List[Dict[str, Any]], max_tokens: Optional[int]) -> int:
+        """Rough token estimate (~4 characters per token) to reserve before a request."""
+        chars = sum(len(str(message.get("content", ""))) for message in messages)
+        return chars // 4 + 4 * len(messages) + (max_tokens or 0)
+
     def generate_image(
         self,
         prompt: str,
@@ -545,33 +1312,52 @@ class LLMClient:
         )
 
     def _stream_response(
-        self, response_stream: Iterator, model: str, start_time: float
+        self,
+        response_stream: Iterator,
+        model: str,
+        start_time: float,
+        messages: Optional[List[Dict[str, Any]]] = None,
     ) -> Iterator[str]:
         """Handle streaming responses with cost tracking."""
-        accumulated_tokens = 0
+        parts: List[str] = []
 
         for chunk in response_stream:
             if hasattr(chunk, "choices") and len(chunk.choices) > 0:
                 delta = chunk.choices[0].delta
                 if hasattr(delta, "content") and delta.content:
-                    accumulated_tokens += len(delta.content.split())
+                    parts.append(delta.content)
                     yield delta.content
 
-        # Track final cost estimate
+        # Streams carry no usage; count tokens once the output is complete
+        input_tokens = self._count_tokens(model, messages=messages) if messages else 0
+        output_tokens = self._count_tokens(model, text="".join(parts))
         latency_ms = (time.time() - start_time) * 1000
-        cost = self._calculate_cost(
-            model, TaskType.CHAT_COMPLETION, 0, accumulated_tokens  # Rough estimate
-        )
+        cost = self._calculate_cost(model, TaskType.CHAT_COMPLETION, input_tokens, output_tokens)
 
         if self.enable_cost_tracking:
             self._record_cost(
                 model=model,
                 task_type=TaskType.CHAT_COMPLETION,
-                output_tokens=accumulated_tokens,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
                 cost=cost,
                 latency_ms=latency_ms,
             )
 
+    @staticmethod
+    def _count_tokens(
+        model: str,
+        text: Optional[str] = None,
+        messages: Optional[List[Dict[str, Any]]] = None,
+    ) -> int:
+        """Count tokens with LiteLLM's tokenizer for the model (~4 chars/token fallback)."""
+        try:
+            return litellm.token_counter(model=model, text=text, messages=messages)
+        except Exception:
+            if messages is not None:
+                text = "".join(str(message.get("content", "")) for message in messages)
+            return math.ceil(len(text or "") / 4)
+
     def _calculate_cost(
         self,
         model: str,
@@ -611,6 +1397,8 @@ class LLMClient:
         latency_ms: float = 0.0,
         success: bool = True,
         error_message: Optional[str] = None,
+        cached: bool = False,
+        cost_saved: float = 0.0,
     ) -> None:
         """Record cost for analytics."""
         record = CostTrackingRecord(
@@ -625,45 +1413,86 @@ class LLMClient:
             latency_ms=latency_ms,
             success=success,
             error_message=error_message,
+            cached=cached,
+            cost_saved=cost_saved,
         )
-        self.cost_records.append(record)
+
+        batch = None
+        with self._cost_lock:
+            self.cost_records.append(record)
+            self._total_cost += cost
+            self._total_cost_saved += cost_saved
+            self._cost_by_model[model] = self._cost_by_model.get(model, 0.0) + cost
+            self._cost_by_provider[record.provider] = (
+                self._cost_by_provider.get(record.provider, 0.0) + cost
+            )
+            if self.persist_costs:
+                self._pending_costs.append(record)
+                if len(self._pending_costs) >= COST_FLUSH_BATCH:
+                    batch, self._pending_costs = self._pending_costs, []
+
+        if batch:
+            self._write_cost_records(batch)
+
+    def flush_cost_records(self) -> None:
+        """Write buffered cost records to the metrics database."""
+        with self._cost_lock:
+            batch, self._pending_costs = self._pending_costs, []
+        if batch:
+            self._write_cost_records(batch)
+
+    def _write_cost_records(self, batch: List[CostTrackingRecord]) -> None:
+        """Persist a batch of cost records; failures never affect LLM calls."""
+        from .monitoring import get_monitor
+
+        try:
+            get_monitor().record_llm_costs([self._cost_record_dict(r) for r in batch])
+        except Exception as e:
+            logger.warning(f"Failed to persist {len(batch)} LLM cost records: {e}")
 
     def get_total_cost(self) -> float:
         """Get total cost of all requests."""
-        return sum(record.cost for record in self.cost_records)
+        return self._total_cost
+
+    def get_cost_saved(self) -> float:
+        """Get total cost avoided by response cache hits."""
+        return self._total_cost_saved
 
     def get_cost_by_model(self) -> Dict[str, float]:
         """Get costs grouped by model."""
-        costs = {}
-        for record in self.cost_records:
-            costs[record.model] = costs.get(record.model, 0.0) + record.cost
-        return costs
+        with self._cost_lock:
+            return dict(self._cost_by_model)
 
     def get_cost_by_provider(self) -> Dict[str, float]:
         """Get costs grouped by provider."""
-        costs = {}
-        for record in self.cost_records:
-            costs[record.provider] = costs.get(record.provider, 0.0) + record.cost
-        return costs
+        with self._cost_lock:
+            return dict(self._cost_by_provider)
+
+    @staticmethod
+    def _cost_record_dict(record: CostTrackingRecord) -> Dict[str, Any]:
+        """Record as a dict of plain values (timestamp stays a datetime)."""
+        return {
+            "timestamp": record.timestamp,
+            "model": record.model,
+            "provider": record.provider,
+            "task_type": record.task_type.value,
+            "input_tokens": record.input_tokens,
+            "output_tokens": record.output_tokens,
+            "total_tokens": record.total_tokens,
+            "cost": record.cost,
+            "latency_ms": record.latency_ms,
+            "success": record.success,
+            "error_message": record.error_message,
+            "cached": record.cached,
+            "cost_saved": record.cost_saved,
+        }
 
     def export_cost_records(self, filepath: str) -> None:
-        """Export cost records to JSON file."""
-        records = [
-            {
-                "timestamp": record.timestamp.isoformat(),
-                "model": record.model,
-                "provider": record.provider,
-                "task_type": record.task_type.value,
-                "input_tokens": record.input_tokens,
-                "output_tokens": record.output_tokens,
-                "total_tokens": record.total_tokens,
-                "cost": record.cost,
-                "latency_ms": record.latency_ms,
-                "success": record.success,
-                "error_message": record.error_message,
-            }
-            for record in self.cost_records
-        ]
+        """Export recent cost records (up to max_cost_records) to JSON file."""
+        with self._cost_lock:
+            records = [self._cost_record_dict(record) for record in self.cost_records]
+        for record in records:
+            record["timestamp"] = record["timestamp"].isoformat()
 
         with open(filepath, "w") as f:
             json.dump(records, f, indent=2)
@@ -701,9 +1530,19 @@ def get_llm_client(
         if enable_cost_tracking is not None:
             cost_tracking = enable_cost_tracking
 
+        response_cache = None
+        if os.getenv("LITELLM_CACHE_ENABLED", "false").lower() == "true":
+            response_cache = LLMResponseCache(
+                ttl=int(os.getenv("LITELLM_CACHE_TTL", "3600")),
+                semantic=os.getenv("LITELLM_SEMANTIC_CACHE", "false").lower() == "true",
+                similarity_threshold=float(os.getenv("LITELLM_CACHE_SIMILARITY", "0.95")),
+            )
+
         _client = LLMClient(
             enable_fallback=fallback,
             enable_cost_tracking=cost_tracking,
+            response_cache=response_cache,
+            persist_costs=os.getenv("LITELLM_PERSIST_COSTS", "false").lower() == "true",
         )
 
     return _client
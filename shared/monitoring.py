@@ -7,6 +7,8 @@ Provides:
 - Resource usage tracking (CPU, memory)
 - Metrics export (JSON, Prometheus format)
 - Alert thresholds
+- Response payload size tracking (serialized bytes per tool)
+- LLM cost records (batched inserts from LLMClient)
 - SQLite-based persistent storage with minimal overhead
 """
 
@@ -83,6 +85,9 @@ class AggregatedMetrics:
     requests_per_minute: float = 0.0
     first_seen: Optional[datetime] = None
     last_seen: Optional[datetime] = None
+    avg_response_bytes: Optional[float] = None
+    max_response_bytes: Optional[int] = None
+    total_response_bytes: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -162,6 +167,54 @@ class PerformanceMonitor:
             """
             )
 
+            # Serialized response sizes (recorded by transports such as the MCP server)
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS response_sizes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    tool_name TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    source TEXT
+                )
+            """
+            )
+
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_response_tool_timestamp
+                ON response_sizes(tool_name, timestamp)
+            """
+            )
+
+            # LLM calls made through shared.llm_client
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_costs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    provider TEXT,
+                    task_type TEXT,
+                    input_tokens INTEGER DEFAULT 0,
+                    output_tokens INTEGER DEFAULT 0,
+                    cost REAL DEFAULT 0,
+                    latency_ms REAL DEFAULT 0,
+                    success INTEGER NOT NULL,
+                    cached INTEGER DEFAULT 0,
+                    cost_saved REAL DEFAULT 0,
+                    error_message TEXT
+                )
+            """
+            )
+
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_llm_costs_timestamp
+                ON llm_costs(timestamp)
+            """
+            )
+
             conn.commit()
 
     def _cleanup_old_data(self) -> None:
@@ -171,6 +224,8 @@ class PerformanceMonitor:
 
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("DELETE FROM performance_metrics WHERE timestamp < ?", (cutoff_str,))
+            conn.execute("DELETE FROM response_sizes WHERE timestamp < ?", (cutoff_str,))
+            conn.execute("DELETE FROM llm_costs WHERE timestamp < ?", (cutoff_str,))
             conn.commit()
 
     def record_metric(self, metric: PerformanceMetric) -> None:
@@ -204,6 +259,133 @@ class PerformanceMonitor:
                 )
                 conn.commit()
 
+    def record_response_size(self, tool_name: str, size_bytes: int, source: str = "mcp") -> None:
+        """
+        Record the serialized size of a tool response.
+
+        Args:
+            tool_name: Tool name
+            size_bytes: Serialized response size in bytes
+            source: Transport that serialized the response
+        """
+        with self._lock:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT INTO response_sizes (tool_name, timestamp, size_bytes, source)
+                    VALUES (?, ?, ?, ?)
+                """,
+                    (tool_name, datetime.utcnow().isoformat(), size_bytes, source),
+                )
+                conn.commit()
+
+    def record_llm_costs(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Record a batch of LLM cost records in one transaction.
+
+        Args:
+            records: Dicts with the llm_costs columns (timestamp as datetime)
+        """
+        if not records:
+            return
+
+        rows = [
+            (
+                record["timestamp"].isoformat(),
+                record["model"],
+                record.get("provider"),
+                record.get("task_type"),
+                record.get("input_tokens", 0),
+                record.get("output_tokens", 0),
+                record.get("cost", 0.0),
+                record.get("latency_ms", 0.0),
+                1 if record.get("success", True) else 0,
+                1 if record.get("cached") else 0,
+                record.get("cost_saved", 0.0),
+                record.get("error_message"),
+            )
+            for record in records
+        ]
+
+        with self._lock:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO llm_costs
+                    (timestamp, model, provider, task_type, input_tokens, output_tokens,
+                     cost, latency_ms, success, cached, cost_saved, error_message)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
+                conn.commit()
+
+    def get_llm_costs(self, days: int = 7) -> Dict[str, Dict[str, Any]]:
+        """
+        Get LLM usage and cost per model.
+
+        Args:
+            days: Number of days to look back
+
+        Returns:
+            Dict of model -> requests, failures, cache_hits, tokens, cost, cost_saved
+        """
+        cutoff_str = (datetime.utcnow() - timedelta(days=days)).isoformat()
+
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT model, COUNT(*), SUM(1 - success), SUM(cached),
+                       SUM(input_tokens + output_tokens), SUM(cost), SUM(cost_saved)
+                FROM llm_costs
+                WHERE timestamp >= ?
+                GROUP BY model
+            """,
+                (cutoff_str,),
+            ).fetchall()
+
+        return {
+            model: {
+                "requests": requests,
+                "failures": failures,
+                "cache_hits": cache_hits,
+                "tokens": tokens,
+                "cost": cost,
+                "cost_saved": cost_saved,
+            }
+            for model, requests, failures, cache_hits, tokens, cost, cost_saved in rows
+        }
+
+    def get_response_sizes(self, tool_name: str, days: int = 7) -> Dict[str, Any]:
+        """
+        Get aggregated response sizes for a tool.
+
+        Args:
+            tool_name: Tool name
+            days: Number of days to look back
+
+        Returns:
+            Dict with count, avg_bytes, max_bytes and total_bytes
+        """
+        cutoff_str = (datetime.utcnow() - timedelta(days=days)).isoformat()
+
+        with sqlite3.connect(self.db_path) as conn:
+            count, avg_bytes, max_bytes, total_bytes = conn.execute(
+                """
+                SELECT COUNT(*), AVG(size_bytes), MAX(size_bytes), SUM(size_bytes)
+                FROM response_sizes
+                WHERE tool_name = ? AND timestamp >= ?
+            """,
+                (tool_name, cutoff_str),
+            ).fetchone()
+
+        return {
+            "count": count,
+            "avg_bytes": avg_bytes,
+            "max_bytes": max_bytes,
+            "total_bytes": total_bytes or 0,
+        }
+
     def get_metrics(
         self, tool_name: str, days: int = 7, include_percentiles: bool = True
     ) -> AggregatedMetrics:
@@ -235,6 +417,8 @@ class PerformanceMonitor:
 
             rows = cursor.fetchall()
 
+        sizes = self.get_response_sizes(tool_name, days)
+
         if not rows:
             # Return empty metrics
             return AggregatedMetrics(
@@ -250,6 +434,9 @@ class PerformanceMonitor:
                 max_latency_ms=0.0,
                 total_duration_ms=0.0,
                 error_rate_percent=0.0,
+                avg_response_bytes=sizes["avg_bytes"],
+                max_response_bytes=sizes["max_bytes"],
+                total_response_bytes=sizes["total_bytes"],
             )
 
         # Extract data
@@ -316,6 +503,9 @@ class PerformanceMonitor:
             requests_per_minute=requests_per_minute,
             first_seen=timestamps[0] if timestamps else None,
             last_seen=timestamps[-1] if timestamps else None,
+            avg_response_bytes=sizes["avg_bytes"],
+            max_response_bytes=sizes["max_bytes"],
+            total_response_bytes=sizes["total_bytes"],
         )
 
     def get_all_metrics(self, days: int = 7) -> Dict[str, AggregatedMetrics]:
@@ -469,45 +659,62 @@ class PerformanceMonitor:
             Prometheus-formatted metrics string
         """
         all_metrics = self.get_all_metrics(days)
+        if not all_metrics:
+            return ""
         lines = []
 
-        for tool_name, metrics in all_metrics.items():
-            # Request count
-            lines.append(f"# HELP agentswarm_tool_requests_total Total requests for tool")
-            lines.append(f"# TYPE agentswarm_tool_requests_total counter")
-            lines.append(
-                f'agentswarm_tool_requests_total{{tool="{tool_name}"}} {metrics.total_requests}'
-            )
-
-            # Success count
-            lines.append(
-                f'agentswarm_tool_requests_success{{tool="{tool_name}"}} {metrics.successful_requests}'
-            )
-
-            # Failure count
-            lines.append(
-                f'agentswarm_tool_requests_failed{{tool="{tool_name}"}} {metrics.failed_requests}'
-            )
-
-            # Latency metrics
-            lines.append(f"# HELP agentswarm_tool_latency_ms Tool latency in milliseconds")
-            lines.append(f"# TYPE agentswarm_tool_latency_ms summary")
-            lines.append(
-                f'agentswarm_tool_latency_ms{{tool="{tool_name}",quantile="0.5"}} {metrics.p50_latency_ms}'
-            )
-            lines.append(
-                f'agentswarm_tool_latency_ms{{tool="{tool_name}",quantile="0.95"}} {metrics.p95_latency_ms}'
-            )
-            lines.append(
-                f'agentswarm_tool_latency_ms{{tool="{tool_name}",quantile="0.99"}} {metrics.p99_latency_ms}'
-            )
+        # (name, type, help, [(extra labels, attribute)]) for each metric family
+        families = [
+            (
+                "agentswarm_tool_requests_total",
+                "counter",
+                "Total requests for tool",
+                [("", "total_requests")],
+            ),
+            (
+                "agentswarm_tool_requests_success",
+                "counter",
+                "Successful requests for tool",
+                [("", "successful_requests")],
+            ),
+            (
+                "agentswarm_tool_requests_failed",
+                "counter",
+                "Failed requests for tool",
+                [("", "failed_requests")],
+            ),
+            (
+                "agentswarm_tool_latency_ms",
+                "summary",
+                "Tool latency in milliseconds",
+                [
+                    (',quantile="0.5"', "p50_latency_ms"),
+                    (',quantile="0.95"', "p95_latency_ms"),
+                    (',quantile="0.99"', "p99_latency_ms"),
+                ],
+            ),
+            (
+                "agentswarm_tool_error_rate",
+                "gauge",
+                "Error rate percentage",
+                [("", "error_rate_percent")],
+            ),
+            (
+                "agentswarm_tool_response_bytes_total",
+                "counter",
+                "Serialized response bytes",
+                [("", "total_response_bytes")],
+            ),
+        ]
 
-            # Error rate
-            lines.append(f"# HELP agentswarm_tool_error_rate Error rate percentage")
-            lines.append(f"# TYPE agentswarm_tool_error_rate gauge")
-            lines.append(
-                f'agentswarm_tool_error_rate{{tool="{tool_name}"}} {metrics.error_rate_percent}'
-            )
+        # HELP and TYPE appear once per metric, followed by every tool's samples
+        for name, metric_type, help_text, samples in families:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for tool_name, metrics in all_metrics.items():
+                for labels, attribute in samples:
+                    value = getattr(metrics, attribute)
+                    lines.append(f'{name}{{tool="{tool_name}"{labels}}} {value}')
 
         return "\n".join(lines)
 
@@ -653,6 +860,21 @@ def record_performance_metric(
     monitor.record_metric(metric)
 
 
+def record_response_size(tool_name: str, size_bytes: int, source: str = "mcp") -> None:
+    """
+    Record the serialized size of a tool response.
+
+    Args:
+        tool_name: Name of the tool
+        size_bytes: Serialized response size in bytes
+        source: Transport that serialized the response
+    """
+    if not _enabled:
+        return
+
+    get_monitor().record_response_size(tool_name, size_bytes, source)
+
+
 if __name__ == "__main__":
     # Test performance monitoring
     print("Testing Performance Monitoring...")
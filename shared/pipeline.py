@@ -5,6 +5,7 @@ Provides fluent API for building tool pipelines with:
 - Method chaining
 - Data transformation between steps
 - Parallel execution support
+- Streaming (lazy, chunked) map/filter execution
 - Error handling
 - Pipeline composition
 
@@ -22,6 +23,18 @@ Example:
         .execute()
     )
 
+    # Streaming mode: map/filter consume and yield lazily, reduce materializes
+    result = (
+        Pipeline("etl")
+        .streaming_mode(chunk_size=500, max_buffered_chunks=4)
+        .add_function("load", lambda: read_rows("big.csv"))
+        .filter("valid", lambda row: row["amount"] > 0)
+        .map("amount", lambda row: row["amount"])
+        .reduce("total", lambda acc, x: acc + x, initial=0)
+        .execute()
+    )
+    print(result["streaming"]["peak_memory_bytes"])
+
     # Or using decorator
     @pipeline_builder
     def research_workflow(topic: str):
@@ -34,18 +47,244 @@ Example:
 
 import inspect
 import logging
+import queue
+import threading
 import time
+import tracemalloc
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from functools import wraps
+from itertools import islice
 from typing import Any, Callable, Dict, List, Optional, Union
 
 from .base import BaseTool
+from .batch import ExecutorType, SilentProgressCallback, get_default_max_workers, parallel_process
 from .errors import ToolError, ValidationError
 from .registry import tool_registry
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Default number of items pulled from upstream per chunk in streaming mode
+DEFAULT_CHUNK_SIZE = 1000
+
+# Sentinel marking the end of a prefetched stream
+_END_OF_STREAM = object()
+
+
+def _is_streamable(data: Any) -> bool:
+    """Return True if data should be treated as a stream of items (not a scalar)."""
+    if isinstance(data, (str, bytes, bytearray, dict)):
+        return False
+    return isinstance(data, Iterable)
+
+
+def _iter_chunks(data: Iterable, chunk_size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most chunk_size items, pulling lazily from data."""
+    iterator = iter(data)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _prefetch_chunks(chunks: Iterator[List[Any]], max_buffered_chunks: int) -> Iterator[List[Any]]:
+    """
+    Pull chunks from upstream in a background thread.
+
+    The bounded queue provides backpressure: the producer blocks once
+    max_buffered_chunks chunks are waiting to be consumed. Upstream
+    exceptions are re-raised in the consumer.
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=max_buffered_chunks)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def producer() -> None:
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+            put(_END_OF_STREAM)
+        except BaseException as e:  # forwarded to consumer
+            put(e)
+
+    thread = threading.Thread(target=producer, name="pipeline-prefetch", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END_OF_STREAM:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def _resolve_executor_type(executor: Union[ExecutorType, str]) -> ExecutorType:
+    """Convert an executor name ("thread"/"process") to ExecutorType."""
+    if isinstance(executor, ExecutorType):
+        return executor
+    try:
+        return ExecutorType(executor)
+    except ValueError:
+        raise ValidationError(
+            f"Invalid executor: {executor!r} (expected 'thread' or 'process')",
+            field="executor",
+        )
+
+
+class _IndexedCall:
+    """Apply func to an (index, item) pair, returning (index, result) to restore order."""
+
+    def __init__(self, func: Callable, params: Dict[str, Any]):
+        self.func = func
+        self.params = params
+
+    def __call__(self, indexed_item: tuple) -> tuple:
+        index, item = indexed_item
+        return index, self.func(item, **self.params)
+
+
+def _parallel_apply(
+    func: Callable,
+    params: Dict[str, Any],
+    items: List[Any],
+    workers: int,
+    executor_type: ExecutorType,
+) -> List[Any]:
+    """Apply func to items on a worker pool, returning results in input order."""
+    batch = parallel_process(
+        items=list(enumerate(items)),
+        processor=_IndexedCall(func, params),
+        max_workers=workers,
+        executor_type=executor_type,
+        progress_callback=SilentProgressCallback(),
+        continue_on_error=False,
+    )
+
+    if batch.failed_count > 0:
+        failure = batch.failures[0]
+        raise ToolError(
+            f"Parallel map failed on item {failure['item_index']}: {failure['error']}",
+            error_code="PARALLEL_MAP_ERROR",
+            details=failure,
+        )
+
+    return [result for _, result in sorted(batch.successes, key=lambda pair: pair[0])]
+
+
+# Step bodies for map/filter/reduce/conditional. These are module-level
+# callables (not closures) so pipelines can be pickled to a process pool.
+
+
+class _MapStep:
+    """Step body for Pipeline.map."""
+
+    def __init__(
+        self,
+        pipeline: "Pipeline",
+        func: Callable,
+        params: Dict[str, Any],
+        workers: Optional[int],
+        executor_type: ExecutorType,
+    ):
+        self.pipeline = pipeline
+        self.func = func
+        self.params = params
+        self.workers = workers
+        self.executor_type = executor_type
+
+    def __call__(self, data: Any) -> Any:
+        if self.pipeline.streaming and _is_streamable(data):
+            return self._stream(data)
+        if isinstance(data, list):
+            return self._apply(data)
+        else:
+            return self.func(data, **self.params)
+
+    def _stream(self, data: Iterable) -> Iterator[Any]:
+        for chunk in self.pipeline._chunks(data):
+            if self._parallel:
+                yield from self._apply(chunk)
+            else:
+                for item in chunk:
+                    yield self.func(item, **self.params)
+
+    @property
+    def _parallel(self) -> bool:
+        return self.workers is not None and self.workers > 1
+
+    def _apply(self, items: List[Any]) -> List[Any]:
+        if self._parallel and len(items) > 1:
+            return _parallel_apply(self.func, self.params, items, self.workers, self.executor_type)
+        return [self.func(item, **self.params) for item in items]
+
+
+class _FilterStep:
+    """Step body for Pipeline.filter."""
+
+    def __init__(self, pipeline: "Pipeline", predicate: Callable):
+        self.pipeline = pipeline
+        self.predicate = predicate
+
+    def __call__(self, data: Any) -> Any:
+        predicate = self.predicate
+        if self.pipeline.streaming and _is_streamable(data):
+            return (
+                item for chunk in self.pipeline._chunks(data) for item in chunk if predicate(item)
+            )
+        if isinstance(data, list):
+            return [item for item in data if predicate(item)]
+        else:
+            return data if predicate(data) else None
+
+
+class _ReduceStep:
+    """Step body for Pipeline.reduce."""
+
+    def __init__(self, pipeline: "Pipeline", func: Callable, initial: Any):
+        self.pipeline = pipeline
+        self.func = func
+        self.initial = initial
+
+    def __call__(self, data: Any) -> Any:
+        if isinstance(data, list) or (self.pipeline.streaming and _is_streamable(data)):
+            from functools import reduce as py_reduce
+
+            return py_reduce(self.func, data, self.initial)
+        else:
+            return data
+
+
+class _ConditionalStep:
+    """Step body for Pipeline.conditional."""
+
+    def __init__(self, condition: Callable, then_step: Callable, else_step: Optional[Callable]):
+        self.condition = condition
+        self.then_step = then_step
+        self.else_step = else_step
+
+    def __call__(self, data: Any) -> Any:
+        if self.condition(data):
+            return self.then_step(data)
+        elif self.else_step:
+            return self.else_step(data)
+        else:
+            return data
+
 
 class PipelineStep:
     """Represents a single step in a pipeline."""
@@ -75,6 +314,12 @@ class PipelineStep:
         self.error: Optional[str] = None
         self.duration_ms: Optional[float] = None
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Results (possibly live generators) are not shipped to worker processes
+        state = self.__dict__.copy()
+        state["result"] = None
+        return state
+
     def execute(self, previous_result: Any = None) -> Any:
         """
         Execute this step.
@@ -188,6 +433,10 @@ class Pipeline:
         self.steps: List[PipelineStep] = []
         self.error_handlers: List[Callable] = []
         self.continue_on_error = False
+        self.streaming = False
+        self.chunk_size = DEFAULT_CHUNK_SIZE
+        self.max_buffered_chunks = 0
+        self.track_memory = False
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
 
@@ -258,31 +507,51 @@ class Pipeline:
         """
         return self.add_step(name, func, **params)
 
-    def map(self, name: str, func: Callable, **params) -> "Pipeline":
+    def map(
+        self,
+        name: str,
+        func: Callable,
+        workers: Optional[int] = None,
+        executor: Union[ExecutorType, str] = ExecutorType.THREAD,
+        **params,
+    ) -> "Pipeline":
         """
         Map a function over previous results (if list).
 
+        In streaming mode the step consumes any iterable lazily and yields
+        results one by one instead of building a list.
+
+        With ``workers`` > 1 items are fanned out through
+        ``shared.batch.parallel_process`` (one batch per chunk in streaming
+        mode). Results keep input order. Use ``executor="process"`` for
+        CPU-bound functions; ``func`` and the items must then be picklable.
+
         Args:
             name: Step name
             func: Function to map
+            workers: Number of parallel workers (None/1 = run inline)
+            executor: Executor type ("thread" for I/O-bound, "process" for CPU-bound)
             **params: Additional parameters
 
         Returns:
             Self for chaining
 
+        Raises:
+            ValidationError: If workers or executor are invalid
+
         Example:
             ```python
             pipeline.map("extract_urls", lambda item: item['url'])
+            pipeline.map("fetch", fetch_page, workers=16)
+            pipeline.map("hash", expensive_hash, workers=4, executor="process")
             ```
         """
 
-        def mapper(data):
-            if isinstance(data, list):
-                return [func(item, **params) for item in data]
-            else:
-                return func(data, **params)
+        if workers is not None and workers < 1:
+            raise ValidationError("workers must be >= 1", field="workers")
+        executor_type = _resolve_executor_type(executor)
 
-        return self.add_step(name, mapper)
+        return self.add_step(name, _MapStep(self, func, params, workers, executor_type))
 
     def filter(
         self,
@@ -292,6 +561,9 @@ class Pipeline:
         """
         Filter previous results (if list).
 
+        In streaming mode the step consumes any iterable lazily and yields
+        matching items instead of building a list.
+
         Args:
             name: Step name
             predicate: Filter function (returns bool)
@@ -305,13 +577,7 @@ class Pipeline:
             ```
         """
 
-        def filterer(data):
-            if isinstance(data, list):
-                return [item for item in data if predicate(item)]
-            else:
-                return data if predicate(data) else None
-
-        return self.add_step(name, filterer)
+        return self.add_step(name, _FilterStep(self, predicate))
 
     def reduce(
         self,
@@ -322,6 +588,9 @@ class Pipeline:
         """
         Reduce previous results (if list).
 
+        In streaming mode this is the materialization point: the upstream
+        iterator is consumed item by item into the accumulator.
+
         Args:
             name: Step name
             func: Reduce function (acc, item) -> acc
@@ -336,15 +605,7 @@ class Pipeline:
             ```
         """
 
-        def reducer(data):
-            if isinstance(data, list):
-                from functools import reduce as py_reduce
-
-                return py_reduce(func, data, initial)
-            else:
-                return data
-
-        return self.add_step(name, reducer)
+        return self.add_step(name, _ReduceStep(self, func, initial))
 
     def conditional(
         self,
@@ -376,15 +637,7 @@ class Pipeline:
             ```
         """
 
-        def conditional_func(data):
-            if condition(data):
-                return then_step(data)
-            elif else_step:
-                return else_step(data)
-            else:
-                return data
-
-        return self.add_step(name, conditional_func)
+        return self.add_step(name, _ConditionalStep(condition, then_step, else_step))
 
     def on_error(self, handler: Callable) -> "Pipeline":
         """
@@ -417,6 +670,57 @@ class Pipeline:
         self.continue_on_error = enabled
         return self
 
+    def streaming_mode(
+        self,
+        enabled: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_buffered_chunks: int = 0,
+        track_memory: bool = False,
+    ) -> "Pipeline":
+        """
+        Enable/disable streaming execution.
+
+        In streaming mode ``map`` and ``filter`` steps consume their input
+        lazily and yield results, so no intermediate lists are built and
+        downstream steps start on the first chunk. ``reduce`` is the only
+        step that materializes the stream; if the pipeline ends in a lazy
+        step, ``execute()`` collects the final stream into a list (use
+        ``stream()`` to consume it item by item instead).
+
+        Args:
+            enabled: Whether to stream map/filter steps
+            chunk_size: Items pulled from upstream per chunk
+            max_buffered_chunks: Chunks prefetched ahead of the consumer in a
+                background thread (0 = pure pull, no prefetch). The producer
+                blocks when the buffer is full.
+            track_memory: Report peak traced memory. Off by default: tracemalloc
+                slows every allocation while the pipeline runs
+
+        Returns:
+            Self for chaining
+
+        Example:
+            ```python
+            pipeline.streaming_mode(chunk_size=500, max_buffered_chunks=4)
+            ```
+        """
+        if chunk_size < 1:
+            raise ValidationError("chunk_size must be >= 1", field="chunk_size")
+        if max_buffered_chunks < 0:
+            raise ValidationError("max_buffered_chunks must be >= 0", field="max_buffered_chunks")
+        self.streaming = enabled
+        self.chunk_size = chunk_size
+        self.max_buffered_chunks = max_buffered_chunks
+        self.track_memory = track_memory
+        return self
+
+    def _chunks(self, data: Iterable) -> Iterator[List[Any]]:
+        """Split a stream into chunks, prefetching ahead if configured."""
+        chunks = _iter_chunks(data, self.chunk_size)
+        if self.max_buffered_chunks > 0:
+            return _prefetch_chunks(chunks, self.max_buffered_chunks)
+        return chunks
+
     def execute(self, initial_data: Any = None) -> Dict[str, Any]:
         """
         Execute the pipeline.
@@ -430,15 +734,68 @@ class Pipeline:
             - result: Final result
             - steps: List of step results
             - duration_ms: Total execution time
+            - streaming: Streaming stats (streaming mode only): chunk settings,
+              items_out, time_to_first_result_ms and, with track_memory,
+              peak_memory_bytes
 
         Raises:
             ToolError: If pipeline fails and continue_on_error is False
         """
+        return self._execute(initial_data, materialize=True)
+
+    def stream(self, initial_data: Any = None) -> Iterator[Any]:
+        """
+        Execute the pipeline and yield final results one by one.
+
+        Map/filter steps run lazily as items are pulled, so the first item
+        is available before upstream has finished. A non-iterable final
+        result is yielded as a single item.
+
+        Args:
+            initial_data: Optional initial data to pass to first step
+
+        Yields:
+            Items of the final step's output
+
+        Raises:
+            ToolError: If the pipeline fails
+
+        Example:
+            ```python
+            for row in pipeline.streaming_mode().stream(rows):
+                write(row)
+            ```
+        """
+        result = self._execute(initial_data, materialize=False)
+        if not result["success"]:
+            raise ToolError(
+                f"Pipeline {self.name} failed: {result['error']}",
+                tool_name=self.name,
+            )
+
+        data = result["result"]
+        if _is_streamable(data):
+            yield from data
+        else:
+            yield data
+
+    def _execute(self, initial_data: Any, materialize: bool) -> Dict[str, Any]:
+        """Run all steps; in streaming mode optionally collect the final stream."""
         self.start_time = time.time()
+        self.end_time = None
         logger.info(f"Executing pipeline: {self.name} ({len(self.steps)} steps)")
 
         current_data = initial_data
         step_results = []
+        stream_stats: Optional[Dict[str, Any]] = None
+
+        started_tracing = False
+        if self.streaming and materialize and self.track_memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                started_tracing = True
 
         try:
             for i, step in enumerate(self.steps):
@@ -481,13 +838,65 @@ class Pipeline:
                     if not self.continue_on_error:
                         raise
 
+            if self.streaming and materialize:
+                stream_stats = {
+                    "chunk_size": self.chunk_size,
+                    "max_buffered_chunks": self.max_buffered_chunks,
+                }
+                try:
+                    current_data = self._collect_stream(current_data, stream_stats)
+                except Exception as e:
+                    # Errors from lazy map/filter steps surface while draining
+                    logger.error(f"Streaming pipeline {self.name} failed: {e}")
+                    for handler in self.error_handlers:
+                        try:
+                            handler(e)
+                        except Exception as handler_error:
+                            logger.error(f"Error handler failed: {handler_error}")
+                    raise
+
             # Success
             self.end_time = time.time()
-            return self._build_result(success=True, result=current_data, step_results=step_results)
+            return self._build_result(
+                success=True,
+                result=current_data,
+                step_results=step_results,
+                stream_stats=stream_stats,
+            )
 
         except Exception as e:
             self.end_time = time.time()
-            return self._build_result(success=False, error=str(e), step_results=step_results)
+            return self._build_result(
+                success=False,
+                error=str(e),
+                step_results=step_results,
+                stream_stats=stream_stats,
+            )
+
+        finally:
+            # stream_stats is shared with the returned result dict
+            if stream_stats is not None and self.track_memory and tracemalloc.is_tracing():
+                stream_stats["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+
+    def _collect_stream(self, data: Any, stats: Dict[str, Any]) -> Any:
+        """Drain a lazy final result into a list, recording time-to-first-result."""
+        stats["time_to_first_result_ms"] = None
+        stats["items_out"] = 0
+
+        if not isinstance(data, Iterator):
+            stats["time_to_first_result_ms"] = (time.time() - self.start_time) * 1000
+            stats["items_out"] = len(data) if isinstance(data, list) else 1
+            return data
+
+        collected = []
+        for item in data:
+            if not collected:
+                stats["time_to_first_result_ms"] = (time.time() - self.start_time) * 1000
+            collected.append(item)
+        stats["items_out"] = len(collected)
+        return collected
 
     def _build_result(
         self,
@@ -495,11 +904,12 @@ class Pipeline:
         result: Any = None,
         error: Optional[str] = None,
         step_results: Optional[List[Dict[str, Any]]] = None,
+        stream_stats: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Build pipeline execution result."""
         duration_ms = (self.end_time - self.start_time) * 1000 if self.end_time else 0
 
-        return {
+        output = {
             "success": success,
             "pipeline_name": self.name,
             "result": result,
@@ -510,6 +920,9 @@ class Pipeline:
             "duration_ms": duration_ms,
             "timestamp": datetime.utcnow().isoformat(),
         }
+        if stream_stats is not None:
+            output["streaming"] = stream_stats
+        return output
 
     def __call__(self, initial_data: Any = None) -> Dict[str, Any]:
         """Allow pipeline to be called as a function."""
@@ -581,18 +994,57 @@ def pipeline_builder(func: Callable) -> Callable:
     return wrapper
 
 
+def _run_branch(branch: tuple) -> tuple:
+    """Execute one ParallelPipeline branch, returning (index, result)."""
+    index, pipeline, initial_data = branch
+    return index, pipeline.execute(initial_data)
+
+
 class ParallelPipeline:
     """
-    Execute multiple pipelines in parallel (simulated).
+    Execute multiple pipelines in parallel.
 
-    Note: Currently simulates parallel execution by running sequentially.
-    True parallel execution would require threading/async.
+    Branches run on a thread pool (default, for I/O-bound pipelines) or a
+    process pool (for CPU-bound pipelines) via ``shared.batch.parallel_process``.
+    Results are returned in the order pipelines were added.
+
+    With ``executor="process"`` each pipeline is pickled to a worker, so its
+    steps must be picklable (module-level functions, tool classes or tool
+    names), and step state is not reflected back onto the original objects.
+
+    Example:
+        ```python
+        parallel = (
+            ParallelPipeline("multi-search", max_workers=4)
+            .add_pipeline(web_pipeline)
+            .add_pipeline(scholar_pipeline)
+        )
+        result = parallel.execute()
+        ```
     """
 
-    def __init__(self, name: str = "parallel-pipeline"):
-        """Initialize parallel pipeline."""
+    def __init__(
+        self,
+        name: str = "parallel-pipeline",
+        max_workers: Optional[int] = None,
+        executor: Union[ExecutorType, str] = ExecutorType.THREAD,
+    ):
+        """
+        Initialize parallel pipeline.
+
+        Args:
+            name: Parallel pipeline name
+            max_workers: Maximum concurrent branches (None = one per pipeline,
+                capped at the executor's default worker count)
+            executor: Executor type ("thread" or "process")
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValidationError("max_workers must be >= 1", field="max_workers")
+
         self.name = name
         self.pipelines: List[Pipeline] = []
+        self.max_workers = max_workers
+        self.executor_type = _resolve_executor_type(executor)
 
     def add_pipeline(self, pipeline: Pipeline) -> "ParallelPipeline":
         """Add a pipeline to execute in parallel."""
@@ -607,18 +1059,34 @@ class ParallelPipeline:
             initial_data: Data to pass to all pipelines
 
         Returns:
-            Combined results from all pipelines
+            Combined results from all pipelines (in the order they were added)
         """
         start_time = time.time()
-        results = []
+        results: List[Dict[str, Any]] = []
 
-        for pipeline in self.pipelines:
-            try:
-                result = pipeline.execute(initial_data)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Parallel pipeline {pipeline.name} failed: {e}")
-                results.append({"success": False, "pipeline_name": pipeline.name, "error": str(e)})
+        if self.pipelines:
+            max_workers = self.max_workers or min(
+                len(self.pipelines), get_default_max_workers(self.executor_type)
+            )
+            batch = parallel_process(
+                items=[(i, pipeline, initial_data) for i, pipeline in enumerate(self.pipelines)],
+                processor=_run_branch,
+                max_workers=max_workers,
+                executor_type=self.executor_type,
+                progress_callback=SilentProgressCallback(),
+                continue_on_error=True,
+            )
+
+            by_index: Dict[int, Dict[str, Any]] = dict(batch.successes)
+            for failure in batch.failures:
+                pipeline = self.pipelines[failure["item_index"]]
+                logger.error(f"Parallel pipeline {pipeline.name} failed: {failure['error']}")
+                by_index[failure["item_index"]] = {
+                    "success": False,
+                    "pipeline_name": pipeline.name,
+                    "error": failure["error"],
+                }
+            results = [by_index[i] for i in range(len(self.pipelines))]
 
         duration_ms = (time.time() - start_time) * 1000
 
@@ -628,6 +1096,7 @@ class ParallelPipeline:
             "results": results,
             "total_pipelines": len(self.pipelines),
             "successful_pipelines": sum(1 for r in results if r.get("success")),
+            "executor": self.executor_type.value,
             "duration_ms": duration_ms,
             "timestamp": datetime.utcnow().isoformat(),
         }
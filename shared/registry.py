@@ -1,17 +1,18 @@
 """
 Tool registry for AgentSwarm Tools Framework.
 Provides centralized discovery, registration, and management of tools.
+
+Discovery is lazy: tools are found with a static (AST) index of the tools/
+tree and a tool module is imported only when the tool is first requested.
 """
 
-import importlib
 import inspect
 import logging
-import os
-import pkgutil
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Type
 
 from .base import BaseTool
+from .tool_index import ToolIndexEntry, get_tool_index, load_tool_class
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -26,7 +27,8 @@ class ToolRegistry:
 
     Features:
     - Singleton pattern for global access
-    - Auto-discovery of tools from directory structure
+    - Auto-discovery of tools from directory structure (static index, no imports)
+    - Import-on-first-use: get_tool() imports only the requested tool module
     - Filter tools by category
     - Get tool metadata
 
@@ -49,6 +51,8 @@ class ToolRegistry:
 
     _instance = None
     _tools: Dict[str, Type[BaseTool]] = {}
+    _index: Dict[str, ToolIndexEntry] = {}
+    _tools_root: Optional[Path] = None
     _discovered: bool = False
 
     def __new__(cls):
@@ -56,15 +60,18 @@ class ToolRegistry:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._tools = {}
+            cls._instance._index = {}
+            cls._instance._tools_root = None
             cls._instance._discovered = False
         return cls._instance
 
-    def register(self, tool_class: Type[BaseTool]) -> None:
+    def register(self, tool_class: Type[BaseTool], name: Optional[str] = None) -> None:
         """
         Register a tool class.
 
         Args:
             tool_class: Tool class to register (must inherit from BaseTool)
+            name: Registration name (defaults to tool_name or the snake_case class name)
 
         Raises:
             ValueError: If tool_class doesn't inherit from BaseTool
@@ -73,7 +80,8 @@ class ToolRegistry:
             raise ValueError(f"Expected a class, got {type(tool_class)}")
 
         # Get tool name from class attribute or class name
-        name = getattr(tool_class, "tool_name", None)
+        if name is None:
+            name = getattr(tool_class, "tool_name", None)
         if name is None or name == "base_tool":
             # Use class name converted to snake_case
             name = self._to_snake_case(tool_class.__name__)
@@ -94,23 +102,31 @@ class ToolRegistry:
         Returns:
             True if tool was removed, False if not found
         """
+        found = self._index.pop(name, None) is not None
         if name in self._tools:
             del self._tools[name]
+            found = True
+        if found:
             logger.debug(f"Unregistered tool: {name}")
-            return True
-        return False
+        return found
 
     def get_tool(self, name: str) -> Optional[Type[BaseTool]]:
         """
         Get a tool class by name.
 
+        Indexed tools are imported on first access; only the module that
+        defines the tool is loaded.
+
         Args:
             name: Name of the tool
 
         Returns:
-            Tool class or None if not found
+            Tool class or None if not found (or if its module fails to import)
         """
-        return self._tools.get(name)
+        tool_class = self._tools.get(name)
+        if tool_class is None and name in self._index:
+            tool_class = self._load_indexed(name)
+        return tool_class
 
     def has_tool(self, name: str) -> bool:
         """
@@ -122,7 +138,7 @@ class ToolRegistry:
         Returns:
             True if tool exists
         """
-        return name in self._tools
+        return name in self._tools or name in self._index
 
     def list_tools(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -136,11 +152,25 @@ class ToolRegistry:
             - name: Tool name
             - category: Tool category
             - description: Tool docstring
-            - class: Tool class reference
+            - class: Tool class reference (None for indexed tools not yet loaded)
         """
         tools = []
-        for name, tool_class in sorted(self._tools.items()):
-            tool_category = getattr(tool_class, "tool_category", "unknown")
+        for name in sorted(self._names()):
+            tool_class = self._tools.get(name)
+            if tool_class is None:
+                entry = self._index[name]
+                if category is None or entry.category == category:
+                    tools.append(
+                        {
+                            "name": name,
+                            "category": entry.category,
+                            "description": entry.description,
+                            "class": None,
+                        }
+                    )
+                continue
+
+            tool_category = self._get_category(tool_class)
 
             if category is None or tool_category == category:
                 tools.append(
@@ -160,29 +190,30 @@ class ToolRegistry:
         Returns:
             Sorted list of category names
         """
-        categories = set()
+        categories = {entry.category for entry in self._index.values()}
         for tool_class in self._tools.values():
-            category = getattr(tool_class, "tool_category", "unknown")
-            categories.add(category)
+            categories.add(self._get_category(tool_class))
         return sorted(categories)
 
     def get_tool_metadata(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed metadata for a specific tool.
 
+        Imports the tool if it has not been loaded yet (fields need the class).
+
         Args:
             name: Tool name
 
         Returns:
             Metadata dictionary or None if not found
         """
-        tool_class = self._tools.get(name)
+        tool_class = self.get_tool(name)
         if tool_class is None:
             return None
 
         return {
             "name": name,
-            "category": getattr(tool_class, "tool_category", "unknown"),
+            "category": self._get_category(tool_class),
             "description": self._get_description(tool_class),
             "rate_limit_type": getattr(tool_class, "rate_limit_type", "default"),
             "class": tool_class,
@@ -190,15 +221,23 @@ class ToolRegistry:
             "fields": self._get_fields(tool_class),
         }
 
-    def discover_tools(self, tools_path: Optional[str] = None) -> int:
+    def discover_tools(
+        self,
+        tools_path: Optional[str] = None,
+        lazy: bool = True,
+        index_path: Optional[str] = None,
+    ) -> int:
         """
-        Auto-discover and register tools from directory.
+        Auto-discover tools from directory.
 
-        Walks the tools/ directory structure and imports all tool classes
-        that inherit from BaseTool.
+        Walks the full tools/ tree (including nested subcategories) with a
+        persisted static index; tool modules are not imported unless
+        ``lazy=False``.
 
         Args:
             tools_path: Path to tools directory. If None, uses default location.
+            lazy: Defer imports until get_tool(); False imports every tool now
+            index_path: Index file (defaults to ~/.agentswarm/tool_index.json)
 
         Returns:
             Number of tools discovered
@@ -213,63 +252,51 @@ class ToolRegistry:
             logger.warning(f"Tools directory not found: {tools_path}")
             return 0
 
-        initial_count = len(self._tools)
+        entries = get_tool_index(tools_path, index_path, refresh=True)
+        self._tools_root = tools_path.resolve()
 
-        # Walk through all subdirectories
-        for category_dir in tools_path.iterdir():
-            if not category_dir.is_dir():
-                continue
-            if category_dir.name.startswith("_"):
-                continue
-
-            # Process each Python file in the category
-            for py_file in category_dir.glob("*.py"):
-                if py_file.name.startswith("_"):
-                    continue
-                if py_file.name.startswith("test_"):
-                    continue
+        initial_count = len(self)
+        for name, entry in entries.items():
+            if name not in self._tools:
+                self._index[name] = entry
 
-                self._import_tools_from_file(py_file, tools_path)
+        if not lazy:
+            for name in list(self._index):
+                self._load_indexed(name)
 
-        discovered = len(self._tools) - initial_count
+        discovered = len(self) - initial_count
         self._discovered = True
         logger.info(f"Discovered {discovered} tools from {tools_path}")
         return discovered
 
-    def _import_tools_from_file(self, file_path: Path, tools_root: Path) -> None:
-        """Import tool classes from a Python file."""
+    def _load_indexed(self, name: str) -> Optional[Type[BaseTool]]:
+        """Import the module of an indexed tool and register its class."""
+        entry = self._index[name]
         try:
-            # Calculate module path
-            relative_path = file_path.relative_to(tools_root.parent)
-            module_name = str(relative_path.with_suffix("")).replace(os.sep, ".")
+            tool_class = load_tool_class(entry, self._tools_root)
+        except Exception as e:
+            logger.warning(f"Failed to import tool '{name}' from {entry.path}: {e}")
+            return None
 
-            # Import the module
-            spec = importlib.util.spec_from_file_location(module_name, file_path)
-            if spec is None or spec.loader is None:
-                return
+        if not (inspect.isclass(tool_class) and issubclass(tool_class, BaseTool)):
+            logger.warning(f"Indexed class {entry.module}.{entry.class_name} is not a BaseTool")
+            return None
 
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+        del self._index[name]
+        self.register(tool_class, name=name)
+        return tool_class
 
-            # Find all BaseTool subclasses in the module
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
+    def _names(self) -> set:
+        """Names of all known tools, loaded or indexed."""
+        return set(self._tools) | set(self._index)
 
-                if not inspect.isclass(attr):
-                    continue
-                if attr is BaseTool:
-                    continue
-                if not issubclass(attr, BaseTool):
-                    continue
-                if attr.__module__ != module.__name__:
-                    # Skip imported classes
-                    continue
-
-                # Register the tool
-                self.register(attr)
-
-        except Exception as e:
-            logger.warning(f"Failed to import tools from {file_path}: {e}")
+    def _get_category(self, tool_class: Type[BaseTool]) -> str:
+        """Get a tool class category (pydantic fields are not class attributes)."""
+        category = getattr(tool_class, "tool_category", None)
+        if category is None and hasattr(tool_class, "model_fields"):
+            field = tool_class.model_fields.get("tool_category")
+            category = field.default if field else None
+        return category or "unknown"
 
     def _get_description(self, tool_class: Type[BaseTool]) -> str:
         """Extract description from tool class docstring."""
@@ -340,15 +367,16 @@ class ToolRegistry:
         return "".join(result)
 
     def clear(self) -> None:
-        """Clear all registered tools."""
+        """Clear all registered and indexed tools."""
         self._tools.clear()
+        self._index.clear()
         self._discovered = False
         logger.debug("Cleared all registered tools")
 
     @property
     def tool_count(self) -> int:
-        """Get the number of registered tools."""
-        return len(self._tools)
+        """Get the number of registered and indexed tools."""
+        return len(self._names())
 
     @property
     def is_discovered(self) -> bool:
@@ -356,16 +384,16 @@ class ToolRegistry:
         return self._discovered
 
     def __len__(self) -> int:
-        """Return number of registered tools."""
-        return len(self._tools)
+        """Return number of registered and indexed tools."""
+        return len(self._names())
 
     def __contains__(self, name: str) -> bool:
         """Check if tool is registered."""
-        return name in self._tools
+        return self.has_tool(name)
 
     def __iter__(self):
         """Iterate over tool names."""
-        return iter(self._tools)
+        return iter(sorted(self._names()))
 
 
 # Singleton instance
@@ -398,17 +426,18 @@ def list_tools(category: Optional[str] = None) -> List[Dict[str, Any]]:
     return tool_registry.list_tools(category)
 
 
-def discover_tools(tools_path: Optional[str] = None) -> int:
+def discover_tools(tools_path: Optional[str] = None, lazy: bool = True) -> int:
     """
     Convenience function to discover tools.
 
     Args:
         tools_path: Path to tools directory
+        lazy: Defer tool imports until first use
 
     Returns:
         Number of tools discovered
     """
-    return tool_registry.discover_tools(tools_path)
+    return tool_registry.discover_tools(tools_path, lazy=lazy)
 
 
 if __name__ == "__main__":
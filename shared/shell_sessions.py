@@ -0,0 +1,634 @@
+"""
+Persistent shell sessions for AgentSwarm Tools Framework.
+
+BashTool, BashOutputTool and KillShellTool share one ShellManager:
+
+- A session is a long-lived ``bash`` process in its own process group.
+  Commands are written to its stdin and framed by random sentinels, so
+  consecutive commands reuse the shell (no per-command startup) and keep its
+  working directory and exported variables.
+- Every command is a ShellJob with an id. Foreground jobs run in a named
+  session and are waited for; background jobs get a dedicated session that
+  exits when the job finishes, so they never block the named session.
+- Reader threads capture stdout and stderr into OutputBuffers: ring buffers
+  holding the last ``max_memory_bytes`` of each stream. Output beyond that
+  spills to a file under ~/.agentswarm/shell_output/ so it can still be read
+  from any offset.
+- Jobs are killed by signalling their session's process group, which reaches
+  everything the command started.
+
+Example:
+    ```python
+    from shared.shell_sessions import get_shell_manager
+
+    manager = get_shell_manager()
+    job = manager.start("make -j8")
+    lines, offset, _ = job.stdout.read_lines(0, 65536)
+    manager.kill(job.id)
+    ```
+"""
+
+import atexit
+import logging
+import os
+import secrets
+import signal
+import subprocess
+import threading
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Output of each stream kept in memory per job
+DEFAULT_MAX_MEMORY_BYTES = 1024 * 1024
+
+# Finished jobs kept readable (oldest forgotten first)
+MAX_FINISHED_JOBS = 32
+
+# Bytes read from a pipe at a time
+READ_CHUNK_BYTES = 64 * 1024
+
+# Session foreground commands run in unless another is named
+DEFAULT_SESSION = "default"
+
+
+def default_spill_dir() -> Path:
+    """Default spill directory (~/.agentswarm/shell_output)."""
+    return Path.home() / ".agentswarm" / "shell_output"
+
+
+class OutputBuffer:
+    """
+    Captured output of one stream, addressed by absolute byte offset.
+
+    The last ``max_memory_bytes`` are kept in memory as a deque of chunks.
+    Once more has been written, the whole stream is also appended to
+    ``spill_path`` (from offset 0) if one is given; otherwise older output is
+    dropped and reads from before ``start`` begin at ``start``.
+    """
+
+    def __init__(
+        self, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES, spill_path: Optional[Path] = None
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.spill_path = spill_path
+        self._chunks: Deque[bytes] = deque()
+        self._start = 0  # offset of the first byte held in memory
+        self._end = 0
+        self._spill: Optional[IO[bytes]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def end(self) -> int:
+        """Total bytes written."""
+        return self._end
+
+    @property
+    def start(self) -> int:
+        """First offset that can still be read."""
+        return 0 if self._spill is not None else self._start
+
+    @property
+    def truncated(self) -> bool:
+        """Whether output has left the in-memory window."""
+        return self._start > 0
+
+    def write(self, data: bytes) -> None:
+        """Append output."""
+        if not data:
+            return
+        with self._lock:
+            self._chunks.append(data)
+            self._end += len(data)
+            if self._spill is not None:
+                self._spill.write(data)
+            while self._end - self._start - len(self._chunks[0]) >= self.max_memory_bytes:
+                if self._spill is None and self.spill_path is not None:
+                    self._open_spill()
+                self._start += len(self._chunks.popleft())
+
+    def _open_spill(self) -> None:
+        """Start spilling: write everything so far (still all in memory)."""
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill = open(self.spill_path, "wb")
+            self._spill.writelines(self._chunks)
+        except OSError as e:
+            logger.warning(f"Cannot spill shell output to {self.spill_path}: {e}")
+            self.spill_path = None
+            self._spill = None
+
+    def read(self, offset: int, max_bytes: int) -> Tuple[bytes, int]:
+        """
+        Read up to max_bytes from offset.
+
+        Returns:
+            (data, offset of data), which is past ``offset`` if that output was
+            dropped
+        """
+        with self._lock:
+            offset = min(max(offset, 0), self._end)
+            max_bytes = min(max_bytes, self._end - offset)
+            if offset < self._start:
+                if self._spill is not None:
+                    self._spill.flush()
+                    with open(self.spill_path, "rb") as f:
+                        f.seek(offset)
+                        return f.read(max_bytes), offset
+                offset = self._start
+                max_bytes = min(max_bytes, self._end - offset)
+
+            parts: List[bytes] = []
+            position = self._start
+            for chunk in self._chunks:
+                if max_bytes <= 0:
+                    break
+                chunk_end = position + len(chunk)
+                if chunk_end > offset:
+                    piece = chunk[max(0, offset - position) :][:max_bytes]
+                    parts.append(piece)
+                    max_bytes -= len(piece)
+                position = chunk_end
+            return b"".join(parts), offset
+
+    def read_lines(self, offset: int, max_bytes: int, final: bool) -> Tuple[List[str], int, int]:
+        """
+        Read whole lines from offset.
+
+        A trailing partial line is left for the next read unless the stream
+        is final (the job has finished) and nothing follows it, or one line
+        fills max_bytes by itself.
+
+        Returns:
+            (lines, next offset, bytes skipped because they were dropped)
+        """
+        data, start = self.read(offset, max_bytes)
+        if not final or start + len(data) < self._end:
+            cut = data.rfind(b"\n") + 1
+            if cut or len(data) < max_bytes:
+                data = data[:cut]
+        return (
+            data.decode("utf-8", errors="replace").splitlines(),
+            start + len(data),
+            max(0, start - offset),
+        )
+
+    def getvalue(self) -> bytes:
+        """The output held in memory (all of it unless truncated)."""
+        return self.read(self._start, self._end - self._start)[0]
+
+    def close(self, delete: bool = False) -> None:
+        """Close the spill file, optionally removing it."""
+        with self._lock:
+            if self._spill is not None:
+                self._spill.close()
+            if delete and self.spill_path is not None:
+                try:
+                    self.spill_path.unlink()
+                except FileNotFoundError:
+                    pass
+
+
+class ShellJob:
+    """One command run in a ShellSession."""
+
+    def __init__(
+        self,
+        job_id: str,
+        command: str,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        spill_dir: Optional[Path] = None,
+    ):
+        self.id = job_id
+        self.command = command
+        self.session: Optional["ShellSession"] = None
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.exit_code: Optional[int] = None
+        self.killed = False
+        self.stdout = OutputBuffer(
+            max_memory_bytes, spill_dir / f"{job_id}.stdout" if spill_dir else None
+        )
+        self.stderr = OutputBuffer(
+            max_memory_bytes, spill_dir / f"{job_id}.stderr" if spill_dir else None
+        )
+        # Next offsets for incremental reads (BashOutputTool)
+        self.cursors = {"stdout": 0, "stderr": 0}
+        self._done = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return not self._done.is_set()
+
+    @property
+    def status(self) -> str:
+        """running, completed, failed or killed."""
+        if self.running:
+            return "running"
+        if self.killed:
+            return "killed"
+        return "completed" if self.exit_code == 0 else "failed"
+
+    @property
+    def pid(self) -> Optional[int]:
+        """Pid (and process group id) of the session running the job."""
+        return self.session.pid if self.session else None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the job to finish; False on timeout."""
+        return self._done.wait(timeout)
+
+    def _finish(self, exit_code: Optional[int]) -> None:
+        if self._done.is_set():
+            return
+        self.exit_code = exit_code
+        self.finished_at = time.time()
+        self._done.set()
+
+
+class ShellSession:
+    """
+    A long-lived bash process running one job at a time.
+
+    Callers hold ``lock`` while a job runs. Each command is read by the shell
+    into a variable through a quoted heredoc and run with eval (so syntax
+    errors do not end the shell) with stdin from /dev/null. Sentinel lines
+    printed after it on stdout (with the exit status and working directory)
+    and stderr mark the end of its output.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        cwd: Optional[str] = None,
+        close_when_idle: bool = False,
+    ):
+        self.name = name
+        self.cwd = cwd or os.getcwd()
+        self.close_when_idle = close_when_idle
+        self.lock = threading.Lock()
+        self.process = subprocess.Popen(
+            ["bash", "--noprofile", "--norc"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self.cwd,
+            start_new_session=True,
+        )
+        self._state_lock = threading.Lock()
+        self._job: Optional[ShellJob] = None
+        self._marker = b""
+        self._open_streams: set = set()
+        self._exit_code: Optional[int] = None
+        self._closed_streams = 0
+        self._readers = [
+            threading.Thread(
+                target=self._pump, args=(name,), name=f"shell-{self.name}-{name}", daemon=True
+            )
+            for name in ("stdout", "stderr")
+        ]
+        for reader in self._readers:
+            reader.start()
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    @property
+    def busy(self) -> bool:
+        return self._job is not None
+
+    def execute(self, job: ShellJob) -> None:
+        """Start a job; the session must be idle."""
+        token = secrets.token_hex(8)
+        marker = f"__agentswarm_{token}__"
+        delimiter = f"__AGENTSWARM_EOF_{token}"
+        script = (
+            f"IFS= read -r -d '' __agentswarm_cmd <<'{delimiter}'\n"
+            f"{job.command}\n"
+            f"{delimiter}\n"
+            'eval "$__agentswarm_cmd" </dev/null\n'
+            "__agentswarm_status=$?\n"
+            f"printf '%s%s %s\\n' '{marker}' \"$__agentswarm_status\" \"$PWD\"\n"
+            f"printf '%s\\n' '{marker}' >&2\n"
+            "unset __agentswarm_cmd __agentswarm_status\n"
+        )
+        with self._state_lock:
+            if self._job is not None:
+                raise RuntimeError(f"Session {self.name} is busy")
+            job.session = self
+            if self._closed_streams == 2:
+                job._finish(self.process.wait())  # the shell has already exited
+                return
+            self._job = job
+            self._marker = marker.encode("ascii")
+            self._open_streams = {"stdout", "stderr"}
+            self._exit_code = None
+        try:
+            self.process.stdin.write(script.encode("utf-8"))
+            self.process.stdin.flush()
+        except (OSError, ValueError):
+            pass  # the shell is gone; the readers finish the job at EOF
+
+    def kill(self, force: bool = False, timeout: float = 5.0) -> Tuple[str, Optional[int]]:
+        """
+        Terminate the session's process group.
+
+        Sends SIGKILL if force (or timeout is 0), otherwise SIGTERM and then
+        SIGKILL if the shell is still running after timeout seconds.
+
+        Returns:
+            (signal used, shell exit code)
+        """
+        if force or timeout == 0:
+            signal_used = "SIGKILL"
+            self._signal(signal.SIGKILL)
+        else:
+            signal_used = "SIGTERM"
+            self._signal(signal.SIGTERM)
+            try:
+                self.process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                signal_used = "SIGKILL (after SIGTERM timeout)"
+                self._signal(signal.SIGKILL)
+        return signal_used, self.process.wait()
+
+    def _signal(self, signum: int) -> None:
+        try:
+            os.killpg(self.process.pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def close(self) -> None:
+        """Let the shell exit once its input is consumed."""
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+
+    def _pump(self, name: str) -> None:
+        """Reader thread: move one stream's output into the current job."""
+        fd = getattr(self.process, name).fileno()
+        pending = b""
+        while True:
+            try:
+                chunk = os.read(fd, READ_CHUNK_BYTES)
+            except OSError:
+                chunk = b""
+            if not chunk:
+                break
+            pending = self._deliver(name, pending + chunk)
+        getattr(self.process, name).close()
+
+        with self._state_lock:
+            job = self._job if name in self._open_streams else None
+            self._closed_streams += 1
+            last = self._closed_streams == 2
+        if job is not None and pending:
+            getattr(job, name).write(pending)
+        if last:
+            # The shell exited (exit in a command, or killed): end any job with its status
+            self.close()
+            returncode = self.process.wait()
+            with self._state_lock:
+                job, self._job = self._job, None
+            if job is not None:
+                job._finish(returncode)
+
+    def _deliver(self, name: str, data: bytes) -> bytes:
+        """Write output to the current job up to its sentinel; returns held-back bytes."""
+        while data:
+            with self._state_lock:
+                job = self._job if name in self._open_streams else None
+                marker = self._marker
+            if job is None:
+                return b""  # output after a job ended (e.g. a leftover background process)
+            buffer = getattr(job, name)
+            found = data.find(marker)
+            if found < 0:
+                keep = _prefix_overlap(data, marker)
+                buffer.write(data[: len(data) - keep])
+                return data[len(data) - keep :]
+            line_end = data.find(b"\n", found)
+            if line_end < 0:
+                buffer.write(data[:found])
+                return data[found:]
+            buffer.write(data[:found])
+            self._stream_done(name, data[found + len(marker) : line_end])
+            data = data[line_end + 1 :]
+        return b""
+
+    def _stream_done(self, name: str, trailer: bytes) -> None:
+        """A sentinel arrived; finish the job once both streams have one."""
+        with self._state_lock:
+            self._open_streams.discard(name)
+            if name == "stdout":
+                status, _, cwd = trailer.decode("utf-8", errors="replace").partition(" ")
+                self._exit_code = int(status) if status.isdigit() else None
+                if cwd:
+                    self.cwd = cwd
+            if self._open_streams:
+                return
+            job, self._job = self._job, None
+        job._finish(self._exit_code)
+        if self.close_when_idle:
+            self.close()
+
+
+def _prefix_overlap(data: bytes, marker: bytes) -> int:
+    """Length of the longest suffix of data that is a proper prefix of marker."""
+    for size in range(min(len(marker) - 1, len(data)), 0, -1):
+        if data.endswith(marker[:size]):
+            return size
+    return 0
+
+
+class ShellManager:
+    """
+    Named persistent sessions plus background jobs, addressed by job id.
+
+    Example:
+        ```python
+        manager = ShellManager()
+        job = manager.run("cd src && ls")          # waits; cwd persists
+        job = manager.start("pytest -x")           # returns at once
+        manager.kill(job.id, timeout=5)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        spill_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize shell manager.
+
+        Args:
+            max_memory_bytes: Output of each stream kept in memory per job
+            spill_dir: Directory for output beyond that (defaults to
+                ~/.agentswarm/shell_output)
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir else default_spill_dir()
+        self._sessions: Dict[str, ShellSession] = {}
+        self._jobs: "OrderedDict[str, ShellJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def session(self, name: str = DEFAULT_SESSION) -> ShellSession:
+        """A named session, started (or restarted in its last cwd) as needed."""
+        with self._lock:
+            session = self._sessions.get(name)
+            if session is None or not session.alive:
+                cwd = session.cwd if session is not None and os.path.isdir(session.cwd) else None
+                session = ShellSession(name, cwd=cwd)
+                self._sessions[name] = session
+            return session
+
+    def run(
+        self, command: str, session: str = DEFAULT_SESSION, timeout: Optional[float] = None
+    ) -> ShellJob:
+        """
+        Run a command in a named session and wait for it.
+
+        Raises:
+            TimeoutError: If the session stays busy or the command runs
+                longer than timeout; a command that timed out is killed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            shell = self.session(session)
+            if not shell.lock.acquire(timeout=_remaining(deadline)):
+                raise TimeoutError(f"Session '{session}' is busy")
+            if shell.alive:
+                break
+            shell.lock.release()  # exited while we waited: start a new one
+        try:
+            job = self._new_job(command)
+            shell.execute(job)
+            if not job.wait(None if deadline is None else _remaining(deadline)):
+                self.kill(job.id, force=True)
+                raise TimeoutError(f"Command timed out after {timeout}s")
+            return job
+        finally:
+            shell.lock.release()
+
+    def start(self, command: str, cwd: Optional[str] = None) -> ShellJob:
+        """
+        Run a command in the background in a dedicated session.
+
+        The session starts in cwd, or the default session's working
+        directory, and exits when the command finishes.
+        """
+        if cwd is None:
+            with self._lock:
+                default = self._sessions.get(DEFAULT_SESSION)
+            cwd = default.cwd if default is not None and os.path.isdir(default.cwd) else None
+        job = self._new_job(command)
+        ShellSession(job.id, cwd=cwd, close_when_idle=True).execute(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[ShellJob]:
+        """A job by id, or None."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[ShellJob]:
+        """All known jobs, oldest first."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def kill(self, job_id: str, force: bool = False, timeout: float = 5.0) -> Dict[str, Any]:
+        """
+        Terminate a running job (and its session).
+
+        Returns:
+            Dict with previous_status, signal_used (None if the job had
+            already finished) and exit_code
+
+        Raises:
+            KeyError: If the job is unknown
+        """
+        job = self.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        previous_status = job.status
+        if not job.running:
+            return {
+                "previous_status": previous_status,
+                "signal_used": None,
+                "exit_code": job.exit_code,
+            }
+
+        job.killed = True
+        session = job.session
+        signal_used, exit_code = session.kill(force=force, timeout=timeout)
+        job.wait(1.0)
+        job._finish(exit_code)  # a named session restarts on next use, in its last cwd
+        return {
+            "previous_status": previous_status,
+            "signal_used": signal_used,
+            "exit_code": exit_code,
+        }
+
+    def remove(self, job_id: str) -> None:
+        """Forget a finished job and delete its spilled output."""
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+        if job is not None:
+            job.stdout.close(delete=True)
+            job.stderr.close(delete=True)
+
+    def shutdown(self) -> None:
+        """Kill every session and delete spilled output."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            jobs = list(self._jobs.values())
+            self._sessions.clear()
+            self._jobs.clear()
+        for job in jobs:
+            if job.running and job.session is not None:
+                job.killed = True
+                job.session.kill(force=True)
+            job.stdout.close(delete=True)
+            job.stderr.close(delete=True)
+        for session in sessions:
+            if session.alive:
+                session.kill(force=True)
+
+    def _new_job(self, command: str) -> ShellJob:
+        job = ShellJob(
+            f"shell_{secrets.token_hex(6)}", command, self.max_memory_bytes, self.spill_dir
+        )
+        with self._lock:
+            self._jobs[job.id] = job
+            finished = [j.id for j in self._jobs.values() if not j.running]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            self.remove(job_id)
+        return job
+
+
+def _remaining(deadline: Optional[float]) -> float:
+    """Seconds until deadline for Lock.acquire (-1 waits forever)."""
+    return -1 if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+_manager: Optional[ShellManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_shell_manager() -> ShellManager:
+    """Process-wide ShellManager (sessions are killed at exit)."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ShellManager()
+            atexit.register(_manager.shutdown)
+        return _manager
@@ -0,0 +1,893 @@
+"""
+Persistent priority task queues for fanning out agent work.
+
+Tasks are stored in SQLite in WAL mode (~/.agentswarm/task_queue.db, or
+TASK_QUEUE_PATH), or in Redis at REDIS_URL when TASK_QUEUE_BACKEND=redis.
+Pending tasks are ordered by priority (higher first), then by insertion. Both
+backends keep them in an ordered index (a partial B-tree index or a sorted
+set), so enqueueing, dequeueing and reprioritizing cost O(log n) instead of
+a scan of the queue.
+
+Dequeueing leases a task to a worker for a visibility timeout. The worker
+completes or fails it with the lease id, or extends the lease while it is
+still working. A task whose lease expires becomes pending again on the next
+dequeue, unless it has already been leased max_attempts times, in which case
+it is marked failed.
+
+Example:
+    ```python
+    queue = get_task_queue()
+    queue.enqueue_many("crawl", [{"url": u} for u in urls], priority=7)
+
+    for task in queue.dequeue("crawl", count=10, worker_id="worker-1"):
+        try:
+            result = crawl(task["data"]["url"])
+            queue.complete("crawl", task["task_id"], task["lease_id"], result)
+        except Exception as e:
+            queue.fail("crawl", task["task_id"], task["lease_id"], str(e))
+    ```
+"""
+
+import json
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MIN_PRIORITY = 1
+MAX_PRIORITY = 10
+DEFAULT_PRIORITY = 5
+DEFAULT_VISIBILITY_TIMEOUT = 300.0
+DEFAULT_MAX_ATTEMPTS = 5
+THROUGHPUT_WINDOW_SECONDS = 60
+
+STATUSES = ("pending", "in_progress", "completed", "failed")
+
+
+def default_queue_path() -> Path:
+    """Default SQLite database for task queues."""
+    return Path.home() / ".agentswarm" / "task_queue.db"
+
+
+def _new_task_id() -> str:
+    return f"task_{secrets.token_hex(8)}"
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.utcfromtimestamp(timestamp).isoformat() if timestamp is not None else None
+
+
+def _check_priority(priority: int) -> int:
+    if not MIN_PRIORITY <= priority <= MAX_PRIORITY:
+        raise ValueError(f"priority must be between {MIN_PRIORITY} and {MAX_PRIORITY}")
+    return priority
+
+
+class TaskQueue(ABC):
+    """
+    Named priority queues of JSON-serializable tasks.
+
+    Tasks are returned as dicts with task_id, queue_id, status, priority,
+    data, attempts, worker_id, result, error and ISO timestamps (created_at,
+    started_at, completed_at, lease_expires_at); dequeued tasks also carry
+    their lease_id.
+    """
+
+    def __init__(self, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        self.max_attempts = max_attempts
+
+    def enqueue(self, queue: str, data: Any, priority: int = DEFAULT_PRIORITY) -> str:
+        """Add one task; returns its id."""
+        return self.enqueue_many(queue, [data], priority)[0]
+
+    @abstractmethod
+    def enqueue_many(
+        self, queue: str, items: Iterable[Any], priority: int = DEFAULT_PRIORITY
+    ) -> List[str]:
+        """Add tasks in one transaction; returns their ids in order."""
+
+    @abstractmethod
+    def dequeue(
+        self,
+        queue: str,
+        count: int = 1,
+        worker_id: Optional[str] = None,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+    ) -> List[Dict[str, Any]]:
+        """Lease up to count of the most urgent pending tasks."""
+
+    @abstractmethod
+    def complete(self, queue: str, task_id: str, lease_id: str, result: Any = None) -> bool:
+        """Mark a leased task completed; False if the lease is no longer held."""
+
+    @abstractmethod
+    def fail(
+        self,
+        queue: str,
+        task_id: str,
+        lease_id: str,
+        error: Optional[str] = None,
+        retry: bool = True,
+    ) -> bool:
+        """
+        Release a leased task after an error; False if the lease is no longer held.
+
+        With retry, the task becomes pending again unless it has used up
+        max_attempts; otherwise it is marked failed.
+        """
+
+    @abstractmethod
+    def extend(self, queue: str, task_id: str, lease_id: str, visibility_timeout: float) -> bool:
+        """Renew a lease for visibility_timeout from now; False if it is no longer held."""
+
+    @abstractmethod
+    def get(self, queue: str, task_id: str) -> Optional[Dict[str, Any]]:
+        """A task, or None."""
+
+    @abstractmethod
+    def remove(self, queue: str, task_id: str) -> bool:
+        """Delete a task; False if it does not exist."""
+
+    @abstractmethod
+    def prioritize(self, queue: str, task_id: str, priority: int) -> Optional[int]:
+        """Change a task's priority; returns the old one, or None if it does not exist."""
+
+    @abstractmethod
+    def position(self, queue: str, task_id: str) -> Optional[int]:
+        """Number of pending tasks ahead of a pending task, or None."""
+
+    @abstractmethod
+    def list(
+        self, queue: str, status: Optional[str] = None, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Tasks of a queue, optionally of one status.
+
+        Pending tasks come in dequeue order, leased tasks by lease expiry,
+        finished tasks newest first.
+        """
+
+    @abstractmethod
+    def clear(self, queue: str) -> int:
+        """Delete every task of a queue; returns how many were removed."""
+
+    @abstractmethod
+    def stats(self, queue: str) -> Dict[str, Any]:
+        """
+        Queue statistics.
+
+        Returns:
+            Dict with total_tasks, a count per status, oldest_task_age_seconds
+            and newest_task_age_seconds (of pending tasks),
+            average_wait_time_seconds (enqueue to first lease) and
+            throughput_per_minute (completions over the last minute)
+        """
+
+
+class SQLiteTaskQueue(TaskQueue):
+    """
+    Task queues in one SQLite database.
+
+    Each status has its own partial index, so the pending index is a heap
+    ordered by (priority DESC, seq) and expired leases are found by expiry.
+    Writes that read first use BEGIN IMMEDIATE, so several worker processes
+    can share the database.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        Initialize queue store.
+
+        Args:
+            path: Database file (default: ~/.agentswarm/task_queue.db)
+            max_attempts: Leases before an expired or failed task is marked failed
+        """
+        super().__init__(max_attempts)
+        self.path = Path(path) if path else default_queue_path()
+        self._local = threading.local()
+        self._init_db()
+
+    def _conn(self) -> sqlite3.Connection:
+        """This thread's connection (in autocommit mode)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # A generous busy timeout lets workers queue for the write lock
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """A write transaction, taking the write lock up front."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _init_db(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                seq INTEGER PRIMARY KEY,
+                id TEXT NOT NULL UNIQUE,
+                queue TEXT NOT NULL,
+                status TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                completed_at REAL,
+                lease_id TEXT,
+                lease_expires REAL,
+                worker_id TEXT,
+                result TEXT,
+                error TEXT
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_pending "
+            "ON tasks(queue, priority DESC, seq) WHERE status = 'pending'"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_leased "
+            "ON tasks(queue, lease_expires) WHERE status = 'in_progress'"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_finished "
+            "ON tasks(queue, status, completed_at) WHERE status IN ('completed', 'failed')"
+        )
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def enqueue_many(
+        self, queue: str, items: Iterable[Any], priority: int = DEFAULT_PRIORITY
+    ) -> List[str]:
+        _check_priority(priority)
+        now = time.time()
+        rows = [(_new_task_id(), queue, priority, json.dumps(item), now) for item in items]
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO tasks (id, queue, status, priority, data, created_at) "
+                "VALUES (?, ?, 'pending', ?, ?, ?)",
+                rows,
+            )
+        return [row[0] for row in rows]
+
+    def dequeue(
+        self,
+        queue: str,
+        count: int = 1,
+        worker_id: Optional[str] = None,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+    ) -> List[Dict[str, Any]]:
+        now = time.time()
+        with self._transaction() as conn:
+            self._reclaim(conn, queue, now)
+            rows = conn.execute(
+                "SELECT seq FROM tasks WHERE queue = ? AND status = 'pending' "
+                "ORDER BY priority DESC, seq LIMIT ?",
+                (queue, count),
+            ).fetchall()
+            seqs = [row["seq"] for row in rows]
+            conn.executemany(
+                "UPDATE tasks SET status = 'in_progress', attempts = attempts + 1, "
+                "lease_id = ?, lease_expires = ?, worker_id = ?, "
+                "started_at = COALESCE(started_at, ?) WHERE seq = ?",
+                [
+                    (secrets.token_hex(8), now + visibility_timeout, worker_id, now, seq)
+                    for seq in seqs
+                ],
+            )
+            rows = conn.execute(
+                f"SELECT * FROM tasks WHERE seq IN ({', '.join('?' * len(seqs))})", seqs
+            ).fetchall()
+        by_seq = {row["seq"]: row for row in rows}
+        return [self._row_to_task(by_seq[seq]) for seq in seqs]
+
+    def _reclaim(self, conn: sqlite3.Connection, queue: str, now: float) -> None:
+        """Return tasks with expired leases to pending, or fail them."""
+        conn.execute(
+            "UPDATE tasks SET "
+            "status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "completed_at = CASE WHEN attempts >= ? THEN ? END, "
+            "error = CASE WHEN attempts >= ? THEN 'lease expired' ELSE error END, "
+            "lease_id = NULL, lease_expires = NULL "
+            "WHERE queue = ? AND status = 'in_progress' AND lease_expires <= ?",
+            (self.max_attempts, self.max_attempts, now, self.max_attempts, queue, now),
+        )
+
+    def complete(self, queue: str, task_id: str, lease_id: str, result: Any = None) -> bool:
+        cursor = self._conn().execute(
+            "UPDATE tasks SET status = 'completed', completed_at = ?, result = ?, "
+            "lease_id = NULL, lease_expires = NULL "
+            "WHERE id = ? AND queue = ? AND status = 'in_progress' AND lease_id = ?",
+            (time.time(), json.dumps(result), task_id, queue, lease_id),
+        )
+        return cursor.rowcount == 1
+
+    def fail(
+        self,
+        queue: str,
+        task_id: str,
+        lease_id: str,
+        error: Optional[str] = None,
+        retry: bool = True,
+    ) -> bool:
+        now = time.time()
+        retry_below = self.max_attempts if retry else 0
+        cursor = self._conn().execute(
+            "UPDATE tasks SET "
+            "status = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END, "
+            "completed_at = CASE WHEN attempts < ? THEN NULL ELSE ? END, "
+            "error = ?, lease_id = NULL, lease_expires = NULL "
+            "WHERE id = ? AND queue = ? AND status = 'in_progress' AND lease_id = ?",
+            (retry_below, retry_below, now, error, task_id, queue, lease_id),
+        )
+        return cursor.rowcount == 1
+
+    def extend(self, queue: str, task_id: str, lease_id: str, visibility_timeout: float) -> bool:
+        cursor = self._conn().execute(
+            "UPDATE tasks SET lease_expires = ? "
+            "WHERE id = ? AND queue = ? AND status = 'in_progress' AND lease_id = ?",
+            (time.time() + visibility_timeout, task_id, queue, lease_id),
+        )
+        return cursor.rowcount == 1
+
+    def get(self, queue: str, task_id: str) -> Optional[Dict[str, Any]]:
+        return self._fetch(self._conn(), "id = ? AND queue = ?", (task_id, queue))
+
+    def remove(self, queue: str, task_id: str) -> bool:
+        cursor = self._conn().execute(
+            "DELETE FROM tasks WHERE id = ? AND queue = ?", (task_id, queue)
+        )
+        return cursor.rowcount == 1
+
+    def prioritize(self, queue: str, task_id: str, priority: int) -> Optional[int]:
+        _check_priority(priority)
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT priority FROM tasks WHERE id = ? AND queue = ?", (task_id, queue)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE tasks SET priority = ? WHERE id = ?", (priority, task_id))
+        return row["priority"]
+
+    def position(self, queue: str, task_id: str) -> Optional[int]:
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT priority, seq FROM tasks WHERE id = ? AND queue = ? AND status = 'pending'",
+            (task_id, queue),
+        ).fetchone()
+        if row is None:
+            return None
+        return conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE queue = ? AND status = 'pending' "
+            "AND (priority > ? OR (priority = ? AND seq < ?))",
+            (queue, row["priority"], row["priority"], row["seq"]),
+        ).fetchone()[0]
+
+    def list(
+        self, queue: str, status: Optional[str] = None, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        order = {
+            "pending": "priority DESC, seq",
+            "in_progress": "lease_expires",
+            "completed": "completed_at DESC",
+            "failed": "completed_at DESC",
+        }
+        statuses = [status] if status else list(STATUSES)
+        tasks: List[Dict[str, Any]] = []
+        conn = self._conn()
+        for name in statuses:
+            if len(tasks) >= limit:
+                break
+            rows = conn.execute(
+                f"SELECT * FROM tasks WHERE queue = ? AND status = ? ORDER BY {order[name]} "
+                "LIMIT ?",
+                (queue, name, limit - len(tasks)),
+            ).fetchall()
+            tasks.extend(self._row_to_task(row) for row in rows)
+        return tasks
+
+    def clear(self, queue: str) -> int:
+        return self._conn().execute("DELETE FROM tasks WHERE queue = ?", (queue,)).rowcount
+
+    def stats(self, queue: str) -> Dict[str, Any]:
+        now = time.time()
+        conn = self._conn()
+        counts = {
+            status: conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE queue = ? AND status = ?", (queue, status)
+            ).fetchone()[0]
+            for status in STATUSES
+        }
+        oldest, newest = conn.execute(
+            "SELECT MIN(created_at), MAX(created_at) FROM tasks "
+            "WHERE queue = ? AND status = 'pending'",
+            (queue,),
+        ).fetchone()
+        average_wait = conn.execute(
+            "SELECT AVG(started_at - created_at) FROM tasks "
+            "WHERE queue = ? AND started_at IS NOT NULL",
+            (queue,),
+        ).fetchone()[0]
+        completed_recently = conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE queue = ? AND status = 'completed' "
+            "AND completed_at >= ?",
+            (queue, now - THROUGHPUT_WINDOW_SECONDS),
+        ).fetchone()[0]
+        return _stats(counts, now, oldest, newest, average_wait, completed_recently)
+
+    def _fetch(
+        self, conn: sqlite3.Connection, where: str, params: Tuple
+    ) -> Optional[Dict[str, Any]]:
+        row = conn.execute(f"SELECT * FROM tasks WHERE {where}", params).fetchone()
+        return self._row_to_task(row) if row is not None else None
+
+    @staticmethod
+    def _row_to_task(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a database row to a task."""
+        return {
+            "task_id": row["id"],
+            "queue_id": row["queue"],
+            "status": row["status"],
+            "priority": row["priority"],
+            "data": json.loads(row["data"]),
+            "attempts": row["attempts"],
+            "worker_id": row["worker_id"],
+            "lease_id": row["lease_id"],
+            "lease_expires_at": _isoformat(row["lease_expires"]),
+            "created_at": _isoformat(row["created_at"]),
+            "started_at": _isoformat(row["started_at"]),
+            "completed_at": _isoformat(row["completed_at"]),
+            "result": json.loads(row["result"]) if row["result"] is not None else None,
+            "error": row["error"],
+        }
+
+
+def _stats(
+    counts: Dict[str, int],
+    now: float,
+    oldest: Optional[float],
+    newest: Optional[float],
+    average_wait: Optional[float],
+    completed_recently: int,
+) -> Dict[str, Any]:
+    return {
+        "total_tasks": sum(counts.values()),
+        **counts,
+        "oldest_task_age_seconds": round(now - oldest, 3) if oldest is not None else 0,
+        "newest_task_age_seconds": round(now - newest, 3) if newest is not None else 0,
+        "average_wait_time_seconds": round(average_wait or 0.0, 3),
+        "throughput_per_minute": completed_recently * 60 / THROUGHPUT_WINDOW_SECONDS,
+    }
+
+
+# Redis keeps per queue: a pending sorted set scored by (priority, seq), the
+# same tasks scored by creation time (for age stats), leased tasks scored by
+# lease expiry, completed and failed tasks scored by completion time, and a
+# hash per task. Multi-key updates run as Lua scripts, so they are atomic.
+
+_REQUEUE_EXPIRED = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', ARGV[1])
+for _, id in ipairs(expired) do
+    local key = ARGV[3] .. id
+    redis.call('ZREM', KEYS[3], id)
+    redis.call('HDEL', key, 'lease_id', 'lease_expires')
+    if tonumber(redis.call('HGET', key, 'attempts')) >= tonumber(ARGV[2]) then
+        redis.call('HSET', key, 'status', 'failed', 'completed_at', ARGV[1],
+                   'error', 'lease expired')
+        redis.call('ZADD', KEYS[5], ARGV[1], id)
+    else
+        redis.call('HSET', key, 'status', 'pending')
+        redis.call('ZADD', KEYS[1], redis.call('HGET', key, 'score'), id)
+        redis.call('ZADD', KEYS[2], redis.call('HGET', key, 'created_at'), id)
+    end
+end
+"""
+
+# ARGV: now, max attempts, task key prefix, count, visibility timeout,
+# worker id, one lease id per task
+_DEQUEUE = _REQUEUE_EXPIRED + """
+local expires = tonumber(ARGV[1]) + tonumber(ARGV[5])
+local popped = redis.call('ZPOPMIN', KEYS[1], ARGV[4])
+local leased = {}
+for i = 1, #popped, 2 do
+    local id = popped[i]
+    local key = ARGV[3] .. id
+    local lease = ARGV[6 + (i + 1) / 2]
+    redis.call('ZREM', KEYS[2], id)
+    redis.call('ZADD', KEYS[3], expires, id)
+    redis.call('HSET', key, 'status', 'in_progress', 'lease_id', lease,
+               'lease_expires', expires, 'worker_id', ARGV[6])
+    redis.call('HINCRBY', key, 'attempts', 1)
+    if redis.call('HSETNX', key, 'started_at', ARGV[1]) == 1 then
+        local wait = tonumber(ARGV[1]) - tonumber(redis.call('HGET', key, 'created_at'))
+        redis.call('HINCRBYFLOAT', KEYS[6], 'wait_sum', wait)
+        redis.call('HINCRBY', KEYS[6], 'wait_count', 1)
+    end
+    leased[#leased + 1] = id
+end
+return leased
+"""
+
+# KEYS as for _DEQUEUE; ARGV: now, task key, lease id, new status or '' to
+# retry below max attempts, result or error field, its value, max attempts
+_RELEASE = """
+local key = ARGV[2]
+if redis.call('HGET', key, 'status') ~= 'in_progress'
+        or redis.call('HGET', key, 'lease_id') ~= ARGV[3] then
+    return 0
+end
+local id = redis.call('HGET', key, 'id')
+redis.call('ZREM', KEYS[3], id)
+redis.call('HDEL', key, 'lease_id', 'lease_expires')
+redis.call('HSET', key, ARGV[5], ARGV[6])
+local status = ARGV[4]
+if status == '' then
+    if tonumber(redis.call('HGET', key, 'attempts')) < tonumber(ARGV[7]) then
+        redis.call('HSET', key, 'status', 'pending')
+        redis.call('ZADD', KEYS[1], redis.call('HGET', key, 'score'), id)
+        redis.call('ZADD', KEYS[2], redis.call('HGET', key, 'created_at'), id)
+        return 1
+    end
+    status = 'failed'
+end
+redis.call('HSET', key, 'status', status, 'completed_at', ARGV[1])
+redis.call('ZADD', status == 'completed' and KEYS[4] or KEYS[5], ARGV[1], id)
+return 1
+"""
+
+_EXTEND = """
+local key = ARGV[1]
+if redis.call('HGET', key, 'status') ~= 'in_progress'
+        or redis.call('HGET', key, 'lease_id') ~= ARGV[2] then
+    return 0
+end
+redis.call('HSET', key, 'lease_expires', ARGV[3])
+redis.call('ZADD', KEYS[3], ARGV[3], redis.call('HGET', key, 'id'))
+return 1
+"""
+
+# ARGV: task key, new priority, new score; returns the old priority or false
+_PRIORITIZE = """
+local key = ARGV[1]
+local old = redis.call('HGET', key, 'priority')
+if not old then
+    return false
+end
+redis.call('HSET', key, 'priority', ARGV[2], 'score', ARGV[3])
+if redis.call('HGET', key, 'status') == 'pending' then
+    redis.call('ZADD', KEYS[1], ARGV[3], redis.call('HGET', key, 'id'))
+end
+return tonumber(old)
+"""
+
+_REMOVE = """
+local key = ARGV[1]
+local id = redis.call('HGET', key, 'id')
+if not id then
+    return 0
+end
+for i = 1, 5 do
+    redis.call('ZREM', KEYS[i], id)
+end
+redis.call('DEL', key)
+return 1
+"""
+
+# Pending order: higher priority first, then insertion order (seq < 2**40)
+_SEQ_BITS = 2**40
+
+
+def _score(priority: int, seq: int) -> int:
+    return (MAX_PRIORITY - priority) * _SEQ_BITS + seq
+
+
+class RedisTaskQueue(TaskQueue):
+    """
+    Task queues in Redis, shared by workers on any host.
+
+    Scripts touch task hashes that are not declared as keys, so this needs a
+    single Redis server rather than Redis Cluster.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        prefix: str = "agentswarm:queue:",
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        """
+        Initialize queue store.
+
+        Args:
+            client: redis.Redis client (with decode_responses=True)
+            prefix: Key prefix for namespacing
+            max_attempts: Leases before an expired or failed task is marked failed
+        """
+        super().__init__(max_attempts)
+        self._client = client
+        self._prefix = prefix
+        self._dequeue = client.register_script(_DEQUEUE)
+        self._release = client.register_script(_RELEASE)
+        self._extend = client.register_script(_EXTEND)
+        self._prioritize = client.register_script(_PRIORITIZE)
+        self._remove = client.register_script(_REMOVE)
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "RedisTaskQueue":
+        """Connect to url; raises ImportError or a connection error if unavailable."""
+        import redis
+
+        client = redis.Redis.from_url(
+            url, decode_responses=True, socket_connect_timeout=2, socket_timeout=10
+        )
+        client.ping()
+        return cls(client, **kwargs)
+
+    def _keys(self, queue: str) -> List[str]:
+        """pending, pending_age, leased, completed, failed, meta"""
+        base = f"{self._prefix}{queue}:"
+        return [
+            base + name
+            for name in ("pending", "pending_age", "leased", "completed", "failed", "meta")
+        ]
+
+    def _task_key(self, queue: str, task_id: str = "") -> str:
+        return f"{self._prefix}{queue}:task:{task_id}"
+
+    def enqueue_many(
+        self, queue: str, items: Iterable[Any], priority: int = DEFAULT_PRIORITY
+    ) -> List[str]:
+        _check_priority(priority)
+        items = list(items)
+        if not items:
+            return []
+        pending, pending_age, _, _, _, meta = self._keys(queue)
+        first = self._client.hincrby(meta, "seq", len(items)) - len(items) + 1
+        now = time.time()
+        ids = [_new_task_id() for _ in items]
+        pipe = self._client.pipeline(transaction=True)
+        for seq, (task_id, item) in enumerate(zip(ids, items), first):
+            score = _score(priority, seq)
+            pipe.hset(
+                self._task_key(queue, task_id),
+                mapping={
+                    "id": task_id,
+                    "status": "pending",
+                    "priority": priority,
+                    "score": score,
+                    "data": json.dumps(item),
+                    "attempts": 0,
+                    "created_at": now,
+                },
+            )
+            pipe.zadd(pending, {task_id: score})
+            pipe.zadd(pending_age, {task_id: now})
+        pipe.execute()
+        return ids
+
+    def dequeue(
+        self,
+        queue: str,
+        count: int = 1,
+        worker_id: Optional[str] = None,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+    ) -> List[Dict[str, Any]]:
+        leases = [secrets.token_hex(8) for _ in range(count)]
+        ids = self._dequeue(
+            keys=self._keys(queue),
+            args=[
+                time.time(),
+                self.max_attempts,
+                self._task_key(queue),
+                count,
+                visibility_timeout,
+                worker_id or "",
+                *leases,
+            ],
+        )
+        return self._fetch_many(queue, ids)
+
+    def _release_lease(
+        self, queue: str, task_id: str, lease_id: str, status: str, field: str, value: str
+    ) -> bool:
+        return bool(
+            self._release(
+                keys=self._keys(queue),
+                args=[
+                    time.time(),
+                    self._task_key(queue, task_id),
+                    lease_id,
+                    status,
+                    field,
+                    value,
+                    self.max_attempts,
+                ],
+            )
+        )
+
+    def complete(self, queue: str, task_id: str, lease_id: str, result: Any = None) -> bool:
+        return self._release_lease(
+            queue, task_id, lease_id, "completed", "result", json.dumps(result)
+        )
+
+    def fail(
+        self,
+        queue: str,
+        task_id: str,
+        lease_id: str,
+        error: Optional[str] = None,
+        retry: bool = True,
+    ) -> bool:
+        return self._release_lease(
+            queue, task_id, lease_id, "" if retry else "failed", "error", error or ""
+        )
+
+    def extend(self, queue: str, task_id: str, lease_id: str, visibility_timeout: float) -> bool:
+        return bool(
+            self._extend(
+                keys=self._keys(queue),
+                args=[self._task_key(queue, task_id), lease_id, time.time() + visibility_timeout],
+            )
+        )
+
+    def get(self, queue: str, task_id: str) -> Optional[Dict[str, Any]]:
+        tasks = self._fetch_many(queue, [task_id])
+        return tasks[0] if tasks else None
+
+    def remove(self, queue: str, task_id: str) -> bool:
+        return bool(self._remove(keys=self._keys(queue), args=[self._task_key(queue, task_id)]))
+
+    def prioritize(self, queue: str, task_id: str, priority: int) -> Optional[int]:
+        _check_priority(priority)
+        key = self._task_key(queue, task_id)
+        score = self._client.hget(key, "score")
+        if score is None:
+            return None
+        seq = int(float(score)) % _SEQ_BITS
+        return self._prioritize(keys=self._keys(queue), args=[key, priority, _score(priority, seq)])
+
+    def position(self, queue: str, task_id: str) -> Optional[int]:
+        return self._client.zrank(self._keys(queue)[0], task_id)
+
+    def list(
+        self, queue: str, status: Optional[str] = None, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        pending, _, leased, completed, failed, _ = self._keys(queue)
+        sources = {
+            "pending": (pending, False),
+            "in_progress": (leased, False),
+            "completed": (completed, True),
+            "failed": (failed, True),
+        }
+        ids: List[str] = []
+        for name in [status] if status else STATUSES:
+            if len(ids) >= limit:
+                break
+            key, newest_first = sources[name]
+            fetch = self._client.zrevrange if newest_first else self._client.zrange
+            ids.extend(fetch(key, 0, limit - len(ids) - 1))
+        return self._fetch_many(queue, ids)
+
+    def clear(self, queue: str) -> int:
+        keys = self._keys(queue)
+        removed = 0
+        for key in (keys[0], keys[2], keys[3], keys[4]):
+            while True:
+                ids = self._client.zrange(key, 0, 999)
+                if not ids:
+                    break
+                pipe = self._client.pipeline(transaction=True)
+                pipe.zrem(key, *ids)
+                pipe.zrem(keys[1], *ids)
+                pipe.delete(*(self._task_key(queue, task_id) for task_id in ids))
+                removed += pipe.execute()[0]
+        self._client.hdel(keys[5], "wait_sum", "wait_count")
+        return removed
+
+    def stats(self, queue: str) -> Dict[str, Any]:
+        now = time.time()
+        pending, pending_age, leased, completed, failed, meta = self._keys(queue)
+        pipe = self._client.pipeline(transaction=False)
+        for key in (pending, leased, completed, failed):
+            pipe.zcard(key)
+        pipe.zrange(pending_age, 0, 0, withscores=True)
+        pipe.zrevrange(pending_age, 0, 0, withscores=True)
+        pipe.hmget(meta, "wait_sum", "wait_count")
+        pipe.zcount(completed, now - THROUGHPUT_WINDOW_SECONDS, "+inf")
+        *sizes, oldest, newest, (wait_sum, wait_count), completed_recently = pipe.execute()
+        counts = dict(zip(STATUSES, sizes))
+        average_wait = float(wait_sum) / int(wait_count) if wait_count else None
+        return _stats(
+            counts,
+            now,
+            oldest[0][1] if oldest else None,
+            newest[0][1] if newest else None,
+            average_wait,
+            completed_recently,
+        )
+
+    def _fetch_many(self, queue: str, ids: List[str]) -> List[Dict[str, Any]]:
+        pipe = self._client.pipeline(transaction=False)
+        for task_id in ids:
+            pipe.hgetall(self._task_key(queue, task_id))
+        return [self._hash_to_task(queue, fields) for fields in pipe.execute() if fields]
+
+    @staticmethod
+    def _hash_to_task(queue: str, fields: Dict[str, str]) -> Dict[str, Any]:
+        """Convert a task hash to a task."""
+
+        def timestamp(name: str) -> Optional[str]:
+            value = fields.get(name)
+            return _isoformat(float(value)) if value else None
+
+        result = fields.get("result")
+        return {
+            "task_id": fields["id"],
+            "queue_id": queue,
+            "status": fields["status"],
+            "priority": int(fields["priority"]),
+            "data": json.loads(fields["data"]),
+            "attempts": int(fields["attempts"]),
+            "worker_id": fields.get("worker_id") or None,
+            "lease_id": fields.get("lease_id"),
+            "lease_expires_at": timestamp("lease_expires"),
+            "created_at": timestamp("created_at"),
+            "started_at": timestamp("started_at"),
+            "completed_at": timestamp("completed_at"),
+            "result": json.loads(result) if result is not None else None,
+            "error": fields.get("error") or None,
+        }
+
+
+_queue: Optional[TaskQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_task_queue() -> TaskQueue:
+    """
+    Process-wide task queue store (singleton).
+
+    Uses Redis at REDIS_URL when TASK_QUEUE_BACKEND=redis, falling back to
+    SQLite at TASK_QUEUE_PATH (default ~/.agentswarm/task_queue.db) if Redis
+    is not available.
+    """
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            if os.getenv("TASK_QUEUE_BACKEND", "sqlite").lower() == "redis":
+                url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+                try:
+                    _queue = RedisTaskQueue.from_url(url)
+                except Exception as e:
+                    logger.warning(f"Redis task queue unavailable ({e}); using SQLite")
+            if _queue is None:
+                path = os.getenv("TASK_QUEUE_PATH")
+                _queue = SQLiteTaskQueue(Path(path) if path else None)
+        return _queue
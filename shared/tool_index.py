@@ -0,0 +1,456 @@
+"""
+Static tool index for AgentSwarm Tools Framework.
+
+Finds tool classes in the tools/ tree by parsing source files with ``ast``
+instead of importing them, so listing tools costs a directory walk and a few
+stat calls rather than importing every tool and its dependencies.
+
+The index is persisted as JSON (default: ~/.agentswarm/tool_index.json).
+Each source file is re-parsed only when its mtime or size changes.
+
+This is the single tool catalog for every entry point: the shared registry,
+the CLI (run, list, info, validate), the MCP server catalog and the SDK
+validator all look tools up here instead of walking tools/ themselves.
+
+Example:
+    ```python
+    from shared.tool_index import get_tool_index, load_tool_class
+
+    entries = get_tool_index()  # {tool_name: ToolIndexEntry}, built once per process
+    WebSearch = load_tool_class(entries["web_search"])
+    ```
+"""
+
+import ast
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Bump when the index layout or the scanner changes
+INDEX_VERSION = 3
+
+# Base classes that mark a class as a tool
+TOOL_BASE_CLASSES = frozenset({"BaseTool", "AsyncBaseTool", "SimpleBaseTool"})
+
+# Directory names never walked
+SKIP_DIRS = frozenset({"__pycache__", "tests", "node_modules"})
+
+# Top-level packages of this repository (not reported as dependencies)
+LOCAL_PACKAGES = frozenset({"shared", "tools", "cli", "sdk", "mcp_server"})
+
+# Process-wide caches used by get_tool_index() and get_index_errors()
+_index_cache: Dict[Tuple[str, str], Dict[str, "ToolIndexEntry"]] = {}
+_error_cache: Dict[Tuple[str, str], Dict[str, str]] = {}
+_index_lock = threading.Lock()
+
+
+def default_index_path() -> Path:
+    """Default index location (~/.agentswarm/tool_index.json)."""
+    return Path.home() / ".agentswarm" / "tool_index.json"
+
+
+def default_tools_path() -> Path:
+    """The repository tools/ directory."""
+    return Path(__file__).resolve().parent.parent / "tools"
+
+
+def to_snake_case(name: str) -> str:
+    """Convert CamelCase to snake_case (same rule as ToolRegistry)."""
+    result = []
+    for i, char in enumerate(name):
+        if char.isupper() and i > 0:
+            result.append("_")
+        result.append(char.lower())
+    return "".join(result)
+
+
+@dataclass
+class ToolIndexEntry:
+    """Statically extracted metadata for one tool class."""
+
+    name: str
+    class_name: str
+    module: str
+    path: str
+    category: str
+    description: str = ""
+    schema_hash: str = ""
+    dependencies: List[str] = field(default_factory=list)
+
+    @property
+    def directory(self) -> str:
+        """Tool directory relative to the tools root (posix)."""
+        return self.path.rsplit("/", 1)[0] if "/" in self.path else ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for the index file."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ToolIndexEntry":
+        """Create entry from an index record."""
+        return cls(**data)
+
+
+def _base_name(node: ast.expr) -> Optional[str]:
+    """Return the trailing name of a base class expression (``base.BaseTool`` -> BaseTool)."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Subscript):
+        return _base_name(node.value)
+    return None
+
+
+def _string_constants(class_node: ast.ClassDef) -> Dict[str, str]:
+    """Collect class-level ``name = "value"`` and ``name: str = "value"`` assignments."""
+    values = {}
+    for stmt in class_node.body:
+        if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
+            targets, value = [stmt.target], stmt.value
+        elif isinstance(stmt, ast.Assign):
+            targets, value = stmt.targets, stmt.value
+        else:
+            continue
+
+        if isinstance(value, ast.Constant) and isinstance(value.value, str):
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    values[target.id] = value.value
+    return values
+
+
+def _schema_hash(class_node: ast.ClassDef) -> str:
+    """
+    Hash everything that shapes the tool schema.
+
+    Covers the class docstring and every class-level statement that is not a
+    method (Field declarations, tool_name, tool_category, ...), so method
+    edits leave the hash unchanged.
+    """
+    parts = [ast.get_docstring(class_node) or ""]
+    for stmt in class_node.body:
+        if isinstance(stmt, (ast.AnnAssign, ast.Assign)):
+            parts.append(ast.dump(stmt, annotate_fields=False))
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _dependencies(tree: ast.Module) -> List[str]:
+    """Third-party top-level packages imported anywhere in the module."""
+    stdlib = getattr(sys, "stdlib_module_names", frozenset())
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names = [node.module]
+        else:
+            continue
+
+        for name in names:
+            root = name.split(".")[0]
+            if root not in stdlib and root not in LOCAL_PACKAGES and root != "__future__":
+                found.add(root)
+    return sorted(found)
+
+
+def _summary(docstring: Optional[str]) -> str:
+    """First paragraph of a docstring on one line."""
+    if not docstring:
+        return ""
+    return docstring.strip().split("\n\n")[0].strip().replace("\n", " ")
+
+
+def scan_source(source: str, filename: str = "<unknown>") -> List[Dict[str, str]]:
+    """
+    Find tool classes in Python source without executing it.
+
+    A class is a tool if it subclasses one of TOOL_BASE_CLASSES, or another
+    tool class defined earlier in the same file.
+
+    Args:
+        source: Python source code
+        filename: File name used in syntax error messages
+
+    Returns:
+        List of dicts with name, class_name, category (may be empty),
+        description, schema_hash and dependencies
+    """
+    tree = ast.parse(source, filename=filename)
+    tool_bases = set(TOOL_BASE_CLASSES)
+    tools = []
+    dependencies = None
+
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if not any(_base_name(base) in tool_bases for base in node.bases):
+            continue
+
+        tool_bases.add(node.name)
+        constants = _string_constants(node)
+        if dependencies is None:
+            dependencies = _dependencies(tree)
+        tools.append(
+            {
+                "name": constants.get("tool_name") or to_snake_case(node.name),
+                "class_name": node.name,
+                "category": constants.get("tool_category", ""),
+                "description": _summary(ast.get_docstring(node)),
+                "schema_hash": _schema_hash(node),
+                "dependencies": list(dependencies),
+            }
+        )
+
+    return tools
+
+
+class ToolIndex:
+    """
+    Persisted AST index of the tools/ tree.
+
+    Covers the full nested tree (``tools/<category>/[<subcategory>/]<tool>/<tool>.py``);
+    private files and directories (leading ``_``) and ``test_*.py`` are skipped.
+    """
+
+    def __init__(self, tools_path: Union[str, Path], index_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize index.
+
+        Args:
+            tools_path: Root of the tools tree
+            index_path: Index file (defaults to ~/.agentswarm/tool_index.json, or a
+                per-tree tool_index-<hash>.json for trees other than tools/)
+        """
+        self.tools_path = Path(tools_path).resolve()
+        if index_path:
+            self.index_path = Path(index_path)
+        elif self.tools_path == default_tools_path().resolve():
+            self.index_path = default_index_path()
+        else:
+            # Other trees get their own file so they never evict the main index
+            digest = hashlib.sha1(str(self.tools_path).encode("utf-8")).hexdigest()[:12]
+            self.index_path = default_index_path().with_name(f"tool_index-{digest}.json")
+
+        # Files that could not be parsed at the last load: relative path -> error
+        self.errors: Dict[str, str] = {}
+
+    def load_or_build(self, rebuild: bool = False) -> Dict[str, ToolIndexEntry]:
+        """
+        Return index entries, re-parsing only files that changed.
+
+        Args:
+            rebuild: Ignore the persisted index and parse every file
+
+        Returns:
+            Dict mapping tool name -> ToolIndexEntry
+        """
+        cached_files = {} if rebuild else self._read_index()
+        files: Dict[str, Dict[str, Any]] = {}
+        parsed = 0
+
+        for rel_path, stamp in self._walk():
+            cached = cached_files.get(rel_path)
+            if cached and cached["stamp"] == stamp:
+                files[rel_path] = cached
+                continue
+
+            parsed += 1
+            files[rel_path] = {"stamp": stamp, **self._scan_file(rel_path)}
+
+        if parsed or set(files) != set(cached_files):
+            logger.debug(f"Tool index refreshed ({parsed} files parsed)")
+            self._write_index(files)
+
+        self.errors = {path: record["error"] for path, record in files.items() if "error" in record}
+        entries: Dict[str, ToolIndexEntry] = {}
+        for rel_path, record in files.items():
+            for tool in record["tools"]:
+                if tool["name"] in entries:
+                    logger.warning(
+                        f"Tool '{tool['name']}' defined in both "
+                        f"{entries[tool['name']].path} and {rel_path}, keeping the first"
+                    )
+                    continue
+                entries[tool["name"]] = ToolIndexEntry.from_dict(tool)
+        return entries
+
+    def _walk(self) -> Iterator[Tuple[str, List[int]]]:
+        """Yield (relative posix path, [mtime_ns, size]) for candidate files, sorted."""
+        stack = [self.tools_path]
+        found = []
+
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        name = entry.name
+                        if name.startswith((".", "_")):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in SKIP_DIRS:
+                                stack.append(Path(entry.path))
+                        elif name.endswith(".py") and not name.startswith("test_"):
+                            st = entry.stat()
+                            rel_path = Path(entry.path).relative_to(self.tools_path).as_posix()
+                            found.append((rel_path, [st.st_mtime_ns, st.st_size]))
+            except OSError as e:
+                logger.warning(f"Cannot scan {directory}: {e}")
+
+        return iter(sorted(found))
+
+    def _scan_file(self, rel_path: str) -> Dict[str, Any]:
+        """Parse one file into its file record: index records for its tools, or the error."""
+        file_path = self.tools_path / rel_path
+        try:
+            source = file_path.read_text(encoding="utf-8")
+            tools = scan_source(source, str(file_path))
+        except (OSError, SyntaxError, UnicodeDecodeError, ValueError) as e:
+            logger.warning(f"Failed to index {file_path}: {e}")
+            return {"tools": [], "error": f"{type(e).__name__}: {e}"}
+
+        parts = Path(rel_path).with_suffix("").parts
+        module = ".".join((self.tools_path.name,) + parts)
+        default_category = parts[0] if len(parts) > 1 else "unknown"
+
+        records = []
+        for tool in tools:
+            records.append(
+                ToolIndexEntry(
+                    name=tool["name"],
+                    class_name=tool["class_name"],
+                    module=module,
+                    path=rel_path,
+                    category=tool["category"] or default_category,
+                    description=tool["description"],
+                    schema_hash=tool["schema_hash"],
+                    dependencies=tool["dependencies"],
+                ).to_dict()
+            )
+        return {"tools": records}
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load persisted file records if the index matches this tools tree."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable tool index {self.index_path}: {e}")
+            return {}
+
+        if data.get("version") != INDEX_VERSION or data.get("tools_path") != str(self.tools_path):
+            return {}
+        return data.get("files", {})
+
+    def _write_index(self, files: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically write the index file."""
+        data = {
+            "version": INDEX_VERSION,
+            "tools_path": str(self.tools_path),
+            "built_at": time.time(),
+            "files": files,
+        }
+
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not write tool index {self.index_path}: {e}")
+
+
+def get_tool_index(
+    tools_path: Optional[Union[str, Path]] = None,
+    index_path: Optional[Union[str, Path]] = None,
+    refresh: bool = False,
+) -> Dict[str, ToolIndexEntry]:
+    """
+    Return the tool index, built or refreshed at most once per process.
+
+    Lookups in the returned dict are O(1); the first call per process costs a
+    stat walk of tools/ (plus parsing of changed files).
+
+    Args:
+        tools_path: Tools tree (defaults to the repository tools/ directory)
+        index_path: Index file (defaults to ~/.agentswarm/tool_index.json)
+        refresh: Re-check the tree even if this process already loaded it
+
+    Returns:
+        Dict mapping tool name -> ToolIndexEntry
+    """
+    index = ToolIndex(tools_path or default_tools_path(), index_path)
+    key = (str(index.tools_path), str(index.index_path))
+
+    with _index_lock:
+        if refresh or key not in _index_cache:
+            _index_cache[key] = index.load_or_build()
+            _error_cache[key] = index.errors
+        return _index_cache[key]
+
+
+def get_index_errors(
+    tools_path: Optional[Union[str, Path]] = None,
+    index_path: Optional[Union[str, Path]] = None,
+) -> Dict[str, str]:
+    """
+    Return the files get_tool_index() could not parse.
+
+    Such files contribute no tools to the index, so callers that check the
+    tree (validation) use this to report them instead of skipping them.
+
+    Args:
+        tools_path: Tools tree (defaults to the repository tools/ directory)
+        index_path: Index file (defaults to ~/.agentswarm/tool_index.json)
+
+    Returns:
+        Dict mapping relative file path -> parse error
+    """
+    index = ToolIndex(tools_path or default_tools_path(), index_path)
+    get_tool_index(tools_path, index_path)
+    return _error_cache[(str(index.tools_path), str(index.index_path))]
+
+
+def load_tool_class(entry: ToolIndexEntry, tools_path: Optional[Union[str, Path]] = None) -> Any:
+    """
+    Import the module of an indexed tool (once) and return the tool class.
+
+    The module is imported by its dotted name, so its parent packages are
+    imported first and relative imports between a tool's modules work. The
+    directory containing the tools tree is added to sys.path if missing, so
+    trees outside sys.path load too.
+
+    Args:
+        entry: Index entry
+        tools_path: Tools tree the entry belongs to (defaults to tools/)
+
+    Returns:
+        Tool class
+
+    Raises:
+        ImportError: If the module cannot be loaded
+        AttributeError: If the class is missing from the module
+    """
+    module = sys.modules.get(entry.module)
+    if module is None:
+        root = str(Path(tools_path or default_tools_path()).resolve().parent)
+        if root not in sys.path:
+            sys.path.append(root)
+        module = importlib.import_module(entry.module)
+
+    return getattr(module, entry.class_name)
@@ -0,0 +1,298 @@
+"""
+Tests for the CLI tool-runner daemon
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+from argparse import Namespace
+
+import pytest
+
+from cli.daemon import (
+    DAEMON_AVAILABLE,
+    DaemonClient,
+    ToolDaemon,
+    env_fingerprint,
+)
+
+pytestmark = pytest.mark.skipif(not DAEMON_AVAILABLE, reason="Unix sockets not available")
+
+PARAMS = {"text": "hello", "operations": ["uppercase"]}
+
+VERSION_TOOL = '''
+from shared.base import BaseTool
+from daemon_tools.utils.version_tool.helper import VERSION
+
+
+class VersionTool(BaseTool):
+    """Report the helper version."""
+
+    tool_name: str = "version_tool"
+    tool_category: str = "utils"
+
+    def _execute(self):
+        return {"version": VERSION}
+'''
+
+
+@pytest.fixture
+def socket_path(tmp_path_factory):
+    """Short socket path (AF_UNIX paths are limited to ~100 bytes)."""
+    return tmp_path_factory.mktemp("d") / "d.sock"
+
+
+@pytest.fixture
+def daemon(socket_path, monkeypatch):
+    """A daemon serving on a temporary socket in a background thread."""
+    monkeypatch.setenv("USE_MOCK_APIS", "true")
+    daemon = ToolDaemon(socket_path, idle_timeout=0)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+
+    client = DaemonClient(socket_path)
+    deadline = time.monotonic() + 10
+    while not client.is_running():
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.02)
+
+    yield daemon
+    daemon.shutdown()
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def tools_tree(tmp_path, monkeypatch):
+    """A one-tool tree standing in for tools/, with its own index file."""
+    tool_dir = tmp_path / "daemon_tools" / "utils" / "version_tool"
+    tool_dir.mkdir(parents=True)
+    for package in (tool_dir.parent.parent, tool_dir.parent, tool_dir):
+        (package / "__init__.py").write_text("")
+    (tool_dir / "version_tool.py").write_text(VERSION_TOOL)
+    (tool_dir / "helper.py").write_text("VERSION = 1\n")
+
+    monkeypatch.setattr("shared.tool_index.default_tools_path", lambda: tmp_path / "daemon_tools")
+    monkeypatch.setattr("shared.tool_index.default_index_path", lambda: tmp_path / "index.json")
+    yield tool_dir
+    for name in [m for m in sys.modules if m.split(".")[0] == "daemon_tools"]:
+        del sys.modules[name]
+    if str(tmp_path) in sys.path:
+        sys.path.remove(str(tmp_path))
+
+
+class TestDaemonClient:
+    """Test the client without a daemon."""
+
+    def test_not_running(self, socket_path):
+        """Test a missing socket is reported as not running."""
+        client = DaemonClient(socket_path)
+
+        assert not client.is_running()
+        with pytest.raises(ConnectionError):
+            client.status()
+
+    def test_stale_socket(self, socket_path):
+        """Test a socket file nobody listens on is reported as not running."""
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        assert not DaemonClient(socket_path).is_running()
+
+
+class TestToolDaemon:
+    """Test the daemon over its socket."""
+
+    def test_run_tool(self, daemon, socket_path):
+        """Test a tool runs in the daemon and stays loaded."""
+        client = DaemonClient(socket_path)
+
+        response = client.run_tool("text_formatter", PARAMS)
+
+        assert response["success"]
+        assert response["result"]["metadata"]["tool_name"] == "text_formatter"
+        status = client.status()
+        assert status["requests_served"] == 1
+        assert "text_formatter" in status["loaded_tools"]
+
+    def test_errors(self, daemon, socket_path):
+        """Test unknown tools, bad parameters and unknown actions."""
+        client = DaemonClient(socket_path)
+
+        assert "not found" in client.run_tool("no_such_tool", {})["error"]
+        assert "validation" in client.run_tool("text_formatter", {"bogus": 1})["error"]
+        assert not client.request({"action": "explode"})["success"]
+
+    def test_tool_import_error(self, daemon, socket_path, monkeypatch):
+        """Test a tool whose module fails to import gets an error response."""
+
+        def broken(entry, tools_path=None):
+            raise ImportError("No module named 'missing_dependency'")
+
+        monkeypatch.setattr("shared.tool_index.load_tool_class", broken)
+        client = DaemonClient(socket_path)
+
+        response = client.run_tool("text_formatter", PARAMS)
+
+        assert not response["success"]
+        assert "missing_dependency" in response["error"]
+        assert client.is_running()
+
+    def test_other_cwd_falls_back(self, daemon, socket_path, tmp_path):
+        """Test requests from another directory are sent back to the client."""
+        response = DaemonClient(socket_path).request(
+            {"action": "run", "tool": "text_formatter", "params": PARAMS, "cwd": str(tmp_path)}
+        )
+
+        assert response["fallback"]
+
+    def test_other_env_falls_back(self, daemon, socket_path):
+        """Test requests from a shell with another environment are sent back to the client."""
+        client = DaemonClient(socket_path)
+        other_env = env_fingerprint({**os.environ, "USE_MOCK_APIS": "false"})
+
+        # Same process, so the client's environment is the daemon's
+        assert client.run_tool("text_formatter", PARAMS)["success"]
+        response = client.request(
+            {"action": "run", "tool": "text_formatter", "params": PARAMS, "env": other_env}
+        )
+
+        assert response["fallback"]
+        assert daemon.requests_served == 1
+
+    def test_env_fingerprint_ignores_shell_bookkeeping(self):
+        """Test only variables that can change a tool's behaviour count."""
+        base = {"OPENAI_API_KEY": "a", "PWD": "/one", "SHLVL": "1"}
+
+        assert env_fingerprint(base) == env_fingerprint({**base, "PWD": "/two", "SHLVL": "2"})
+        assert env_fingerprint(base) != env_fingerprint({**base, "OPENAI_API_KEY": "b"})
+
+    def test_edited_tool_is_reimported(self, daemon, socket_path, tools_tree):
+        """Test a tool whose sources change is imported again on its next run."""
+        client = DaemonClient(socket_path)
+
+        assert client.run_tool("version_tool", {})["result"] == {"version": 1}
+        (tools_tree / "helper.py").write_text("VERSION = 22\n")
+
+        assert client.run_tool("version_tool", {})["result"] == {"version": 22}
+
+    def test_concurrent_clients(self, daemon, socket_path):
+        """Test several clients are served at once."""
+        results = []
+
+        def call():
+            results.append(DaemonClient(socket_path).run_tool("text_formatter", PARAMS))
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        assert len(results) == 8
+        assert all(r["success"] for r in results)
+
+    def test_stop(self, daemon, socket_path):
+        """Test stop shuts the daemon down and removes the socket."""
+        DaemonClient(socket_path).stop()
+
+        deadline = time.monotonic() + 5
+        while socket_path.exists():
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+        assert not DaemonClient(socket_path).is_running()
+
+    def test_idle_exit(self, socket_path):
+        """Test the daemon exits after idle_timeout without requests."""
+        daemon = ToolDaemon(socket_path, idle_timeout=0.3)
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+
+        thread.join(timeout=10)
+
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+
+
+class TestRunForwarding:
+    """Test `agentswarm run` forwarding."""
+
+    def make_args(self, **overrides):
+        args = dict(
+            tool="text_formatter",
+            params='{"text": "hello", "operations": ["uppercase"]}',
+            interactive=False,
+            output=None,
+            format="json",
+            daemon=False,
+            no_daemon=False,
+        )
+        args.update(overrides)
+        return Namespace(**args)
+
+    def test_forwards_to_running_daemon(self, daemon, socket_path, monkeypatch, capsys):
+        """Test run goes to the daemon when one is running."""
+        from cli.commands import run
+
+        monkeypatch.setenv("AGENTSWARM_DAEMON_SOCKET", str(socket_path))
+
+        assert run.execute(self.make_args()) == 0
+        assert "(daemon)" in capsys.readouterr().out
+        assert daemon.requests_served == 1
+
+    def test_no_daemon_runs_locally(self, daemon, socket_path, monkeypatch, capsys):
+        """Test --no-daemon bypasses a running daemon."""
+        from cli.commands import run
+
+        monkeypatch.setenv("AGENTSWARM_DAEMON_SOCKET", str(socket_path))
+
+        assert run.execute(self.make_args(no_daemon=True)) == 0
+        output = capsys.readouterr().out
+        assert "Running text_formatter..." in output
+        assert "(daemon)" not in output
+        assert daemon.requests_served == 0
+
+    @pytest.mark.parametrize("reply", [b"", b"x" * 200000], ids=["closed", "too-large"])
+    def test_lost_response_is_not_rerun_locally(self, socket_path, monkeypatch, capsys, reply):
+        """Test a request the daemon received is never repeated in the client."""
+        from cli.commands import run
+
+        monkeypatch.setattr("cli.daemon.MAX_REQUEST_BYTES", 1000)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(socket_path))
+        server.listen(1)
+
+        def answer():
+            conn, _ = server.accept()
+            conn.recv(65536)
+            try:
+                conn.sendall(reply)
+            except OSError:
+                pass  # the client stopped reading
+            conn.close()
+
+        thread = threading.Thread(target=answer)
+        thread.start()
+        try:
+            exit_code = run.run_in_daemon(DaemonClient(socket_path), self.make_args(), PARAMS)
+        finally:
+            thread.join(timeout=5)
+            server.close()
+
+        assert exit_code == 1
+        error = capsys.readouterr().err
+        assert "No valid response" in error or "without a response" in error
+        assert "running locally" not in error
+
+    def test_undelivered_request_runs_locally(self, socket_path, capsys):
+        """Test the client falls back when the request never reached a daemon."""
+        from cli.commands import run
+
+        assert run.run_in_daemon(DaemonClient(socket_path), self.make_args(), PARAMS) is None
+        assert "running locally" in capsys.readouterr().err
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
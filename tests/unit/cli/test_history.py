@@ -3,14 +3,18 @@ Tests for command history functionality
 """
 
 import json
+import subprocess
+import sys
 import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
 
 from cli.history import CommandHistory
 
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
 
 class TestCommandHistory:
     """Test CommandHistory class."""
@@ -19,11 +23,7 @@ class TestCommandHistory:
     def temp_history(self):
         """Create temporary history instance."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            history = CommandHistory()
-            history.history_dir = Path(tmpdir)
-            history.history_file = history.history_dir / "history.json"
-            history.history = []
-            yield history
+            yield CommandHistory(history_dir=Path(tmpdir))
 
     def test_add_command(self, temp_history):
         """Test adding command to history."""
@@ -181,28 +181,115 @@ class TestCommandHistory:
         assert len(history.history) <= 1000
 
     def test_save_and_load_history(self, temp_history):
-        """Test saving and loading history."""
+        """Test history persists across instances."""
         history = temp_history
 
         # Add commands
         history.add_command(command="run", tool="tool1", success=True)
         history.add_command(command="run", tool="tool2", success=False)
 
-        # Save
-        history._save_history()
-
-        # Create new instance and load
-        new_history = CommandHistory()
-        new_history.history_file = history.history_file
-        new_history.history = new_history._load_history()
+        # Create new instance on the same directory
+        new_history = CommandHistory(history_dir=history.history_dir)
 
         assert len(new_history.history) == 2
         assert new_history.history[0]["tool"] == "tool1"
+        assert new_history.history[1]["success"] is False
+
+    def test_ids_stay_unique_after_trim(self, temp_history):
+        """Test ids are not reused once old entries are dropped."""
+        history = CommandHistory(history_dir=temp_history.history_dir, max_entries=3)
+
+        ids = [history.add_command(command="run", tool=f"tool_{i}")["id"] for i in range(5)]
+
+        assert ids == [1, 2, 3, 4, 5]
+        assert [e["id"] for e in history.history] == [3, 4, 5]
+        assert history.get_by_id(1) is None
+        assert history.get_by_id(5)["tool"] == "tool_4"
+
+    def test_get_history_by_tool_and_time(self, temp_history):
+        """Test tool and time filters."""
+        history = temp_history
+        before = datetime.now() - timedelta(seconds=1)
+
+        history.add_command(command="run", tool="tool1")
+        history.add_command(command="test", tool="tool2")
+        history.add_command(command="run", tool="tool1")
+
+        assert [e["id"] for e in history.get_history(tool_filter="tool1")] == [3, 1]
+        assert len(history.get_history(since=before)) == 3
+        assert history.get_history(until=before) == []
+
+    def test_migrates_legacy_json(self, tmp_path):
+        """Test history.json is imported once and then retired."""
+        legacy = [
+            {
+                "id": 1,
+                "timestamp": "2025-01-01T10:00:00",
+                "command": "run",
+                "tool": "web_search",
+                "params": {"query": "test"},
+                "success": True,
+                "error": None,
+                "duration": 1.5,
+            },
+            {
+                "id": 1,
+                "timestamp": "2025-01-01T11:00:00",
+                "command": "test",
+                "tool": "web_search",
+                "params": {},
+                "success": False,
+                "error": "boom",
+                "duration": None,
+            },
+        ]
+        (tmp_path / "history.json").write_text(json.dumps(legacy))
+
+        history = CommandHistory(history_dir=tmp_path)
+
+        assert not (tmp_path / "history.json").exists()
+        assert (tmp_path / "history.json.migrated").exists()
+        assert history.get_by_id(1)["params"] == {"query": "test"}
+        assert [e["error"] for e in history.get_history()] == ["boom", None]
+        assert history.add_command(command="run")["id"] == 3
+        assert len(CommandHistory(history_dir=tmp_path).history) == 3
+
+    def test_unreadable_legacy_json_is_set_aside(self, tmp_path):
+        """Test a corrupt history.json is moved aside, not left claimed."""
+        (tmp_path / "history.json").write_text("{not json")
+
+        history = CommandHistory(history_dir=tmp_path)
+
+        assert sorted(p.name for p in tmp_path.glob("history.json*")) == ["history.json.unreadable"]
+        assert history.get_history() == []
+
+    def test_concurrent_writers(self, temp_history):
+        """Test entries from several processes are all kept."""
+        code = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from cli.history import CommandHistory\n"
+            "history = CommandHistory(history_dir=Path(sys.argv[1]))\n"
+            "for i in range(25):\n"
+            "    history.add_command(command='run', tool='worker_' + sys.argv[2])\n"
+        )
+        processes = [
+            subprocess.Popen(
+                [sys.executable, "-c", code, str(temp_history.history_dir), str(n)],
+                cwd=PROJECT_ROOT,
+            )
+            for n in range(4)
+        ]
+
+        assert all(p.wait(timeout=60) == 0 for p in processes)
+        entries = temp_history.history
+        assert len(entries) == 100
+        assert len({e["id"] for e in entries}) == 100
 
 
-def test_history_entry_structure():
+def test_history_entry_structure(tmp_path):
     """Test that history entries have correct structure."""
-    history = CommandHistory()
+    history = CommandHistory(history_dir=tmp_path)
 
     history.add_command(
         command="run",
@@ -0,0 +1,60 @@
+"""
+Tests for the CLI entry point and lazy command loading
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cli.main import COMMANDS, create_parser, main
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+
+
+class TestMain:
+    """Test command dispatch."""
+
+    def test_every_subcommand_is_dispatched(self):
+        """Test each parser subcommand maps to a command module."""
+        parser = create_parser()
+        subparsers = next(a for a in parser._actions if a.dest == "command")
+
+        assert set(subparsers.choices) == set(COMMANDS)
+
+    def test_no_command_prints_help(self, capsys):
+        """Test running without a command prints help."""
+        assert main([]) == 0
+        assert "agentswarm" in capsys.readouterr().out
+
+    def test_list_json(self, capsys):
+        """Test list output comes from the tool index."""
+        assert main(["list", "--category", "utils", "--format", "json"]) == 0
+
+        tools = json.loads(capsys.readouterr().out)
+        assert any(tool["Tool"] == "text_formatter" for tool in tools)
+
+    def test_help_does_not_import_commands(self):
+        """Test --help loads no command module, shared.base or pydantic."""
+        code = (
+            "import sys\n"
+            "from cli.main import main\n"
+            "try:\n"
+            "    main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "heavy = [m for m in sys.modules if m.startswith('cli.commands.')\n"
+            "         or m in ('shared.base', 'pydantic', 'shared.monitoring')]\n"
+            "print(heavy, file=sys.stderr)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+
+        assert result.stderr.strip().splitlines()[-1] == "[]"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,174 @@
+"""
+Tests for the parallel tool runner
+"""
+
+import os
+import time
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from cli.runner import (
+    ERROR,
+    FAILED,
+    PASSED,
+    RunCache,
+    ToolRunResult,
+    run_parallel,
+    skipped_result,
+    write_junit,
+)
+from shared.tool_index import ToolIndexEntry
+
+
+def make_entry(name, path=None):
+    return ToolIndexEntry(
+        name=name,
+        class_name=name.title(),
+        module=f"tools.utils.{name}.{name}",
+        path=path or f"utils/{name}/{name}.py",
+        category="utils",
+    )
+
+
+def check(entry, mode="ok"):
+    """Per-tool check whose behaviour depends on the tool name."""
+    if entry.name == "hangs":
+        time.sleep(30)
+    if entry.name == "crashes":
+        os._exit(3)
+    if entry.name == "raises":
+        raise RuntimeError("boom")
+    if entry.name == "fails":
+        return {"success": False, "error": "bad output"}
+    return {"success": True, "mode": mode}
+
+
+class TestRunParallel:
+    """Test process-per-tool execution."""
+
+    def test_results_and_options(self):
+        """Test passing and failing tools and forwarded options."""
+        results = list(
+            run_parallel(
+                check, [make_entry("good"), make_entry("fails")], workers=2, options={"mode": "x"}
+            )
+        )
+
+        by_tool = {r.tool: r for r in results}
+        assert by_tool["good"].status == PASSED
+        assert by_tool["good"].details["mode"] == "x"
+        assert by_tool["fails"].status == FAILED
+        assert by_tool["fails"].message == "bad output"
+
+    def test_isolates_hangs_crashes_and_exceptions(self):
+        """Test one bad tool does not stall or break the others."""
+        entries = [make_entry(n) for n in ("hangs", "crashes", "raises", "good")]
+
+        start = time.monotonic()
+        results = {r.tool: r for r in run_parallel(check, entries, workers=4, timeout=1)}
+
+        assert time.monotonic() - start < 10
+        assert results["good"].status == PASSED
+        assert results["hangs"].status == ERROR
+        assert "Timed out" in results["hangs"].message
+        assert results["crashes"].status == ERROR
+        assert "exited with code 3" in results["crashes"].message
+        assert results["raises"].status == ERROR
+        assert "RuntimeError: boom" in results["raises"].message
+
+    def test_streams_in_completion_order(self):
+        """Test fast tools are reported before slow ones finish."""
+        entries = [make_entry("hangs"), make_entry("good")]
+
+        first = next(run_parallel(check, entries, workers=2, timeout=5))
+
+        assert first.tool == "good"
+
+
+class TestRunCache:
+    """Test source-hash based reruns."""
+
+    @pytest.fixture
+    def tools_tree(self, tmp_path):
+        tool_dir = tmp_path / "tools" / "utils" / "echo"
+        tool_dir.mkdir(parents=True)
+        (tool_dir / "echo.py").write_text("x = 1\n")
+        (tool_dir / "test_echo.py").write_text("y = 1\n")
+        return tmp_path / "tools"
+
+    def test_green_until_source_changes(self, tools_tree, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        entry = make_entry("echo")
+        cache = RunCache("test", cache_path, tools_tree)
+
+        assert not cache.is_green(entry)
+        cache.record(entry, ToolRunResult("echo", "utils", entry.module, PASSED))
+        cache.save()
+
+        reloaded = RunCache("test", cache_path, tools_tree)
+        assert reloaded.is_green(entry)
+        assert not RunCache("other-suite", cache_path, tools_tree).is_green(entry)
+
+        # Test files do not affect the hash; sources do
+        (tools_tree / "utils" / "echo" / "test_echo.py").write_text("y = 2\n")
+        assert RunCache("test", cache_path, tools_tree).is_green(entry)
+        (tools_tree / "utils" / "echo" / "echo.py").write_text("x = 2\n")
+        assert not RunCache("test", cache_path, tools_tree).is_green(entry)
+
+    def test_checker_changes_invalidate(self, tools_tree, tmp_path, monkeypatch):
+        root = tmp_path / "repo"
+        for name in ("shared/base.py", "cli/commands/validate.py", "sdk/validator.py"):
+            (root / name).parent.mkdir(parents=True, exist_ok=True)
+            (root / name).write_text("v = 1\n")
+        monkeypatch.setattr("cli.runner.PROJECT_ROOT", root)
+
+        cache_path = tmp_path / "cache.json"
+        entry = make_entry("echo")
+        for name in ("shared/base.py", "cli/commands/validate.py", "sdk/validator.py"):
+            cache = RunCache("test", cache_path, tools_tree)
+            cache.record(entry, ToolRunResult("echo", "utils", entry.module, PASSED))
+            cache.save()
+            assert RunCache("test", cache_path, tools_tree).is_green(entry)
+
+            (root / name).write_text("v = 2\n")
+            assert not RunCache("test", cache_path, tools_tree).is_green(entry), name
+
+    def test_failure_clears_green(self, tools_tree, tmp_path):
+        entry = make_entry("echo")
+        cache = RunCache("test", tmp_path / "cache.json", tools_tree)
+
+        cache.record(entry, ToolRunResult("echo", "utils", entry.module, PASSED))
+        cache.record(entry, skipped_result(entry))
+        assert cache.is_green(entry)
+
+        cache.record(entry, ToolRunResult("echo", "utils", entry.module, FAILED))
+        assert not cache.is_green(entry)
+
+
+def test_write_junit(tmp_path):
+    """Test the JUnit report layout and counts."""
+    results = [
+        ToolRunResult("a", "utils", "tools.utils.a.a", PASSED, 0.5),
+        ToolRunResult("b", "utils", "tools.utils.b.b", FAILED, 0.25, "bad\ntrace"),
+        ToolRunResult("c", "utils", "tools.utils.c.c", ERROR, 1.0, "Timed out after 1s"),
+        skipped_result(make_entry("d")),
+    ]
+    output = tmp_path / "test-results" / "tools.xml"
+
+    write_junit(results, output, "agentswarm test")
+
+    suite = ET.parse(output).getroot().find("testsuite")
+    assert suite.attrib["tests"] == "4"
+    assert suite.attrib["failures"] == "1"
+    assert suite.attrib["errors"] == "1"
+    assert suite.attrib["skipped"] == "1"
+    cases = {case.attrib["name"]: case for case in suite.findall("testcase")}
+    assert cases["a"].attrib["classname"] == "tools.utils.a.a"
+    assert cases["b"].find("failure").attrib["message"] == "bad"
+    assert cases["c"].find("error") is not None
+    assert cases["d"].find("skipped") is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
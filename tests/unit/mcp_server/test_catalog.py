@@ -0,0 +1,117 @@
+"""
+Unit tests for the MCP tool catalog
+"""
+
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from mcp_server.catalog import CATALOG_VERSION, CatalogEntry, ToolCatalog
+from mcp_server.config import MCPConfig
+from mcp_server.tools import ToolRegistry
+
+
+class TestToolCatalog:
+    """Test catalog build, reuse and invalidation."""
+
+    @pytest.fixture
+    def catalog_path(self, tmp_path):
+        """Temporary manifest path."""
+        return tmp_path / "catalog.json"
+
+    @pytest.fixture
+    def registry(self, catalog_path):
+        """Registry over the small utils category."""
+        config = MCPConfig(enabled_categories=["utils"], tool_catalog_path=str(catalog_path))
+        return ToolRegistry(config)
+
+    def test_build_writes_manifest(self, registry, catalog_path):
+        """Test first load builds and persists the manifest."""
+        tools = registry.catalog.load_or_build()
+
+        assert len(tools) > 0
+        assert all(isinstance(entry, CatalogEntry) for entry in tools.values())
+
+        manifest = json.loads(catalog_path.read_text())
+        assert manifest["version"] == CATALOG_VERSION
+        assert manifest["categories"] == ["utils"]
+
+    def test_fresh_manifest_skips_imports(self, registry):
+        """Test an unchanged tree is served without importing tool modules."""
+        registry.catalog.load_or_build()
+
+        with patch.object(registry, "_load_tool_from_directory") as loader:
+            tools = ToolCatalog(registry, registry.catalog.path).load_or_build()
+
+        loader.assert_not_called()
+        assert len(tools) > 0
+
+    def test_changed_schema_reimports_only_that_tool(self, registry, catalog_path):
+        """Test a changed schema hash re-imports just that directory."""
+        registry.catalog.load_or_build()
+
+        manifest = json.loads(catalog_path.read_text())
+        rel_dir = next(d for d, record in manifest["dirs"].items() if record["tool"])
+        manifest["dirs"][rel_dir]["fingerprint"] += "-stale"  # pretend the schema changed
+        catalog_path.write_text(json.dumps(manifest))
+
+        with patch.object(
+            registry, "_load_tool_from_directory", wraps=registry._load_tool_from_directory
+        ) as loader:
+            registry.catalog.load_or_build()
+
+        assert loader.call_count == 1
+        assert loader.call_args[0][0].as_posix().endswith(rel_dir)
+
+    def test_category_change_invalidates(self, registry, catalog_path):
+        """Test a manifest built for other categories is ignored."""
+        registry.catalog.load_or_build()
+        manifest = json.loads(catalog_path.read_text())
+        manifest["categories"] = ["data"]
+        catalog_path.write_text(json.dumps(manifest))
+
+        assert registry.catalog._read_manifest() is None
+
+    def test_entry_loads_lazily(self, registry):
+        """Test entries import their module only on load()."""
+        tools = registry.catalog.load_or_build()
+        entry = next(iter(tools.values()))
+
+        assert entry._tool_class is None
+        tool_class = entry.load()
+        assert tool_class.__name__ == entry.class_name
+        assert entry.load() is tool_class
+
+    def test_registry_serves_schema_from_catalog(self, registry):
+        """Test generate_tool_schema returns the cached schema for entries."""
+        tools = registry.discover_tools()
+        entry = next(iter(tools.values()))
+
+        schema = registry.generate_tool_schema(entry)
+
+        assert schema["name"] == entry.tool_name
+        assert schema["inputSchema"]["type"] == "object"
+        assert entry._tool_class is None  # Still not imported
+
+    def test_catalog_disabled(self, catalog_path):
+        """Test eager discovery when the catalog is disabled."""
+        config = MCPConfig(
+            enabled_categories=["utils"],
+            use_tool_catalog=False,
+            tool_catalog_path=str(catalog_path),
+        )
+        tools = ToolRegistry(config).discover_tools()
+
+        assert len(tools) > 0
+        assert not any(isinstance(t, CatalogEntry) for t in tools.values())
+        assert not catalog_path.exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
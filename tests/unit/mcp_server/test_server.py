@@ -2,10 +2,14 @@
 Unit tests for MCP Server
 """
 
+import asyncio
+import io
 import json
 import os
 import sys
+import time
 from unittest.mock import MagicMock, Mock, patch
+from urllib.parse import urlparse
 
 import pytest
 
@@ -227,5 +231,224 @@ class TestMCPServerIntegration:
         assert "tools" in list_response["result"]
 
 
+class TestMCPServerDispatcher:
+    """Test the concurrent stdio dispatcher."""
+
+    @pytest.fixture
+    def server(self):
+        """Create server whose test tools sleep for the requested time."""
+        config = MCPConfig(
+            enabled_categories=["data"],
+            enable_analytics=False,
+            enable_caching=False,
+            max_concurrent_requests=4,
+            request_timeout=5,
+        )
+        with patch("mcp_server.server.ToolRegistry") as mock_registry:
+            mock_registry_instance = MagicMock()
+            mock_registry_instance.discover_tools.return_value = {
+                "sleep_tool": Mock(tool_name="sleep_tool", __doc__="Sleeps")
+            }
+
+            def execute_tool(tool_class, arguments):
+                time.sleep(arguments.get("seconds", 0))
+                return {"success": True, "slept": arguments.get("seconds", 0)}
+
+            mock_registry_instance.execute_tool.side_effect = execute_tool
+            mock_registry.return_value = mock_registry_instance
+
+            return MCPServer(config)
+
+    def _serve(self, server, messages):
+        """Feed messages through run_async and return the parsed responses in write order."""
+        stdin = io.StringIO("".join(json.dumps(m) + "\n" for m in messages))
+        stdout = io.StringIO()
+        with patch("sys.stdin", stdin), patch("sys.stdout", stdout):
+            asyncio.run(server.run_async())
+        return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def _call(self, request_id, seconds):
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {"name": "sleep_tool", "arguments": {"seconds": seconds}},
+        }
+
+    def test_slow_call_does_not_block_ping(self, server):
+        """Test ping is answered while a slow tool call is running."""
+        responses = self._serve(
+            server,
+            [self._call(1, 0.3), {"jsonrpc": "2.0", "id": 2, "method": "ping"}],
+        )
+
+        assert [r["id"] for r in responses] == [2, 1]
+        assert responses[1]["result"]["content"][0]["type"] == "text"
+
+    def test_calls_run_concurrently(self, server):
+        """Test tool calls overlap on the pool."""
+        start = time.time()
+        responses = self._serve(server, [self._call(i, 0.3) for i in range(4)])
+        elapsed = time.time() - start
+
+        assert sorted(r["id"] for r in responses) == [0, 1, 2, 3]
+        assert elapsed < 1.0  # Sequential would take 1.2s
+
+    def test_request_timeout(self, server):
+        """Test slow calls get a timeout error."""
+        server.config.request_timeout = 0.1
+
+        responses = self._serve(server, [self._call(1, 0.5)])
+
+        assert responses[0]["id"] == 1
+        assert responses[0]["error"]["code"] == MCPServer.REQUEST_TIMEOUT_CODE
+
+    def test_cancelled_request_gets_no_response(self, server):
+        """Test notifications/cancelled drops the in-flight request."""
+        responses = self._serve(
+            server,
+            [
+                self._call(1, 0.3),
+                {
+                    "jsonrpc": "2.0",
+                    "method": "notifications/cancelled",
+                    "params": {"requestId": 1, "reason": "user aborted"},
+                },
+                {"jsonrpc": "2.0", "id": 2, "method": "ping"},
+            ],
+        )
+
+        assert [r["id"] for r in responses] == [2]
+
+    def test_notifications_are_not_answered(self, server):
+        """Test notifications produce no response."""
+        responses = self._serve(server, [{"jsonrpc": "2.0", "method": "notifications/initialized"}])
+
+        assert responses == []
+
+    def test_invalid_json(self, server):
+        """Test malformed lines get a parse error."""
+        stdout = io.StringIO()
+        with patch("sys.stdin", io.StringIO("{not json\n")), patch("sys.stdout", stdout):
+            asyncio.run(server.run_async())
+
+        response = json.loads(stdout.getvalue())
+        assert response["error"]["code"] == -32700
+
+    def test_progress_notifications(self, server):
+        """Test calls with a progressToken get progress heartbeats before the result."""
+        server.config.progress_interval = 0.1
+        request = self._call(1, 0.35)
+        request["params"]["_meta"] = {"progressToken": "tok-1"}
+
+        messages = self._serve(server, [request])
+
+        progress = [m for m in messages if m.get("method") == "notifications/progress"]
+        assert len(progress) >= 2
+        assert all(m["params"]["progressToken"] == "tok-1" for m in progress)
+        assert messages[-1]["id"] == 1
+
+
+class TestMCPServerPayloads:
+    """Test response serialization and spill-to-file."""
+
+    @pytest.fixture
+    def server(self, tmp_path):
+        """Create server with a small inline limit and a temp spill directory."""
+        config = MCPConfig(
+            enabled_categories=["data"],
+            enable_analytics=False,
+            max_inline_bytes=1000,
+            payload_dir=str(tmp_path / "payloads"),
+        )
+        with patch("mcp_server.server.ToolRegistry") as mock_registry:
+            mock_registry_instance = MagicMock()
+            mock_registry_instance.discover_tools.return_value = {
+                "chart_tool": Mock(tool_name="chart_tool", __doc__="Charts")
+            }
+            mock_registry.return_value = mock_registry_instance
+            return MCPServer(config)
+
+    def _call(self, server, result):
+        server.tool_registry.execute_tool = Mock(return_value=result)
+        response = server.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/call",
+                "params": {"name": "chart_tool", "arguments": {}},
+            }
+        )
+        return response["result"]["content"][0]["text"]
+
+    def test_small_result_is_inline_and_compact(self, server):
+        """Test small results are returned inline without indentation."""
+        text = self._call(server, {"success": True, "result": {"a": 1}})
+
+        assert "\n" not in text
+        assert json.loads(text) == {"success": True, "result": {"a": 1}}
+
+    def test_large_result_is_spilled(self, server):
+        """Test large results are replaced by a preview and a readable resource."""
+        result = {"success": True, "result": {"image": "A" * 5000}}
+
+        envelope = json.loads(self._call(server, result))
+
+        assert envelope["truncated"] is True
+        assert envelope["size_bytes"] > 5000
+        assert len(envelope["preview"]) < envelope["size_bytes"]
+
+        response = server.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "resources/read",
+                "params": {"uri": envelope["resource_uri"]},
+            }
+        )
+        assert json.loads(response["result"]["contents"][0]["text"]) == result
+
+    def test_list_resources(self, server):
+        """Test spilled results are listed as resources, newest first."""
+        request = {"jsonrpc": "2.0", "id": 4, "method": "resources/list", "params": {}}
+        assert server.handle_request(request)["result"] == {"resources": []}
+
+        first = json.loads(self._call(server, {"result": "A" * 5000}))
+        second = json.loads(self._call(server, {"result": "B" * 5000}))
+        old = time.time() - 60
+        os.utime(urlparse(first["resource_uri"]).path, (old, old))
+
+        resources = server.handle_request(request)["result"]["resources"]
+
+        assert [r["uri"] for r in resources] == [second["resource_uri"], first["resource_uri"]]
+        assert resources[0]["mimeType"] == "application/json"
+        assert resources[0]["size"] == second["size_bytes"]
+
+    def test_read_resource_outside_payload_dir(self, server, tmp_path):
+        """Test resources/read refuses files the server did not spill."""
+        secret = tmp_path / "secret.json"
+        secret.write_text("{}")
+
+        response = server.handle_request(
+            {
+                "jsonrpc": "2.0",
+                "id": 3,
+                "method": "resources/read",
+                "params": {"uri": secret.as_uri()},
+            }
+        )
+
+        assert "error" in response
+
+    def test_response_size_recorded(self, server):
+        """Test serialized bytes are reported to monitoring when analytics is on."""
+        server.config.enable_analytics = True
+
+        with patch("shared.monitoring.record_response_size") as record:
+            text = self._call(server, {"success": True})
+
+        record.assert_called_once_with("chart_tool", len(text.encode("utf-8")), source="mcp")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
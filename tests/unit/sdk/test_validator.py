@@ -0,0 +1,203 @@
+"""
+Tests for ToolValidator result caching and parallel validation
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+import sdk.validator as validator_module
+from sdk.validator import ToolValidator, ValidationCache
+
+TOOL_SOURCE = '''"""Echo tool"""
+
+import os
+
+from pydantic import Field
+
+from shared.base import BaseTool
+from shared.errors import ValidationError
+
+
+class {class_name}(BaseTool):
+    """
+    Echo input back.
+
+    Args:
+        text: Text to echo
+
+    Returns:
+        Dict with the text
+
+    Example:
+        >>> {class_name}(text="hi").run()
+    """
+
+    tool_name: str = "{name}"
+    tool_category: str = "utils"
+
+    text: str = Field(..., description="Text to echo")
+
+    def _execute(self):
+        """Run."""
+        return self._process()
+
+    def _validate_parameters(self):
+        """Validate."""
+
+    def _should_use_mock(self):
+        """Mock?"""
+        return os.getenv("USE_MOCK_APIS") == "true"
+
+    def _generate_mock_results(self):
+        """Mock results."""
+        return {{}}
+
+    def _process(self):
+        """Process."""
+        return {{"text": self.text}}
+
+
+if __name__ == "__main__":
+    os.environ["USE_MOCK_APIS"] = "true"
+'''
+
+
+def write_tool(root: Path, name: str) -> Path:
+    """Write a tool package with supporting files."""
+    tool_dir = root / "utils" / name
+    tool_dir.mkdir(parents=True)
+    class_name = "".join(part.title() for part in name.split("_"))
+    (tool_dir / f"{name}.py").write_text(TOOL_SOURCE.format(class_name=class_name, name=name))
+    (tool_dir / f"test_{name}.py").write_text("")
+    (tool_dir / "README.md").write_text("# Echo\n")
+    (tool_dir / "__init__.py").write_text("")
+    return tool_dir
+
+
+def summarize(results):
+    return {
+        name: (r.passed, r.score, [(i.severity, i.message) for i in r.issues])
+        for name, r in results.items()
+    }
+
+
+class TestToolValidatorCache:
+    """Test content-hash caching and the process pool"""
+
+    def setup_method(self):
+        """Set up a temporary tools tree and cache"""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.tools_dir = self.test_dir / "tools"
+        self.cache_path = self.test_dir / "validator_cache.json"
+        for i in range(3):
+            write_tool(self.tools_dir, f"echo_tool_{i}")
+
+    def teardown_method(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.test_dir)
+
+    def validator(self):
+        return ToolValidator(cache_path=self.cache_path)
+
+    def test_second_run_is_served_from_cache(self):
+        """Test unchanged files are not re-checked"""
+        first = self.validator()
+        first_results = first.validate_all_tools(self.tools_dir, workers=1)
+        assert first.cache.misses == 3
+
+        second = self.validator()
+        second_results = second.validate_all_tools(self.tools_dir, workers=1)
+
+        assert second.cache.hits == 3
+        assert second.cache.misses == 0
+        assert summarize(second_results) == summarize(first_results)
+        assert first_results["echo_tool_0"].passed
+
+    def test_changed_file_is_rechecked(self):
+        """Test editing a file invalidates only that file"""
+        self.validator().validate_all_tools(self.tools_dir, workers=1)
+        tool_file = self.tools_dir / "utils" / "echo_tool_1" / "echo_tool_1.py"
+        tool_file.write_text(tool_file.read_text().replace('tool_category: str = "utils"\n', ""))
+
+        validator = self.validator()
+        results = validator.validate_all_tools(self.tools_dir, workers=1)
+
+        assert (validator.cache.hits, validator.cache.misses) == (2, 1)
+        assert not results["echo_tool_1"].passed
+        assert "Missing tool_category attribute" in [
+            i.message for i in results["echo_tool_1"].errors
+        ]
+
+    def test_version_bump_invalidates(self, monkeypatch):
+        """Test a new validator version discards cached results"""
+        self.validator().validate_all_tools(self.tools_dir, workers=1)
+        monkeypatch.setattr(validator_module, "VALIDATOR_VERSION", "test-bump")
+
+        validator = self.validator()
+        validator.validate_all_tools(self.tools_dir, workers=1)
+
+        assert validator.cache.misses == 3
+
+    def test_supporting_files_are_not_cached(self):
+        """Test directory checks run even when the file is cached"""
+        self.validator().validate_all_tools(self.tools_dir, workers=1)
+        (self.tools_dir / "utils" / "echo_tool_0" / "README.md").unlink()
+
+        result = self.validator().validate_tool(self.tools_dir / "utils" / "echo_tool_0")
+
+        assert "Missing README.md" in [i.message for i in result.warnings]
+
+    def test_syntax_error(self):
+        """Test a syntax error fails the tool with score 0"""
+        tool_file = self.tools_dir / "utils" / "echo_tool_2" / "echo_tool_2.py"
+        tool_file.write_text("class Broken(:\n")
+
+        result = self.validator().validate_tool(tool_file.parent)
+
+        assert not result.passed
+        assert result.score == 0
+        assert result.issues[0].category == "syntax"
+
+    def test_syntax_error_in_full_sweep(self):
+        """Test a tool whose file does not parse is reported, not skipped"""
+        tool_file = self.tools_dir / "utils" / "echo_tool_2" / "echo_tool_2.py"
+        tool_file.write_text("class Broken(:\n")
+
+        results = self.validator().validate_all_tools(self.tools_dir, workers=1)
+
+        assert set(results) == {"echo_tool_0", "echo_tool_1", "echo_tool_2"}
+        assert not results["echo_tool_2"].passed
+        assert results["echo_tool_2"].score == 0
+        assert results["echo_tool_2"].issues[0].category == "syntax"
+
+    def test_process_pool_matches_serial(self, monkeypatch):
+        """Test pooled results equal serial results"""
+        monkeypatch.setattr(validator_module, "MIN_PARALLEL_FILES", 1)
+
+        serial = ToolValidator(use_cache=False).validate_all_tools(self.tools_dir, workers=1)
+        pooled = ToolValidator(use_cache=False).validate_all_tools(self.tools_dir, workers=2)
+
+        assert summarize(pooled) == summarize(serial)
+
+
+def test_cache_keeps_only_used_entries(tmp_path):
+    """Test saved cache drops entries for content no longer in the tree"""
+    old, new = ValidationCache.key("old source"), ValidationCache.key("new source")
+    cache = ValidationCache(tmp_path / "cache.json")
+    cache.put(old, [])
+    cache.save()
+
+    cache = ValidationCache(tmp_path / "cache.json")
+    cache.put(new, [])
+    cache.save()
+
+    cache = ValidationCache(tmp_path / "cache.json")
+    assert cache.get(old) is None
+    assert cache.get(new) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,196 @@
+"""
+Tests for the single-pass edit engine
+"""
+
+import os
+import stat
+
+import pytest
+
+import shared.line_index as line_index
+from shared.edit_engine import (
+    Edit,
+    apply_edits,
+    atomic_write,
+    changed_lines,
+    find_occurrences,
+    parse_edits,
+    splice,
+)
+from shared.errors import ValidationError
+
+
+def apply(content, *edits):
+    result = apply_edits(content.encode(), list(edits))
+    return b"".join(bytes(c) for c in result.chunks).decode()
+
+
+class TestParseEdits:
+    """Test edit validation"""
+
+    def test_valid_edits(self):
+        edits = parse_edits(
+            [
+                {"action": "replace", "search": "a", "replace": "b"},
+                {"action": "insert", "line": 0, "text": "x"},
+                {"action": "delete", "line": 3},
+            ]
+        )
+
+        assert [e.action for e in edits] == ["replace", "insert", "delete"]
+        assert edits[1].line == 0 and edits[1].text == "x"
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            {},
+            {"action": "insert", "line": -1},
+            {"action": "delete", "line": "3"},
+            {"action": "delete", "line": True},
+            {"action": "replace", "search": ""},
+            {"action": "move"},
+        ],
+    )
+    def test_invalid_edits(self, raw):
+        with pytest.raises(ValidationError):
+            parse_edits([raw], tool_name="multiedit_tool")
+
+
+class TestApplyEdits:
+    """Test sequential edit semantics"""
+
+    @pytest.fixture(autouse=True)
+    def small_blocks(self, monkeypatch):
+        monkeypatch.setattr(line_index, "BLOCK_BYTES", 16)
+
+    def test_line_numbers_follow_previous_edits(self):
+        content = "".join(f"line{i}\n" for i in range(10))
+
+        result = apply(
+            content,
+            Edit("insert", line=0, text="top"),
+            Edit("delete", line=1),
+            Edit("insert", line=5, text="a\nb"),
+            Edit("delete", line=99),
+        )
+
+        assert result.splitlines() == [
+            "top",
+            "line1",
+            "line2",
+            "line3",
+            "line4",
+            "a",
+            "b",
+            "line5",
+            "line6",
+            "line7",
+            "line8",
+            "line9",
+        ]
+
+    def test_replace_skips_text_inserted_after_it(self):
+        result = apply(
+            "foo\nbar\n",
+            Edit("insert", line=1, text="foo early"),
+            Edit("replace", search="foo", replace="baz"),
+            Edit("insert", line=0, text="foo late"),
+        )
+
+        assert result == "foo late\nbaz\nbaz early\nbar\n"
+
+    def test_replace_across_lines_renumbers(self):
+        result = apply(
+            "a\nb\nc\n",
+            Edit("replace", search="a\nb", replace="ab"),
+            Edit("delete", line=1),
+        )
+
+        assert result == "ab\n"
+
+    def test_counts_replacements(self):
+        edits = [
+            Edit("replace", search="o", replace="0"),
+            Edit("replace", search="\n", replace="|"),
+        ]
+
+        result = apply_edits(b"foo\nboo\n", edits)
+
+        assert result.replacements == 6
+
+    def test_append_terminates_last_line(self):
+        assert apply("a\nb", Edit("insert", line=5, text="c")) == "a\nb\nc\n"
+        assert apply("", Edit("insert", line=0, text="c")) == "c\n"
+
+    def test_crlf_files_keep_line_endings(self):
+        result = apply(
+            "a\r\nb\r\n",
+            Edit("insert", line=1, text="x\ny"),
+            Edit("replace", search="b\n", replace="B\n"),
+        )
+
+        assert result == "a\r\nx\r\ny\r\nB\r\n"
+
+
+class TestSplicing:
+    """Test the helpers EditTool uses"""
+
+    def test_find_occurrences_limit(self):
+        assert find_occurrences(b"aaaa", b"aa") == [0, 2]
+        assert find_occurrences(b"xaxaxa", b"a", limit=2) == [1, 3]
+
+    def test_splice(self):
+        data = b"one two one"
+        chunks = splice(data, [0, 8], 3, b"1")
+
+        assert b"".join(bytes(c) for c in chunks) == b"1 two 1"
+
+    def test_changed_lines(self):
+        data = b"a x\nb\nx x\nd\n"
+        assert changed_lines(data, find_occurrences(data, b"x"), b"x", b"y") == 2
+        data = b"a\nb\nc\n"
+        assert changed_lines(data, [0], b"a\nb", b"z") == 2
+
+
+class TestAtomicWrite:
+    """Test atomic replacement of files"""
+
+    def test_keeps_mode_and_leaves_no_temp_files(self, tmp_path):
+        path = tmp_path / "script.sh"
+        path.write_text("old")
+        os.chmod(path, 0o750)
+
+        atomic_write(str(path), [b"new ", memoryview(b"content")])
+
+        assert path.read_text() == "new content"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o750
+        assert os.listdir(tmp_path) == ["script.sh"]
+
+    def test_writes_through_symlinks(self, tmp_path):
+        target = tmp_path / "target.txt"
+        target.write_text("old")
+        link = tmp_path / "link.txt"
+        link.symlink_to(target)
+
+        atomic_write(str(link), [b"new"])
+
+        assert link.is_symlink()
+        assert target.read_text() == "new"
+
+    def test_failed_write_keeps_original(self, tmp_path):
+        path = tmp_path / "data.txt"
+        path.write_text("original")
+
+        def chunks():
+            yield b"partial"
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            atomic_write(str(path), chunks())
+
+        assert path.read_text() == "original"
+        assert os.listdir(tmp_path) == ["data.txt"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,191 @@
+"""
+Tests for the ignore-aware file walker
+"""
+
+import os
+import time
+
+import pytest
+
+import shared.file_walker as file_walker_module
+from shared.file_walker import FileListCache, FileWalker, IgnoreRules, glob_regex, split_glob
+
+
+def make_tree(root, files):
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def walk(root, **kwargs):
+    return [entry.rel_path for entry in FileWalker(root, **kwargs)]
+
+
+class TestIgnoreRules:
+    """Test .gitignore pattern semantics"""
+
+    def rules(self, *lines):
+        return IgnoreRules(list(lines))
+
+    def test_unanchored_matches_at_any_depth(self):
+        rules = self.rules("*.log")
+        assert rules.match("a.log", "a.log", False) is True
+        assert rules.match("x/y/a.log", "a.log", False) is True
+        assert rules.match("a.txt", "a.txt", False) is None
+
+    def test_anchored_and_directory_only(self):
+        rules = self.rules("/top.txt", "build/")
+        assert rules.match("top.txt", "top.txt", False) is True
+        assert rules.match("sub/top.txt", "top.txt", False) is None
+        assert rules.match("sub/build", "build", True) is True
+        assert rules.match("build", "build", False) is None
+
+    def test_double_star_and_negation(self):
+        rules = self.rules("docs/**/*.tmp", "*.log", "!keep.log", "# comment", "")
+        assert rules.match("docs/a/b/c.tmp", "c.tmp", False) is True
+        assert rules.match("docs/c.tmp", "c.tmp", False) is True
+        assert rules.match("keep.log", "keep.log", False) is False
+        assert len(rules.rules) == 3
+
+    def test_base_directory(self):
+        rules = IgnoreRules(["/secret.txt"], base="sub/")
+        assert rules.match("sub/secret.txt", "secret.txt", False) is True
+        assert rules.match("secret.txt", "secret.txt", False) is None
+
+
+class TestFileWalker:
+    """Test walking, pruning and ordering"""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        make_tree(
+            tmp_path,
+            {
+                ".gitignore": "*.log\nbuild/\n!keep.log\n",
+                "a.py": "",
+                "x.log": "",
+                "keep.log": "",
+                "build/out.py": "",
+                "node_modules/m.js": "",
+                "env/pyvenv.cfg": "",
+                "env/lib.py": "",
+                ".hidden/h.py": "",
+                "sub/.ignore": "secret.txt\n",
+                "sub/secret.txt": "",
+                "sub/b.py": "",
+                "sub/deeper/c.py": "",
+            },
+        )
+        return tmp_path
+
+    def test_respects_ignore_files(self, tree):
+        """Test ignore files, skipped directories, virtualenvs and hidden paths"""
+        assert walk(tree) == ["a.py", "keep.log", "sub/b.py", "sub/deeper/c.py"]
+
+    def test_without_ignore_rules(self, tree):
+        """Test respect_ignore=False still skips hidden and VCS paths"""
+        (tree / ".git").mkdir()
+        (tree / ".git" / "HEAD").write_text("")
+
+        files = walk(tree, respect_ignore=False, include_hidden=True)
+
+        assert "build/out.py" in files
+        assert "node_modules/m.js" in files
+        assert ".hidden/h.py" in files
+        assert not any(f.startswith(".git/") for f in files)
+
+    def test_parent_ignore_rules_apply_inside_repository(self, tree):
+        """Test walking a subdirectory honors .gitignore files above it"""
+        (tree / ".git").mkdir()
+        (tree / ".gitignore").write_text("*.log\nsub/deeper/\n")
+        (tree / "sub" / "note.log").write_text("")
+
+        assert walk(tree / "sub") == ["b.py"]
+
+    def test_max_depth_and_dirs(self, tree):
+        """Test include_dirs yields directories and max_depth stops descent"""
+        # Directories at max_depth are not listed, so "env" is not known to be a virtualenv
+        assert walk(tree, include_dirs=True, max_depth=1) == ["env", "sub", "a.py", "keep.log"]
+        assert walk(tree, include_dirs=True) == [
+            "a.py",
+            "keep.log",
+            "sub",
+            "sub/b.py",
+            "sub/deeper",
+            "sub/deeper/c.py",
+        ]
+
+    def test_stat_uses_scandir_entry(self, tree):
+        """Test entries carry a working stat()"""
+        entry = next(iter(FileWalker(tree)))
+
+        assert entry.stat().st_size == 0
+        assert entry.path == os.path.join(str(tree), "a.py")
+
+
+class TestFileListCache:
+    """Test persisted directory listings"""
+
+    @pytest.fixture(autouse=True)
+    def no_racy_window(self, monkeypatch):
+        monkeypatch.setattr(file_walker_module, "RACY_WINDOW_NS", 0)
+
+    def test_unchanged_directories_are_not_listed(self, tmp_path):
+        root = tmp_path / "root"
+        make_tree(root, {"a.py": "", "sub/b.py": ""})
+        cache_path = tmp_path / "lists.json"
+
+        first = FileListCache(root, cache_path)
+        assert walk(root, cache=first) == ["a.py", "sub/b.py"]
+        assert (first.hits, first.misses) == (0, 2)
+
+        second = FileListCache(root, cache_path)
+        assert walk(root, cache=second) == ["a.py", "sub/b.py"]
+        assert (second.hits, second.misses) == (2, 0)
+
+    def test_changed_directory_is_relisted(self, tmp_path):
+        root = tmp_path / "root"
+        make_tree(root, {"a.py": "", "sub/b.py": ""})
+        cache_path = tmp_path / "lists.json"
+        walk(root, cache=FileListCache(root, cache_path))
+
+        new_file = root / "sub" / "c.py"
+        new_file.write_text("")
+        stamp = time.time_ns() + 5_000_000_000
+        os.utime(root / "sub", ns=(stamp, stamp))
+
+        cache = FileListCache(root, cache_path)
+        assert walk(root, cache=cache) == ["a.py", "sub/b.py", "sub/c.py"]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_recent_directories_are_not_cached(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(file_walker_module, "RACY_WINDOW_NS", 60_000_000_000)
+        make_tree(tmp_path / "root", {"a.py": ""})
+        cache_path = tmp_path / "lists.json"
+        walk(tmp_path / "root", cache=FileListCache(tmp_path / "root", cache_path))
+
+        assert not cache_path.exists()
+
+
+class TestGlobHelpers:
+    """Test glob translation for GlobTool"""
+
+    def test_glob_regex(self):
+        assert glob_regex("**/*.py").match("a/b/c.py")
+        assert glob_regex("**/*.py").match("c.py")
+        assert not glob_regex("*.py").match("a/c.py")
+        # Wildcards skip hidden names unless the pattern starts with '.'
+        assert not glob_regex("**/*.py").match(".venv/c.py")
+        assert not glob_regex("*").match(".hidden")
+        assert glob_regex(".*").match(".hidden")
+        assert glob_regex("[!a]?.t[x]t").match("bc.txt")
+
+    def test_split_glob(self):
+        assert split_glob("src/**/*.ts") == ("src", "**/*.ts", None)
+        assert split_glob("*.py") == ("", "*.py", 1)
+        assert split_glob("./a/b/*/c.py") == ("a/b", "*/c.py", 2)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
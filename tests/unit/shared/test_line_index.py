@@ -0,0 +1,113 @@
+"""
+Tests for the sparse line-offset index
+"""
+
+import mmap
+import os
+
+import pytest
+
+import shared.line_index as line_index
+from shared.line_index import LineIndex, get_line_index, read_lines
+
+
+class TestLineIndex:
+    """Test building, lookups and caching"""
+
+    @pytest.fixture(autouse=True)
+    def small_blocks(self, monkeypatch):
+        monkeypatch.setattr(line_index, "BLOCK_BYTES", 64)
+        monkeypatch.setattr(line_index, "_indexes", line_index.OrderedDict())
+
+    def mapped(self, path):
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            return mmap.mmap(f.fileno(), st.st_size, access=mmap.ACCESS_READ), st
+
+    def test_every_line_is_located(self, tmp_path):
+        p = tmp_path / "mixed.txt"
+        lines = [("x" * (i % 37)) for i in range(300)]
+        p.write_text("\n".join(lines), encoding="utf-8")
+        data = p.read_bytes()
+        mm, st = self.mapped(p)
+
+        index = LineIndex.build(mm, st.st_mtime_ns)
+
+        assert index.total_lines == 300
+        assert len(index.block_offsets) > 1
+        expected = 0
+        for number, line in enumerate(lines, start=1):
+            assert index.line_start(mm, number) == expected
+            assert index.line_at(mm, expected + len(line) // 2) == (number, expected)
+            expected += len(line) + 1
+        assert index.line_start(mm, 301) == len(data)
+        mm.close()
+
+    def test_cached_index_extended_after_append(self, tmp_path):
+        p = tmp_path / "app.log"
+        p.write_text("".join(f"entry {i}\n" for i in range(100)), encoding="utf-8")
+        mm, st = self.mapped(p)
+        first = get_line_index(str(p), mm, st)
+        assert get_line_index(str(p), mm, st) is first
+        mm.close()
+
+        with open(p, "a", encoding="utf-8") as f:
+            f.write("".join(f"entry {i}\n" for i in range(100, 150)))
+        stamp = st.st_mtime_ns + 1_000_000_000
+        os.utime(p, ns=(stamp, stamp))
+        mm, st = self.mapped(p)
+
+        extended = get_line_index(str(p), mm, st)
+
+        assert extended is not first
+        assert extended.total_lines == 150
+        assert list(extended.block_offsets) == list(
+            LineIndex.build(mm, st.st_mtime_ns).block_offsets
+        )
+        assert mm[extended.line_start(mm, 120) :].startswith(b"entry 119\n")
+        mm.close()
+
+    def test_rewritten_file_is_reindexed(self, tmp_path):
+        p = tmp_path / "data.txt"
+        p.write_text("a\n" * 100, encoding="utf-8")
+        mm, st = self.mapped(p)
+        get_line_index(str(p), mm, st)
+        mm.close()
+
+        p.write_text("bb\n" * 100 + "tail", encoding="utf-8")
+        mm, st = self.mapped(p)
+
+        index = get_line_index(str(p), mm, st)
+
+        assert index.total_lines == 101
+        assert index.line_start(mm, 101) == 300
+        mm.close()
+
+    def test_lookups_work_on_bytes(self):
+        data = b"".join(b"row %d\n" % i for i in range(1, 101))
+
+        index = LineIndex.build(data)
+
+        assert index.total_lines == 100
+        assert data[index.line_start(data, 42) :].startswith(b"row 42\n")
+        assert index.line_at(data, index.line_start(data, 77) + 3)[0] == 77
+
+
+class TestReadLines:
+    """Test decoding line ranges"""
+
+    def test_stops_at_end_offset_after_finishing_line(self):
+        lines, end, truncated = read_lines(b"a\nbb\nccc\n", 0, None, 100, end=3)
+
+        assert lines == ["a", "bb"]
+        assert end == 5
+        assert truncated is False
+
+    def test_undecodable_bytes_are_replaced(self):
+        lines, _, _ = read_lines(b"ok\n\xff\xfe\n", 0, None, 100)
+
+        assert lines == ["ok", "��"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
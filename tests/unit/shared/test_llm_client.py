@@ -2,7 +2,9 @@
 Unit tests for LiteLLM client integration.
 """
 
+import asyncio
 import os
+import time
 from datetime import datetime
 from unittest.mock import MagicMock, Mock, patch
 
@@ -13,8 +15,11 @@ from shared.llm_client import (
     CostTrackingRecord,
     LLMClient,
     LLMResponse,
+    LLMResponseCache,
     ModelConfig,
+    ProviderLimits,
     TaskType,
+    TokenBudget,
     get_llm_client,
     reset_client,
 )
@@ -349,5 +354,391 @@ class TestGlobalClient:
             assert client.enable_fallback is False
 
 
+def make_response(content, prompt_tokens=10, completion_tokens=5):
+    """Build a LiteLLM-style completion response."""
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = content
+    response.usage = Mock()
+    response.usage.__dict__ = {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+    return response
+
+
+class FakeAcompletion:
+    """Async completion stub with per-model latency and failures."""
+
+    def __init__(self, delays=None, failures=()):
+        self.delays = delays or {}
+        self.failures = set(failures)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = []
+
+    async def __call__(self, model, messages, **kwargs):
+        self.calls.append(model)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(model, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled.append(model)
+            raise
+        finally:
+            self.in_flight -= 1
+        if model in self.failures:
+            raise RuntimeError(f"{model} unavailable")
+        return make_response(f"{model}: {messages[0]['content']}")
+
+
+@pytest.fixture
+def fake_acompletion():
+    """Patch LiteLLM's async completion and exception types."""
+    fake = FakeAcompletion()
+    with (
+        patch("shared.llm_client.acompletion", fake, create=True),
+        patch(
+            "shared.llm_client.LiteLLMRateLimitError",
+            type("RateLimit", (Exception,), {}),
+            create=True,
+        ),
+        patch("shared.llm_client.LiteLLMAuthError", type("Auth", (Exception,), {}), create=True),
+        patch("shared.llm_client.LiteLLMTimeout", type("Timeout", (Exception,), {}), create=True),
+    ):
+        yield fake
+
+
+def user(content):
+    return [{"role": "user", "content": content}]
+
+
+class TestAsyncCompletion:
+    """Test async, batched and hedged completions."""
+
+    def test_achat_completion(self, llm_client, fake_acompletion):
+        """Test a single async completion tracks cost like the sync path."""
+        response = asyncio.run(llm_client.achat_completion(user("Hi"), model="gpt-3.5-turbo"))
+
+        assert response.content == "gpt-3.5-turbo: Hi"
+        assert response.provider == "openai"
+        assert response.cost > 0
+        assert response.metadata == {"attempt": 1, "fallback_used": False, "hedged": False}
+        assert len(llm_client.cost_records) == 1
+
+    def test_achat_completion_fallback(self, llm_client, fake_acompletion):
+        """Test a failed model falls back to the next one."""
+        fake_acompletion.failures = {"gpt-4"}
+
+        response = asyncio.run(
+            llm_client.achat_completion(
+                user("Hi"), model="gpt-4", fallback_models=["gpt-3.5-turbo"]
+            )
+        )
+
+        assert response.model == "gpt-3.5-turbo"
+        assert response.metadata["fallback_used"] is True
+        assert fake_acompletion.calls == ["gpt-4", "gpt-3.5-turbo"]
+
+    def test_achat_completion_all_fail(self, llm_client, fake_acompletion):
+        """Test APIError and a failure record when every model fails."""
+        fake_acompletion.failures = {"gpt-4", "gpt-3.5-turbo"}
+
+        with pytest.raises(APIError, match="All models failed"):
+            asyncio.run(
+                llm_client.achat_completion(
+                    user("Hi"), model="gpt-4", fallback_models=["gpt-3.5-turbo"]
+                )
+            )
+
+        assert llm_client.cost_records[-1].success is False
+
+    def test_hedged_request_wins_and_cancels_slow_model(self, llm_client, fake_acompletion):
+        """Test a slow primary is raced against the fallback after the threshold."""
+        fake_acompletion.delays = {"gpt-4": 5.0, "claude-3-haiku-20240307": 0.01}
+
+        start = time.monotonic()
+        response = asyncio.run(
+            llm_client.achat_completion(
+                user("Hi"),
+                model="gpt-4",
+                fallback_models=["claude-3-haiku-20240307"],
+                hedge_after=0.05,
+            )
+        )
+
+        assert time.monotonic() - start < 2
+        assert response.model == "claude-3-haiku-20240307"
+        assert response.metadata["hedged"] is True
+        assert fake_acompletion.cancelled == ["gpt-4"]
+        assert [r.model for r in llm_client.cost_records] == ["claude-3-haiku-20240307"]
+
+    def test_no_hedge_when_primary_is_fast(self, llm_client, fake_acompletion):
+        """Test the fallback is not called when the primary answers in time."""
+        response = asyncio.run(
+            llm_client.achat_completion(
+                user("Hi"), model="gpt-4", fallback_models=["gpt-3.5-turbo"], hedge_after=1.0
+            )
+        )
+
+        assert response.model == "gpt-4"
+        assert fake_acompletion.calls == ["gpt-4"]
+
+    def test_batch_preserves_order_and_limits_provider(self, mock_litellm, fake_acompletion):
+        """Test batch results are ordered and provider concurrency is capped."""
+        client = LLMClient(provider_limits={"openai": ProviderLimits(max_concurrency=2)})
+
+        responses = client.batch_chat_completion(
+            [user(str(i)) for i in range(6)], concurrency=6, model="gpt-3.5-turbo"
+        )
+
+        assert [r.content for r in responses] == [f"gpt-3.5-turbo: {i}" for i in range(6)]
+        assert fake_acompletion.max_in_flight == 2
+
+    def test_batch_errors(self, llm_client, fake_acompletion):
+        """Test failed items raise, or are returned in place when requested."""
+        fake_acompletion.failures = {"gpt-4"}
+        batch = [user("a"), user("b")]
+
+        with pytest.raises(APIError):
+            llm_client.batch_chat_completion(batch, model="gpt-4")
+
+        results = llm_client.batch_chat_completion(batch, model="gpt-4", return_exceptions=True)
+        assert all(isinstance(r, APIError) for r in results)
+
+    def test_batch_from_running_loop(self, llm_client, fake_acompletion):
+        """Test the sync batch API works when called inside an event loop."""
+
+        async def caller():
+            return llm_client.batch_chat_completion([user("x")], model="gpt-3.5-turbo")
+
+        assert asyncio.run(caller())[0].content == "gpt-3.5-turbo: x"
+
+
+class TestTokenBudget:
+    """Test tokens-per-minute budgets."""
+
+    def test_acquire_waits_for_refill(self):
+        """Test a reservation beyond the remaining budget waits for refill."""
+        budget = TokenBudget(tokens_per_minute=6000)  # 100 tokens/second
+
+        async def reserve():
+            await budget.acquire(6000)
+            start = time.monotonic()
+            await budget.acquire(10)
+            return time.monotonic() - start
+
+        assert asyncio.run(reserve()) >= 0.08
+
+    def test_settle_returns_unused_tokens(self):
+        """Test settling refunds an over-estimate and charges an under-estimate."""
+        budget = TokenBudget(tokens_per_minute=1000)
+        asyncio.run(budget.acquire(500))
+
+        budget.settle(reserved=500, used=100)
+        assert budget.available == pytest.approx(900, abs=5)
+
+        budget.settle(reserved=0, used=400)
+        assert budget.available == pytest.approx(500, abs=5)
+
+    def test_client_applies_tpm_budget(self, mock_litellm, fake_acompletion):
+        """Test async calls spend the provider budget by actual usage."""
+        client = LLMClient(provider_limits={"openai": ProviderLimits(tokens_per_minute=600)})
+
+        asyncio.run(client.achat_completion(user("Hi"), model="gpt-3.5-turbo", max_tokens=500))
+
+        # Reserved ~500 tokens, settled to the 15 actually used
+        assert client._get_budget("openai").available == pytest.approx(600 - 15, abs=5)
+        assert client._get_budget("anthropic") is None
+
+
+def keyword_embedding(text):
+    """Toy embedding: counts of a few keywords."""
+    words = text.lower().replace("?", "").split()
+    return [float(words.count(w)) for w in ("summarize", "outline", "classify", "report")] + [0.1]
+
+
+class TestResponseCache:
+    """Test exact and semantic response caching."""
+
+    @pytest.fixture
+    def cached_client(self, mock_litellm):
+        """Client with an exact-match cache and a stubbed sync completion."""
+        fake = Mock(
+            return_value=make_response("Outline", prompt_tokens=1000, completion_tokens=500)
+        )
+        with patch("shared.llm_client.completion", fake, create=True):
+            client = LLMClient(response_cache=LLMResponseCache(max_entries=2, ttl=60))
+            client.fake_completion = fake
+            yield client
+
+    def test_exact_hit_records_cost_saved(self, cached_client):
+        """Test a repeated temperature-0 request is served from the cache."""
+        first = cached_client.chat_completion(user("Outline X"), temperature=0)
+        second = cached_client.chat_completion(user("Outline X"), temperature=0)
+
+        assert cached_client.fake_completion.call_count == 1
+        assert second.content == first.content
+        assert second.cost == 0.0
+        assert second.metadata == {"cached": True, "cache_tier": "exact"}
+        assert cached_client.cost_records[-1].cached is True
+        assert cached_client.get_cost_saved() == pytest.approx(first.cost)
+        assert cached_client.get_total_cost() == pytest.approx(first.cost)
+
+    def test_key_covers_model_and_params(self, cached_client):
+        """Test different models or params do not share entries."""
+        cached_client.chat_completion(user("Outline X"), temperature=0)
+        cached_client.chat_completion(user("Outline X"), temperature=0, model="gpt-4")
+        cached_client.chat_completion(user("Outline X"), temperature=0, max_tokens=50)
+
+        assert cached_client.fake_completion.call_count == 3
+
+    def test_sampled_requests_are_not_cached(self, cached_client):
+        """Test temperature above the limit bypasses the cache."""
+        cached_client.chat_completion(user("Outline X"), temperature=0.7)
+        cached_client.chat_completion(user("Outline X"), temperature=0.7)
+
+        assert cached_client.fake_completion.call_count == 2
+
+    def test_lru_and_ttl_eviction(self):
+        """Test the exact tier evicts least recently used and expired entries."""
+        cache = LLMResponseCache(max_entries=2, ttl=60)
+        payload = {"content": "x", "model": "m", "provider": "p", "usage": {}, "cost": 0.0}
+        for name in ("a", "b"):
+            cache.put("m", user(name), 0, {}, payload)
+        assert cache.get("m", user("a"), 0, {})  # a is now most recently used
+        cache.put("m", user("c"), 0, {}, payload)
+
+        assert cache.get("m", user("b"), 0, {}) is None
+        assert cache.get("m", user("a"), 0, {}) is not None
+
+        cache.ttl = 0
+        cache.put("m", user("d"), 0, {}, payload)
+        assert cache.get("m", user("d"), 0, {}) is None
+
+    def test_semantic_tier(self, tmp_path):
+        """Test similar conversations hit the on-disk index across instances."""
+        payload = {"content": "sum", "model": "m", "provider": "p", "usage": {}, "cost": 0.01}
+        writer = LLMResponseCache(
+            semantic=True, embed_fn=keyword_embedding, index_path=tmp_path / "index.db"
+        )
+        writer.put("m", user("Summarize the report"), 0, {}, payload)
+
+        reader = LLMResponseCache(
+            semantic=True, embed_fn=keyword_embedding, index_path=tmp_path / "index.db"
+        )
+        hit = reader.get("m", user("summarize report?"), 0, {})
+
+        assert hit["content"] == "sum"
+        assert hit["cache_tier"] == "semantic"
+        assert hit["similarity"] >= 0.95
+        assert reader.get("m", user("Classify the report"), 0, {}) is None
+        assert reader.get("other-model", user("Summarize the report"), 0, {}) is None
+
+    def test_semantic_miss_embeds_once(self, mock_litellm, tmp_path):
+        """Test a semantic miss reuses the lookup's embedding when storing the response."""
+        embedded = []
+
+        def embed(text):
+            embedded.append(text)
+            return keyword_embedding(text)
+
+        cache = LLMResponseCache(semantic=True, embed_fn=embed, index_path=tmp_path / "index.db")
+        fake = Mock(return_value=make_response("Sum"))
+        with patch("shared.llm_client.completion", fake, create=True):
+            client = LLMClient(response_cache=cache)
+            client.chat_completion(user("Summarize the report"), temperature=0)
+            hit = cache.get("gpt-3.5-turbo", user("summarize report?"), 0, {"max_tokens": None})
+
+        assert len(embedded) == 2  # one miss-and-store, one lookup
+        assert hit["content"] == "Sum"
+
+    def test_async_hit(self, mock_litellm, fake_acompletion):
+        """Test achat_completion uses the cache too."""
+        client = LLMClient(response_cache=LLMResponseCache())
+
+        async def twice():
+            await client.achat_completion(user("Hi"), temperature=0)
+            return await client.achat_completion(user("Hi"), temperature=0)
+
+        assert asyncio.run(twice()).metadata["cached"] is True
+        assert fake_acompletion.calls == ["gpt-3.5-turbo"]
+
+
+class TestBoundedCostTracking:
+    """Test the record ring, running totals and persistence."""
+
+    def test_ring_is_bounded_and_totals_cover_everything(self, mock_litellm):
+        """Test old records rotate out without changing the totals."""
+        client = LLMClient(max_cost_records=3)
+        for i in range(5):
+            client._record_cost(model="gpt-4", task_type=TaskType.CHAT_COMPLETION, cost=1.0)
+        client._record_cost(model="claude-3-haiku-20240307", task_type=TaskType.CHAT_COMPLETION)
+
+        assert len(client.cost_records) == 3
+        assert client.get_total_cost() == pytest.approx(5.0)
+        assert client.get_cost_by_model() == {"gpt-4": 5.0, "claude-3-haiku-20240307": 0.0}
+        assert client.get_cost_by_provider() == {"openai": 5.0, "anthropic": 0.0}
+
+    def test_records_use_slots(self):
+        """Test cost records carry no per-instance __dict__."""
+        record = CostTrackingRecord(
+            timestamp=datetime.utcnow(),
+            model="gpt-4",
+            provider="openai",
+            task_type=TaskType.CHAT_COMPLETION,
+        )
+        assert not hasattr(record, "__dict__")
+
+    def test_persisted_in_batches(self, mock_litellm, tmp_path, monkeypatch):
+        """Test records reach the metrics database in batches and on flush."""
+        from shared.monitoring import PerformanceMonitor
+
+        monitor = PerformanceMonitor(db_path=str(tmp_path / "metrics.db"))
+        monkeypatch.setattr("shared.monitoring.get_monitor", lambda: monitor)
+        monkeypatch.setattr("shared.llm_client.COST_FLUSH_BATCH", 2)
+        client = LLMClient(persist_costs=True)
+
+        for _ in range(3):
+            client._record_cost(model="gpt-4", task_type=TaskType.CHAT_COMPLETION, cost=0.1)
+        assert monitor.get_llm_costs(days=1)["gpt-4"]["requests"] == 2
+
+        client.flush_cost_records()
+        assert monitor.get_llm_costs(days=1)["gpt-4"]["requests"] == 3
+
+    def test_stream_counts_tokens_with_tokenizer(self, llm_client, mock_litellm):
+        """Test streamed completions are costed from tokenizer counts."""
+        mock_litellm.token_counter.side_effect = lambda model, text=None, messages=None: (
+            100 if messages else 40
+        )
+        chunks = []
+        for piece in ("Hello", " world"):
+            chunk = Mock()
+            chunk.choices = [Mock()]
+            chunk.choices[0].delta.content = piece
+            chunks.append(chunk)
+
+        output = "".join(
+            llm_client._stream_response(iter(chunks), "gpt-3.5-turbo", time.time(), user("Hi"))
+        )
+
+        record = llm_client.cost_records[-1]
+        assert output == "Hello world"
+        assert (record.input_tokens, record.output_tokens) == (100, 40)
+        assert record.cost == pytest.approx(
+            llm_client._calculate_cost("gpt-3.5-turbo", TaskType.CHAT_COMPLETION, 100, 40)
+        )
+
+    def test_token_count_fallback(self, llm_client, mock_litellm):
+        """Test a character estimate is used when no tokenizer is available."""
+        mock_litellm.token_counter.side_effect = RuntimeError("no tokenizer")
+
+        assert llm_client._count_tokens("gpt-4", text="x" * 41) == 11
+        assert llm_client._count_tokens("gpt-4", messages=user("y" * 8)) == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -317,6 +317,29 @@ class TestPerformanceMonitor:
         assert "agentswarm_tool_latency_ms" in prom_str
         assert 'tool="test_tool"' in prom_str
 
+    def test_prometheus_help_and_type_once_per_metric(self, monitor):
+        """Test each metric family is declared once however many tools report."""
+        for tool_name in ("tool_a", "tool_b"):
+            monitor.record_metric(
+                PerformanceMetric(
+                    tool_name=tool_name,
+                    timestamp=datetime.utcnow(),
+                    duration_ms=100.0,
+                    success=True,
+                )
+            )
+
+        lines = monitor.export_to_prometheus(days=1).splitlines()
+
+        type_lines = [line for line in lines if line.startswith("# TYPE ")]
+        assert len(type_lines) == len(set(type_lines)) == 6
+        assert lines.count("# HELP agentswarm_tool_requests_total Total requests for tool") == 1
+        samples = [line for line in lines if line.startswith("agentswarm_tool_requests_total{")]
+        assert samples == [
+            'agentswarm_tool_requests_total{tool="tool_a"} 1',
+            'agentswarm_tool_requests_total{tool="tool_b"} 1',
+        ]
+
     def test_retention_cleanup(self, monitor):
         """Test automatic cleanup of old data."""
         # Record old metric (outside retention period)
@@ -336,6 +359,37 @@ class TestPerformanceMonitor:
         metrics = monitor.get_metrics("test_tool", days=40)
         assert metrics.total_requests == 0
 
+    def test_response_size_tracking(self, monitor):
+        """Test serialized response sizes are aggregated per tool."""
+        for size in (100, 300, 800):
+            monitor.record_response_size("test_tool", size)
+        monitor.record_response_size("other_tool", 5000)
+
+        metrics = monitor.get_metrics("test_tool", days=1)
+        assert metrics.total_requests == 0
+        assert metrics.avg_response_bytes == pytest.approx(400.0)
+        assert metrics.max_response_bytes == 800
+        assert metrics.total_response_bytes == 1200
+
+    def test_llm_cost_tracking(self, monitor):
+        """Test batched LLM cost records are aggregated per model."""
+        now = datetime.utcnow()
+        monitor.record_llm_costs(
+            [
+                {"timestamp": now, "model": "gpt-4", "input_tokens": 10, "cost": 0.5},
+                {"timestamp": now, "model": "gpt-4", "success": False},
+                {"timestamp": now, "model": "gpt-4", "cached": True, "cost_saved": 0.5},
+            ]
+        )
+
+        costs = monitor.get_llm_costs(days=1)["gpt-4"]
+        assert costs["requests"] == 3
+        assert costs["failures"] == 1
+        assert costs["cache_hits"] == 1
+        assert costs["tokens"] == 10
+        assert costs["cost"] == pytest.approx(0.5)
+        assert costs["cost_saved"] == pytest.approx(0.5)
+
     def test_cache_hit_tracking(self, monitor):
         """Test cache hit rate tracking."""
         # Record metrics with cache hits
@@ -10,6 +10,8 @@ Tests:
 - Parallel pipelines
 """
 
+import time
+import tracemalloc
 from unittest.mock import Mock
 
 import pytest
@@ -418,6 +420,141 @@ class TestParallelPipeline:
         assert result["success"] == False  # Overall fails
         assert result["successful_pipelines"] == 1  # One succeeded
 
+    def test_parallel_preserves_order(self):
+        """Test results keep the order pipelines were added."""
+
+        def slow_first(data):
+            time.sleep(0.1)
+            return "first"
+
+        parallel = (
+            ParallelPipeline("ordered")
+            .add_pipeline(Pipeline("slow").add_step("s", slow_first))
+            .add_pipeline(Pipeline("fast").add_step("f", lambda data: "second"))
+        )
+
+        result = parallel.execute(initial_data="start")
+
+        assert [r["result"] for r in result["results"]] == ["first", "second"]
+
+    def test_parallel_runs_concurrently(self):
+        """Test branches run concurrently on the thread pool."""
+
+        def sleepy(data):
+            time.sleep(0.2)
+            return data
+
+        parallel = ParallelPipeline("concurrent", max_workers=4)
+        for i in range(4):
+            parallel.add_pipeline(Pipeline(f"p{i}").add_step("sleep", sleepy))
+
+        start = time.time()
+        result = parallel.execute(initial_data=1)
+        elapsed = time.time() - start
+
+        assert result["successful_pipelines"] == 4
+        assert result["executor"] == "thread"
+        assert elapsed < 0.6  # Sequential would take 0.8s
+
+    def test_parallel_process_executor(self):
+        """Test branches on a process pool."""
+        parallel = (
+            ParallelPipeline("processes", executor="process", max_workers=2)
+            .add_pipeline(Pipeline("p1").add_step("search", mock_search, query="AI", max_results=2))
+            .add_pipeline(
+                Pipeline("p2")
+                .add_step("search", mock_search, query="ML", max_results=3)
+                .add_step("urls", mock_process)
+                .map("upper", str.upper)
+            )
+        )
+
+        result = parallel.execute()
+
+        assert result["success"] == True
+        assert result["executor"] == "process"
+        assert len(result["results"][0]["result"]["results"]) == 2
+        assert result["results"][1]["result"][0] == "HTTPS://EXAMPLE.COM/0"
+
+    def test_invalid_executor(self):
+        """Test unknown executor names are rejected."""
+        with pytest.raises(ValidationError):
+            ParallelPipeline("bad", executor="gpu")
+
+
+class TestParallelMap:
+    """Test map steps fanned out over worker pools."""
+
+    def test_parallel_map_preserves_order(self):
+        """Test parallel map results keep input order."""
+
+        def jittery(x):
+            time.sleep(0.01 * (x % 3))
+            return x * 10
+
+        pipeline = (
+            Pipeline("parallel-map")
+            .add_function("load", lambda: list(range(30)))
+            .map("scale", jittery, workers=8)
+        )
+
+        result = pipeline.execute()
+
+        assert result["result"] == [x * 10 for x in range(30)]
+
+    def test_parallel_map_passes_params(self):
+        """Test extra params still reach the mapped function."""
+
+        def add(x, amount):
+            return x + amount
+
+        pipeline = (
+            Pipeline("params")
+            .add_function("load", lambda: [1, 2, 3])
+            .map("add", add, workers=2, amount=10)
+        )
+
+        assert pipeline.execute()["result"] == [11, 12, 13]
+
+    def test_parallel_map_streaming(self):
+        """Test parallel map fans out one chunk at a time in streaming mode."""
+        pipeline = (
+            Pipeline("stream-parallel")
+            .streaming_mode(chunk_size=4)
+            .add_function("load", lambda: range(10))
+            .map("square", lambda x: x * x, workers=3)
+        )
+
+        assert pipeline.execute()["result"] == [x * x for x in range(10)]
+
+    def test_parallel_map_process_executor(self):
+        """Test parallel map on a process pool."""
+        pipeline = (
+            Pipeline("process-map")
+            .add_function("load", lambda: [-1, -2, 3])
+            .map("abs", abs, workers=2, executor="process")
+        )
+
+        assert pipeline.execute()["result"] == [1, 2, 3]
+
+    def test_parallel_map_failure(self):
+        """Test a failing item fails the step."""
+        pipeline = (
+            Pipeline("fail-map")
+            .add_function("load", lambda: [1, 2, 3])
+            .map("fail", failing_function, workers=2)
+        )
+
+        result = pipeline.execute()
+
+        assert result["success"] == False
+        assert "Intentional failure" in result["error"]
+
+    def test_invalid_workers(self):
+        """Test workers must be positive."""
+        with pytest.raises(ValidationError):
+            Pipeline("bad").map("m", str, workers=0)
+
 
 class TestComplexPipelines:
     """Test complex pipeline scenarios."""
@@ -480,3 +617,134 @@ class TestComplexPipelines:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestStreamingPipeline:
+    """Test streaming (lazy) pipeline execution."""
+
+    def test_streaming_map_filter_reduce(self):
+        """Test streaming map/filter feeding a reduce."""
+        pipeline = (
+            Pipeline("streaming")
+            .streaming_mode(chunk_size=100, track_memory=True)
+            .add_function("load", lambda: range(10_000))
+            .filter("even", lambda x: x % 2 == 0)
+            .map("double", lambda x: x * 2)
+            .reduce("sum", lambda acc, x: acc + x, initial=0)
+        )
+
+        result = pipeline.execute()
+
+        assert result["success"] == True
+        assert result["result"] == sum(x * 2 for x in range(10_000) if x % 2 == 0)
+        assert result["streaming"]["chunk_size"] == 100
+        assert result["streaming"]["peak_memory_bytes"] > 0
+        assert result["streaming"]["time_to_first_result_ms"] is not None
+
+    def test_streaming_steps_are_lazy(self):
+        """Test that map consumes upstream only as items are pulled."""
+        pulled = []
+
+        def source():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        pipeline = (
+            Pipeline("lazy")
+            .streaming_mode(chunk_size=10)
+            .add_function("load", source)
+            .map("inc", lambda x: x + 1)
+        )
+
+        stream = pipeline.stream()
+        assert next(stream) == 1
+        assert len(pulled) == 10  # Only the first chunk was read
+        stream.close()
+
+    def test_streaming_collects_final_stream(self):
+        """Test execute() collects a lazy final step into a list."""
+        pipeline = (
+            Pipeline("collect")
+            .streaming_mode()
+            .add_function("load", lambda: iter([{"score": 0.9}, {"score": 0.2}]))
+            .filter("high", lambda item: item["score"] > 0.5)
+        )
+
+        result = pipeline.execute()
+
+        assert result["result"] == [{"score": 0.9}]
+        assert result["streaming"]["items_out"] == 1
+
+    def test_streaming_counts_list_result(self):
+        """Test items_out counts the items of a list returned by the last step."""
+        pipeline = (
+            Pipeline("list result")
+            .streaming_mode()
+            .add_function("load", lambda: iter(range(5)))
+            .add_function("collect", lambda data: list(data))
+        )
+
+        result = pipeline.execute()
+
+        assert result["result"] == [0, 1, 2, 3, 4]
+        assert result["streaming"]["items_out"] == 5
+
+    def test_streaming_memory_tracking_is_opt_in(self):
+        """Test tracemalloc only runs when track_memory is set."""
+        seen = []
+        pipeline = (
+            Pipeline("untracked")
+            .streaming_mode()
+            .add_function("load", lambda: iter(range(10)))
+            .map("check", lambda x: seen.append(tracemalloc.is_tracing()) or x)
+        )
+
+        result = pipeline.execute()
+
+        assert result["success"] == True
+        assert "peak_memory_bytes" not in result["streaming"]
+        assert not any(seen)
+
+    def test_streaming_with_prefetch(self):
+        """Test bounded prefetch preserves order."""
+        pipeline = (
+            Pipeline("prefetch")
+            .streaming_mode(chunk_size=7, max_buffered_chunks=2)
+            .add_function("load", lambda: range(1000))
+            .map("square", lambda x: x * x)
+        )
+
+        result = pipeline.execute()
+
+        assert result["result"] == [x * x for x in range(1000)]
+
+    def test_streaming_error_in_lazy_step(self):
+        """Test errors raised inside lazy steps fail the pipeline."""
+        errors = []
+
+        pipeline = (
+            Pipeline("lazy-error")
+            .streaming_mode(chunk_size=2, max_buffered_chunks=1)
+            .on_error(lambda e: errors.append(str(e)))
+            .add_function("load", lambda: range(10))
+            .map("fail", failing_function)
+        )
+
+        result = pipeline.execute()
+
+        assert result["success"] == False
+        assert "Intentional failure" in result["error"]
+        assert len(errors) == 1
+
+    def test_streaming_mode_validation(self):
+        """Test invalid streaming settings are rejected."""
+        with pytest.raises(ValidationError):
+            Pipeline("bad").streaming_mode(chunk_size=0)
+
+    def test_non_streaming_result_unchanged(self):
+        """Test eager mode still returns lists and no streaming stats."""
+        result = Pipeline("eager").add_function("load", lambda: [1, 2]).map("m", str).execute()
+
+        assert result["result"] == ["1", "2"]
+        assert "streaming" not in result
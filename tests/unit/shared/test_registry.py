@@ -0,0 +1,299 @@
+"""
+Unit tests for the lazy tool registry and static tool index
+"""
+
+import os
+import sys
+import textwrap
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from shared.registry import ToolRegistry
+from shared.tool_index import (
+    ToolIndex,
+    get_index_errors,
+    get_tool_index,
+    load_tool_class,
+    scan_source,
+)
+
+TOOL_TEMPLATE = '''
+from shared.base import BaseTool
+
+
+class {class_name}(BaseTool):
+    """{doc}
+
+    Longer description.
+    """
+
+    tool_name: str = "{name}"
+    tool_category: str = "{category}"
+
+    def _execute(self):
+        return {{"success": True}}
+'''
+
+
+def write_tool(root, rel_dir, name, class_name, category="utils", doc="Does things"):
+    """Write a tool package under root/rel_dir/name."""
+    tool_dir = root / rel_dir / name
+    tool_dir.mkdir(parents=True, exist_ok=True)
+    (tool_dir / "__init__.py").write_text("")
+    path = tool_dir / f"{name}.py"
+    path.write_text(
+        TOOL_TEMPLATE.format(class_name=class_name, name=name, category=category, doc=doc)
+    )
+    return path
+
+
+@pytest.fixture
+def tools_tree(tmp_path):
+    """Tools tree with flat, nested, private and test files."""
+    root = tmp_path / "fake_tools"
+    write_tool(root, "utils", "echo_tool", "EchoTool", doc="Echo input back")
+    write_tool(root, "data/search", "deep_search", "DeepSearch", category="data")
+    write_tool(root, "_examples", "example_tool", "ExampleTool")
+    (root / "utils" / "echo_tool" / "test_echo_tool.py").write_text(
+        "from shared.base import BaseTool\n\nclass TestOnly(BaseTool):\n    pass\n"
+    )
+    yield root
+    # Loading imports the fake packages and puts tmp_path on sys.path
+    for name in [m for m in sys.modules if m == "fake_tools" or m.startswith("fake_tools.")]:
+        del sys.modules[name]
+    if str(tmp_path) in sys.path:
+        sys.path.remove(str(tmp_path))
+
+
+@pytest.fixture
+def registry():
+    """The singleton registry with its state saved and restored around the test."""
+    registry = ToolRegistry()
+    saved = (dict(registry._tools), dict(registry._index), registry._discovered)
+    registry._tools.clear()
+    registry._index.clear()
+    yield registry
+    registry._tools.clear()
+    registry._index.clear()
+    registry._tools.update(saved[0])
+    registry._index.update(saved[1])
+    registry._discovered = saved[2]
+
+
+class TestScanSource:
+    """Test AST tool extraction."""
+
+    def test_finds_tool_classes(self):
+        source = TOOL_TEMPLATE.format(
+            class_name="EchoTool", name="echo_tool", category="utils", doc="Echo"
+        )
+
+        tools = scan_source(source)
+
+        assert len(tools) == 1
+        assert tools[0]["name"] == "echo_tool"
+        assert tools[0]["class_name"] == "EchoTool"
+        assert tools[0]["category"] == "utils"
+        assert tools[0]["description"] == "Echo"
+
+    def test_schema_hash_ignores_methods(self):
+        source = TOOL_TEMPLATE.format(
+            class_name="EchoTool", name="echo_tool", category="utils", doc="Echo"
+        )
+        method_change = source.replace('{"success": True}', '{"success": False}')
+        field_change = source.replace(
+            "    def _execute", '    text: str = Field(..., description="Text")\n\n    def _execute'
+        )
+
+        original = scan_source(source)[0]["schema_hash"]
+
+        assert scan_source(method_change)[0]["schema_hash"] == original
+        assert scan_source(field_change)[0]["schema_hash"] != original
+
+    def test_dependencies(self):
+        source = textwrap.dedent(
+            """
+            import os
+            import requests
+            from shared.base import BaseTool
+            from pydantic import Field
+
+            class FetchTool(BaseTool):
+                def _execute(self):
+                    from bs4 import BeautifulSoup
+            """
+        )
+
+        assert scan_source(source)[0]["dependencies"] == ["bs4", "pydantic", "requests"]
+
+    def test_subclass_of_local_tool_and_defaults(self):
+        source = textwrap.dedent(
+            """
+            from shared import base
+
+            class Helper:
+                pass
+
+            class ParentTool(base.BaseTool):
+                pass
+
+            class ChildTool(ParentTool):
+                tool_name = "child"
+            """
+        )
+
+        tools = scan_source(source)
+
+        assert [t["name"] for t in tools] == ["parent_tool", "child"]
+        assert tools[0]["category"] == ""
+
+
+class TestToolIndex:
+    """Test the persisted index."""
+
+    def test_indexes_nested_tree(self, tools_tree, tmp_path):
+        entries = ToolIndex(tools_tree, tmp_path / "index.json").load_or_build()
+
+        assert set(entries) == {"echo_tool", "deep_search"}
+        assert entries["deep_search"].module == "fake_tools.data.search.deep_search.deep_search"
+        assert entries["deep_search"].category == "data"
+        assert entries["echo_tool"].description == "Echo input back"
+
+    def test_reparses_only_changed_files(self, tools_tree, tmp_path, monkeypatch):
+        index_path = tmp_path / "index.json"
+        ToolIndex(tools_tree, index_path).load_or_build()
+
+        parsed = []
+        original = ToolIndex._scan_file
+
+        def spy(self, rel_path):
+            parsed.append(rel_path)
+            return original(self, rel_path)
+
+        monkeypatch.setattr(ToolIndex, "_scan_file", spy)
+
+        ToolIndex(tools_tree, index_path).load_or_build()
+        assert parsed == []
+
+        write_tool(tools_tree, "utils", "echo_tool", "EchoTool", doc="Echo changed input back")
+        entries = ToolIndex(tools_tree, index_path).load_or_build()
+
+        assert parsed == ["utils/echo_tool/echo_tool.py"]
+        assert entries["echo_tool"].description == "Echo changed input back"
+
+    def test_detects_new_and_removed_files(self, tools_tree, tmp_path):
+        index_path = tmp_path / "index.json"
+        ToolIndex(tools_tree, index_path).load_or_build()
+
+        write_tool(tools_tree, "media", "new_tool", "NewTool", category="media")
+        os.remove(tools_tree / "utils" / "echo_tool" / "echo_tool.py")
+        entries = ToolIndex(tools_tree, index_path).load_or_build()
+
+        assert set(entries) == {"deep_search", "new_tool"}
+
+    def test_records_parse_errors(self, tools_tree, tmp_path):
+        index_path = tmp_path / "index.json"
+        broken = write_tool(tools_tree, "utils", "broken_tool", "BrokenTool")
+        broken.write_text("class BrokenTool(BaseTool:\n")
+
+        index = ToolIndex(tools_tree, index_path)
+        assert "broken_tool" not in index.load_or_build()
+        assert list(index.errors) == ["utils/broken_tool/broken_tool.py"]
+        assert index.errors["utils/broken_tool/broken_tool.py"].startswith("SyntaxError")
+
+        # Served from the persisted index, the failure is still reported
+        cached = ToolIndex(tools_tree, index_path)
+        cached.load_or_build()
+        assert cached.errors == index.errors
+        assert get_index_errors(tools_tree, index_path) == index.errors
+
+        write_tool(tools_tree, "utils", "broken_tool", "BrokenTool")
+        fixed = ToolIndex(tools_tree, index_path)
+        assert "broken_tool" in fixed.load_or_build()
+        assert fixed.errors == {}
+
+    def test_other_trees_get_their_own_index_file(self, tools_tree):
+        from shared.tool_index import default_index_path, default_tools_path
+
+        assert ToolIndex(default_tools_path()).index_path == default_index_path()
+        assert ToolIndex(tools_tree).index_path != default_index_path()
+        assert ToolIndex(tools_tree).index_path.parent == default_index_path().parent
+
+
+class TestLazyRegistry:
+    """Test discovery without imports and import-on-first-use."""
+
+    def test_discover_does_not_import(self, registry, tools_tree, tmp_path):
+        count = registry.discover_tools(str(tools_tree), index_path=str(tmp_path / "i.json"))
+
+        assert count == 2
+        assert registry.has_tool("deep_search")
+        assert "fake_tools.data.search.deep_search.deep_search" not in sys.modules
+        assert registry.list_categories() == ["data", "utils"]
+        listed = registry.list_tools(category="utils")
+        assert listed[0]["name"] == "echo_tool"
+        assert listed[0]["class"] is None
+
+    def test_get_tool_imports_only_requested_module(self, registry, tools_tree, tmp_path):
+        registry.discover_tools(str(tools_tree), index_path=str(tmp_path / "i.json"))
+
+        tool_class = registry.get_tool("echo_tool")
+
+        assert tool_class.__name__ == "EchoTool"
+        assert "fake_tools.utils.echo_tool.echo_tool" in sys.modules
+        assert "fake_tools.data.search.deep_search.deep_search" not in sys.modules
+        assert registry.get_tool("echo_tool") is tool_class
+        assert registry.list_tools(category="utils")[0]["class"] is tool_class
+        assert registry.get_tool_metadata("echo_tool")["category"] == "utils"
+
+        sys.modules.pop("fake_tools.utils.echo_tool.echo_tool", None)
+
+    def test_eager_discovery(self, registry, tools_tree, tmp_path):
+        registry.discover_tools(str(tools_tree), lazy=False, index_path=str(tmp_path / "i.json"))
+
+        assert not registry._index
+        assert set(registry) == {"echo_tool", "deep_search"}
+
+        sys.modules.pop("fake_tools.utils.echo_tool.echo_tool", None)
+        sys.modules.pop("fake_tools.data.search.deep_search.deep_search", None)
+
+    def test_unregister_indexed_tool(self, registry, tools_tree, tmp_path):
+        registry.discover_tools(str(tools_tree), index_path=str(tmp_path / "i.json"))
+
+        assert registry.unregister("deep_search")
+        assert not registry.has_tool("deep_search")
+        assert len(registry) == 1
+
+    def test_tool_with_relative_imports(self, registry, tools_tree, tmp_path):
+        path = write_tool(tools_tree, "utils", "split_tool", "SplitTool")
+        (path.parent / "helper.py").write_text("ANSWER = 42\n")
+        path.write_text(path.read_text() + "\nfrom .helper import ANSWER\n")
+        registry.discover_tools(str(tools_tree), index_path=str(tmp_path / "i.json"))
+
+        tool_class = registry.get_tool("split_tool")
+
+        assert tool_class.__name__ == "SplitTool"
+        assert sys.modules[tool_class.__module__].ANSWER == 42
+
+
+@pytest.mark.parametrize(
+    "entry", sorted(get_tool_index().values(), key=lambda e: e.name), ids=lambda e: e.name
+)
+def test_every_indexed_tool_loads(entry):
+    """Every tool in the repository index imports through the index loader."""
+    try:
+        tool_class = load_tool_class(entry)
+    except ModuleNotFoundError as e:
+        if e.name and e.name.split(".")[0] not in ("tools", "shared"):
+            pytest.skip(f"optional dependency {e.name} is not installed")
+        raise
+
+    assert tool_class.__name__ == entry.class_name
+    assert tool_class.__module__ == entry.module
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,145 @@
+"""
+Tests for persistent shell sessions
+"""
+
+import os
+
+import pytest
+
+from shared.shell_sessions import OutputBuffer, ShellManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ShellManager(max_memory_bytes=64, spill_dir=tmp_path / "spill")
+    yield manager
+    manager.shutdown()
+
+
+class TestOutputBuffer:
+    """Test bounded output buffers"""
+
+    def test_read_from_offset(self):
+        buffer = OutputBuffer()
+        buffer.write(b"hello ")
+        buffer.write(b"world\n")
+
+        assert buffer.read(0, 100) == (b"hello world\n", 0)
+        assert buffer.read(3, 5) == (b"lo wo", 3)
+        assert buffer.read(50, 10) == (b"", 12)
+        assert buffer.end == 12
+
+    def test_ring_drops_oldest_output(self):
+        buffer = OutputBuffer(max_memory_bytes=10)
+        for i in range(10):
+            buffer.write(b"%d-abcdef\n" % i)
+
+        assert buffer.truncated
+        assert buffer.start == 72
+        assert buffer.read(0, 100) == (b"8-abcdef\n9-abcdef\n", 72)
+
+    def test_spill_keeps_whole_stream(self, tmp_path):
+        buffer = OutputBuffer(max_memory_bytes=10, spill_path=tmp_path / "out.log")
+        expected = b"".join(b"%d-abcdef\n" % i for i in range(10))
+        for i in range(10):
+            buffer.write(b"%d-abcdef\n" % i)
+
+        assert buffer.start == 0
+        assert buffer.read(0, 1000) == (expected, 0)
+        assert buffer.read(85, 10) == (expected[85:95], 85)
+        buffer.close(delete=True)
+        assert not (tmp_path / "out.log").exists()
+
+    def test_read_lines_holds_back_partial_line(self):
+        buffer = OutputBuffer()
+        buffer.write(b"one\ntwo\nthr")
+
+        assert buffer.read_lines(0, 100, final=False) == (["one", "two"], 8, 0)
+        assert buffer.read_lines(8, 100, final=True) == (["thr"], 11, 0)
+
+    def test_read_lines_reports_dropped_bytes(self):
+        buffer = OutputBuffer(max_memory_bytes=4)
+        buffer.write(b"old\n")
+        buffer.write(b"new\n")
+
+        assert buffer.read_lines(0, 100, final=True) == (["new"], 8, 4)
+
+
+class TestShellManager:
+    """Test sessions and jobs"""
+
+    def test_state_persists_between_commands(self, manager, tmp_path):
+        manager.run(f"cd {tmp_path} && export VALUE=42 && f() {{ echo fn; }}")
+        job = manager.run('pwd; echo "$VALUE"; f')
+
+        assert job.stdout.getvalue() == f"{tmp_path}\n42\nfn\n".encode()
+        assert manager.session().cwd == str(tmp_path)
+
+    def test_exit_code_and_stderr(self, manager):
+        job = manager.run("echo out; echo err >&2; false")
+
+        assert job.exit_code == 1
+        assert job.status == "failed"
+        assert job.stdout.getvalue() == b"out\n"
+        assert job.stderr.getvalue() == b"err\n"
+
+    def test_syntax_error_keeps_session(self, manager):
+        manager.run("export KEEP=1")
+        job = manager.run("if then")
+
+        assert job.exit_code == 2
+        assert manager.run('echo "$KEEP"').stdout.getvalue() == b"1\n"
+
+    def test_commands_get_empty_stdin(self, manager):
+        job = manager.run("cat; echo done", timeout=5)
+
+        assert job.stdout.getvalue() == b"done\n"
+
+    def test_session_restarts_after_exit(self, manager, tmp_path):
+        manager.run(f"cd {tmp_path}")
+        job = manager.run("exit 5")
+        assert job.exit_code == 5
+
+        assert manager.run("pwd").stdout.getvalue() == f"{tmp_path}\n".encode()
+
+    def test_timeout_kills_command(self, manager):
+        with pytest.raises(TimeoutError):
+            manager.run("sleep 30", timeout=0.5)
+
+        assert manager.run("echo ok", timeout=5).stdout.getvalue() == b"ok\n"
+
+    def test_background_output_spills(self, manager):
+        job = manager.start("seq 1 500; sleep 0.1; seq 501 1000")
+        assert job.wait(10)
+
+        assert job.stdout.truncated
+        assert job.stdout.start == 0
+        lines, _, dropped = job.stdout.read_lines(0, 1 << 20, final=True)
+        assert lines == [str(i) for i in range(1, 1001)]
+        assert dropped == 0
+
+    def test_kill_terminates_process_group(self, manager):
+        job = manager.start("sleep 30 & sleep 30; wait")
+        pid = job.pid
+
+        result = manager.kill(job.id, timeout=5)
+
+        assert result["previous_status"] == "running"
+        assert result["signal_used"] == "SIGTERM"
+        assert job.status == "killed"
+        with pytest.raises(ProcessLookupError):
+            os.killpg(pid, 0)
+
+    def test_kill_escalates_to_sigkill(self, manager):
+        job = manager.start("trap '' TERM; echo ready; sleep 30")
+        while job.stdout.end == 0:
+            job.wait(0.01)
+
+        result = manager.kill(job.id, timeout=0.5)
+
+        assert result["signal_used"].startswith("SIGKILL")
+        assert job.status == "killed"
+
+    def test_kill_unknown_job(self, manager):
+        with pytest.raises(KeyError):
+            manager.kill("shell_missing")
@@ -0,0 +1,216 @@
+"""
+Tests for persistent priority task queues
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from shared.task_queue import RedisTaskQueue, SQLiteTaskQueue
+
+
+def redis_queue():
+    try:
+        queue = RedisTaskQueue.from_url(
+            os.getenv("REDIS_URL", "redis://localhost:6379/15"),
+            prefix=f"agentswarm:test:{os.getpid()}:",
+            max_attempts=2,
+        )
+    except Exception:
+        pytest.skip("Redis not available")
+    return queue
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def queue(request, tmp_path):
+    if request.param == "sqlite":
+        store = SQLiteTaskQueue(tmp_path / "queue.db", max_attempts=2)
+    else:
+        store = redis_queue()
+    yield store
+    for name in ("q", "other"):
+        store.clear(name)
+
+
+class TestOrdering:
+    """Test priority order"""
+
+    def test_priority_then_fifo(self, queue):
+        queue.enqueue("q", "low", priority=1)
+        queue.enqueue_many("q", ["a", "b"], priority=5)
+        queue.enqueue("q", "urgent", priority=10)
+
+        tasks = queue.dequeue("q", count=10)
+
+        assert [t["data"] for t in tasks] == ["urgent", "a", "b", "low"]
+
+    def test_position(self, queue):
+        first = queue.enqueue("q", 1)
+        second = queue.enqueue("q", 2)
+        urgent = queue.enqueue("q", 3, priority=9)
+
+        assert [queue.position("q", t) for t in (urgent, first, second)] == [0, 1, 2]
+        assert queue.position("q", "task_missing") is None
+
+    def test_prioritize_moves_task(self, queue):
+        first = queue.enqueue("q", 1)
+        last = queue.enqueue("q", 2)
+
+        assert queue.prioritize("q", last, 8) == 5
+        assert queue.dequeue("q")[0]["task_id"] == last
+        assert queue.get("q", first)["priority"] == 5
+        assert queue.prioritize("q", "task_missing", 8) is None
+
+    def test_invalid_priority(self, queue):
+        with pytest.raises(ValueError):
+            queue.enqueue("q", 1, priority=11)
+
+    def test_queues_are_separate(self, queue):
+        queue.enqueue("q", 1)
+
+        assert queue.dequeue("other") == []
+        assert queue.stats("other")["total_tasks"] == 0
+
+
+class TestLeases:
+    """Test leasing, completion and expiry"""
+
+    def test_dequeue_leases_task(self, queue):
+        task_id = queue.enqueue("q", {"n": 1})
+
+        (task,) = queue.dequeue("q", worker_id="w1", visibility_timeout=60)
+
+        assert task["task_id"] == task_id
+        assert task["status"] == "in_progress"
+        assert task["attempts"] == 1
+        assert task["worker_id"] == "w1"
+        assert task["lease_id"]
+        assert queue.dequeue("q") == []
+
+    def test_complete(self, queue):
+        queue.enqueue("q", 1)
+        (task,) = queue.dequeue("q")
+
+        assert not queue.complete("q", task["task_id"], "wrong-lease")
+        assert queue.complete("q", task["task_id"], task["lease_id"], {"ok": True})
+        assert not queue.complete("q", task["task_id"], task["lease_id"])
+
+        stored = queue.get("q", task["task_id"])
+        assert stored["status"] == "completed"
+        assert stored["result"] == {"ok": True}
+        assert stored["completed_at"] is not None
+
+    def test_fail_retries_until_max_attempts(self, queue):
+        queue.enqueue("q", 1)
+        (task,) = queue.dequeue("q")
+        assert queue.fail("q", task["task_id"], task["lease_id"], "first")
+        assert queue.get("q", task["task_id"])["status"] == "pending"
+
+        (task,) = queue.dequeue("q")
+        assert queue.fail("q", task["task_id"], task["lease_id"], "second")
+
+        stored = queue.get("q", task["task_id"])
+        assert (stored["status"], stored["attempts"], stored["error"]) == ("failed", 2, "second")
+
+    def test_fail_without_retry(self, queue):
+        queue.enqueue("q", 1)
+        (task,) = queue.dequeue("q")
+
+        assert queue.fail("q", task["task_id"], task["lease_id"], "fatal", retry=False)
+        assert queue.get("q", task["task_id"])["status"] == "failed"
+
+    def test_expired_lease_is_requeued(self, queue):
+        queue.enqueue("q", 1)
+        (first,) = queue.dequeue("q", visibility_timeout=0.05)
+        time.sleep(0.1)
+
+        (second,) = queue.dequeue("q", visibility_timeout=0.05)
+
+        assert second["task_id"] == first["task_id"]
+        assert second["attempts"] == 2
+        assert not queue.complete("q", first["task_id"], first["lease_id"])
+
+        time.sleep(0.1)
+        assert queue.dequeue("q") == []
+        stored = queue.get("q", first["task_id"])
+        assert (stored["status"], stored["error"]) == ("failed", "lease expired")
+
+    def test_extend_keeps_lease(self, queue):
+        queue.enqueue("q", 1)
+        (task,) = queue.dequeue("q", visibility_timeout=0.05)
+
+        assert queue.extend("q", task["task_id"], task["lease_id"], 60)
+        time.sleep(0.1)
+
+        assert queue.dequeue("q") == []
+        assert queue.complete("q", task["task_id"], task["lease_id"])
+
+    def test_concurrent_workers_never_share_tasks(self, queue):
+        task_ids = set(queue.enqueue_many("q", range(200)))
+        seen = []
+        lock = threading.Lock()
+
+        def worker():
+            while True:
+                tasks = queue.dequeue("q", count=7)
+                if not tasks:
+                    return
+                with lock:
+                    seen.extend(t["task_id"] for t in tasks)
+                for t in tasks:
+                    queue.complete("q", t["task_id"], t["lease_id"])
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(seen) == sorted(task_ids)
+        assert queue.stats("q")["completed"] == 200
+
+
+class TestManagement:
+    """Test listing, removal and stats"""
+
+    def test_list_orders_by_status(self, queue):
+        queue.enqueue_many("q", [1, 2])
+        queue.enqueue("q", 3, priority=9)
+        (leased,) = queue.dequeue("q")
+        queue.complete("q", leased["task_id"], leased["lease_id"])
+
+        tasks = queue.list("q")
+        assert [(t["status"], t["data"]) for t in tasks] == [
+            ("pending", 1),
+            ("pending", 2),
+            ("completed", 3),
+        ]
+        assert [t["data"] for t in queue.list("q", status="pending", limit=1)] == [1]
+
+    def test_remove_and_clear(self, queue):
+        first, second = queue.enqueue_many("q", [1, 2])
+        queue.dequeue("q")
+
+        assert queue.remove("q", first)
+        assert not queue.remove("q", first)
+        assert queue.get("q", first) is None
+        assert queue.clear("q") == 1
+        assert queue.stats("q")["total_tasks"] == 0
+
+    def test_stats(self, queue):
+        queue.enqueue_many("q", [1, 2, 3])
+        time.sleep(0.05)
+        (task,) = queue.dequeue("q")
+        queue.complete("q", task["task_id"], task["lease_id"])
+        queue.dequeue("q")
+
+        stats = queue.stats("q")
+
+        assert stats["total_tasks"] == 3
+        assert (stats["pending"], stats["in_progress"], stats["completed"]) == (1, 1, 1)
+        assert stats["failed"] == 0
+        assert stats["oldest_task_age_seconds"] >= 0.05
+        assert stats["average_wait_time_seconds"] >= 0.05
+        assert stats["throughput_per_minute"] == 1
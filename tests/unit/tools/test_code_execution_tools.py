@@ -68,21 +68,26 @@ class TestBashTool:
         assert result["success"] is True
         # In mock mode, subprocess is not called
 
-    @patch("tools.infrastructure.execution.bash_tool.bash_tool.subprocess.run")
-    def test_execute_live_mode_error(self, mock_run, monkeypatch):
+    @patch("tools.infrastructure.execution.bash_tool.bash_tool.get_shell_manager")
+    def test_execute_live_mode_error(self, mock_manager, monkeypatch):
         """Test execution with command error"""
-        monkeypatch.setenv("USE_MOCK_APIS", "true")
+        monkeypatch.setenv("USE_MOCK_APIS", "false")
+        monkeypatch.setenv("DISABLE_RATE_LIMITING", "true")
 
-        mock_result = MagicMock()
-        mock_result.stdout = ""
-        mock_result.stderr = "command not found"
-        mock_result.returncode = 1
-        mock_run.return_value = mock_result
+        mock_job = MagicMock()
+        mock_job.stdout.getvalue.return_value = b""
+        mock_job.stderr.getvalue.return_value = b"command not found"
+        mock_job.stdout.truncated = mock_job.stderr.truncated = False
+        mock_job.exit_code = 127
+        mock_manager.return_value.run.return_value = mock_job
 
         tool = BashTool(input="invalid_command")
         result = tool.run()
         # BashTool doesn't raise error for non-zero exit codes, it returns them
         assert result["success"] is True
+        assert result["result"]["exit_code"] == 127
+        assert result["result"]["stderr"] == "command not found"
+        mock_manager.return_value.run.assert_called_once()
 
     def test_edge_case_long_command(self, monkeypatch):
         """Test handling of very long commands"""
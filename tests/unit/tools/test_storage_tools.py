@@ -169,14 +169,15 @@ class TestFileFormatConverter:
         with pytest.raises(ValidationError):
             tool._validate_parameters()
 
-    def test_validate_parameters_unsupported_format(self):
+    def test_validate_parameters_unsupported_format(self, monkeypatch):
         """Test validation with unsupported format"""
         import base64
 
+        monkeypatch.setenv("USE_MOCK_APIS", "false")
+        monkeypatch.setenv("DISABLE_RATE_LIMITING", "true")
         tool = FileFormatConverter(input=f"xyz|abc|{base64.b64encode(b'test').decode()}")
-        # Tool doesn't validate format types, so it should succeed
-        result = tool.run()
-        assert result["success"] is True
+        with pytest.raises(ValidationError, match="Unsupported conversion"):
+            tool.run()
 
     def test_execute_live_mode_success(self, monkeypatch):
         """Test execution with mocked conversion API - using mock mode"""
@@ -323,7 +323,7 @@ class OfficeSlidesTool(BaseTool):
         else:
             raise ValidationError(f"Unsupported URL scheme: {url}", tool_name=self.tool_name)
 
-    def _save_and_return(self, prs: Presentation) -> Dict[str, Any]:
+    def _save_and_return(self, prs: "Presentation") -> Dict[str, Any]:
         """Save presentation and return result metadata."""
         # Save presentation to temporary file
         temp_file = self._save_presentation(prs)
@@ -348,7 +348,7 @@ class OfficeSlidesTool(BaseTool):
             "mode": self.mode,
         }
 
-    def _get_theme_colors(self) -> Dict[str, RGBColor]:
+    def _get_theme_colors(self) -> Dict[str, "RGBColor"]:
         """Get color scheme based on selected theme."""
         themes = {
             "modern": {
@@ -383,7 +383,7 @@ class OfficeSlidesTool(BaseTool):
 
         return themes.get(self.theme, themes["modern"])
 
-    def _add_title_slide(self, prs: Presentation, theme_colors: Dict[str, RGBColor]) -> None:
+    def _add_title_slide(self, prs: "Presentation", theme_colors: Dict[str, "RGBColor"]) -> None:
         """Add title slide to presentation."""
         # Use blank layout and add custom text boxes
         slide_layout = prs.slide_layouts[6]  # Blank layout
@@ -420,7 +420,7 @@ class OfficeSlidesTool(BaseTool):
             author_para.alignment = PP_ALIGN.CENTER
 
     def _add_content_slide(
-        self, prs: Presentation, slide_def: Dict[str, Any], theme_colors: Dict[str, RGBColor]
+        self, prs: "Presentation", slide_def: Dict[str, Any], theme_colors: Dict[str, "RGBColor"]
     ) -> None:
         """Add content slide to presentation."""
         layout_type = slide_def["layout"]
@@ -435,7 +435,7 @@ class OfficeSlidesTool(BaseTool):
             self._add_blank_slide(prs, slide_def, theme_colors)
 
     def _add_title_content_slide(
-        self, prs: Presentation, slide_def: Dict[str, Any], theme_colors: Dict[str, RGBColor]
+        self, prs: "Presentation", slide_def: Dict[str, Any], theme_colors: Dict[str, "RGBColor"]
     ) -> None:
         """Add slide with title and content."""
         slide_layout = prs.slide_layouts[6]  # Blank layout
@@ -473,7 +473,7 @@ class OfficeSlidesTool(BaseTool):
             para.font.color.rgb = theme_colors["text"]
 
     def _add_content_only_slide(
-        self, prs: Presentation, slide_def: Dict[str, Any], theme_colors: Dict[str, RGBColor]
+        self, prs: "Presentation", slide_def: Dict[str, Any], theme_colors: Dict[str, "RGBColor"]
     ) -> None:
         """Add slide with only content (no prominent title)."""
         slide_layout = prs.slide_layouts[6]
@@ -508,7 +508,7 @@ class OfficeSlidesTool(BaseTool):
             para.font.color.rgb = theme_colors["text"]
 
     def _add_two_column_slide(
-        self, prs: Presentation, slide_def: Dict[str, Any], theme_colors: Dict[str, RGBColor]
+        self, prs: "Presentation", slide_def: Dict[str, Any], theme_colors: Dict[str, "RGBColor"]
     ) -> None:
         """Add slide with two columns."""
         slide_layout = prs.slide_layouts[6]
@@ -563,7 +563,7 @@ class OfficeSlidesTool(BaseTool):
             left_frame.paragraphs[0].font.color.rgb = theme_colors["text"]
 
     def _add_blank_slide(
-        self, prs: Presentation, slide_def: Dict[str, Any], theme_colors: Dict[str, RGBColor]
+        self, prs: "Presentation", slide_def: Dict[str, Any], theme_colors: Dict[str, "RGBColor"]
     ) -> None:
         """Add blank slide with minimal content."""
         slide_layout = prs.slide_layouts[6]
@@ -578,7 +578,7 @@ class OfficeSlidesTool(BaseTool):
             title_para.font.size = Pt(24)
             title_para.font.color.rgb = theme_colors["secondary"]
 
-    def _save_presentation(self, prs: Presentation) -> str:
+    def _save_presentation(self, prs: "Presentation") -> str:
         """Save presentation to temporary file."""
         # Create temporary file
         temp_dir = tempfile.gettempdir()
@@ -4,12 +4,16 @@ Monitor output from background bash processes.
 
 import os
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import Field
 
 from shared.base import BaseTool
 from shared.errors import APIError, ValidationError
+from shared.shell_sessions import ShellJob, get_shell_manager
+
+# Default bytes read per stream per call
+DEFAULT_MAX_BYTES = 256 * 1024
 
 
 class BashOutputTool(BaseTool):
@@ -20,14 +24,24 @@ class BashOutputTool(BaseTool):
     background shell process. Supports optional regex filtering to show
     only lines matching a specific pattern.
 
+    Output is read incrementally from the job's buffers (see
+    shared/shell_sessions.py): each call continues where the previous one
+    stopped, or from an explicit byte offset. Only whole lines are returned
+    while the command is running.
+
     Args:
         shell_id: ID of the background shell to monitor (required)
         filter_pattern: Optional regex pattern to filter output lines
+        offset: stdout byte offset to read from (default: after the last read)
+        stderr_offset: stderr byte offset to read from (default: after the last read)
+        max_bytes: Most bytes read from each stream
 
     Returns:
         Dict containing:
         - success: Boolean indicating success
-        - result: Dict with output_lines, filtered_lines_count, shell_status, shell_id, has_more
+        - result: Dict with output_lines, stderr_lines, filtered_lines_count,
+          total_lines, shell_status, exit_code, shell_id, has_more, next_offset,
+          next_stderr_offset and dropped_bytes (output no longer retained)
         - metadata: Tool information and execution details
 
     Example:
@@ -48,12 +62,13 @@ class BashOutputTool(BaseTool):
     # Parameters
     shell_id: str = Field(..., description="ID of background shell to monitor", min_length=1)
     filter_pattern: Optional[str] = Field(None, description="Regex pattern to filter output lines")
-
-    # Simulated shell registry for demonstration
-    # In production, this would be a persistent data store or API
-    _shell_registry: Dict[str, Dict[str, Any]] = {}
-    _output_buffers: Dict[str, List[str]] = {}
-    _read_positions: Dict[str, int] = {}
+    offset: Optional[int] = Field(
+        None, description="stdout byte offset to read from (default: continue)", ge=0
+    )
+    stderr_offset: Optional[int] = Field(
+        None, description="stderr byte offset to read from (default: continue)", ge=0
+    )
+    max_bytes: int = Field(DEFAULT_MAX_BYTES, description="Most bytes read from each stream", ge=1)
 
     def _execute(self) -> Dict[str, Any]:
         """
@@ -174,52 +189,57 @@ class BashOutputTool(BaseTool):
         Raises:
             APIError: If shell_id not found or retrieval fails
         """
-        # Initialize shell registry if needed (for demo purposes)
-        self._init_shell_registry()
-
-        # Check if shell exists
-        if self.shell_id not in self._shell_registry:
+        job = get_shell_manager().get(self.shell_id)
+        if job is None:
             raise APIError(
                 f"Shell ID '{self.shell_id}' not found",
                 tool_name=self.tool_name,
             )
 
-        # Get shell info
-        shell_info = self._shell_registry[self.shell_id]
-
-        # Get output buffer
-        output_buffer = self._output_buffers.get(self.shell_id, [])
-
-        # Get read position (tracks what's been read before)
-        read_position = self._read_positions.get(self.shell_id, 0)
-
-        # Get new output since last read
-        new_output = output_buffer[read_position:]
-
-        # Update read position
-        self._read_positions[self.shell_id] = len(output_buffer)
+        # Checked before reading, so output that arrives meanwhile is left for the next read
+        final = not job.running
+        stdout_lines, next_offset, stdout_dropped = self._read(job, "stdout", self.offset, final)
+        stderr_lines, next_stderr_offset, stderr_dropped = self._read(
+            job, "stderr", self.stderr_offset, final
+        )
+        total_lines = len(stdout_lines) + len(stderr_lines)
 
         # Apply filter if provided
         if self.filter_pattern:
-            filtered_lines = self._apply_filter(new_output, self.filter_pattern)
-        else:
-            filtered_lines = new_output
-
-        # Get shell status
-        shell_status = shell_info.get("status", "running")
+            stdout_lines = self._apply_filter(stdout_lines, self.filter_pattern)
+            stderr_lines = self._apply_filter(stderr_lines, self.filter_pattern)
 
-        # Check if there's potentially more output
-        has_more = shell_status == "running"
+        has_more = not final or next_offset < job.stdout.end or next_stderr_offset < job.stderr.end
 
         return {
             "shell_id": self.shell_id,
-            "output_lines": filtered_lines,
-            "filtered_lines_count": len(filtered_lines),
-            "total_lines": len(new_output),
-            "shell_status": shell_status,
+            "output_lines": stdout_lines,
+            "stderr_lines": stderr_lines,
+            "filtered_lines_count": len(stdout_lines) + len(stderr_lines),
+            "total_lines": total_lines,
+            "shell_status": job.status,
+            "exit_code": job.exit_code,
             "has_more": has_more,
+            "next_offset": next_offset,
+            "next_stderr_offset": next_stderr_offset,
+            "dropped_bytes": stdout_dropped + stderr_dropped,
         }
 
+    def _read(
+        self, job: ShellJob, stream: str, offset: Optional[int], final: bool
+    ) -> Tuple[List[str], int, int]:
+        """
+        Read whole lines of one stream and advance its cursor.
+
+        Returns:
+            (lines, next offset, bytes dropped before the offset could be read)
+        """
+        if offset is None:
+            offset = job.cursors[stream]
+        lines, next_offset, dropped = getattr(job, stream).read_lines(offset, self.max_bytes, final)
+        job.cursors[stream] = next_offset
+        return lines, next_offset, dropped
+
     def _apply_filter(self, lines: List[str], pattern: str) -> List[str]:
         """
         Apply regex filter to output lines.
@@ -238,47 +258,6 @@ class BashOutputTool(BaseTool):
             # Should not happen as we validated in _validate_parameters
             return lines
 
-    def _init_shell_registry(self) -> None:
-        """
-        Initialize shell registry with demo data.
-
-        In production, this would connect to a shell management system.
-        """
-        # Only initialize if empty (for demo purposes)
-        if not self._shell_registry:
-            # Create some demo shells
-            demo_shells = {
-                "shell_001": {"status": "running", "created_at": "2025-01-01T00:00:00"},
-                "shell_002": {"status": "completed", "created_at": "2025-01-01T00:00:00"},
-                "shell_003": {"status": "failed", "created_at": "2025-01-01T00:00:00"},
-            }
-
-            demo_outputs = {
-                "shell_001": [
-                    "Starting application...",
-                    "Initializing components...",
-                    "Ready to accept requests",
-                ],
-                "shell_002": [
-                    "Build started",
-                    "Compiling sources...",
-                    "Build completed successfully",
-                ],
-                "shell_003": [
-                    "Starting deployment...",
-                    "Error: Connection refused",
-                    "Deployment failed",
-                ],
-            }
-
-            BashOutputTool._shell_registry = demo_shells
-            BashOutputTool._output_buffers = demo_outputs
-            BashOutputTool._read_positions = {
-                "shell_001": 0,
-                "shell_002": 0,
-                "shell_003": 0,
-            }
-
 
 if __name__ == "__main__":
     print("Testing BashOutputTool...")
@@ -8,6 +8,7 @@ import re
 import pytest
 
 from shared.errors import APIError, ValidationError
+from shared.shell_sessions import get_shell_manager
 from tools.infrastructure.execution.bash_output_tool.bash_output_tool import (
     BashOutputTool,
 )
@@ -25,16 +26,21 @@ def setup_mock_mode():
         os.environ.pop("USE_MOCK_APIS", None)
 
 
-@pytest.fixture(autouse=True)
-def reset_shell_registry():
-    """Reset shell registry between tests."""
-    BashOutputTool._shell_registry = {}
-    BashOutputTool._output_buffers = {}
-    BashOutputTool._read_positions = {}
+@pytest.fixture
+def production_mode():
+    """Disable mock mode and rate limiting for tests against real shells."""
+    os.environ["USE_MOCK_APIS"] = "false"
+    os.environ["DISABLE_RATE_LIMITING"] = "true"
     yield
-    BashOutputTool._shell_registry = {}
-    BashOutputTool._output_buffers = {}
-    BashOutputTool._read_positions = {}
+    os.environ["USE_MOCK_APIS"] = "true"
+    os.environ.pop("DISABLE_RATE_LIMITING", None)
+
+
+def start_job(command: str):
+    """Start a background command and wait for it to finish."""
+    job = get_shell_manager().start(command)
+    assert job.wait(10)
+    return job
 
 
 class TestBashOutputToolBasic:
@@ -236,33 +242,57 @@ class TestBashOutputToolNonExistentShell:
 class TestBashOutputToolMultipleReads:
     """Test multiple reads from same shell (output depletion)."""
 
-    def test_multiple_reads_production_mode(self):
+    def test_multiple_reads_production_mode(self, production_mode):
         """Test reading output multiple times depletes buffer."""
-        # Disable mock mode for this test
-        os.environ["USE_MOCK_APIS"] = "false"
+        job = start_job("printf 'Line 1\\nLine 2\\nLine 3\\n'")
 
-        try:
-            # Initialize registry
-            BashOutputTool._shell_registry = {"test_shell_123": {"status": "running"}}
-            BashOutputTool._output_buffers = {"test_shell_123": ["Line 1", "Line 2", "Line 3"]}
-            BashOutputTool._read_positions = {"test_shell_123": 0}
+        # First read - should get all lines
+        result1 = BashOutputTool(shell_id=job.id).run()
 
-            # First read - should get all lines
-            tool1 = BashOutputTool(shell_id="test_shell_123")
-            result1 = tool1.run()
+        assert result1["success"] is True
+        assert result1["result"]["output_lines"] == ["Line 1", "Line 2", "Line 3"]
+        assert result1["result"]["shell_status"] == "completed"
+        assert result1["result"]["exit_code"] == 0
+        assert result1["result"]["next_offset"] == 21
 
-            assert result1["success"] is True
-            assert len(result1["result"]["output_lines"]) == 3
+        # Second read - should get no new lines
+        result2 = BashOutputTool(shell_id=job.id).run()
 
-            # Second read - should get no new lines
-            tool2 = BashOutputTool(shell_id="test_shell_123")
-            result2 = tool2.run()
+        assert result2["success"] is True
+        assert len(result2["result"]["output_lines"]) == 0
 
-            assert result2["success"] is True
-            assert len(result2["result"]["output_lines"]) == 0
+    def test_read_from_offset(self, production_mode):
+        """Test that an explicit offset re-reads retained output."""
+        job = start_job("printf 'Line 1\\nLine 2\\nLine 3\\n'")
+        BashOutputTool(shell_id=job.id).run()
 
-        finally:
-            os.environ["USE_MOCK_APIS"] = "true"
+        result = BashOutputTool(shell_id=job.id, offset=7).run()
+
+        assert result["result"]["output_lines"] == ["Line 2", "Line 3"]
+
+    def test_max_bytes_returns_whole_lines(self, production_mode):
+        """Test that reads are bounded by max_bytes and continue on the next call."""
+        job = start_job("printf 'Line 1\\nLine 2\\nLine 3\\n'")
+
+        first = BashOutputTool(shell_id=job.id, max_bytes=10).run()
+        second = BashOutputTool(shell_id=job.id).run()
+
+        assert first["result"]["output_lines"] == ["Line 1"]
+        assert first["result"]["has_more"] is True
+        assert second["result"]["output_lines"] == ["Line 2", "Line 3"]
+
+    def test_filter_and_stderr_production_mode(self, production_mode):
+        """Test filtering real output and reading stderr separately."""
+        job = start_job("echo 'ok 1'; echo 'ERROR bad' ; echo 'warn' >&2; exit 4")
+
+        result = BashOutputTool(shell_id=job.id, filter_pattern="error|warn").run()
+
+        assert result["result"]["output_lines"] == ["ERROR bad"]
+        assert result["result"]["filtered_lines_count"] == 2
+        assert result["result"]["total_lines"] == 3
+        assert result["result"]["stderr_lines"] == ["warn"]
+        assert result["result"]["shell_status"] == "failed"
+        assert result["result"]["exit_code"] == 4
 
 
 class TestBashOutputToolLargeOutput:
@@ -295,24 +325,20 @@ class TestBashOutputToolUnicodeOutput:
 class TestBashOutputToolEmptyOutput:
     """Test handling of empty output."""
 
-    def test_empty_output_scenario(self):
+    def test_empty_output_scenario(self, production_mode):
         """Test shell with no output."""
-        # In production mode with empty buffer
-        os.environ["USE_MOCK_APIS"] = "false"
-
+        job = get_shell_manager().start("sleep 5")
         try:
-            BashOutputTool._shell_registry = {"empty_shell": {"status": "running"}}
-            BashOutputTool._output_buffers = {"empty_shell": []}
-            BashOutputTool._read_positions = {"empty_shell": 0}
-
-            tool = BashOutputTool(shell_id="empty_shell")
+            tool = BashOutputTool(shell_id=job.id)
             result = tool.run()
 
             assert result["success"] is True
             assert len(result["result"]["output_lines"]) == 0
             assert result["result"]["total_lines"] == 0
+            assert result["result"]["shell_status"] == "running"
+            assert result["result"]["has_more"] is True
         finally:
-            os.environ["USE_MOCK_APIS"] = "true"
+            get_shell_manager().kill(job.id, force=True)
 
 
 class TestBashOutputToolMetadata:
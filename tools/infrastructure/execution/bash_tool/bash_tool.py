@@ -3,31 +3,47 @@ Execute bash commands in sandboxed Linux environment
 """
 
 import os
-import subprocess
 from typing import Any, Dict
 
 from pydantic import Field
 
 from shared.base import BaseTool
 from shared.errors import APIError, ValidationError
+from shared.shell_sessions import DEFAULT_SESSION, get_shell_manager
+
+# Seconds a foreground command may run before it is killed
+DEFAULT_TIMEOUT_SECONDS = 20
 
 
 class BashTool(BaseTool):
     """
     Execute bash commands in sandboxed Linux environment
 
+    Commands run in a persistent bash session (see shared/shell_sessions.py),
+    so there is no per-command shell startup and the working directory and
+    exported variables carry over between calls with the same session_id.
+
     Args:
-        input: Primary input parameter
+        input: Command to run
+        timeout: Seconds a foreground command may run before it is killed
+        run_in_background: Start the command and return its shell_id at once;
+            read its output with BashOutputTool and stop it with KillShellTool
+        session_id: Persistent session foreground commands run in
 
     Returns:
         Dict containing:
         - success: Boolean indicating success
-        - result: Tool-specific results
+        - result: stdout, stderr, exit_code, shell_id, cwd and truncated (output
+          beyond 1 MB per stream is readable with BashOutputTool); for a
+          background command shell_id, status and pid
         - metadata: Additional information
 
     Example:
         >>> tool = BashTool(input="echo hello")
         >>> result = tool.run()
+
+        >>> tool = BashTool(input="make -j8", run_in_background=True)
+        >>> shell_id = tool.run()["result"]["shell_id"]
     """
 
     # Tool metadata
@@ -37,6 +53,21 @@ class BashTool(BaseTool):
 
     # Parameters
     input: str = Field(..., description="Primary input parameter", min_length=1, max_length=5000)
+    timeout: int = Field(
+        DEFAULT_TIMEOUT_SECONDS,
+        description="Seconds a foreground command may run before it is killed",
+        ge=1,
+        le=3600,
+    )
+    run_in_background: bool = Field(
+        False, description="Return a shell_id at once instead of waiting for the command"
+    )
+    session_id: str = Field(
+        DEFAULT_SESSION,
+        description="Persistent shell session for foreground commands",
+        min_length=1,
+        max_length=100,
+    )
 
     def _execute(self) -> Dict[str, Any]:
         """
@@ -106,6 +137,16 @@ class BashTool(BaseTool):
 
     def _generate_mock_results(self) -> Dict[str, Any]:
         """Generate mock results for testing."""
+        if self.run_in_background:
+            return {
+                "success": True,
+                "result": {"shell_id": "shell_mock", "status": "running", "pid": None},
+                "metadata": {
+                    "mock_mode": True,
+                    "tool_name": self.tool_name,
+                    "tool_version": "1.0.0",
+                },
+            }
         return {
             "success": True,
             "result": {
@@ -125,24 +166,29 @@ class BashTool(BaseTool):
         Execute the bash command within the sandbox.
 
         Returns:
-            Dict with stdout, stderr, exit_code
+            Dict with stdout, stderr, exit_code (or shell_id for a background command)
 
         Raises:
             APIError: If execution fails unexpectedly
         """
+        manager = get_shell_manager()
         try:
-            completed = subprocess.run(
-                self.input, shell=True, capture_output=True, text=True, timeout=20
-            )
-        except subprocess.TimeoutExpired:
-            raise APIError("Command execution timed out", tool_name=self.tool_name)
+            if self.run_in_background:
+                job = manager.start(self.input)
+                return {"shell_id": job.id, "status": job.status, "pid": job.pid}
+            job = manager.run(self.input, session=self.session_id, timeout=self.timeout)
+        except TimeoutError as exc:
+            raise APIError(f"Command execution timed out: {exc}", tool_name=self.tool_name)
         except Exception as exc:
             raise APIError(f"Execution error: {exc}", tool_name=self.tool_name)
 
         return {
-            "stdout": completed.stdout,
-            "stderr": completed.stderr,
-            "exit_code": completed.returncode,
+            "stdout": job.stdout.getvalue().decode("utf-8", errors="replace"),
+            "stderr": job.stderr.getvalue().decode("utf-8", errors="replace"),
+            "exit_code": job.exit_code,
+            "shell_id": job.id,
+            "cwd": job.session.cwd,
+            "truncated": job.stdout.truncated or job.stderr.truncated,
         }
 
 
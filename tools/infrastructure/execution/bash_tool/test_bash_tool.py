@@ -1,14 +1,16 @@
 """Tests for bash_tool tool."""
 
 import os
-import subprocess
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError as PydanticValidationError
 
 from shared.errors import APIError, ValidationError
-from tools.code_execution.bash_tool import BashTool
+from shared.shell_sessions import ShellManager, get_shell_manager
+from tools.infrastructure.execution.bash_tool import BashTool
+
+REAL_MODE = {"USE_MOCK_APIS": "false", "DISABLE_RATE_LIMITING": "true"}
 
 
 class TestBashTool:
@@ -24,50 +26,56 @@ class TestBashTool:
     def tool(self, valid_command: str) -> BashTool:
         return BashTool(input=valid_command)
 
-    @pytest.fixture
-    def mock_completed_process(self) -> subprocess.CompletedProcess:
-        cp = MagicMock()
-        cp.stdout = "hello\n"
-        cp.stderr = ""
-        cp.returncode = 0
-        return cp
-
     # ========== INITIALIZATION TESTS ==========
 
     def test_tool_initialization_success(self, valid_command: str):
         tool = BashTool(input=valid_command)
         assert tool.input == valid_command
         assert tool.tool_name == "bash_tool"
-        assert tool.tool_category == "code_execution"
+        assert tool.tool_category == "infrastructure"
 
     def test_metadata_correct(self, tool: BashTool):
         assert tool.tool_name == "bash_tool"
-        assert tool.tool_category == "code_execution"
+        assert tool.tool_category == "infrastructure"
         assert tool.tool_description == "Execute bash commands in sandboxed Linux environment"
 
     # ========== HAPPY PATH ==========
 
-    @patch.dict(os.environ, {"USE_MOCK_APIS": "false"})
-    @patch("subprocess.run")
-    def test_execute_success(self, mock_run, tool: BashTool, mock_completed_process):
-        mock_run.return_value = mock_completed_process
+    @patch.dict(os.environ, REAL_MODE)
+    def test_execute_success(self, tool: BashTool):
         result = tool.run()
 
         assert result["success"] is True
         assert "stdout" in result["result"]
         assert result["result"]["stdout"] == "hello\n"
+        assert result["result"]["exit_code"] == 0
+        assert result["result"]["shell_id"]
         assert result["metadata"]["tool_name"] == "bash_tool"
 
-    @patch.dict(os.environ, {"USE_MOCK_APIS": "false"})
-    @patch("subprocess.run")
-    def test_process_called_correctly(self, mock_run, tool: BashTool, mock_completed_process):
-        mock_run.return_value = mock_completed_process
+    @patch.dict(os.environ, REAL_MODE)
+    def test_session_state_persists(self, tmp_path):
+        session = f"test-{os.getpid()}"
+        BashTool(input=f"cd {tmp_path} && export GREETING=hi", session_id=session).run()
+        result = BashTool(input='pwd; echo "$GREETING"', session_id=session).run()
+
+        assert result["result"]["stdout"] == f"{tmp_path}\nhi\n"
+        assert result["result"]["cwd"] == str(tmp_path)
 
-        tool.run()
-        mock_run.assert_called_once()
-        args, kwargs = mock_run.call_args
-        assert kwargs["shell"] is True
-        assert kwargs["capture_output"] is True
+    @patch.dict(os.environ, REAL_MODE)
+    def test_stderr_and_exit_code(self):
+        result = BashTool(input="echo oops >&2; exit_code() { return 3; }; exit_code").run()
+
+        assert result["result"]["stderr"] == "oops\n"
+        assert result["result"]["exit_code"] == 3
+
+    @patch.dict(os.environ, REAL_MODE)
+    def test_run_in_background_returns_shell_id(self):
+        result = BashTool(input="sleep 0.2; echo done", run_in_background=True).run()
+
+        assert result["result"]["status"] == "running"
+        job = get_shell_manager().get(result["result"]["shell_id"])
+        assert job.wait(10)
+        assert job.stdout.getvalue() == b"done\n"
 
     # ========== MOCK MODE TESTS ==========
 
@@ -78,12 +86,10 @@ class TestBashTool:
         assert result["metadata"]["mock_mode"] is True
         assert "MOCK: Executed" in result["result"]["stdout"]
 
-    @patch.dict(os.environ, {"USE_MOCK_APIS": "false"})
-    @patch("subprocess.run")
-    def test_real_mode_process(self, mock_run, tool: BashTool, mock_completed_process):
-        mock_run.return_value = mock_completed_process
-        result = tool.run()
-        assert result["success"] is True
+    @patch.dict(os.environ, {"USE_MOCK_APIS": "true"})
+    def test_mock_mode_background(self):
+        result = BashTool(input="make", run_in_background=True).run()
+        assert result["result"]["status"] == "running"
 
     # ========== VALIDATION TESTS ==========
 
@@ -95,34 +101,34 @@ class TestBashTool:
     def test_whitespace_input_raises_validation_error(self):
         """Whitespace-only string passes Pydantic but fails tool validation."""
         tool = BashTool(input="   ")
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(ValidationError):
+            tool.run()
 
     @pytest.mark.parametrize("forbidden", ["rm -rf", "shutdown", "reboot", ":(){:|:&};:"])
     def test_forbidden_commands_raise_error(self, forbidden: str):
         tool = BashTool(input=f"{forbidden} /tmp/test")
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(ValidationError):
+            tool.run()
 
     # ========== API ERROR TESTING ==========
 
-    @patch.dict(os.environ, {"USE_MOCK_APIS": "false"})
-    @patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd="x", timeout=20))
+    @patch.dict(os.environ, REAL_MODE)
+    @patch.object(ShellManager, "run", side_effect=TimeoutError("Command timed out after 20s"))
     def test_timeout_raises_api_error(self, mock_run, tool: BashTool):
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(APIError):
+            tool.run()
 
-    @patch.dict(os.environ, {"USE_MOCK_APIS": "false"})
-    @patch("subprocess.run", side_effect=Exception("boom"))
+    @patch.dict(os.environ, REAL_MODE)
+    @patch.object(ShellManager, "run", side_effect=Exception("boom"))
     def test_execution_exception_raises_api_error(self, mock_run, tool: BashTool):
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(APIError):
+            tool.run()
 
     @patch.dict(os.environ, {"USE_MOCK_APIS": "false"})
     @patch.object(BashTool, "_process", side_effect=Exception("process failed"))
     def test_process_error_propagates(self, mock_proc, tool: BashTool):
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(APIError):
+            tool.run()
 
     # ========== EDGE CASES ==========
 
@@ -156,8 +162,8 @@ class TestBashTool:
             assert tool.input == input_value
         else:
             tool = BashTool(input=input_value)
-            result = tool.run()
-            assert result["success"] is False
+            with pytest.raises(ValidationError):
+                tool.run()
 
     def test_empty_string_param_raises_pydantic(self):
         """Empty string is caught by Pydantic."""
@@ -166,14 +172,13 @@ class TestBashTool:
 
     # ========== INTEGRATION TESTS ==========
 
-    @patch("subprocess.run")
-    def test_integration_full_flow(self, mock_run, mock_completed_process):
-        mock_run.return_value = mock_completed_process
+    @patch.dict(os.environ, REAL_MODE)
+    def test_integration_full_flow(self):
         tool = BashTool(input="echo integration")
         result = tool.run()
 
         assert result["success"] is True
-        assert "stdout" in result["result"]
+        assert result["result"]["stdout"] == "integration\n"
 
     @patch.object(BashTool, "_execute", side_effect=ValueError("test error"))
     def test_base_error_handling_integration(self, mock_exec, tool: BashTool):
@@ -8,6 +8,15 @@ from typing import Any, Dict
 from pydantic import Field
 
 from shared.base import BaseTool
+from shared.edit_engine import (
+    atomic_write,
+    changed_lines,
+    detect_newline,
+    encode_text,
+    find_occurrences,
+    read_file,
+    splice,
+)
 from shared.errors import APIError, ValidationError
 
 
@@ -152,6 +161,9 @@ class EditTool(BaseTool):
         """
         Main processing logic: Perform exact string replacement in file.
 
+        Works on the file's bytes without decoding or splitting it, and
+        replaces the file atomically.
+
         Returns:
             Dict with lines_changed, occurrences_replaced, file_path
 
@@ -160,12 +172,15 @@ class EditTool(BaseTool):
             APIError: If file operations fail
         """
         try:
-            # Read file contents
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                original_content = f.read()
+            # Read file contents; "\n" in the strings matches the file's line endings
+            data = read_file(self.file_path)
+            newline = detect_newline(data)
+            old = encode_text(self.old_string, newline)
+            new = encode_text(self.new_string, newline)
 
-            # Count occurrences of old_string
-            occurrences = original_content.count(self.old_string)
+            # Without replace_all, finding a second occurrence is enough to fail
+            offsets = find_occurrences(data, old, limit=None if self.replace_all else 2)
+            occurrences = len(offsets)
 
             # Validate occurrences
             if occurrences == 0:
@@ -176,35 +191,19 @@ class EditTool(BaseTool):
                 )
 
             if occurrences > 1 and not self.replace_all:
+                occurrences = data.count(old)
                 raise ValidationError(
                     f"old_string found {occurrences} times in file. Use replace_all=True to replace all occurrences, or provide a more specific old_string.",
                     tool_name=self.tool_name,
                     details={"occurrences": occurrences, "file_path": self.file_path},
                 )
 
-            # Perform replacement
-            if self.replace_all:
-                new_content = original_content.replace(self.old_string, self.new_string)
-                occurrences_replaced = occurrences
-            else:
-                # Replace only first occurrence
-                new_content = original_content.replace(self.old_string, self.new_string, 1)
-                occurrences_replaced = 1
-
-            # Count lines changed
-            original_lines = original_content.splitlines()
-            new_lines = new_content.splitlines()
-            lines_changed = sum(1 for old, new in zip(original_lines, new_lines) if old != new)
-            # Account for line count differences
-            lines_changed += abs(len(original_lines) - len(new_lines))
-
-            # Write modified content back to file
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                f.write(new_content)
+            # Write the file with each occurrence replaced, in one pass
+            atomic_write(self.file_path, splice(data, offsets, len(old), new))
 
             return {
-                "lines_changed": lines_changed,
-                "occurrences_replaced": occurrences_replaced,
+                "lines_changed": changed_lines(data, offsets, old, new),
+                "occurrences_replaced": occurrences,
                 "file_path": self.file_path,
             }
 
@@ -334,6 +334,30 @@ class TestEditTool:
 
         assert result["result"]["lines_changed"] >= 1  # At least one line changed
 
+    def test_non_unique_error_reports_total_occurrences(self):
+        """Test the error counts every occurrence, not just the first two"""
+        with open(self.test_file, "w") as f:
+            f.write("x\nx\nx\n")
+
+        tool = EditTool(file_path=self.test_file, old_string="x", new_string="y")
+
+        with pytest.raises(ValidationError) as exc_info:
+            tool.run()
+
+        assert "found 3 times" in str(exc_info.value)
+
+    def test_crlf_file_matches_and_keeps_line_endings(self):
+        """Test newlines in old_string/new_string follow the file's CRLF endings"""
+        with open(self.test_file, "wb") as f:
+            f.write(b"Line 1\r\nLine 2\r\nLine 3\r\n")
+
+        tool = EditTool(file_path=self.test_file, old_string="1\nLine 2", new_string="1\nNew 2")
+        result = tool.run()
+
+        assert result["result"]["lines_changed"] == 2
+        with open(self.test_file, "rb") as f:
+            assert f.read() == b"Line 1\r\nNew 2\r\nLine 3\r\n"
+
     def test_metadata_in_response(self):
         """Test that response includes proper metadata"""
         with open(self.test_file, "w") as f:
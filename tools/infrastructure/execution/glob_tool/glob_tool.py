@@ -4,12 +4,13 @@ Fast file pattern matching tool for finding files by name patterns
 
 import glob as glob_module
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import Field
 
 from shared.base import BaseTool
 from shared.errors import APIError, ValidationError
+from shared.file_walker import FileWalker, file_list_cache_for, glob_regex, split_glob
 
 
 class GlobTool(BaseTool):
@@ -19,6 +20,7 @@ class GlobTool(BaseTool):
     Args:
         pattern: Glob pattern like '**/*.js' or 'src/**/*.ts'
         path: Directory to search in (defaults to current working directory)
+        respect_gitignore: Skip paths matched by .gitignore/.ignore and dependency directories
 
     Returns:
         Dict containing:
@@ -43,6 +45,9 @@ class GlobTool(BaseTool):
     path: Optional[str] = Field(
         None, description="Directory to search in (defaults to current working directory)"
     )
+    respect_gitignore: bool = Field(
+        True, description="Skip paths matched by .gitignore/.ignore and dependency directories"
+    )
 
     def _execute(self) -> Dict[str, Any]:
         """
@@ -164,6 +169,12 @@ class GlobTool(BaseTool):
 
         Performs glob pattern matching and returns sorted results.
 
+        Relative patterns are matched during a single ignore-aware walk that
+        starts at the pattern's literal leading directories, stops at the
+        pattern's depth (unless it contains '**') and reuses each directory
+        entry's stat for the mtime sort. Absolute patterns and patterns with
+        '..' fall back to glob.glob.
+
         Returns:
             Dict with matches, count, pattern_used, search_path
 
@@ -174,51 +185,68 @@ class GlobTool(BaseTool):
             # Determine search directory
             search_path = self.path if self.path else os.getcwd()
 
-            # Change to search directory if needed
-            original_cwd = os.getcwd()
-            if self.path:
-                os.chdir(self.path)
+            if os.path.isabs(self.pattern) or ".." in self.pattern.split("/"):
+                matches_with_mtime = self._glob_fallback(search_path)
+            else:
+                matches_with_mtime = self._walk_matches(search_path)
 
-            try:
-                # Perform glob search
-                # Use recursive=True to enable ** pattern matching
-                matches = glob_module.glob(self.pattern, recursive=True)
-
-                # Convert to absolute paths
-                if self.path:
-                    matches = [os.path.abspath(match) for match in matches]
-                else:
-                    matches = [os.path.abspath(match) for match in matches]
-
-                # Get modification times and sort by most recent first
-                matches_with_mtime = []
-                for match in matches:
-                    try:
-                        mtime = os.path.getmtime(match)
-                        matches_with_mtime.append((match, mtime))
-                    except OSError:
-                        # If we can't get mtime, add with time 0
-                        matches_with_mtime.append((match, 0))
-
-                # Sort by modification time (most recent first)
-                matches_with_mtime.sort(key=lambda x: x[1], reverse=True)
-                sorted_matches = [match for match, _ in matches_with_mtime]
-
-                return {
-                    "matches": sorted_matches,
-                    "count": len(sorted_matches),
-                    "pattern_used": self.pattern,
-                    "search_path": search_path,
-                }
-
-            finally:
-                # Restore original directory
-                os.chdir(original_cwd)
+            # Sort by modification time (most recent first)
+            matches_with_mtime.sort(key=lambda x: x[1], reverse=True)
+            sorted_matches = [match for match, _ in matches_with_mtime]
+
+            return {
+                "matches": sorted_matches,
+                "count": len(sorted_matches),
+                "pattern_used": self.pattern,
+                "search_path": search_path,
+            }
 
         except Exception as e:
             self._logger.error(f"Error in glob operation: {str(e)}", exc_info=True)
             raise APIError(f"Glob operation failed: {e}", tool_name=self.tool_name)
 
+    def _walk_matches(self, search_path: str) -> List[Tuple[str, float]]:
+        """Walk the tree once and return (absolute path, mtime) for matching paths."""
+        literal, rest, depth = split_glob(self.pattern)
+        root = os.path.abspath(os.path.join(search_path, literal))
+        if not os.path.isdir(root):
+            return []
+
+        regex = glob_regex(rest)
+        walker = FileWalker(
+            root,
+            respect_ignore=self.respect_gitignore,
+            # Hidden names are only walked when the pattern asks for them
+            include_hidden=any(part.startswith(".") for part in rest.split("/")),
+            include_dirs=True,
+            max_depth=depth,
+            cache=file_list_cache_for(root),
+        )
+
+        matches = []
+        for entry in walker:
+            if not regex.match(entry.rel_path):
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                # If we can't get mtime, add with time 0
+                mtime = 0
+            matches.append((entry.path, mtime))
+        return matches
+
+    def _glob_fallback(self, search_path: str) -> List[Tuple[str, float]]:
+        """Match absolute or parent-relative patterns with glob.glob."""
+        matches = []
+        for match in glob_module.glob(self.pattern, root_dir=search_path, recursive=True):
+            match = os.path.abspath(os.path.join(search_path, match))
+            try:
+                mtime = os.path.getmtime(match)
+            except OSError:
+                mtime = 0
+            matches.append((match, mtime))
+        return matches
+
 
 if __name__ == "__main__":
     print("Testing GlobTool...")
@@ -299,6 +299,35 @@ class TestGlobTool:
         # file1.py, file2.py, file3.js, file4.ts, README.md, .hidden
         assert len(matches) >= 5
 
+    def test_gitignore_respected(self, test_directory):
+        """Test 21: .gitignore and dependency directories are skipped"""
+        Path(test_directory, ".gitignore").write_text("subdir2/\n")
+        Path(test_directory, "node_modules").mkdir()
+        Path(test_directory, "node_modules", "dep.py").write_text("# dependency")
+
+        tool = GlobTool(pattern="**/*.py", path=test_directory)
+        matches = tool.run()["result"]["matches"]
+
+        assert len(matches) == 4
+        assert not any("subdir2" in m or "node_modules" in m for m in matches)
+
+        tool = GlobTool(pattern="**/*.py", path=test_directory, respect_gitignore=False)
+        assert len(tool.run()["result"]["matches"]) == 6
+
+    def test_literal_directory_prefix(self, test_directory):
+        """Test 22: Patterns starting with literal directories"""
+        tool = GlobTool(pattern="deep/**/*.py", path=test_directory)
+        matches = tool.run()["result"]["matches"]
+
+        assert matches == [os.path.join(test_directory, "deep", "nested", "path", "deep_file.py")]
+
+    def test_absolute_pattern(self, test_directory):
+        """Test 23: Absolute patterns still work"""
+        tool = GlobTool(pattern=os.path.join(test_directory, "*.js"), path=test_directory)
+        matches = tool.run()["result"]["matches"]
+
+        assert matches == [os.path.join(test_directory, "file3.js")]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
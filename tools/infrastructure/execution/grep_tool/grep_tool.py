@@ -4,13 +4,21 @@ Powerful content search tool with regex support
 
 import os
 import re
+import sqlite3
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from pydantic import Field
 
 from shared.base import BaseTool
 from shared.errors import APIError, ValidationError
+from shared.file_walker import FileWalker, file_list_cache_for
+from tools.infrastructure.execution.grep_tool.search_engine import (
+    FileResult,
+    SearchEngine,
+    SearchSpec,
+)
+from tools.infrastructure.execution.grep_tool.trigram_index import get_trigram_index
 
 
 class GrepTool(BaseTool):
@@ -27,6 +35,10 @@ class GrepTool(BaseTool):
         context_after: Lines to show after match (content mode)
         glob: Glob pattern to filter files (e.g., '*.js')
         file_type: File type filter (e.g., 'py', 'js')
+        head_limit: Return at most this many results (stops the search early)
+        respect_gitignore: Skip files matched by .gitignore/.ignore and dependency directories
+        use_index: Only read files a persistent trigram index of path reports as
+            possible matches (built on first use, then updated incrementally)
 
     Returns:
         Dict containing:
@@ -58,6 +70,16 @@ class GrepTool(BaseTool):
     context_after: int = Field(0, description="Lines to show after match (content mode)", ge=0)
     glob: Optional[str] = Field(None, description="Glob pattern to filter files (e.g., '*.js')")
     file_type: Optional[str] = Field(None, description="File type filter (e.g., 'py', 'js')")
+    head_limit: Optional[int] = Field(
+        None, description="Return at most this many results (lines, files or counts)", ge=1
+    )
+    respect_gitignore: bool = Field(
+        True, description="Skip files matched by .gitignore/.ignore and dependency directories"
+    )
+    use_index: bool = Field(
+        False,
+        description="Use a persistent trigram index of path to only read files that may match",
+    )
 
     def _execute(self) -> Dict[str, Any]:
         """
@@ -190,62 +212,100 @@ class GrepTool(BaseTool):
         search_path = Path(self.path) if self.path else Path.cwd()
 
         # Collect files to search
-        files_to_search = self._collect_files(search_path)
+        files_to_search = self._collect_files(search_path, compiled_pattern)
 
         # Search each file
         results = self._search_files(files_to_search, compiled_pattern)
 
         return results
 
-    def _collect_files(self, search_path: Path) -> List[Path]:
+    def _collect_files(
+        self, search_path: Path, pattern: Optional[re.Pattern] = None
+    ) -> Iterator[Union[Path, str]]:
         """
-        Collect files to search based on path, glob, and file_type.
+        Yield files to search based on path, glob, and file_type.
+
+        Directories are walked with the shared ignore-aware walker, so hidden,
+        VCS, dependency and (with respect_gitignore) ignored paths are pruned
+        without being listed. With use_index, only files the trigram index
+        reports as possible matches for pattern are yielded. Binary content is
+        detected later by the search engine, in the same read that searches
+        the file.
 
         Args:
             search_path: Path to start searching from
+            pattern: Compiled pattern (used to query the index)
 
-        Returns:
-            List of file paths to search
+        Yields:
+            File paths to search
         """
-        files = []
-
         if search_path.is_file():
             # Single file
-            files = [search_path]
-        else:
-            # Directory - walk recursively
-            for root, _, filenames in os.walk(search_path):
-                for filename in filenames:
-                    file_path = Path(root) / filename
+            yield search_path
+            return
+
+        entries = None
+        if self.use_index and self.respect_gitignore and pattern is not None:
+            entries = self._indexed_files(search_path, pattern)
+        if entries is None:
+            walker = FileWalker(
+                search_path,
+                respect_ignore=self.respect_gitignore,
+                cache=file_list_cache_for(search_path),
+            )
+            entries = ((entry.path, entry.name) for entry in walker)
+        suffix = f".{self.file_type}" if self.file_type else None
+
+        for path, name in entries:
+            # Skip common non-text files
+            if self._should_skip_file(name):
+                continue
+
+            # Apply glob filter
+            if self.glob and not Path(path).match(self.glob):
+                continue
 
-                    # Skip binary files and common non-text files
-                    if self._should_skip_file(file_path):
-                        continue
+            # Apply file_type filter
+            if suffix and os.path.splitext(name)[1] != suffix:
+                continue
 
-                    # Apply glob filter
-                    if self.glob and not file_path.match(self.glob):
-                        continue
+            yield path
 
-                    # Apply file_type filter
-                    if self.file_type and file_path.suffix != f".{self.file_type}":
-                        continue
+    def _indexed_files(
+        self, search_path: Path, pattern: re.Pattern
+    ) -> Optional[List[Tuple[str, str]]]:
+        """
+        (path, name) of files that may match according to the trigram index.
 
-                    files.append(file_path)
+        Returns every file if the pattern cannot be indexed, or None if the
+        index is unavailable (the caller then walks the tree).
+        """
+        try:
+            paths, candidates = get_trigram_index(search_path).candidates(
+                pattern.pattern, pattern.flags
+            )
+        except (sqlite3.Error, OSError) as e:
+            self._logger.warning(f"Trigram index unavailable for {search_path}: {e}")
+            return None
 
-        return files
+        return [
+            (os.path.join(search_path, rel_path), rel_path.rpartition("/")[2])
+            for rel_path in paths
+            if candidates is None or rel_path in candidates
+        ]
 
-    def _should_skip_file(self, file_path: Path) -> bool:
+    def _should_skip_file(self, name: str) -> bool:
         """
-        Check if file should be skipped (binary, hidden, etc.).
+        Check if file should be skipped by name (hidden or binary extension).
 
         Args:
-            file_path: Path to check
+            name: File name to check
 
         Returns:
             True if file should be skipped
         """
         # Skip hidden files
-        if file_path.name.startswith("."):
+        if name.startswith("."):
             return True
 
         # Skip common binary extensions
@@ -286,155 +346,116 @@ class GrepTool(BaseTool):
             ".pptx",
         }
 
-        if file_path.suffix.lower() in binary_extensions:
-            return True
-
-        # Try to detect binary files by reading first bytes
-        try:
-            with open(file_path, "rb") as f:
-                chunk = f.read(1024)
-                # Check for null bytes (common in binary files)
-                if b"\x00" in chunk:
-                    return True
-        except (OSError, IOError):
-            # If we can't read the file, skip it
-            return True
-
-        return False
+        return os.path.splitext(name)[1].lower() in binary_extensions
 
-    def _search_files(self, files: List[Path], pattern: re.Pattern) -> Dict[str, Any]:
+    def _search_files(self, files: Iterable[Path], pattern: re.Pattern) -> Dict[str, Any]:
         """
         Search files for pattern matches.
 
         Args:
-            files: List of files to search
+            files: Files to search
             pattern: Compiled regex pattern
 
         Returns:
             Dict with search results based on output_mode
         """
-        total_matches = 0
-        files_searched = 0
-
-        if self.output_mode == "files_with_matches":
-            results = self._search_files_with_matches(files, pattern)
-            total_matches = sum(1 for _ in results)
-        elif self.output_mode == "count":
-            results = self._search_count(files, pattern)
-            total_matches = sum(results.values())
-        else:  # content
-            results = self._search_content(files, pattern)
-            total_matches = len(results)
+        engine = SearchEngine(
+            SearchSpec(
+                pattern=pattern.pattern,
+                flags=pattern.flags,
+                output_mode=self.output_mode,
+                context_before=self.context_before,
+                context_after=self.context_after,
+                # One past the limit so truncation is detectable
+                max_matches_per_file=self.head_limit + 1 if self.head_limit else None,
+            )
+        )
+        matches = engine.search(files)
 
-        files_searched = len(files)
+        try:
+            if self.output_mode == "files_with_matches":
+                results = self._collect_results(matches, self._files_with_matches_entries)
+                total_matches = len(results)
+            elif self.output_mode == "count":
+                entries = self._collect_results(matches, self._count_entries)
+                results = dict(entries)
+                total_matches = sum(results.values())
+            else:  # content
+                results = self._collect_results(matches, self._content_entries())
+                total_matches = len(results)
+        finally:
+            matches.close()
+
+        truncated = bool(self.head_limit) and len(results) > self.head_limit
+        if truncated:
+            if isinstance(results, dict):
+                results = dict(list(results.items())[: self.head_limit])
+            else:
+                results = results[: self.head_limit]
+            total_matches = sum(results.values()) if isinstance(results, dict) else len(results)
 
         return {
             "results": results,
             "total_matches": total_matches,
-            "files_searched": files_searched,
+            "files_searched": engine.files_searched,
             "pattern_used": self.pattern,
             "output_mode": self.output_mode,
+            "truncated": truncated,
         }
 
-    def _search_files_with_matches(self, files: List[Path], pattern: re.Pattern) -> List[str]:
-        """
-        Search for files containing matches.
+    def _collect_results(self, matches: Iterator[FileResult], entries_for) -> List[Any]:
+        """Gather result entries per matching file, stopping once past head_limit."""
+        results: List[Any] = []
+        for match in matches:
+            results.extend(entries_for(match))
+            if self.head_limit and len(results) > self.head_limit:
+                break
+        return results
 
-        Args:
-            files: List of files to search
-            pattern: Compiled regex pattern
+    @staticmethod
+    def _files_with_matches_entries(match: FileResult) -> List[str]:
+        return [match.path]
 
-        Returns:
-            List of file paths containing matches
-        """
-        matching_files = []
-
-        for file_path in files:
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                    if pattern.search(content):
-                        matching_files.append(str(file_path))
-            except (OSError, IOError, UnicodeDecodeError):
-                # Skip files we can't read
-                continue
+    @staticmethod
+    def _count_entries(match: FileResult) -> List[tuple]:
+        return [(match.path, match.count)]
 
-        return matching_files
+    def _content_entries(self):
+        """
+        Entry builder for content mode.
 
-    def _search_count(self, files: List[Path], pattern: re.Pattern) -> Dict[str, int]:
+        Context lines already emitted (anywhere in the output) are not
+        repeated; matching lines always are.
         """
-        Count matches in each file.
+        seen = set()
 
-        Args:
-            files: List of files to search
-            pattern: Compiled regex pattern
+        def entries(match: FileResult) -> List[str]:
+            file_path = Path(match.path)
+            output = []
 
-        Returns:
-            Dict mapping file paths to match counts
-        """
-        counts = {}
-
-        for file_path in files:
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                    matches = pattern.findall(content)
-                    if matches:
-                        counts[str(file_path)] = len(matches)
-            except (OSError, IOError, UnicodeDecodeError):
-                # Skip files we can't read
-                continue
+            def add(line_num: int, is_match: bool) -> None:
+                formatted = self._format_line(
+                    file_path, line_num, match.lines[line_num], is_match=is_match
+                )
+                if is_match or formatted not in seen:
+                    output.append(formatted)
+                    seen.add(formatted)
 
-        return counts
+            for i in match.match_lines:
+                # Add context before
+                for j in range(max(0, i - self.context_before), i):
+                    add(j, is_match=False)
 
-    def _search_content(self, files: List[Path], pattern: re.Pattern) -> List[str]:
-        """
-        Search for matching lines with optional context.
+                # Add matching line
+                add(i, is_match=True)
 
-        Args:
-            files: List of files to search
-            pattern: Compiled regex pattern
+                # Add context after
+                for j in range(i + 1, min(match.line_count, i + self.context_after + 1)):
+                    add(j, is_match=False)
 
-        Returns:
-            List of matching lines with optional context and line numbers
-        """
-        matching_lines = []
-
-        for file_path in files:
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    lines = f.readlines()
-
-                    for i, line in enumerate(lines):
-                        if pattern.search(line):
-                            # Add context before
-                            if self.context_before > 0:
-                                start = max(0, i - self.context_before)
-                                for j in range(start, i):
-                                    formatted = self._format_line(
-                                        file_path, j, lines[j], is_match=False
-                                    )
-                                    if formatted not in matching_lines:
-                                        matching_lines.append(formatted)
-
-                            # Add matching line
-                            formatted = self._format_line(file_path, i, line, is_match=True)
-                            matching_lines.append(formatted)
-
-                            # Add context after
-                            if self.context_after > 0:
-                                end = min(len(lines), i + self.context_after + 1)
-                                for j in range(i + 1, end):
-                                    formatted = self._format_line(
-                                        file_path, j, lines[j], is_match=False
-                                    )
-                                    if formatted not in matching_lines:
-                                        matching_lines.append(formatted)
-            except (OSError, IOError, UnicodeDecodeError):
-                # Skip files we can't read
-                continue
+            return output
 
-        return matching_lines
+        return entries
 
     def _format_line(self, file_path: Path, line_num: int, line: str, is_match: bool) -> str:
         """
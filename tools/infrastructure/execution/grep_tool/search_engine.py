@@ -0,0 +1,303 @@
+"""
+Parallel file search engine for GrepTool
+
+Files are partitioned into chunks and scanned by a process pool (or in-process
+for small searches). Each file is read once, through mmap above
+MMAP_THRESHOLD bytes, and that read also detects binary files. Before any
+decoding, the file is checked for the longest literal the pattern requires;
+files without it are rejected without running the regex. Results stream back
+in input order, so callers can stop early.
+
+Matching semantics follow the original GrepTool: files are decoded as UTF-8
+(undecodable bytes dropped) with universal newlines, and the compiled str
+pattern is run on the whole text (files_with_matches, count) or per line
+(content).
+"""
+
+import io
+import mmap
+import multiprocessing
+import os
+import re
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - layout of older Pythons
+    sre_parse = None
+
+# Bytes checked for NUL to classify a file as binary
+BINARY_SNIFF_BYTES = 1024
+
+# Files at least this large are mapped instead of read
+MMAP_THRESHOLD = 64 * 1024
+
+# Files per task sent to a worker process
+CHUNK_SIZE = 128
+
+# Below this many files the search runs in-process (pool startup costs more)
+MIN_PARALLEL_FILES = 512
+
+# ASCII letters that also match non-ASCII characters under re.IGNORECASE
+# (e.g. "k" matches KELVIN SIGN), so a bytes prefilter could miss them
+_UNSAFE_FOLD_CHARS = set("iIkKsS")
+
+
+@dataclass(frozen=True)
+class SearchSpec:
+    """What to search for and how much of each match to report."""
+
+    pattern: str
+    flags: int = 0
+    output_mode: str = "files_with_matches"
+    context_before: int = 0
+    context_after: int = 0
+    max_matches_per_file: Optional[int] = None
+
+
+@dataclass
+class FileResult:
+    """Matches in one file."""
+
+    path: str
+    count: int = 0
+    # content mode: 0-based matching line numbers, the text of those lines and
+    # their context lines, and the file's line count (for clipping context)
+    match_lines: List[int] = field(default_factory=list)
+    lines: Dict[int, str] = field(default_factory=dict)
+    line_count: int = 0
+
+
+def required_literal(pattern: str, flags: int = 0) -> Optional[str]:
+    """
+    Longest literal that every match of pattern must contain, if any.
+
+    Only top-level literals are considered; groups, repeats, classes and
+    alternations end a run. Under IGNORECASE only ASCII letters whose case
+    folding stays in ASCII are used, and newline characters are never used
+    (files are matched after newline translation).
+    """
+    if sre_parse is None:
+        return None
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+
+    ignore_case = bool((flags | parsed.state.flags) & re.IGNORECASE)
+    best, run = "", []
+    for op, arg in list(parsed) + [(None, None)]:
+        char = chr(arg) if op is sre_parse.LITERAL else None
+        usable = char is not None and char not in "\r\n"
+        if usable and ignore_case:
+            usable = char.isascii() and char not in _UNSAFE_FOLD_CHARS
+        if usable:
+            run.append(char)
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+
+    return best or None
+
+
+class _Matcher:
+    """Per-process compiled state for a SearchSpec."""
+
+    def __init__(self, spec: SearchSpec):
+        self.spec = spec
+        self.regex = re.compile(spec.pattern, spec.flags)
+        literal = required_literal(spec.pattern, spec.flags)
+        self.literal: Optional[bytes] = literal.encode("utf-8") if literal else None
+        self.literal_regex = None
+        if literal and self.regex.flags & re.IGNORECASE:
+            self.literal_regex = re.compile(re.escape(self.literal), re.IGNORECASE)
+
+    def might_match(self, data) -> bool:
+        """Cheap literal check on raw bytes (bytes or mmap)."""
+        if self.literal is None:
+            return True
+        if self.literal_regex is not None:
+            return self.literal_regex.search(data) is not None
+        return data.find(self.literal) != -1
+
+    def search_file(self, path: str) -> Optional[FileResult]:
+        """
+        Search one file.
+
+        Returns:
+            FileResult (count 0 when nothing matched), or None for binary and
+            unreadable files
+        """
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size >= MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        return self._search_data(path, data)
+                return self._search_data(path, f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _search_data(self, path: str, data) -> Optional[FileResult]:
+        if data.find(b"\x00", 0, BINARY_SNIFF_BYTES) != -1:
+            return None
+
+        result = FileResult(path=path)
+        if not self.might_match(data):
+            return result
+
+        text = data[:].decode("utf-8", errors="ignore")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        mode = self.spec.output_mode
+        if mode == "files_with_matches":
+            result.count = 1 if self.regex.search(text) else 0
+        elif mode == "count":
+            result.count = sum(1 for _ in self.regex.finditer(text))
+        else:
+            self._search_lines(text, result)
+        return result
+
+    def _search_lines(self, text: str, result: FileResult) -> None:
+        spec = self.spec
+        lines = io.StringIO(text).readlines()
+
+        for i, line in enumerate(lines):
+            if not self.regex.search(line):
+                continue
+            result.match_lines.append(i)
+            start = max(0, i - spec.context_before)
+            for j in range(start, min(len(lines), i + spec.context_after + 1)):
+                result.lines.setdefault(j, lines[j])
+            if spec.max_matches_per_file and len(result.match_lines) >= spec.max_matches_per_file:
+                break
+
+        result.count = len(result.match_lines)
+        result.line_count = len(lines)
+
+
+_worker_matcher: Optional[_Matcher] = None
+
+
+def _init_worker(spec: SearchSpec) -> None:
+    global _worker_matcher
+    _worker_matcher = _Matcher(spec)
+
+
+def _search_chunk(paths: List[str]) -> Tuple[int, List[FileResult]]:
+    """Search a chunk in a worker; returns (files searched, files with matches)."""
+    return _scan(_worker_matcher, paths)
+
+
+def _scan(matcher: _Matcher, paths: List[str]) -> Tuple[int, List[FileResult]]:
+    searched, matches = 0, []
+    for path in paths:
+        result = matcher.search_file(path)
+        if result is None:
+            continue
+        searched += 1
+        if result.count:
+            matches.append(result)
+    return searched, matches
+
+
+def default_workers() -> int:
+    """Default number of search processes."""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    """
+    Start method for the worker pool.
+
+    Forking is cheapest, but forking a process that runs other threads (MCP
+    server, daemon) can copy a held lock into the child, so fork only when
+    this is the only thread.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and threading.active_count() == 1:
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class SearchEngine:
+    """
+    Search many files for a pattern, streaming matches in input order.
+
+    Example:
+        >>> engine = SearchEngine(SearchSpec(pattern="TODO"))
+        >>> for match in engine.search(paths):
+        ...     print(match.path, match.count)
+        >>> engine.files_searched
+    """
+
+    def __init__(self, spec: SearchSpec, workers: Optional[int] = None):
+        """
+        Initialize engine.
+
+        Args:
+            spec: Pattern and output settings
+            workers: Worker processes (default: CPU count, up to 8)
+        """
+        self.spec = spec
+        self.workers = workers or default_workers()
+        self.files_searched = 0  # text files scanned so far (binary files excluded)
+
+    def search(self, paths: Iterable[Path]) -> Iterator[FileResult]:
+        """
+        Yield a FileResult for each file with at least one match.
+
+        Closing the iterator early stops outstanding work.
+        """
+        paths = (str(p) for p in paths)
+        head = list(islice(paths, MIN_PARALLEL_FILES))
+
+        if self.workers <= 1 or len(head) < MIN_PARALLEL_FILES:
+            matcher = _Matcher(self.spec)
+            for path in head + list(paths):
+                yield from self._consume(_scan(matcher, [path]))
+            return
+
+        yield from self._search_parallel(_chunks(head, paths))
+
+    def _search_parallel(self, chunks: Iterator[List[str]]) -> Iterator[FileResult]:
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=_mp_context(),
+            initializer=_init_worker,
+            initargs=(self.spec,),
+        )
+        pending = deque()
+        try:
+            # Keep a bounded window in flight so results stream and early exits are cheap
+            for chunk in chunks:
+                pending.append(executor.submit(_search_chunk, chunk))
+                if len(pending) >= self.workers * 2:
+                    yield from self._consume(pending.popleft().result())
+            while pending:
+                yield from self._consume(pending.popleft().result())
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _consume(self, chunk_result: Tuple[int, List[FileResult]]) -> Iterator[FileResult]:
+        searched, matches = chunk_result
+        self.files_searched += searched
+        yield from matches
+
+
+def _chunks(head: List[str], rest: Iterator[str]) -> Iterator[List[str]]:
+    for start in range(0, len(head), CHUNK_SIZE):
+        yield head[start : start + CHUNK_SIZE]
+    while True:
+        chunk = list(islice(rest, CHUNK_SIZE))
+        if not chunk:
+            return
+        yield chunk
@@ -3,12 +3,28 @@ Comprehensive tests for GrepTool
 """
 
 import os
+import re
+import subprocess
+import sys
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
 
+from tools.infrastructure.execution.grep_tool import search_engine, trigram_index
 from tools.infrastructure.execution.grep_tool.grep_tool import GrepTool
+from tools.infrastructure.execution.grep_tool.search_engine import (
+    SearchEngine,
+    SearchSpec,
+    required_literal,
+)
+from tools.infrastructure.execution.grep_tool.trigram_index import (
+    TrigramIndex,
+    decode_postings,
+    encode_postings,
+    query_plan,
+)
 
 
 # Ensure we're not in mock mode for these tests
@@ -513,5 +529,265 @@ class TestGrepToolMetadata:
             assert "output_mode" in result["result"]
 
 
+class TestGrepToolIgnoreRules:
+    """Test .gitignore and dependency directory handling"""
+
+    def test_ignored_paths_are_skipped(self, tmp_path):
+        """Test .gitignore, node_modules and hidden directories are not searched"""
+        Path(tmp_path, ".gitignore").write_text("dist/\n*.min.js\n")
+        for rel in ["src/app.js", "dist/app.js", "lib.min.js", "node_modules/m.js", ".cache/c.js"]:
+            Path(tmp_path, rel).parent.mkdir(parents=True, exist_ok=True)
+            Path(tmp_path, rel).write_text("needle\n")
+
+        tool = GrepTool(pattern="needle", path=str(tmp_path))
+        result = tool.run()["result"]
+
+        assert result["results"] == [str(Path(tmp_path, "src", "app.js"))]
+
+    def test_respect_gitignore_disabled(self, tmp_path):
+        """Test ignored files are searched when respect_gitignore is False"""
+        Path(tmp_path, ".gitignore").write_text("*.log\n")
+        Path(tmp_path, "app.log").write_text("needle\n")
+
+        tool = GrepTool(pattern="needle", path=str(tmp_path), respect_gitignore=False)
+        result = tool.run()["result"]
+
+        assert result["results"] == [str(Path(tmp_path, "app.log"))]
+
+
+class TestGrepToolHeadLimit:
+    """Test head_limit truncation"""
+
+    def test_head_limit_files(self, tmp_path):
+        """Test files_with_matches stops at head_limit"""
+        for i in range(5):
+            Path(tmp_path, f"f{i}.txt").write_text("needle\n")
+
+        tool = GrepTool(pattern="needle", path=str(tmp_path), head_limit=2)
+        result = tool.run()["result"]
+
+        assert len(result["results"]) == 2
+        assert result["total_matches"] == 2
+        assert result["truncated"] is True
+
+    def test_head_limit_content(self, tmp_path):
+        """Test content lines are capped, including within one file"""
+        Path(tmp_path, "big.log").write_text("hit\n" * 1000)
+
+        tool = GrepTool(pattern="hit", path=str(tmp_path), output_mode="content", head_limit=3)
+        result = tool.run()["result"]
+
+        assert len(result["results"]) == 3
+        assert result["truncated"] is True
+
+    def test_not_truncated_when_under_limit(self, tmp_path):
+        """Test truncated is False when all results fit"""
+        Path(tmp_path, "a.txt").write_text("needle\n")
+
+        tool = GrepTool(pattern="needle", path=str(tmp_path), head_limit=5)
+        result = tool.run()["result"]
+
+        assert result["results"] == [str(Path(tmp_path, "a.txt"))]
+        assert result["truncated"] is False
+
+
+class TestSearchEngine:
+    """Test the byte-level search engine"""
+
+    def test_required_literal(self):
+        """Test literal extraction for the prefilter"""
+        assert required_literal("def \\w+\\(") == "def "
+        assert required_literal("foo.*barbaz") == "barbaz"
+        assert required_literal("a|b") is None
+        assert required_literal("line\\nnext") == "line"
+        # Letters with non-ASCII case folds are not used under IGNORECASE
+        assert required_literal("kelvin", re.IGNORECASE) == "elv"
+        assert required_literal("(?i)ask") == "a"
+
+    def test_prefilter_keeps_case_insensitive_unicode_matches(self, tmp_path):
+        """Test KELVIN SIGN still matches 'k' case-insensitively"""
+        Path(tmp_path, "k.txt").write_text("\u212a\n", encoding="utf-8")
+
+        engine = SearchEngine(SearchSpec(pattern="k", flags=re.IGNORECASE), workers=1)
+
+        assert [m.path for m in engine.search([Path(tmp_path, "k.txt")])]
+
+    def test_crlf_and_large_mmapped_file(self, tmp_path, monkeypatch):
+        """Test universal newlines and the mmap path"""
+        monkeypatch.setattr(search_engine, "MMAP_THRESHOLD", 16)
+        path = Path(tmp_path, "crlf.txt")
+        path.write_bytes(b"first line\r\nsecond match\r\nthird\r\n")
+
+        spec = SearchSpec(pattern="match$", output_mode="content", context_before=1)
+        (match,) = SearchEngine(spec, workers=1).search([path])
+
+        assert match.match_lines == [1]
+        assert match.lines == {0: "first line\n", 1: "second match\n"}
+        assert match.line_count == 3
+
+    def test_binary_detected_in_same_read(self, tmp_path):
+        """Test NUL bytes in the first KB mark a file as binary"""
+        binary = Path(tmp_path, "data.txt")
+        binary.write_bytes(b"needle\x00")
+        text = Path(tmp_path, "text.txt")
+        text.write_text("needle")
+
+        engine = SearchEngine(SearchSpec(pattern="needle"), workers=1)
+
+        assert [m.path for m in engine.search([binary, text])] == [str(text)]
+        assert engine.files_searched == 1
+
+    def test_parallel_matches_serial(self, tmp_path, monkeypatch):
+        """Test the process pool returns the serial results in order"""
+        monkeypatch.setattr(search_engine, "MIN_PARALLEL_FILES", 4)
+        monkeypatch.setattr(search_engine, "CHUNK_SIZE", 3)
+        paths = []
+        for i in range(20):
+            path = Path(tmp_path, f"f{i:02d}.txt")
+            path.write_text("x = 1\n" + ("needle\n" * (i % 3)))
+            paths.append(path)
+        spec = SearchSpec(pattern="needle", output_mode="count")
+
+        serial = [(m.path, m.count) for m in SearchEngine(spec, workers=1).search(paths)]
+        parallel_engine = SearchEngine(spec, workers=2)
+        parallel = [(m.path, m.count) for m in parallel_engine.search(paths)]
+
+        assert parallel == serial
+        assert len(serial) == 13
+        assert parallel_engine.files_searched == 20
+
+    def test_no_fork_with_other_threads(self, tmp_path, monkeypatch):
+        """Test the pool does not fork while other threads run, and still searches"""
+        monkeypatch.setattr(search_engine, "MIN_PARALLEL_FILES", 4)
+        paths = []
+        for i in range(8):
+            path = Path(tmp_path, f"f{i}.txt")
+            path.write_text("needle\n")
+            paths.append(path)
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait)
+        thread.start()
+        try:
+            assert search_engine._mp_context().get_start_method() != "fork"
+            engine = SearchEngine(SearchSpec(pattern="needle"), workers=2)
+            assert len(list(engine.search(paths))) == 8
+        finally:
+            stop.set()
+            thread.join()
+
+
+class TestTrigramIndex:
+    """Test the persistent trigram index"""
+
+    @pytest.fixture
+    def tree(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(trigram_index, "RACY_WINDOW_NS", 0)
+        monkeypatch.setattr(trigram_index, "default_index_dir", lambda: tmp_path / "index")
+        monkeypatch.setattr(trigram_index, "_indexes", {})
+        root = Path(tmp_path, "src")
+        root.mkdir()
+        Path(root, "a.py").write_text("class AlphaTool:\n    pass\n")
+        Path(root, "b.py").write_text("def beta_handler():\n    return 1\n")
+        Path(root, "c.txt").write_text("nothing here\n")
+        return root
+
+    def test_postings_round_trip(self):
+        ids = [1, 2, 130, 20000, 5000000]
+        assert decode_postings(encode_postings(ids)) == ids
+        assert decode_postings(encode_postings(ids[:2]) + encode_postings(ids[2:], 2)) == ids
+
+    def test_query_plan(self):
+        """Test which patterns can use the index"""
+        assert query_plan("a.b") is None
+        assert query_plan("foo|\\w+") is None
+        assert query_plan("x{3}") is None
+        assert query_plan("class \\w+Tool")[0] == "and"
+        (alternatives,) = query_plan("alpha|beta")[2]
+        assert alternatives[0] == "or"
+        # Only 'a' is safe to index case-insensitively in 'ask'
+        assert query_plan("ask", re.IGNORECASE) is None
+
+    def test_candidates(self, tree):
+        """Test candidates are the files containing the pattern's trigrams"""
+        index = TrigramIndex(tree)
+
+        paths, candidates = index.candidates("class \\w+Tool")
+        assert paths == ["a.py", "b.py", "c.txt"]
+        assert candidates == {"a.py"}
+
+        assert index.candidates("BETA_handler", re.IGNORECASE)[1] == {"b.py"}
+        # Trigrams are case-folded, so candidates may differ from matches in case only
+        assert index.candidates("alpha|beta")[1] == {"a.py", "b.py"}
+        assert index.candidates("gamma|delta")[1] == set()
+        assert index.candidates("a.b")[1] is None
+
+    def test_incremental_refresh(self, tree):
+        """Test changed, added and removed files are picked up"""
+        index = TrigramIndex(tree)
+        index.refresh()
+        assert index.files_indexed == 3
+
+        Path(tree, "c.txt").write_text("class GammaTool: ...\n")
+        Path(tree, "d.py").write_text("class DeltaTool: ...\n")
+        Path(tree, "a.py").unlink()
+
+        paths, candidates = TrigramIndex(tree).candidates("class \\w+Tool")
+        assert paths == ["b.py", "c.txt", "d.py"]
+        assert candidates == {"c.txt", "d.py"}
+
+        index.refresh()
+        assert index.files_indexed == 0
+
+        index.compact()
+        assert index.candidates("class \\w+Tool")[1] == {"c.txt", "d.py"}
+
+    def test_grep_tool_with_index(self, tree):
+        """Test use_index returns the same results as a full scan"""
+        for mode in ("files_with_matches", "count", "content"):
+            plain = GrepTool(pattern="Tool|handler", path=str(tree), output_mode=mode).run()
+            indexed = GrepTool(
+                pattern="Tool|handler", path=str(tree), output_mode=mode, use_index=True
+            ).run()
+
+            assert indexed["result"]["results"] == plain["result"]["results"]
+
+
+class TestGrepToolLoading:
+    """The tool imports its helper modules; it must load the ways callers load it"""
+
+    ROOT = Path(__file__).resolve().parents[4]
+
+    def run_python(self, *args, **env):
+        return subprocess.run(
+            [sys.executable, *args],
+            cwd=self.ROOT,
+            env={**os.environ, "PYTHONPATH": str(self.ROOT), **env},
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+    def test_loads_through_registry(self, tmp_path):
+        """Test a fresh interpreter loads the tool through the tool index"""
+        code = (
+            "from shared.registry import tool_registry\n"
+            f"tool_registry.discover_tools(index_path={str(tmp_path / 'index.json')!r})\n"
+            "print(tool_registry.get_tool('grep_tool').__name__)\n"
+        )
+        result = self.run_python("-c", code)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "GrepTool"
+
+    def test_runs_as_script(self):
+        """Test the module's __main__ self-test runs as a script"""
+        result = self.run_python(
+            str(Path(__file__).with_name("grep_tool.py")),
+            USE_MOCK_APIS="false",
+            DISABLE_RATE_LIMITING="true",
+        )
+        assert result.returncode == 0, result.stderr
+        assert "All tests passed" in result.stdout
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
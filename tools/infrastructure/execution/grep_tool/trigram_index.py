@@ -0,0 +1,551 @@
+"""
+Persistent trigram index for GrepTool
+
+Maps every 3-byte sequence of a file's (ASCII-lowercased) content to the
+files containing it. A regex is turned into a query over the trigrams its
+matches must contain (literal runs, AND across a sequence, OR across
+alternatives), so only candidate files need to be read and verified with the
+regex. Patterns without a usable literal of three or more bytes cannot be
+indexed; the caller then searches every file.
+
+The index is a SQLite database per root (default:
+~/.agentswarm/grep_index/<hash>.db):
+
+- files: one row per indexed file (id, path, mtime_ns, size, kind)
+- postings: per trigram, the ids of files containing it as a delta-encoded
+  varint blob. File ids only grow, so new files are appended to the blob.
+
+Every query first refreshes the index: the tree is walked with the shared
+ignore-aware walker and files whose mtime or size changed are re-read.
+Removed and changed files leave stale ids in posting lists; those are
+filtered out at query time and dropped by compact() once they outnumber live
+files.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from shared.file_walker import RACY_WINDOW_NS, FileWalker, file_list_cache_for
+
+from .search_engine import BINARY_SNIFF_BYTES, sre_parse
+
+logger = logging.getLogger(__name__)
+
+# Bump when the database layout or trigram extraction changes
+INDEX_VERSION = 1
+
+# Larger files are not indexed (they are always candidates)
+MAX_INDEX_BYTES = 4 * 1024 * 1024
+
+# Files read between posting list flushes while indexing
+FLUSH_FILES = 2000
+
+# Stop intersecting posting lists once this few candidates remain
+MIN_CANDIDATES = 32
+
+# files.kind values
+KIND_INDEXED = 1
+KIND_UNINDEXED = 0  # too large or unreadable: always a candidate
+KIND_BINARY = 2  # never searched by GrepTool
+
+# ASCII letters that also match non-ASCII characters under re.IGNORECASE
+_UNSAFE_FOLD_CHARS = frozenset("iIkKsS")
+
+# Process-wide instances used by get_trigram_index()
+_indexes: Dict[str, "TrigramIndex"] = {}
+_indexes_lock = threading.Lock()
+
+_REPEATS = tuple(
+    getattr(sre_parse, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if sre_parse is not None and hasattr(sre_parse, name)
+)
+
+
+def default_index_dir() -> Path:
+    """Default index location (~/.agentswarm/grep_index)."""
+    return Path.home() / ".agentswarm" / "grep_index"
+
+
+def extract_trigrams(data: bytes) -> Set[int]:
+    """Distinct trigrams of ASCII-lowercased data, as 24-bit ints."""
+    data = data.lower()
+    return {(a << 16) | (b << 8) | c for a, b, c in set(zip(data, data[1:], data[2:]))}
+
+
+def encode_postings(ids: Iterable[int], last: int = 0) -> bytes:
+    """Delta-encode ascending ids (all greater than last) as varints."""
+    out = bytearray()
+    for file_id in ids:
+        delta = file_id - last
+        last = file_id
+        while delta >= 0x80:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out)
+
+
+def decode_postings(blob: bytes) -> List[int]:
+    """Inverse of encode_postings."""
+    ids = []
+    current = value = shift = 0
+    for byte in blob:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            current += value
+            ids.append(current)
+            value = shift = 0
+    return ids
+
+
+def query_plan(pattern: str, flags: int = 0) -> Optional[tuple]:
+    """
+    Trigram query that every match of pattern satisfies.
+
+    Returns:
+        None if the pattern cannot be indexed, otherwise a plan node:
+        ("and", {trigram, ...}, [subplan, ...]) or ("or", [subplan, ...])
+    """
+    if sre_parse is None:
+        return None
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+    return _plan_sequence(parsed, bool((flags | parsed.state.flags) & re.IGNORECASE))
+
+
+def _literal_trigrams(chars: List[str]) -> Set[int]:
+    if len(chars) < 3:
+        return set()
+    return extract_trigrams("".join(chars).encode("utf-8"))
+
+
+def _plan_sequence(items, ignore_case: bool) -> Optional[tuple]:
+    trigrams: Set[int] = set()
+    subplans: List[tuple] = []
+    run: List[str] = []
+
+    for op, arg in list(items) + [(None, None)]:
+        if op is sre_parse.LITERAL:
+            char = chr(arg)
+            usable = char not in "\r\n"
+            if usable and ignore_case:
+                usable = char.isascii() and char not in _UNSAFE_FOLD_CHARS
+            if usable:
+                run.append(char)
+                continue
+        elif op is sre_parse.AT:
+            continue  # zero-width: the literal run continues
+
+        trigrams |= _literal_trigrams(run)
+        run = []
+
+        sub = None
+        if op is sre_parse.SUBPATTERN:
+            _, add_flags, del_flags, inner = arg
+            inner_ignore = (ignore_case or bool(add_flags & re.IGNORECASE)) and not (
+                del_flags & re.IGNORECASE
+            )
+            sub = _plan_sequence(inner, inner_ignore)
+        elif op is sre_parse.BRANCH:
+            branches = [_plan_sequence(branch, ignore_case) for branch in arg[1]]
+            if all(branch is not None for branch in branches):
+                sub = ("or", branches)
+        elif op in _REPEATS and arg[0] >= 1:
+            sub = _plan_sequence(arg[2], ignore_case)
+        elif op is getattr(sre_parse, "ATOMIC_GROUP", None):
+            sub = _plan_sequence(arg, ignore_case)
+        if sub is not None:
+            subplans.append(sub)
+
+    if not trigrams and not subplans:
+        return None
+    return ("and", trigrams, subplans)
+
+
+class TrigramIndex:
+    """
+    Incrementally maintained trigram index of one directory tree.
+
+    Example:
+        >>> index = get_trigram_index("/path/to/repo")
+        >>> paths, candidates = index.candidates(r"def \\w+_handler", 0)
+        >>> [p for p in paths if candidates is None or p in candidates]
+    """
+
+    def __init__(self, root: Union[str, Path], index_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize index.
+
+        Args:
+            root: Directory to index
+            index_path: Database file (defaults to ~/.agentswarm/grep_index/<hash>.db)
+        """
+        self.root = str(Path(root).resolve())
+        if index_path:
+            self.index_path = Path(index_path)
+        else:
+            digest = hashlib.sha1(self.root.encode("utf-8")).hexdigest()[:12]
+            self.index_path = default_index_dir() / f"{digest}.db"
+
+        self.files_indexed = 0  # files (re-)read by the last refresh
+        self._lock = threading.Lock()
+        self._known: Optional[Dict[str, Tuple[int, int, int]]] = None
+        self._generation: Optional[str] = None
+        self._init_db()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT NOT NULL UNIQUE,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    kind INTEGER NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS postings (
+                    trigram INTEGER PRIMARY KEY,
+                    count INTEGER NOT NULL,
+                    last_id INTEGER NOT NULL,
+                    ids BLOB NOT NULL
+                )
+            """
+            )
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            if meta.get("version") != str(INDEX_VERSION) or meta.get("root") != self.root:
+                conn.execute("DELETE FROM files")
+                conn.execute("DELETE FROM postings")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("version", str(INDEX_VERSION)),
+                        ("root", self.root),
+                        ("next_id", "1"),
+                        ("generation", "0"),
+                    ],
+                )
+            conn.commit()
+
+    def candidates(self, pattern: str, flags: int = 0) -> Tuple[List[str], Optional[Set[str]]]:
+        """
+        Refresh the index and find files that may match.
+
+        Args:
+            pattern: Regular expression
+            flags: re flags the pattern is compiled with
+
+        Returns:
+            (every file under root in walk order as relative posix paths,
+            the subset that may match, or None if the pattern cannot be indexed)
+        """
+        plan = query_plan(pattern, flags)
+        if plan is None:
+            # Nothing to look up, so skip the stat calls of a refresh
+            walker = FileWalker(self.root, cache=file_list_cache_for(self.root))
+            return [entry.rel_path for entry in walker], None
+
+        paths = self.refresh()
+
+        with self._connect() as conn:
+            ids = list(self._evaluate(conn, plan))
+            candidates = {
+                path
+                for (path,) in conn.execute(
+                    "SELECT path FROM files WHERE kind = ?", (KIND_UNINDEXED,)
+                )
+            }
+            # Ids of removed or changed files no longer have a row
+            for start in range(0, len(ids), 900):
+                chunk = ids[start : start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                candidates.update(
+                    path
+                    for (path,) in conn.execute(
+                        f"SELECT path FROM files WHERE id IN ({placeholders})", chunk
+                    )
+                )
+        return paths, candidates
+
+    def refresh(self) -> List[str]:
+        """
+        Bring the index up to date with the tree.
+
+        Returns:
+            Every file under root in walk order (relative posix paths)
+        """
+        with self._lock, self._connect() as conn:
+            known = self._load_known(conn)
+
+            paths = []
+            changed = []
+            unchanged = 0
+            for entry in FileWalker(self.root, cache=file_list_cache_for(self.root)):
+                paths.append(entry.rel_path)
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                record = known.get(entry.rel_path)
+                if record is None or record[1] != st.st_mtime_ns or record[2] != st.st_size:
+                    changed.append((entry.rel_path, st))
+                else:
+                    unchanged += 1
+
+            removed = set()
+            if unchanged + sum(1 for path, _ in changed if path in known) != len(known):
+                removed = known.keys() - set(paths)
+
+            self.files_indexed = len(changed)
+            if changed or removed:
+                self._apply(conn, changed, removed)
+            return paths
+
+    def _load_known(self, conn: sqlite3.Connection) -> Dict[str, Tuple[int, int, int]]:
+        """Indexed files by path, reloaded only when the index was written since."""
+        (generation,) = conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+        if self._known is None or generation != self._generation:
+            self._known = {
+                path: (file_id, mtime_ns, size)
+                for file_id, path, mtime_ns, size in conn.execute(
+                    "SELECT id, path, mtime_ns, size FROM files"
+                )
+            }
+            self._generation = generation
+        return self._known
+
+    def compact(self) -> None:
+        """Drop ids of removed and changed files from every posting list."""
+        with self._lock, self._connect() as conn:
+            self._compact(conn)
+
+    def _apply(
+        self,
+        conn: sqlite3.Connection,
+        changed: List[Tuple[str, os.stat_result]],
+        removed: Iterable[str],
+    ) -> None:
+        """Re-index changed files and forget removed ones."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            stale = [(path,) for path in removed] + [(path,) for path, _ in changed]
+            conn.executemany("DELETE FROM files WHERE path = ?", stale)
+
+            next_id = int(
+                conn.execute("SELECT value FROM meta WHERE key = 'next_id'").fetchone()[0]
+            )
+            now_ns = time.time_ns()
+            pending: Dict[int, List[int]] = {}
+            rows = []
+
+            for i, (rel_path, st) in enumerate(changed):
+                file_id = next_id + i
+                kind, trigrams = self._read_trigrams(os.path.join(self.root, rel_path), st)
+                for trigram in trigrams:
+                    pending.setdefault(trigram, []).append(file_id)
+                # A file modified within the mtime granularity is re-read next time
+                mtime_ns = 0 if now_ns - st.st_mtime_ns < RACY_WINDOW_NS else st.st_mtime_ns
+                rows.append((file_id, rel_path, mtime_ns, st.st_size, kind))
+                if len(rows) >= FLUSH_FILES:
+                    self._flush(conn, rows, pending)
+                    rows, pending = [], {}
+            self._flush(conn, rows, pending)
+
+            conn.execute(
+                "UPDATE meta SET value = ? WHERE key = 'next_id'", (str(next_id + len(changed)),)
+            )
+            self._bump_generation(conn)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+        live = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        if next_id + len(changed) > 2 * live + 1000:
+            self._compact(conn)
+
+    def _bump_generation(self, conn: sqlite3.Connection) -> None:
+        """Mark the index as written so in-memory state of every process is reloaded."""
+        conn.execute(
+            "UPDATE meta SET value = CAST(CAST(value AS INTEGER) + 1 AS TEXT)"
+            " WHERE key = 'generation'"
+        )
+        self._known = None
+
+    @staticmethod
+    def _read_trigrams(path: str, st: os.stat_result) -> Tuple[int, Set[int]]:
+        if st.st_size > MAX_INDEX_BYTES:
+            return KIND_UNINDEXED, set()
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return KIND_UNINDEXED, set()
+        if data.find(b"\x00", 0, BINARY_SNIFF_BYTES) != -1:
+            return KIND_BINARY, set()
+        return KIND_INDEXED, extract_trigrams(data)
+
+    @staticmethod
+    def _flush(conn: sqlite3.Connection, rows: List[tuple], pending: Dict[int, List[int]]) -> None:
+        """Write file rows and append their ids to the posting lists."""
+        conn.executemany(
+            "INSERT INTO files (id, path, mtime_ns, size, kind) VALUES (?, ?, ?, ?, ?)", rows
+        )
+        if not pending:
+            return
+
+        trigrams = list(pending)
+        last_ids = {}
+        for start in range(0, len(trigrams), 900):
+            chunk = trigrams[start : start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            last_ids.update(
+                conn.execute(
+                    f"SELECT trigram, last_id FROM postings WHERE trigram IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+            )
+
+        updates, inserts = [], []
+        for trigram, ids in pending.items():
+            if trigram in last_ids:
+                blob = encode_postings(ids, last_ids[trigram])
+                updates.append((blob, len(ids), ids[-1], trigram))
+            else:
+                inserts.append((trigram, len(ids), ids[-1], encode_postings(ids)))
+
+        conn.executemany(
+            "UPDATE postings SET ids = CAST(ids || ? AS BLOB), count = count + ?, last_id = ?"
+            " WHERE trigram = ?",
+            updates,
+        )
+        conn.executemany(
+            "INSERT INTO postings (trigram, count, last_id, ids) VALUES (?, ?, ?, ?)", inserts
+        )
+
+    def _compact(self, conn: sqlite3.Connection) -> None:
+        live = {
+            row[0] for row in conn.execute("SELECT id FROM files WHERE kind = ?", (KIND_INDEXED,))
+        }
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            updates, deletes = [], []
+            for trigram, blob in conn.execute("SELECT trigram, ids FROM postings").fetchall():
+                ids = [file_id for file_id in decode_postings(blob) if file_id in live]
+                if ids:
+                    updates.append((encode_postings(ids), len(ids), ids[-1], trigram))
+                else:
+                    deletes.append((trigram,))
+            conn.executemany(
+                "UPDATE postings SET ids = ?, count = ?, last_id = ? WHERE trigram = ?", updates
+            )
+            conn.executemany("DELETE FROM postings WHERE trigram = ?", deletes)
+            self._bump_generation(conn)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.execute("VACUUM")
+        logger.debug(f"Compacted grep index {self.index_path} ({len(live)} files)")
+
+    def _evaluate(self, conn: sqlite3.Connection, plan: tuple) -> Set[int]:
+        """Ids of indexed files satisfying a (non-None) plan."""
+        trigrams = set()
+        _collect_trigrams(plan, trigrams)
+        counts = {}
+        trigram_list = list(trigrams)
+        for start in range(0, len(trigram_list), 900):
+            chunk = trigram_list[start : start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            counts.update(
+                conn.execute(
+                    f"SELECT trigram, count FROM postings WHERE trigram IN ({placeholders})", chunk
+                ).fetchall()
+            )
+        return self._evaluate_node(conn, plan, counts)
+
+    def _evaluate_node(self, conn: sqlite3.Connection, node: tuple, counts: Dict[int, int]):
+        if node[0] == "or":
+            result: Set[int] = set()
+            for branch in node[1]:
+                result |= self._evaluate_node(conn, branch, counts)
+            return result
+
+        _, trigrams, subplans = node
+        result: Optional[Set[int]] = None
+        # Rarest first; once few candidates remain, verifying them is cheaper
+        for trigram in sorted(trigrams, key=lambda t: counts.get(t, 0)):
+            if trigram not in counts:
+                return set()
+            if result is not None and len(result) <= MIN_CANDIDATES:
+                break
+            (blob,) = conn.execute(
+                "SELECT ids FROM postings WHERE trigram = ?", (trigram,)
+            ).fetchone()
+            ids = decode_postings(blob)
+            result = set(ids) if result is None else result.intersection(ids)
+
+        for subplan in subplans:
+            if result is not None and len(result) <= MIN_CANDIDATES:
+                break
+            ids = self._evaluate_node(conn, subplan, counts)
+            result = ids if result is None else result & ids
+        return result if result is not None else set()
+
+
+def get_trigram_index(root: Union[str, Path]) -> TrigramIndex:
+    """
+    Shared TrigramIndex for root, so repeated searches in one process keep
+    the indexed file table in memory between refreshes.
+    """
+    key = str(Path(root).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = TrigramIndex(key)
+        return index
+
+
+def _collect_trigrams(node: tuple, out: Set[int]) -> None:
+    if node[0] == "or":
+        for branch in node[1]:
+            _collect_trigrams(branch, out)
+        return
+    out |= node[1]
+    for subplan in node[2]:
+        _collect_trigrams(subplan, out)
@@ -11,8 +11,10 @@ from pydantic import Field
 
 from shared.base import BaseTool
 from shared.errors import APIError, ValidationError
+from shared.shell_sessions import ShellJob, get_shell_manager
 
-# Simulated shell tracking registry (in real implementation, this would be a persistent store)
+# Processes registered by pid with register_shell (jobs started by BashTool
+# are tracked by the shared ShellManager instead)
 _SHELL_REGISTRY = {}
 
 
@@ -24,6 +26,11 @@ class KillShellTool(BaseTool):
     and tracked by the system. Supports both graceful (SIGTERM) and forced
     (SIGKILL) termination.
 
+    Jobs started by BashTool are stopped by signalling their session's process
+    group, which also stops anything the command spawned; their output stays
+    readable with BashOutputTool. Processes registered with register_shell
+    are signalled by pid.
+
     Args:
         shell_id: ID of the background shell to terminate (required)
         force: Whether to use force kill (SIGKILL) instead of graceful termination (SIGTERM)
@@ -157,6 +164,10 @@ class KillShellTool(BaseTool):
         Raises:
             APIError: If shell_id not found or termination fails
         """
+        job = get_shell_manager().get(self.shell_id)
+        if job is not None:
+            return self._kill_job(job)
+
         # Check if shell exists in tracking system
         if self.shell_id not in _SHELL_REGISTRY:
             raise APIError(
@@ -251,8 +262,38 @@ class KillShellTool(BaseTool):
             "pid": pid,
         }
 
+    def _kill_job(self, job: ShellJob) -> Dict[str, Any]:
+        """
+        Terminate a BashTool job through the shell manager.
+
+        Returns:
+            Dict with termination details
+        """
+        manager = get_shell_manager()
+        pid = job.pid
+        self._logger.info(f"Terminating shell {self.shell_id} (process group {pid})")
+        try:
+            outcome = manager.kill(self.shell_id, force=self.force, timeout=self.timeout)
+        except PermissionError:
+            raise APIError(
+                f"Permission denied to kill process {pid}",
+                tool_name=self.tool_name,
+            )
+
+        result = {
+            "shell_id": self.shell_id,
+            "terminated": True,
+            "exit_code": outcome["exit_code"],
+            "signal_used": outcome["signal_used"] or "N/A (already terminated)",
+            "cleanup_performed": True,
+            "pid": pid,
+        }
+        if outcome["signal_used"] is None:
+            result["previous_status"] = outcome["previous_status"]
+        return result
+
 
-# Helper functions for shell tracking (used by BashTool or similar)
+# Helper functions for tracking processes by pid
 def register_shell(shell_id: str, pid: int, command: str = "") -> None:
     """Register a new shell in the tracking system."""
     _SHELL_REGISTRY[shell_id] = {
@@ -14,6 +14,7 @@ import pytest
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../..")))
 
 from shared.errors import APIError, ValidationError
+from shared.shell_sessions import get_shell_manager
 from tools.infrastructure.execution.kill_shell_tool.kill_shell_tool import (
     _SHELL_REGISTRY,
     KillShellTool,
@@ -394,6 +395,43 @@ class TestMultipleConsecutiveKills:
             os.environ["USE_MOCK_APIS"] = "true"
 
 
+class TestBackgroundJobs:
+    """Test killing background jobs started through bash_tool."""
+
+    @pytest.fixture
+    def production_mode(self):
+        os.environ["USE_MOCK_APIS"] = "false"
+        os.environ["DISABLE_RATE_LIMITING"] = "true"
+        yield
+        os.environ["USE_MOCK_APIS"] = "true"
+        os.environ.pop("DISABLE_RATE_LIMITING", None)
+
+    def test_kill_running_job(self, production_mode):
+        """Test that a running job and its children are terminated."""
+        job = get_shell_manager().start("sleep 30 & sleep 30; wait")
+
+        result = KillShellTool(shell_id=job.id, timeout=5).run()
+
+        assert result["success"] == True
+        assert result["result"]["terminated"] == True
+        assert result["result"]["signal_used"] == "SIGTERM"
+        assert result["result"]["cleanup_performed"] == True
+        assert job.status == "killed"
+        with pytest.raises(ProcessLookupError):
+            os.killpg(result["result"]["pid"], 0)
+
+    def test_kill_finished_job(self, production_mode):
+        """Test killing a job that already exited."""
+        job = get_shell_manager().start("exit 3")
+        assert job.wait(10)
+
+        result = KillShellTool(shell_id=job.id).run()
+
+        assert result["result"]["signal_used"] == "N/A (already terminated)"
+        assert result["result"]["previous_status"] == "failed"
+        assert result["result"]["exit_code"] == 3
+
+
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 
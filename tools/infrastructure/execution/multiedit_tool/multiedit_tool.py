@@ -4,13 +4,12 @@ Perform multiple sequential edits to a single file atomically
 
 import json
 import os
-import shutil
-import tempfile
 from typing import Any, Dict, List, Optional
 
 from pydantic import Field
 
 from shared.base import BaseTool
+from shared.edit_engine import apply_edits, atomic_write, parse_edits, read_file
 from shared.errors import APIError, ValidationError
 
 
@@ -27,6 +26,8 @@ class MultieditTool(BaseTool):
                     {"action": "insert", "line": 10, "text": "..."},
                     {"action": "delete", "line": 5}
                ]}
+               Edits apply in order; line numbers are 0-based and refer to the
+               file as changed by the previous edits.
 
     Returns:
         Dict containing:
@@ -107,13 +108,7 @@ class MultieditTool(BaseTool):
                 "Missing or invalid edits list", tool_name=self.tool_name, field="edits"
             )
 
-        for edit in data["edits"]:
-            if "action" not in edit:
-                raise ValidationError(
-                    "Each edit must contain an action",
-                    tool_name=self.tool_name,
-                    details=edit,
-                )
+        parse_edits(data["edits"], tool_name=self.tool_name)
 
     def _should_use_mock(self) -> bool:
         """Check if mock mode enabled."""
@@ -128,77 +123,30 @@ class MultieditTool(BaseTool):
         }
 
     def _process(self) -> Any:
-        """Main processing logic."""
+        """
+        Main processing logic.
+
+        Validates all edits, applies them in one pass with the shared edit
+        engine and replaces the file atomically.
+        """
         data = json.loads(self.input)
         file_path = data["file_path"]
-        edits = data["edits"]
+        edits = parse_edits(data["edits"], tool_name=self.tool_name)
 
         if not os.path.exists(file_path):
             raise APIError(f"File does not exist: {file_path}", tool_name=self.tool_name)
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            orig_content = "".join(lines)
-
-            for edit in edits:
-                action = edit["action"]
-
-                if action == "replace":
-                    search = edit.get("search", "")
-                    replace = edit.get("replace", "")
-                    new_content = orig_content.replace(search, replace)
-                    orig_content = new_content
-
-                elif action == "insert":
-                    line_idx = edit.get("line")
-                    text = edit.get("text", "")
-                    if not isinstance(line_idx, int) or line_idx < 0:
-                        raise ValidationError(
-                            "Invalid line index for insert",
-                            tool_name=self.tool_name,
-                            details=edit,
-                        )
-                    split = orig_content.splitlines(keepends=True)
-                    if line_idx >= len(split):
-                        split.append(text + "\n")
-                    else:
-                        split.insert(line_idx, text + "\n")
-                    orig_content = "".join(split)
-
-                elif action == "delete":
-                    line_idx = edit.get("line")
-                    if not isinstance(line_idx, int) or line_idx < 0:
-                        raise ValidationError(
-                            "Invalid line index for delete",
-                            tool_name=self.tool_name,
-                            details=edit,
-                        )
-                    split = orig_content.splitlines(keepends=True)
-                    if line_idx < len(split):
-                        del split[line_idx]
-                    orig_content = "".join(split)
-
-                else:
-                    raise ValidationError(
-                        f"Unknown edit action: {action}",
-                        tool_name=self.tool_name,
-                        details=edit,
-                    )
-
-            temp_fd, temp_path = tempfile.mkstemp()
-            os.close(temp_fd)
-
-            with open(temp_path, "w", encoding="utf-8") as f:
-                f.write(orig_content)
-
-            shutil.move(temp_path, file_path)
-
-            return {"message": "Edits applied successfully"}
-
-        except ValidationError:
-            raise
+            result = apply_edits(read_file(file_path), edits)
+            atomic_write(file_path, result.chunks)
+
+            return {
+                "message": "Edits applied successfully",
+                "edits_applied": len(edits),
+                "replacements": result.replacements,
+                "total_lines": result.total_lines,
+            }
+
         except Exception as e:
             self._logger.error(f"Error in {self.tool_name}: {str(e)}", exc_info=True)
             raise APIError(f"Failed to apply edits: {e}", tool_name=self.tool_name)
@@ -9,7 +9,7 @@ import pytest
 from pydantic import ValidationError as PydanticValidationError
 
 from shared.errors import APIError, ValidationError
-from tools.code_execution.multiedit_tool import MultieditTool
+from tools.infrastructure.execution.multiedit_tool import MultieditTool
 
 
 class TestMultieditTool:
@@ -17,8 +17,13 @@ class TestMultieditTool:
 
     # ========== FIXTURES ==========
 
+    @pytest.fixture(autouse=True)
+    def disable_mock_apis(self, monkeypatch):
+        """Edit real files; mock mode is opted into per test."""
+        monkeypatch.setenv("USE_MOCK_APIS", "false")
+
     @pytest.fixture
-    def sample_file(tmp_path) -> str:
+    def sample_file(self, tmp_path) -> str:
         """Create a temporary file with sample content."""
         file_path = tmp_path / "test.txt"
         file_path.write_text("line1\nline2\nline3\n", encoding="utf-8")
@@ -57,7 +62,7 @@ class TestMultieditTool:
     def test_metadata_correct(self, tool: MultieditTool):
         """Test tool metadata."""
         assert tool.tool_name == "multiedit_tool"
-        assert tool.tool_category == "code_execution"
+        assert tool.tool_category == "infrastructure"
 
     # ========== MOCK MODE ==========
 
@@ -73,13 +78,13 @@ class TestMultieditTool:
 
     def test_empty_input_raises_error(self):
         tool = MultieditTool(input="   ")
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(ValidationError):
+            tool.run()
 
     def test_invalid_json_raises_error(self):
         tool = MultieditTool(input="{bad_json")
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(ValidationError):
+            tool.run()
 
     @pytest.mark.parametrize(
         "bad_data",
@@ -92,8 +97,8 @@ class TestMultieditTool:
     )
     def test_invalid_structure_raises_error(self, bad_data):
         tool = MultieditTool(input=json.dumps(bad_data))
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(ValidationError):
+            tool.run()
 
     def test_invalid_insert_line_index(self, sample_file: str):
         data = {
@@ -101,32 +106,34 @@ class TestMultieditTool:
             "edits": [{"action": "insert", "line": -1, "text": "bad"}],
         }
         tool = MultieditTool(input=json.dumps(data))
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(ValidationError):
+            tool.run()
 
     def test_invalid_delete_line_index(self, sample_file: str):
         data = {"file_path": sample_file, "edits": [{"action": "delete", "line": -5}]}
         tool = MultieditTool(input=json.dumps(data))
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(ValidationError):
+            tool.run()
 
     def test_unknown_action_raises_error(self, sample_file: str):
         data = {"file_path": sample_file, "edits": [{"action": "unknown"}]}
         tool = MultieditTool(input=json.dumps(data))
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(ValidationError):
+            tool.run()
 
     def test_missing_file_raises_api_error(self, tmp_path):
         missing_file = str(tmp_path / "missing.txt")
         data = {"file_path": missing_file, "edits": []}
         tool = MultieditTool(input=json.dumps(data))
-        result = tool.run()
-        assert result["success"] is False
+        tool.retry_delay = 0
+        with pytest.raises(APIError, match="File does not exist"):
+            tool.run()
 
     def test_api_error_from_process(self, tool: MultieditTool):
+        tool.retry_delay = 0
         with patch.object(tool, "_process", side_effect=Exception("boom")):
-            result = tool.run()
-            assert result["success"] is False
+            with pytest.raises(APIError, match="boom"):
+                tool.run()
 
     # ========== EDGE CASES ==========
 
@@ -147,6 +154,27 @@ class TestMultieditTool:
         content = open(sample_file, "r", encoding="utf-8").read()
         assert "line1" in content  # unchanged
 
+    def test_edits_use_line_numbers_after_previous_edits(self, sample_file: str):
+        data = {
+            "file_path": sample_file,
+            "edits": [
+                {"action": "delete", "line": 0},
+                {"action": "insert", "line": 0, "text": "first"},
+                {"action": "replace", "search": "line", "replace": "row"},
+            ],
+        }
+        result = MultieditTool(input=json.dumps(data)).run()
+        assert result["result"]["replacements"] == 2
+        assert result["result"]["total_lines"] == 3
+        assert open(sample_file, encoding="utf-8").read() == "first\nrow2\nrow3\n"
+
+    def test_crlf_line_endings_preserved(self, tmp_path):
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(b"a\r\nb\r\n")
+        data = {"file_path": str(path), "edits": [{"action": "insert", "line": 1, "text": "x"}]}
+        MultieditTool(input=json.dumps(data)).run()
+        assert path.read_bytes() == b"a\r\nx\r\nb\r\n"
+
     # ========== PARAMETRIZED TESTS ==========
 
     @pytest.mark.parametrize(
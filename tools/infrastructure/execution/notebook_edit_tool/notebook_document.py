@@ -0,0 +1,512 @@
+"""
+Incremental notebook editing for NotebookEditTool
+
+A notebook is scanned once for the byte span of every cell in its "cells"
+array. String tokens (source lines, base64 images, long text outputs) are
+skipped with bytes.find for their closing quote, so the scan runs at memchr
+speed through outputs and never decodes them. The resulting CellIndex maps
+cell ids to spans and is cached per path until the file's size or mtime
+changes. Files modified within RACY_WINDOW_NS are not cached, since a
+same-size rewrite within the same mtime tick would go unnoticed.
+
+Edits decode only the cells they touch. Saving splices the re-serialized cells
+between untouched byte ranges of the original file, so editing one cell of a
+notebook with hundreds of MB of outputs copies those outputs as raw bytes.
+The index of the written file is computed while splicing and cached, so the
+next edit skips the scan too (once the file is out of the racy window).
+
+Optionally, outputs above a size limit are stripped or externalized (written
+to a sidecar JSON file and replaced by a short display_data pointing at it).
+Only cells whose raw span exceeds the limit are decoded to check them.
+Sidecar files written for a save that then fails are removed again.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from shared.edit_engine import Chunk, atomic_write
+from shared.file_walker import RACY_WINDOW_NS
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Notebooks whose cell index is kept in memory (least recently used evicted)
+MAX_CACHED_INDEXES = 32
+
+_BRACKET = re.compile(rb"[\[\]{}]")
+_ARRAY_VALUE = re.compile(rb"\s*:\s*\[")
+_STRING_VALUE = re.compile(rb'\s*:\s*("(?:[^"\\]++|\\.)*+")', re.DOTALL)
+_INDENT = re.compile(rb"\{\r?\n([ \t]+)")
+_WHITESPACE = re.compile(rb"\s*")
+
+_OPEN = frozenset(b"{[")
+_QUOTE = ord('"')
+_BRACE = ord("{")
+_BACKSLASH = ord("\\")
+
+
+def _tokens(data: bytes, pos: int) -> Iterator[Optional[Tuple[int, int]]]:
+    """
+    (start, end) of each string and bracket in a JSON document.
+
+    Yields None once if a string is not terminated.
+    """
+    size = len(data)
+    while pos < size:
+        quote = data.find(b'"', pos)
+        if quote < 0:
+            quote = size
+        for match in _BRACKET.finditer(data, pos, quote):
+            yield match.start(), match.end()
+        if quote == size:
+            return
+        end = data.find(b'"', quote + 1)
+        while end > 0 and data[end - 1] == _BACKSLASH:
+            slashes = end - 1
+            while data[slashes - 1] == _BACKSLASH:
+                slashes -= 1
+            if (end - slashes) % 2 == 0:
+                break  # the backslashes escape each other
+            end = data.find(b'"', end + 1)
+        if end < 0:
+            yield None
+            return
+        yield quote, end + 1
+        pos = end + 1
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass  # let the json module report (or accept, e.g. NaN) it
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode compact JSON as UTF-8, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class CellIndex:
+    """
+    Byte layout of a notebook's cells array.
+
+    Spans are half-open byte ranges of each cell object; ids and cell types
+    are read from the cell's top-level keys (None when absent).
+    """
+
+    __slots__ = (
+        "size",
+        "mtime_ns",
+        "cells_open",
+        "cells_close",
+        "spans",
+        "ids",
+        "types",
+        "indent",
+    )
+
+    def __init__(
+        self,
+        size: int,
+        mtime_ns: int,
+        cells_open: int,
+        cells_close: int,
+        spans: List[Tuple[int, int]],
+        ids: List[Optional[str]],
+        types: List[Optional[str]],
+        indent: Optional[str],
+    ):
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.cells_open = cells_open  # offset of "["
+        self.cells_close = cells_close  # offset of "]"
+        self.spans = spans
+        self.ids = ids
+        self.types = types
+        self.indent = indent  # JSON indent unit, None for single-line files
+
+    @classmethod
+    def scan(cls, data: bytes, mtime_ns: int = 0) -> Optional["CellIndex"]:
+        """Index a notebook, or None if it is not an object with a list of cell objects."""
+        start = _WHITESPACE.match(data).end()
+        if data[start : start + 1] != b"{":
+            return None
+
+        depth = 0
+        cells_open = cells_close = -1
+        in_cells = False
+        cell_start = -1
+        spans: List[Tuple[int, int]] = []
+        ids: List[Optional[str]] = []
+        types: List[Optional[str]] = []
+
+        for token in _tokens(data, start):
+            if token is None:
+                return None
+            pos, end = token
+            char = data[pos]
+            if char == _QUOTE:
+                if depth == 3 and in_cells:
+                    length = end - pos
+                    if length == 4 and data[pos:end] == b'"id"':
+                        value = _STRING_VALUE.match(data, end)
+                        if value and ids[-1] is None:
+                            ids[-1] = json.loads(value.group(1))
+                    elif length == 11 and data[pos:end] == b'"cell_type"':
+                        value = _STRING_VALUE.match(data, end)
+                        if value and types[-1] is None:
+                            types[-1] = json.loads(value.group(1))
+                elif depth == 2 and in_cells:
+                    return None  # cells must be objects
+                elif depth == 1 and end - pos == 7 and data[pos:end] == b'"cells"':
+                    if cells_open >= 0:
+                        continue
+                    value = _ARRAY_VALUE.match(data, end)
+                    if value:
+                        cells_open = value.end() - 1
+            elif char in _OPEN:
+                depth += 1
+                if depth == 2 and pos == cells_open:
+                    in_cells = True
+                elif depth == 3 and in_cells:
+                    if char != _BRACE:
+                        return None
+                    cell_start = pos
+                    ids.append(None)
+                    types.append(None)
+            else:
+                if depth == 3 and in_cells:
+                    spans.append((cell_start, end))
+                elif depth == 2 and in_cells:
+                    in_cells = False
+                    cells_close = pos
+                depth -= 1
+                if depth < 0:
+                    return None
+                if depth == 0:
+                    if data[end:].strip():
+                        return None
+                    break
+
+        if depth != 0 or cells_close < 0:
+            return None
+        indent = _INDENT.match(data, start)
+        return cls(
+            size=len(data),
+            mtime_ns=mtime_ns,
+            cells_open=cells_open,
+            cells_close=cells_close,
+            spans=spans,
+            ids=ids,
+            types=types,
+            indent=indent.group(1).decode("ascii") if indent else None,
+        )
+
+    def is_current(self, st: os.stat_result) -> bool:
+        """Whether the index still describes the file."""
+        return self.size == st.st_size and self.mtime_ns == st.st_mtime_ns
+
+
+_indexes: "OrderedDict[str, CellIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def _cache_index(key: str, index: CellIndex) -> None:
+    with _indexes_lock:
+        if time.time_ns() - index.mtime_ns < RACY_WINDOW_NS:
+            _indexes.pop(key, None)
+            return
+        _indexes[key] = index
+        _indexes.move_to_end(key)
+        while len(_indexes) > MAX_CACHED_INDEXES:
+            _indexes.popitem(last=False)
+
+
+def get_cell_index(path: str, data: bytes, st: os.stat_result) -> Optional[CellIndex]:
+    """Cached index for a notebook, rescanned if the file changed."""
+    key = os.path.realpath(path)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+    if index is not None and index.is_current(st) and index.size == len(data):
+        return index
+
+    index = CellIndex.scan(data, st.st_mtime_ns)
+    if index is not None:
+        _cache_index(key, index)
+    return index
+
+
+class NotebookDocument:
+    """
+    A notebook being edited: untouched cells stay as byte spans of the file.
+
+    Raises json.JSONDecodeError from open() if the file is not JSON and
+    ValueError if it is not a notebook with a list of cell objects.
+
+    Example:
+        ```python
+        document = NotebookDocument.open(path)
+        position = document.find("cell1")
+        document.set_source(position, ["print('hi')"])
+        document.save()
+        ```
+    """
+
+    def __init__(self, path: str, data: bytes, index: CellIndex):
+        self.path = path
+        self._data = data
+        self._index = index
+        # int: original cell number (raw bytes reused); dict: decoded cell
+        self._cells: List[Union[int, Dict[str, Any]]] = list(range(len(index.spans)))
+        self._ids = list(index.ids)
+        self._types = list(index.types)
+        self._positions: Optional[Dict[str, int]] = None
+        self._sidecars: List[Path] = []  # files created by _externalize
+
+    @classmethod
+    def open(cls, path: str) -> "NotebookDocument":
+        """Read and index a notebook."""
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            data = f.read()
+        index = get_cell_index(path, data, st)
+        if index is None:
+            notebook = loads(data)  # raises for invalid JSON
+            if not isinstance(notebook, dict) or "cells" not in notebook:
+                raise ValueError("missing 'cells' key")
+            raise ValueError("'cells' must be a list of cell objects")
+        return cls(path, data, index)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def find(self, cell_id: Optional[str]) -> Optional[int]:
+        """Position of the first cell with this id, or None."""
+        if not cell_id:
+            return None
+        if self._positions is None:
+            positions: Dict[str, int] = {}
+            for position, id_ in enumerate(self._ids):
+                if id_ is not None and id_ not in positions:
+                    positions[id_] = position
+            self._positions = positions
+        return self._positions.get(cell_id)
+
+    def cell(self, position: int) -> Dict[str, Any]:
+        """The decoded cell (decoding it on first access)."""
+        cell = self._cells[position]
+        if isinstance(cell, int):
+            start, end = self._index.spans[cell]
+            cell = loads(self._data[start:end])
+            self._cells[position] = cell
+        return cell
+
+    def cell_type(self, position: int) -> Optional[str]:
+        """A cell's type, without decoding untouched cells."""
+        cell = self._cells[position]
+        if isinstance(cell, int):
+            return self._types[position]
+        return cell.get("cell_type")
+
+    def set_source(self, position: int, source: List[str]) -> None:
+        """Replace a cell's source lines."""
+        self.cell(position)["source"] = source
+
+    def insert(self, position: int, cell: Dict[str, Any]) -> None:
+        """Insert a new cell before position."""
+        self._cells.insert(position, cell)
+        self._ids.insert(position, cell.get("id"))
+        self._types.insert(position, cell.get("cell_type"))
+        self._positions = None
+
+    def delete(self, position: int) -> Optional[str]:
+        """Remove a cell and return its type."""
+        cell_type = self.cell_type(position)
+        del self._cells[position]
+        del self._ids[position]
+        del self._types[position]
+        self._positions = None
+        return cell_type
+
+    def limit_outputs(
+        self, max_bytes: int, mode: str, directory: Optional[Path] = None
+    ) -> Dict[str, int]:
+        """
+        Strip or externalize outputs whose JSON encoding exceeds max_bytes.
+
+        Args:
+            max_bytes: Largest output kept in the notebook
+            mode: "strip" drops the output; "externalize" writes it to
+                directory and leaves a display_data pointing at the file
+            directory: Sidecar directory for externalized outputs
+
+        Returns:
+            Dict with outputs (count) and bytes removed from the notebook
+        """
+        removed = {"outputs": 0, "bytes": 0}
+        try:
+            self._limit_outputs(max_bytes, mode, directory, removed)
+        except BaseException:
+            self._remove_sidecars()
+            raise
+        return removed
+
+    def _limit_outputs(
+        self, max_bytes: int, mode: str, directory: Optional[Path], removed: Dict[str, int]
+    ) -> None:
+        spans = self._index.spans
+        for position, cell in enumerate(self._cells):
+            if isinstance(cell, int):
+                start, end = spans[cell]
+                if end - start <= max_bytes:
+                    continue  # no output in it can be larger
+            outputs = self.cell(position).get("outputs")
+            if not isinstance(outputs, list):
+                continue
+
+            kept = []
+            for number, output in enumerate(outputs):
+                encoded = dumps(output)
+                if len(encoded) <= max_bytes:
+                    kept.append(output)
+                    continue
+                removed["outputs"] += 1
+                removed["bytes"] += len(encoded)
+                if mode == "externalize":
+                    kept.append(self._externalize(position, number, encoded, directory))
+
+            if len(kept) != len(outputs) or any(a is not b for a, b in zip(kept, outputs)):
+                self._cells[position]["outputs"] = kept
+            elif isinstance(cell, int):
+                self._cells[position] = cell  # unchanged: keep the original bytes
+
+    def _externalize(
+        self, position: int, number: int, encoded: bytes, directory: Optional[Path]
+    ) -> Dict[str, Any]:
+        """Write one output to the sidecar directory and return its placeholder."""
+        directory = directory or sidecar_dir(self.path)
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f"{self._ids[position] or f'cell{position}'}-{number}.json"
+        target = directory / name
+        if not target.exists():
+            self._sidecars.append(target)
+        atomic_write(str(target), [encoded])
+        relative = os.path.relpath(target, os.path.dirname(os.path.abspath(self.path)))
+        return {
+            "output_type": "display_data",
+            "data": {"text/plain": [f"[{len(encoded)} byte output saved to {relative}]"]},
+            "metadata": {"externalized_output": relative},
+        }
+
+    def save(self) -> None:
+        """Write the notebook atomically and cache the written file's index."""
+        try:
+            chunks, index = self._render()
+            atomic_write(self.path, chunks)
+        except BaseException:
+            self._remove_sidecars()
+            raise
+        self._sidecars = []
+        st = os.stat(self.path)
+        index.mtime_ns = st.st_mtime_ns
+        if index.size == st.st_size:
+            _cache_index(os.path.realpath(self.path), index)
+
+    def _remove_sidecars(self) -> None:
+        """Delete sidecar files the failed save would have referenced."""
+        for target in self._sidecars:
+            try:
+                target.unlink()
+            except FileNotFoundError:
+                pass
+        self._sidecars = []
+
+    def _render(self) -> Tuple[List[Chunk], CellIndex]:
+        """Chunks of the edited file and its cell index."""
+        original = self._index
+        view = memoryview(self._data)
+        spans = original.spans
+        indent = original.indent
+        if spans:
+            lead = view[original.cells_open + 1 : spans[0][0]]
+            trail = view[spans[-1][1] : original.cells_close]
+        elif indent is not None:
+            lead = ("\n" + indent * 2).encode("ascii")
+            trail = ("\n" + indent).encode("ascii")
+        else:
+            lead = trail = b""
+        if len(spans) > 1:
+            separator: Chunk = view[spans[0][1] : spans[1][0]]
+        else:
+            separator = b"," + bytes(lead) if indent is not None else b", "
+        cell_indent = "\n" + bytes(lead).rpartition(b"\n")[2].decode("ascii", "replace")
+
+        chunks: List[Chunk] = [view[: original.cells_open + 1]]
+        offset = original.cells_open + 1
+        new_spans: List[Tuple[int, int]] = []
+        previous: Optional[int] = None
+        for position, cell in enumerate(self._cells):
+            if position == 0:
+                gap: Chunk = lead
+            elif isinstance(cell, int) and previous is not None and cell == previous + 1:
+                gap = view[spans[previous][1] : spans[cell][0]]
+            else:
+                gap = separator
+            if isinstance(cell, int):
+                start, end = spans[cell]
+                body: Chunk = view[start:end]
+                previous = cell
+            else:
+                text = json.dumps(cell, indent=indent, ensure_ascii=False)
+                if indent is not None:
+                    text = text.replace("\n", cell_indent)
+                body = text.encode("utf-8")
+                previous = None
+            chunks.append(gap)
+            offset += len(gap)
+            chunks.append(body)
+            new_spans.append((offset, offset + len(body)))
+            offset += len(body)
+        if self._cells:
+            chunks.append(trail)
+            offset += len(trail)
+        chunks.append(view[original.cells_close :])
+
+        index = CellIndex(
+            size=offset + len(self._data) - original.cells_close,
+            mtime_ns=0,
+            cells_open=original.cells_open,
+            cells_close=offset,
+            spans=new_spans,
+            ids=list(self._ids),
+            types=[self.cell_type(position) for position in range(len(self._cells))],
+            indent=indent,
+        )
+        return chunks, index
+
+
+def sidecar_dir(notebook_path: str) -> Path:
+    """Directory externalized outputs of a notebook are written to (<stem>_outputs)."""
+    path = Path(notebook_path)
+    return path.with_name(f"{path.stem}_outputs")
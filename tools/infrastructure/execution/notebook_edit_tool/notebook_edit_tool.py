@@ -4,12 +4,21 @@ Edit Jupyter notebook (.ipynb) cells by replacing, inserting, or deleting
 
 import json
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import Field
 
 from shared.base import BaseTool
 from shared.errors import APIError, ValidationError
+from tools.infrastructure.execution.notebook_edit_tool.notebook_document import (
+    NotebookDocument,
+    sidecar_dir,
+)
+
+# Default size above which large_outputs strips or externalizes an output
+DEFAULT_MAX_OUTPUT_BYTES = 1024 * 1024
+
+EDIT_KEYS = ("edit_mode", "cell_id", "new_source", "cell_type")
 
 
 class NotebookEditTool(BaseTool):
@@ -22,11 +31,22 @@ class NotebookEditTool(BaseTool):
         new_source: New source code or markdown for the cell
         cell_type: Cell type: code or markdown
         edit_mode: Edit mode: replace, insert, or delete
+        edits: Batch of edits (dicts with edit_mode, cell_id, new_source,
+            cell_type) applied in order with a single read and write; used
+            instead of the single-edit arguments
+        large_outputs: What to do with outputs over max_output_bytes: keep,
+            strip, or externalize (saved to <notebook>_outputs/ beside it)
+        max_output_bytes: Size limit for large_outputs
+
+    Only the cells an edit touches are decoded and re-serialized; the rest of
+    the file is copied as-is.
 
     Returns:
         Dict containing:
         - success: Boolean indicating success
-        - result: Tool-specific results (edit_mode, cell_id, cell_type, cells_count, notebook_path)
+        - result: Tool-specific results (edit_mode, cell_id, cell_type, cells_count,
+          notebook_path; edits_applied and edits for a batch; outputs_removed and
+          output_bytes_removed when large outputs are stripped or externalized)
         - metadata: Additional information
 
     Example:
@@ -37,6 +57,15 @@ class NotebookEditTool(BaseTool):
         ...     edit_mode="replace"
         ... )
         >>> result = tool.run()
+
+        >>> tool = NotebookEditTool(
+        ...     notebook_path="/path/to/notebook.ipynb",
+        ...     edits=[
+        ...         {"cell_id": "cell1", "new_source": "x = 1"},
+        ...         {"cell_id": "cell2", "edit_mode": "delete"},
+        ...     ],
+        ...     large_outputs="externalize",
+        ... )
     """
 
     # Tool metadata
@@ -52,6 +81,19 @@ class NotebookEditTool(BaseTool):
     new_source: str = Field("", description="New source code or markdown for the cell")
     cell_type: Optional[str] = Field(None, description="Cell type: code or markdown")
     edit_mode: str = Field("replace", description="Edit mode: replace, insert, or delete")
+    edits: Optional[List[Dict[str, Any]]] = Field(
+        None,
+        description="Edits applied in order in one load/save, each with edit_mode, cell_id, "
+        "new_source and cell_type; replaces the single-edit parameters",
+    )
+    large_outputs: str = Field(
+        "keep",
+        description="Outputs larger than max_output_bytes: keep, strip, or externalize "
+        "(written to <notebook>_outputs/ and replaced by a pointer)",
+    )
+    max_output_bytes: int = Field(
+        DEFAULT_MAX_OUTPUT_BYTES, ge=0, description="Size limit for large_outputs"
+    )
 
     def _execute(self) -> Dict[str, Any]:
         """
@@ -128,31 +170,94 @@ class NotebookEditTool(BaseTool):
                 details={"notebook_path": self.notebook_path},
             )
 
+        valid_output_modes = ["keep", "strip", "externalize"]
+        if self.large_outputs not in valid_output_modes:
+            raise ValidationError(
+                f"Invalid large_outputs: {self.large_outputs}. "
+                f"Must be one of: {valid_output_modes}",
+                tool_name=self.tool_name,
+                details={"large_outputs": self.large_outputs, "valid_modes": valid_output_modes},
+            )
+
+        if self.edits is None:
+            self._validate_edit(self.edit_mode, self.cell_id, self.new_source, self.cell_type)
+            return
+
+        if self.cell_id or self.new_source or self.cell_type or self.edit_mode != "replace":
+            raise ValidationError(
+                "Pass either edits or cell_id/new_source/cell_type/edit_mode, not both",
+                tool_name=self.tool_name,
+            )
+        if not self.edits and self.large_outputs == "keep":
+            raise ValidationError(
+                "edits is empty and large_outputs is 'keep': nothing to do",
+                tool_name=self.tool_name,
+            )
+        for i, edit in enumerate(self.edits):
+            unknown = sorted(set(edit) - set(EDIT_KEYS))
+            if unknown:
+                raise ValidationError(
+                    f"Edit {i} has unknown keys: {unknown}",
+                    tool_name=self.tool_name,
+                    details={"edit_index": i, "valid_keys": list(EDIT_KEYS)},
+                )
+            for key in EDIT_KEYS:
+                value = edit.get(key)
+                if value is not None and not isinstance(value, str):
+                    raise ValidationError(
+                        f"Edit {i}: {key} must be a string",
+                        tool_name=self.tool_name,
+                        details={"edit_index": i, "key": key},
+                    )
+            self._validate_edit(
+                edit.get("edit_mode") or "replace",
+                edit.get("cell_id"),
+                edit.get("new_source") or "",
+                edit.get("cell_type"),
+            )
+
+    def _validate_edit(
+        self, edit_mode: str, cell_id: Optional[str], new_source: str, cell_type: Optional[str]
+    ) -> None:
+        """
+        Validate one edit.
+
+        Raises:
+            ValidationError: If the edit is invalid
+        """
         # Validate edit_mode
         valid_modes = ["replace", "insert", "delete"]
-        if self.edit_mode not in valid_modes:
+        if edit_mode not in valid_modes:
             raise ValidationError(
-                f"Invalid edit_mode: {self.edit_mode}. Must be one of: {valid_modes}",
+                f"Invalid edit_mode: {edit_mode}. Must be one of: {valid_modes}",
                 tool_name=self.tool_name,
-                details={"edit_mode": self.edit_mode, "valid_modes": valid_modes},
+                details={"edit_mode": edit_mode, "valid_modes": valid_modes},
             )
 
         # Validate cell_type if provided
-        if self.cell_type:
+        if cell_type:
             valid_types = ["code", "markdown"]
-            if self.cell_type not in valid_types:
+            if cell_type not in valid_types:
                 raise ValidationError(
-                    f"Invalid cell_type: {self.cell_type}. Must be one of: {valid_types}",
+                    f"Invalid cell_type: {cell_type}. Must be one of: {valid_types}",
                     tool_name=self.tool_name,
-                    details={"cell_type": self.cell_type, "valid_types": valid_types},
+                    details={"cell_type": cell_type, "valid_types": valid_types},
                 )
 
         # Validate new_source is provided for replace and insert modes
-        if self.edit_mode in ["replace", "insert"] and not self.new_source:
+        if edit_mode in ["replace", "insert"] and not new_source:
             raise ValidationError(
-                f"new_source is required for {self.edit_mode} mode",
+                f"new_source is required for {edit_mode} mode",
                 tool_name=self.tool_name,
-                details={"edit_mode": self.edit_mode},
+                details={"edit_mode": edit_mode},
+            )
+
+        # Validate cell_id is provided for delete mode
+        if edit_mode == "delete" and not cell_id:
+            raise ValidationError(
+                "cell_id is required for delete mode",
+                tool_name=self.tool_name,
+                details={"edit_mode": edit_mode},
             )
 
     def _should_use_mock(self) -> bool:
@@ -182,6 +287,9 @@ class NotebookEditTool(BaseTool):
         """
         Main processing logic: Edit Jupyter notebook cells.
 
+        All edits are applied in memory before the notebook is written, so a
+        failing edit leaves the file unchanged.
+
         Returns:
             Dict with edit result
 
@@ -190,117 +298,110 @@ class NotebookEditTool(BaseTool):
             ValidationError: If cell_id not found or invalid notebook structure
         """
         try:
-            # Load notebook
-            with open(self.notebook_path, "r", encoding="utf-8") as f:
-                notebook = json.load(f)
+            document = NotebookDocument.open(self.notebook_path)
         except json.JSONDecodeError as e:
             raise APIError(f"Failed to parse notebook JSON: {e}", tool_name=self.tool_name)
-        except IOError as e:
-            raise APIError(f"Failed to read/write notebook file: {e}", tool_name=self.tool_name)
-
-        # Validate notebook structure
-        if "cells" not in notebook:
+        except ValueError as e:
             raise ValidationError(
-                "Invalid notebook structure: missing 'cells' key",
+                f"Invalid notebook structure: {e}",
                 tool_name=self.tool_name,
                 details={"notebook_path": self.notebook_path},
             )
+        except IOError as e:
+            raise APIError(f"Failed to read/write notebook file: {e}", tool_name=self.tool_name)
 
-        cells = notebook["cells"]
-
-        # Perform edit based on mode
-        if self.edit_mode == "replace":
-            cell_index = self._find_cell_by_id(cells, self.cell_id)
-            if cell_index is None:
-                raise ValidationError(
-                    f"Cell with id '{self.cell_id}' not found",
-                    tool_name=self.tool_name,
-                    details={"cell_id": self.cell_id},
-                )
-
-            # Replace cell source
-            cells[cell_index]["source"] = self._format_source(self.new_source)
-            result_cell_id = self.cell_id
-            result_cell_type = cells[cell_index]["cell_type"]
-
-        elif self.edit_mode == "insert":
-            # Determine cell type (use provided or default to code)
-            cell_type = self.cell_type or "code"
-
-            # Create new cell
-            new_cell = self._create_cell(cell_type, self.new_source)
-
-            # Find insert position
-            if self.cell_id:
-                cell_index = self._find_cell_by_id(cells, self.cell_id)
-                if cell_index is None:
-                    raise ValidationError(
-                        f"Cell with id '{self.cell_id}' not found",
-                        tool_name=self.tool_name,
-                        details={"cell_id": self.cell_id},
-                    )
-                insert_position = cell_index + 1
-            else:
-                # Insert at beginning if no cell_id provided
-                insert_position = 0
-
-            cells.insert(insert_position, new_cell)
-            result_cell_id = new_cell["id"]
-            result_cell_type = cell_type
-
-        elif self.edit_mode == "delete":
-            if not self.cell_id:
-                raise ValidationError(
-                    "cell_id is required for delete mode",
-                    tool_name=self.tool_name,
-                    details={"edit_mode": self.edit_mode},
-                )
-
-            cell_index = self._find_cell_by_id(cells, self.cell_id)
-            if cell_index is None:
-                raise ValidationError(
-                    f"Cell with id '{self.cell_id}' not found",
-                    tool_name=self.tool_name,
-                    details={"cell_id": self.cell_id},
-                )
-
-            deleted_cell = cells.pop(cell_index)
-            result_cell_id = self.cell_id
-            result_cell_type = deleted_cell["cell_type"]
+        if self.edits is None:
+            edits = [
+                {
+                    "edit_mode": self.edit_mode,
+                    "cell_id": self.cell_id,
+                    "new_source": self.new_source,
+                    "cell_type": self.cell_type,
+                }
+            ]
+        else:
+            edits = self.edits
+        applied = [
+            self._apply_edit(
+                document,
+                edit.get("edit_mode") or "replace",
+                edit.get("cell_id"),
+                edit.get("new_source") or "",
+                edit.get("cell_type"),
+            )
+            for edit in edits
+        ]
 
-        # Save modified notebook
+        removed = None
         try:
-            with open(self.notebook_path, "w", encoding="utf-8") as f:
-                json.dump(notebook, f, indent=1)
+            if self.large_outputs != "keep":
+                removed = document.limit_outputs(
+                    self.max_output_bytes,
+                    self.large_outputs,
+                    sidecar_dir(self.notebook_path),
+                )
+            # Save modified notebook
+            document.save()
         except IOError as e:
             raise APIError(f"Failed to write notebook file: {e}", tool_name=self.tool_name)
 
-        return {
-            "edit_mode": self.edit_mode,
-            "cell_id": result_cell_id,
-            "cell_type": result_cell_type,
-            "cells_count": len(cells),
-            "notebook_path": self.notebook_path,
-        }
-
-    def _find_cell_by_id(self, cells: list, cell_id: str) -> Optional[int]:
+        if self.edits is None:
+            result: Dict[str, Any] = dict(applied[0])
+        else:
+            result = {"edits_applied": len(applied), "edits": applied}
+        result["cells_count"] = len(document)
+        result["notebook_path"] = self.notebook_path
+        if removed is not None:
+            result["outputs_removed"] = removed["outputs"]
+            result["output_bytes_removed"] = removed["bytes"]
+        return result
+
+    def _apply_edit(
+        self,
+        document: NotebookDocument,
+        edit_mode: str,
+        cell_id: Optional[str],
+        new_source: str,
+        cell_type: Optional[str],
+    ) -> Dict[str, Any]:
         """
-        Find cell index by cell ID.
-
-        Args:
-            cells: List of notebook cells
-            cell_id: Cell ID to find
+        Apply one edit to the document.
 
         Returns:
-            Cell index or None if not found
+            Dict with edit_mode, cell_id and cell_type of the edited cell
+
+        Raises:
+            ValidationError: If cell_id is not found
         """
-        if not cell_id:
-            return None
+        cell_index = document.find(cell_id)
+        if cell_index is None and (edit_mode != "insert" or cell_id):
+            raise ValidationError(
+                f"Cell with id '{cell_id}' not found",
+                tool_name=self.tool_name,
+                details={"cell_id": cell_id},
+            )
+
+        if edit_mode == "replace":
+            # Replace cell source
+            document.set_source(cell_index, self._format_source(new_source))
+            result_cell_id = cell_id
+            result_cell_type = document.cell_type(cell_index)
+
+        elif edit_mode == "insert":
+            # Determine cell type (use provided or default to code)
+            result_cell_type = cell_type or "code"
+            new_cell = self._create_cell(result_cell_type, new_source)
+
+            # Insert after cell_id, or at the beginning if no cell_id provided
+            insert_position = 0 if cell_index is None else cell_index + 1
+            document.insert(insert_position, new_cell)
+            result_cell_id = new_cell["id"]
+
+        else:
+            result_cell_id = cell_id
+            result_cell_type = document.delete(cell_index)
 
-        for i, cell in enumerate(cells):
-            if cell.get("id") == cell_id:
-                return i
-        return None
+        return {"edit_mode": edit_mode, "cell_id": result_cell_id, "cell_type": result_cell_type}
 
     def _format_source(self, source: str) -> list:
         """
@@ -4,12 +4,15 @@ Comprehensive tests for NotebookEditTool
 
 import json
 import os
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from shared.errors import ValidationError
+from shared.errors import APIError, ValidationError
+from tools.infrastructure.execution.notebook_edit_tool import notebook_document
 from tools.infrastructure.execution.notebook_edit_tool.notebook_edit_tool import (
     NotebookEditTool,
 )
@@ -567,6 +570,175 @@ class TestNotebookEditToolEdgeCases:
             assert new_cell_id in cell_ids
 
 
+class TestNotebookEditToolBatch:
+    """Tests for batched edits"""
+
+    def test_batch_applies_edits_in_order(self, temp_notebook):
+        """Test that edits apply in order in one save"""
+        tool = NotebookEditTool(
+            notebook_path=temp_notebook,
+            edits=[
+                {"cell_id": "cell1", "new_source": "a = 1"},
+                {"cell_id": "cell2", "edit_mode": "delete"},
+                {
+                    "cell_id": "cell3",
+                    "new_source": "# Notes",
+                    "edit_mode": "insert",
+                    "cell_type": "markdown",
+                },
+            ],
+        )
+        result = tool.run()
+
+        assert result["success"] is True
+        assert result["result"]["edits_applied"] == 3
+        assert result["result"]["cells_count"] == 3
+        assert [e["cell_type"] for e in result["result"]["edits"]] == [
+            "code",
+            "markdown",
+            "markdown",
+        ]
+
+        with open(temp_notebook) as f:
+            cells = json.load(f)["cells"]
+        assert [c["id"] for c in cells[:2]] == ["cell1", "cell3"]
+        assert cells[0]["source"] == ["a = 1"]
+        assert cells[2]["id"] == result["result"]["edits"][2]["cell_id"]
+        assert cells[2]["source"] == ["# Notes"]
+
+    def test_failing_edit_leaves_notebook_unchanged(self, temp_notebook):
+        """Test that a batch is all-or-nothing"""
+        with open(temp_notebook, "rb") as f:
+            original = f.read()
+
+        tool = NotebookEditTool(
+            notebook_path=temp_notebook,
+            edits=[
+                {"cell_id": "cell1", "new_source": "a = 1"},
+                {"cell_id": "missing", "new_source": "b = 2"},
+            ],
+        )
+        with pytest.raises(ValidationError):
+            tool.run()
+
+        with open(temp_notebook, "rb") as f:
+            assert f.read() == original
+
+    def test_edits_with_single_edit_parameters_fails(self, temp_notebook):
+        """Test that edits cannot be combined with cell_id/new_source"""
+        tool = NotebookEditTool(
+            notebook_path=temp_notebook,
+            cell_id="cell1",
+            new_source="x",
+            edits=[{"cell_id": "cell1", "new_source": "y"}],
+        )
+        with pytest.raises(ValidationError):
+            tool.run()
+
+    def test_edit_with_unknown_key_fails(self, temp_notebook):
+        """Test validation of edit keys"""
+        tool = NotebookEditTool(
+            notebook_path=temp_notebook, edits=[{"cell_id": "cell1", "source": "y"}]
+        )
+        with pytest.raises(ValidationError):
+            tool.run()
+
+    def test_untouched_cells_keep_their_bytes(self, tmp_path, sample_notebook):
+        """Test that only edited cells are re-serialized"""
+        sample_notebook["cells"][2]["metadata"] = {"tags": ["ünïcode"]}
+        path = tmp_path / "nb.ipynb"
+        path.write_text(json.dumps(sample_notebook, indent=1, ensure_ascii=False))
+
+        for source in ("first", "second"):  # second edit uses the cached cell index
+            NotebookEditTool(notebook_path=str(path), cell_id="cell2", new_source=source).run()
+            sample_notebook["cells"][1]["source"] = [source]
+            assert path.read_text() == json.dumps(sample_notebook, indent=1, ensure_ascii=False)
+
+
+class TestNotebookEditToolLargeOutputs:
+    """Tests for stripping and externalizing large outputs"""
+
+    @pytest.fixture
+    def output_notebook(self, tmp_path, sample_notebook):
+        """Notebook with one large and one small output"""
+        sample_notebook["cells"][0]["outputs"] = [
+            {"output_type": "stream", "name": "stdout", "text": ["x" * 5000]},
+            {"output_type": "stream", "name": "stdout", "text": ["ok"]},
+        ]
+        path = tmp_path / "outputs.ipynb"
+        path.write_text(json.dumps(sample_notebook, indent=1))
+        return path
+
+    def test_strip_large_outputs(self, output_notebook):
+        """Test that outputs over the limit are removed"""
+        tool = NotebookEditTool(
+            notebook_path=str(output_notebook),
+            edits=[],
+            large_outputs="strip",
+            max_output_bytes=1000,
+        )
+        result = tool.run()
+
+        assert result["result"]["outputs_removed"] == 1
+        assert result["result"]["output_bytes_removed"] > 5000
+        cells = json.loads(output_notebook.read_text())["cells"]
+        assert cells[0]["outputs"] == [{"output_type": "stream", "name": "stdout", "text": ["ok"]}]
+
+    def test_externalize_large_outputs(self, output_notebook):
+        """Test that outputs over the limit move to a sidecar file"""
+        tool = NotebookEditTool(
+            notebook_path=str(output_notebook),
+            cell_id="cell3",
+            new_source="y = 1",
+            large_outputs="externalize",
+            max_output_bytes=1000,
+        )
+        result = tool.run()
+
+        assert result["result"]["cell_id"] == "cell3"
+        assert result["result"]["outputs_removed"] == 1
+        placeholder = json.loads(output_notebook.read_text())["cells"][0]["outputs"][0]
+        saved = output_notebook.parent / placeholder["metadata"]["externalized_output"]
+        assert saved.parent.name == "outputs_outputs"
+        assert json.loads(saved.read_text())["text"] == ["x" * 5000]
+
+    def test_failed_save_removes_sidecars(self, output_notebook, monkeypatch):
+        """Test that sidecar files are removed when the notebook cannot be written"""
+        write = notebook_document.atomic_write
+
+        def failing_write(path, chunks):
+            if path.endswith(".ipynb"):
+                raise OSError("disk full")
+            write(path, chunks)
+
+        monkeypatch.setattr(notebook_document, "atomic_write", failing_write)
+        before = output_notebook.read_bytes()
+        tool = NotebookEditTool(
+            notebook_path=str(output_notebook),
+            edits=[],
+            large_outputs="externalize",
+            max_output_bytes=1000,
+        )
+        tool.retry_delay = 0
+        with pytest.raises(APIError):
+            tool.run()
+
+        assert output_notebook.read_bytes() == before
+        assert list((output_notebook.parent / "outputs_outputs").iterdir()) == []
+
+    def test_invalid_large_outputs_fails(self, output_notebook):
+        """Test validation of large_outputs"""
+        tool = NotebookEditTool(notebook_path=str(output_notebook), edits=[], large_outputs="drop")
+        with pytest.raises(ValidationError):
+            tool.run()
+
+    def test_empty_edits_without_output_handling_fails(self, output_notebook):
+        """Test that a no-op request is rejected"""
+        tool = NotebookEditTool(notebook_path=str(output_notebook), edits=[])
+        with pytest.raises(ValidationError):
+            tool.run()
+
+
 class TestNotebookEditToolMockMode:
     """Tests for mock mode"""
 
@@ -622,5 +794,71 @@ class TestNotebookEditToolMockMode:
         assert result["result"]["edit_mode"] == "delete"
 
 
+class TestCellIndexCache:
+    """Tests for the cached cell index"""
+
+    def test_recently_modified_notebook_not_cached(self, temp_notebook):
+        """Test that a file in the racy window is rescanned on every open"""
+        key = os.path.realpath(temp_notebook)
+        notebook_document.NotebookDocument.open(temp_notebook)
+        assert key not in notebook_document._indexes
+
+        old = os.stat(temp_notebook).st_mtime_ns - 2 * notebook_document.RACY_WINDOW_NS
+        os.utime(temp_notebook, ns=(old, old))
+        document = notebook_document.NotebookDocument.open(temp_notebook)
+        assert notebook_document._indexes[key] is document._index
+
+    def test_same_tick_rewrite_is_seen(self, temp_notebook):
+        """Test that a same-size rewrite keeping the mtime does not reuse stale spans"""
+        NotebookEditTool(notebook_path=temp_notebook, cell_id="cell1", new_source="a = 1").run()
+        st = os.stat(temp_notebook)
+        text = Path(temp_notebook).read_text()
+        Path(temp_notebook).write_text(text.replace('"cell2"', '"cell9"'))
+        os.utime(temp_notebook, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        NotebookEditTool(notebook_path=temp_notebook, cell_id="cell9", new_source="b = 2").run()
+
+        cells = json.loads(Path(temp_notebook).read_text())["cells"]
+        assert cells[1]["id"] == "cell9"
+        assert cells[1]["source"] == ["b = 2"]
+
+
+class TestNotebookEditToolLoading:
+    """The tool imports its helper module; it must load the ways callers load it"""
+
+    ROOT = Path(__file__).resolve().parents[4]
+
+    def run_python(self, *args, **env):
+        return subprocess.run(
+            [sys.executable, *args],
+            cwd=self.ROOT,
+            env={**os.environ, "PYTHONPATH": str(self.ROOT), **env},
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+    def test_loads_through_registry(self, tmp_path):
+        """Test a fresh interpreter loads the tool through the tool index"""
+        code = (
+            "from shared.registry import tool_registry\n"
+            f"tool_registry.discover_tools(index_path={str(tmp_path / 'index.json')!r})\n"
+            "print(tool_registry.get_tool('notebook_edit_tool').__name__)\n"
+        )
+        result = self.run_python("-c", code)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "NotebookEditTool"
+
+    def test_runs_as_script(self):
+        """Test the module's __main__ self-test runs as a script"""
+        result = self.run_python(
+            str(Path(__file__).with_name("notebook_edit_tool.py")),
+            USE_MOCK_APIS="false",
+            DISABLE_RATE_LIMITING="true",
+        )
+        assert result.returncode == 0, result.stderr
+        assert "All tests passed" in result.stdout
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -2,13 +2,18 @@
 Read files from sandboxed environment with line numbers
 """
 
+import mmap
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import Field
 
 from shared.base import BaseTool
 from shared.errors import APIError, ValidationError
+from shared.line_index import get_line_index, read_lines
+
+# Default cap on the bytes of file content returned by one read
+DEFAULT_MAX_BYTES = 256 * 1024
 
 
 class ReadTool(BaseTool):
@@ -17,16 +22,25 @@ class ReadTool(BaseTool):
 
     Args:
         file_path: Path to the file to read
+        offset: 1-based line to start reading from
+        limit: Maximum number of lines to return
+        tail: Return the last N lines instead
+        byte_offset: Start at the line containing this byte offset instead
+        byte_length: With byte_offset, stop at the line containing the last byte
+        max_bytes: Maximum bytes of content to return; the read stops at a line boundary
 
     Returns:
         Dict containing:
         - success: Boolean indicating success
         - result: Tool-specific results (file content with line numbers)
-        - metadata: Additional information
+        - metadata: Additional information, including the line range returned,
+          the file's line count and whether max_bytes truncated the read
 
     Example:
         >>> tool = ReadTool(file_path="/tmp/example.txt")
         >>> result = tool.run()
+        >>> tool = ReadTool(file_path="/var/log/app.log", offset=5000000, limit=50)
+        >>> result = tool.run()
     """
 
     # Tool metadata
@@ -36,6 +50,18 @@ class ReadTool(BaseTool):
 
     # Parameters
     file_path: str = Field(..., description="Path to the file to read", min_length=1)
+    offset: Optional[int] = Field(None, description="1-based line to start reading from", ge=1)
+    limit: Optional[int] = Field(None, description="Maximum number of lines to return", ge=1)
+    tail: Optional[int] = Field(None, description="Return the last N lines of the file", ge=1)
+    byte_offset: Optional[int] = Field(
+        None, description="Start at the line containing this byte offset", ge=0
+    )
+    byte_length: Optional[int] = Field(
+        None, description="With byte_offset, bytes to cover (whole lines are returned)", ge=1
+    )
+    max_bytes: int = Field(
+        DEFAULT_MAX_BYTES, description="Maximum bytes of file content to return", ge=1
+    )
 
     def _execute(self) -> Dict[str, Any]:
         """
@@ -61,13 +87,13 @@ class ReadTool(BaseTool):
 
         # 3. EXECUTE
         try:
-            result = self._process()
+            result, read_range = self._process()
             self._logger.info(f"Successfully completed {self.tool_name}")
 
             return {
                 "success": True,
                 "result": result,
-                "metadata": {"tool_name": self.tool_name, "path": self.file_path},
+                "metadata": {"tool_name": self.tool_name, "path": self.file_path, **read_range},
             }
         except Exception as e:
             self._logger.error(f"Error in {self.tool_name}: {str(e)}", exc_info=True)
@@ -95,6 +121,27 @@ class ReadTool(BaseTool):
                 details={"file_path": self.file_path},
             )
 
+        if self.tail is not None and (self.offset is not None or self.byte_offset is not None):
+            raise ValidationError(
+                "tail cannot be combined with offset or byte_offset",
+                tool_name=self.tool_name,
+                details={"tail": self.tail, "offset": self.offset, "byte_offset": self.byte_offset},
+            )
+
+        if self.offset is not None and self.byte_offset is not None:
+            raise ValidationError(
+                "offset and byte_offset are mutually exclusive",
+                tool_name=self.tool_name,
+                details={"offset": self.offset, "byte_offset": self.byte_offset},
+            )
+
+        if self.byte_length is not None and self.byte_offset is None:
+            raise ValidationError(
+                "byte_length requires byte_offset",
+                tool_name=self.tool_name,
+                details={"byte_length": self.byte_length},
+            )
+
     def _should_use_mock(self) -> bool:
         """Check if mock mode enabled."""
         return os.getenv("USE_MOCK_APIS", "false").lower() == "true"
@@ -108,14 +155,16 @@ class ReadTool(BaseTool):
             "metadata": {"mock_mode": True, "tool_name": self.tool_name},
         }
 
-    def _process(self) -> List[str]:
+    def _process(self) -> Tuple[List[str], Dict[str, Any]]:
         """
         Main processing logic.
 
-        Reads a file and returns its contents with line numbers.
+        Maps the file and returns the requested lines with line numbers. The
+        lines are located with a sparse line-offset index (cached per file),
+        so a range deep into a large file is read without scanning up to it.
 
         Returns:
-            List of strings with line numbers
+            Tuple of (list of strings with line numbers, read range metadata)
 
         Raises:
             APIError: If file cannot be opened or read
@@ -129,17 +178,52 @@ class ReadTool(BaseTool):
             raise APIError(f"Not a file: {path}", tool_name=self.tool_name)
 
         try:
-            lines_with_numbers: List[str] = []
-            with open(path, "r", encoding="utf-8") as f:
-                for idx, line in enumerate(f, start=1):
-                    lines_with_numbers.append(f"{idx}: {line.rstrip()}")
-
-            return lines_with_numbers
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if st.st_size == 0:
+                    return [], self._read_range(1, 0, 0, False)
+
+                with mmap.mmap(f.fileno(), st.st_size, access=mmap.ACCESS_READ) as mm:
+                    index = get_line_index(path, mm, st)
+                    end = None
+                    limit = self.limit
+                    if self.byte_offset is not None:
+                        offset = min(self.byte_offset, st.st_size)
+                        first_line, start = index.line_at(mm, offset)
+                        if self.byte_length is not None:
+                            end = offset + self.byte_length
+                    else:
+                        if self.tail is not None:
+                            first_line = max(1, index.total_lines - self.tail + 1)
+                            limit = self.tail
+                        else:
+                            first_line = self.offset or 1
+                        start = index.line_start(mm, first_line)
+
+                    lines, _, truncated = read_lines(mm, start, limit, self.max_bytes, end)
+
+            lines_with_numbers = [
+                f"{idx}: {line}" for idx, line in enumerate(lines, start=first_line)
+            ]
+            return lines_with_numbers, self._read_range(
+                first_line, len(lines), index.total_lines, truncated
+            )
 
         except Exception as e:
             self._logger.error(f"Error in {self.tool_name}: {str(e)}", exc_info=True)
             raise APIError(f"Unable to read file: {e}", tool_name=self.tool_name)
 
+    def _read_range(
+        self, first_line: int, count: int, total_lines: int, truncated: bool
+    ) -> Dict[str, Any]:
+        """Metadata describing which lines were returned."""
+        return {
+            "start_line": first_line,
+            "end_line": first_line + count - 1 if count else None,
+            "total_lines": total_lines,
+            "truncated": truncated,
+        }
+
 
 if __name__ == "__main__":
     print("Testing ReadTool...")
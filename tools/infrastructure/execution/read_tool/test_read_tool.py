@@ -6,8 +6,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pydantic import ValidationError as PydanticValidationError
 
+import shared.line_index as line_index
 from shared.errors import APIError, ValidationError
-from tools.code_execution.read_tool import ReadTool
+from tools.infrastructure.execution.read_tool import ReadTool
 
 
 class TestReadTool:
@@ -33,7 +34,7 @@ class TestReadTool:
         tool = ReadTool(file_path=tmp_file)
         assert tool.file_path == tmp_file
         assert tool.tool_name == "read_tool"
-        assert tool.tool_category == "code_execution"
+        assert tool.tool_category == "infrastructure"
 
     # ========== HAPPY PATH TESTS ==========
 
@@ -82,26 +83,29 @@ class TestReadTool:
 
     def test_directory_traversal_rejected(self):
         tool = ReadTool(file_path="../secret.txt")
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(ValidationError):
+            tool.run()
 
     @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
     def test_file_not_found_raises_api_error(self, tmp_path):
         tool = ReadTool(file_path=str(tmp_path / "nonexistent.txt"))
-        result = tool.run()
-        assert result["success"] is False
+        tool.retry_delay = 0
+        with pytest.raises(APIError, match="File not found"):
+            tool.run()
 
     @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
     def test_input_is_directory_raises_api_error(self, tmp_path):
         tool = ReadTool(file_path=str(tmp_path))
-        result = tool.run()
-        assert result["success"] is False
+        tool.retry_delay = 0
+        with pytest.raises(APIError, match="Not a file"):
+            tool.run()
 
     @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
     def test_process_error_propagates_as_api_error(self, tool):
+        tool.retry_delay = 0
         with patch.object(tool, "_process", side_effect=Exception("boom")):
-            result = tool.run()
-            assert result["success"] is False
+            with pytest.raises(APIError, match="boom"):
+                tool.run()
 
     # ========== EDGE CASES ==========
 
@@ -130,6 +134,70 @@ class TestReadTool:
         result = tool.run()
         assert result["result"] == ["1: @#$%^&*()"]
 
+    # ========== RANGED READ TESTS ==========
+
+    @pytest.fixture
+    def numbered_file(self, tmp_path, monkeypatch):
+        """A 1000-line file indexed in small blocks."""
+        monkeypatch.setattr(line_index, "BLOCK_BYTES", 256)
+        monkeypatch.setattr(line_index, "_indexes", line_index.OrderedDict())
+        p = tmp_path / "numbered.log"
+        p.write_text("".join(f"line {i}\n" for i in range(1, 1001)), encoding="utf-8")
+        return str(p)
+
+    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
+    def test_offset_and_limit(self, numbered_file):
+        result = ReadTool(file_path=numbered_file, offset=750, limit=3).run()
+        assert result["result"] == ["750: line 750", "751: line 751", "752: line 752"]
+        assert result["metadata"]["start_line"] == 750
+        assert result["metadata"]["end_line"] == 752
+        assert result["metadata"]["total_lines"] == 1000
+        assert result["metadata"]["truncated"] is False
+
+    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
+    def test_offset_past_end(self, numbered_file):
+        result = ReadTool(file_path=numbered_file, offset=1001).run()
+        assert result["result"] == []
+        assert result["metadata"]["end_line"] is None
+
+    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
+    def test_tail(self, numbered_file):
+        result = ReadTool(file_path=numbered_file, tail=2).run()
+        assert result["result"] == ["999: line 999", "1000: line 1000"]
+
+    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
+    def test_byte_range_returns_whole_lines(self, numbered_file):
+        # "line 1\n" .. "line 9\n" are 7 bytes each; byte 66 is inside line 10
+        result = ReadTool(file_path=numbered_file, byte_offset=66, byte_length=10).run()
+        assert result["result"] == ["10: line 10", "11: line 11"]
+
+    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
+    def test_max_bytes_truncates_at_line_boundary(self, numbered_file):
+        result = ReadTool(file_path=numbered_file, offset=100, max_bytes=20).run()
+        assert result["result"] == ["100: line 100", "101: line 101"]
+        assert result["metadata"]["truncated"] is True
+
+    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
+    def test_max_bytes_cuts_long_first_line(self, tmp_path):
+        p = tmp_path / "long.txt"
+        p.write_text("x" * 100, encoding="utf-8")
+        result = ReadTool(file_path=str(p), max_bytes=10).run()
+        assert result["result"] == ["1: " + "x" * 10]
+        assert result["metadata"]["truncated"] is True
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"tail": 5, "offset": 2},
+            {"tail": 5, "byte_offset": 0},
+            {"offset": 2, "byte_offset": 0},
+            {"byte_length": 10},
+        ],
+    )
+    def test_conflicting_range_parameters(self, tmp_file, kwargs):
+        with pytest.raises(ValidationError):
+            ReadTool(file_path=tmp_file, **kwargs).run()
+
     # ========== PARAMETRIZED TESTS ==========
 
     @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
@@ -149,8 +217,8 @@ class TestReadTool:
             assert result["success"] is True
         else:
             tool = ReadTool(file_path=filename)
-            result = tool.run()
-            assert result["success"] is False
+            with pytest.raises(ValidationError):
+                tool.run()
 
     # ========== INTEGRATION TESTS ==========
 
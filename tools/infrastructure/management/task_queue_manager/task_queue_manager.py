@@ -11,18 +11,46 @@ from pydantic import Field
 
 from shared.base import BaseTool
 from shared.errors import APIError, ValidationError
+from shared.task_queue import (
+    DEFAULT_PRIORITY,
+    DEFAULT_VISIBILITY_TIMEOUT,
+    STATUSES,
+    get_task_queue,
+)
+
+# Actions that act on a leased task
+LEASE_ACTIONS = ["complete", "fail", "extend"]
 
 
 class TaskQueueManager(BaseTool):
     """
     Manage agent task queues including adding, removing, and prioritizing tasks.
 
+    Queues are persistent priority queues (see shared/task_queue.py), kept in
+    SQLite or, with TASK_QUEUE_BACKEND=redis, in Redis. Workers take tasks
+    with dequeue, which leases them for visibility_timeout seconds, and
+    finish them with complete or fail (or renew the lease with extend) using
+    the returned lease_id. Tasks whose lease expires are handed out again.
+
     Args:
-        action: Action to perform (add, remove, list, prioritize, clear, stats)
-        task_id: Task ID for remove/prioritize actions
+        action: Action to perform (add, remove, list, prioritize, clear, stats,
+            dequeue, complete, fail, extend)
+        task_id: Task ID for remove/prioritize/complete/fail/extend actions
         task_data: Task data for add action
+        tasks: Several tasks' data for add action, enqueued in one transaction
         queue_id: Optional queue ID (defaults to default queue)
-        priority: Priority level for prioritize action (1-10, higher is more urgent)
+        priority: Priority level for add and prioritize actions (1-10, higher is
+            more urgent; add defaults to 5)
+        count: Most tasks to lease for dequeue action
+        worker_id: Worker name recorded on dequeued tasks
+        lease_id: Lease returned by dequeue, for complete/fail/extend actions
+        visibility_timeout: Lease duration in seconds for dequeue/extend actions
+        task_result: Result stored by complete action
+        error_message: Error stored by fail action
+        retry: Whether fail returns the task to the queue (until it has been
+            leased max_attempts times)
+        status: Only list tasks with this status
+        limit: Most tasks returned by list action
 
     Returns:
         Dict containing:
@@ -43,13 +71,38 @@ class TaskQueueManager(BaseTool):
     tool_category: str = "infrastructure"
 
     # Parameters
-    action: str = Field(..., description="Action: add, remove, list, prioritize, clear, stats")
-    task_id: Optional[str] = Field(None, description="Task ID for remove/prioritize actions")
+    action: str = Field(
+        ...,
+        description="Action: add, remove, list, prioritize, clear, stats, dequeue, complete, "
+        "fail, extend",
+    )
+    task_id: Optional[str] = Field(
+        None, description="Task ID for remove/prioritize/complete/fail/extend actions"
+    )
     task_data: Optional[Dict[str, Any]] = Field(None, description="Task data for add action")
+    tasks: Optional[List[Dict[str, Any]]] = Field(
+        None, description="Several tasks' data for add action (bulk enqueue)"
+    )
     queue_id: Optional[str] = Field(None, description="Queue ID (defaults to 'default')")
     priority: Optional[int] = Field(
         None, description="Priority level (1-10, higher is more urgent)", ge=1, le=10
     )
+    count: int = Field(1, description="Most tasks to lease for dequeue action", ge=1, le=1000)
+    worker_id: Optional[str] = Field(None, description="Worker name for dequeue action")
+    lease_id: Optional[str] = Field(
+        None, description="Lease from dequeue for complete/fail/extend actions"
+    )
+    visibility_timeout: float = Field(
+        DEFAULT_VISIBILITY_TIMEOUT,
+        description="Lease duration in seconds for dequeue/extend actions",
+        gt=0,
+        le=86400,
+    )
+    task_result: Optional[Any] = Field(None, description="Result for complete action")
+    error_message: Optional[str] = Field(None, description="Error for fail action")
+    retry: bool = Field(True, description="Whether fail returns the task to the queue")
+    status: Optional[str] = Field(None, description="Only list tasks with this status")
+    limit: int = Field(100, description="Most tasks returned by list action", ge=1, le=10000)
 
     def _execute(self) -> Dict[str, Any]:
         """Execute queue management action."""
@@ -89,7 +142,8 @@ class TaskQueueManager(BaseTool):
 
     def _validate_parameters(self) -> None:
         """Validate parameters."""
-        valid_actions = ["add", "remove", "list", "prioritize", "clear", "stats"]
+        valid_actions = ["add", "remove", "list", "prioritize", "clear", "stats", "dequeue"]
+        valid_actions += LEASE_ACTIONS
 
         if self.action not in valid_actions:
             raise ValidationError(
@@ -97,14 +151,21 @@ class TaskQueueManager(BaseTool):
             )
 
         # Validate required parameters for specific actions
-        if self.action == "add" and not self.task_data:
+        if self.action == "add" and not self.task_data and not self.tasks:
             raise ValidationError(
-                "task_data is required for 'add' action",
+                "task_data or tasks is required for 'add' action",
                 tool_name=self.tool_name,
                 field="task_data",
             )
 
-        if self.action in ["remove", "prioritize"] and not self.task_id:
+        if self.task_data and self.tasks:
+            raise ValidationError(
+                "Provide either task_data or tasks, not both",
+                tool_name=self.tool_name,
+                field="tasks",
+            )
+
+        if self.action in ["remove", "prioritize"] + LEASE_ACTIONS and not self.task_id:
             raise ValidationError(
                 f"task_id is required for '{self.action}' action",
                 tool_name=self.tool_name,
@@ -118,6 +179,20 @@ class TaskQueueManager(BaseTool):
                 field="priority",
             )
 
+        if self.action in LEASE_ACTIONS and not self.lease_id:
+            raise ValidationError(
+                f"lease_id is required for '{self.action}' action",
+                tool_name=self.tool_name,
+                field="lease_id",
+            )
+
+        if self.status is not None and self.status not in STATUSES:
+            raise ValidationError(
+                f"status must be one of {list(STATUSES)}",
+                tool_name=self.tool_name,
+                field="status",
+            )
+
     def _should_use_mock(self) -> bool:
         """Check if mock mode enabled."""
         return os.getenv("USE_MOCK_APIS", "false").lower() == "true"
@@ -213,49 +288,95 @@ class TaskQueueManager(BaseTool):
                 "metadata": {"mock_mode": True, "tool_name": self.tool_name},
             }
 
+        elif self.action == "dequeue":
+            return {
+                "success": True,
+                "result": {
+                    "action": "dequeue",
+                    "queue_id": queue_id,
+                    "tasks": [
+                        {
+                            "task_id": "task_001",
+                            "status": "in_progress",
+                            "priority": 8,
+                            "data": {"type": "process"},
+                            "attempts": 1,
+                            "lease_id": "lease_mock",
+                        }
+                    ],
+                    "count": 1,
+                },
+                "metadata": {"mock_mode": True, "tool_name": self.tool_name},
+            }
+
+        elif self.action in LEASE_ACTIONS:
+            return {
+                "success": True,
+                "result": {
+                    "action": self.action,
+                    "task_id": self.task_id,
+                    "queue_id": queue_id,
+                    "lease_id": self.lease_id,
+                    "status": {"complete": "completed", "fail": "pending"}.get(
+                        self.action, "in_progress"
+                    ),
+                },
+                "metadata": {"mock_mode": True, "tool_name": self.tool_name},
+            }
+
         return {"success": True, "result": {}, "metadata": {"mock_mode": True}}
 
     def _process(self) -> Dict[str, Any]:
         """Process queue management action."""
         queue_id = self.queue_id or "default"
-
-        if self.action == "add":
-            return self._add_task(queue_id)
-
-        elif self.action == "remove":
-            return self._remove_task(queue_id)
-
-        elif self.action == "list":
-            return self._list_tasks(queue_id)
-
-        elif self.action == "prioritize":
-            return self._prioritize_task(queue_id)
-
-        elif self.action == "clear":
-            return self._clear_queue(queue_id)
-
-        elif self.action == "stats":
-            return self._get_queue_stats(queue_id)
-
-        return {}
+        handlers = {
+            "add": self._add_task,
+            "remove": self._remove_task,
+            "list": self._list_tasks,
+            "prioritize": self._prioritize_task,
+            "clear": self._clear_queue,
+            "stats": self._get_queue_stats,
+            "dequeue": self._dequeue_tasks,
+            "complete": self._release_task,
+            "fail": self._release_task,
+            "extend": self._extend_lease,
+        }
+        return handlers[self.action](queue_id)
 
     def _add_task(self, queue_id: str) -> Dict[str, Any]:
-        """Add a task to the queue."""
-        # In real implementation, add to actual queue system
-        task_id = f"task_{uuid.uuid4().hex[:8]}"
+        """Add a task, or several in one transaction, to the queue."""
+        queue = get_task_queue()
+        priority = self.priority or DEFAULT_PRIORITY
+        added_at = datetime.utcnow().isoformat()
+
+        if self.tasks:
+            task_ids = queue.enqueue_many(queue_id, self.tasks, priority)
+            return {
+                "action": "add",
+                "task_ids": task_ids,
+                "queue_id": queue_id,
+                "tasks_added": len(task_ids),
+                "priority": priority,
+                "added_at": added_at,
+            }
 
+        task_id = queue.enqueue(queue_id, self.task_data, priority)
         return {
             "action": "add",
             "task_id": task_id,
             "queue_id": queue_id,
-            "position": 0,  # Would be actual position in queue
-            "added_at": datetime.utcnow().isoformat(),
+            "position": queue.position(queue_id, task_id),
+            "priority": priority,
+            "added_at": added_at,
             "task_data": self.task_data,
         }
 
     def _remove_task(self, queue_id: str) -> Dict[str, Any]:
         """Remove a task from the queue."""
-        # In real implementation, remove from actual queue
+        if not get_task_queue().remove(queue_id, self.task_id):
+            raise APIError(
+                f"Task '{self.task_id}' not found in queue '{queue_id}'", tool_name=self.tool_name
+            )
         return {
             "action": "remove",
             "task_id": self.task_id,
@@ -265,48 +386,94 @@ class TaskQueueManager(BaseTool):
         }
 
     def _list_tasks(self, queue_id: str) -> Dict[str, Any]:
-        """List all tasks in the queue."""
-        # In real implementation, query actual queue
-        return {"action": "list", "queue_id": queue_id, "tasks": [], "total_tasks": 0}
+        """List tasks in the queue, most urgent pending tasks first."""
+        tasks = get_task_queue().list(queue_id, self.status, self.limit)
+        return {"action": "list", "queue_id": queue_id, "tasks": tasks, "total_tasks": len(tasks)}
 
     def _prioritize_task(self, queue_id: str) -> Dict[str, Any]:
         """Change task priority."""
-        # In real implementation, update task priority in queue
+        old_priority = get_task_queue().prioritize(queue_id, self.task_id, self.priority)
+        if old_priority is None:
+            raise APIError(
+                f"Task '{self.task_id}' not found in queue '{queue_id}'", tool_name=self.tool_name
+            )
         return {
             "action": "prioritize",
             "task_id": self.task_id,
             "queue_id": queue_id,
-            "old_priority": 5,  # Would be actual old priority
+            "old_priority": old_priority,
             "new_priority": self.priority,
             "updated_at": datetime.utcnow().isoformat(),
         }
 
     def _clear_queue(self, queue_id: str) -> Dict[str, Any]:
         """Clear all tasks from queue."""
-        # In real implementation, clear actual queue
         return {
             "action": "clear",
             "queue_id": queue_id,
-            "tasks_removed": 0,  # Would be actual count
+            "tasks_removed": get_task_queue().clear(queue_id),
             "cleared_at": datetime.utcnow().isoformat(),
         }
 
     def _get_queue_stats(self, queue_id: str) -> Dict[str, Any]:
         """Get queue statistics."""
-        # In real implementation, calculate from actual queue
+        return {"action": "stats", "queue_id": queue_id, **get_task_queue().stats(queue_id)}
+
+    def _dequeue_tasks(self, queue_id: str) -> Dict[str, Any]:
+        """Lease the most urgent pending tasks."""
+        tasks = get_task_queue().dequeue(
+            queue_id, self.count, self.worker_id, self.visibility_timeout
+        )
         return {
-            "action": "stats",
+            "action": "dequeue",
             "queue_id": queue_id,
-            "total_tasks": 0,
-            "pending": 0,
-            "in_progress": 0,
-            "completed": 0,
-            "failed": 0,
-            "average_wait_time_seconds": 0.0,
-            "oldest_task_age_seconds": 0,
-            "newest_task_age_seconds": 0,
+            "tasks": tasks,
+            "count": len(tasks),
+            "worker_id": self.worker_id,
+            "visibility_timeout": self.visibility_timeout,
         }
 
+    def _release_task(self, queue_id: str) -> Dict[str, Any]:
+        """Complete or fail a leased task."""
+        queue = get_task_queue()
+        if self.action == "complete":
+            released = queue.complete(queue_id, self.task_id, self.lease_id, self.task_result)
+        else:
+            released = queue.fail(
+                queue_id, self.task_id, self.lease_id, self.error_message, self.retry
+            )
+        if not released:
+            self._raise_lease_lost(queue_id)
+        task = queue.get(queue_id, self.task_id)
+        return {
+            "action": self.action,
+            "task_id": self.task_id,
+            "queue_id": queue_id,
+            "status": task["status"] if task else None,
+            "attempts": task["attempts"] if task else None,
+        }
+
+    def _extend_lease(self, queue_id: str) -> Dict[str, Any]:
+        """Renew a lease."""
+        queue = get_task_queue()
+        if not queue.extend(queue_id, self.task_id, self.lease_id, self.visibility_timeout):
+            self._raise_lease_lost(queue_id)
+        task = queue.get(queue_id, self.task_id)
+        return {
+            "action": "extend",
+            "task_id": self.task_id,
+            "queue_id": queue_id,
+            "lease_id": self.lease_id,
+            "lease_expires_at": task["lease_expires_at"] if task else None,
+        }
+
+    def _raise_lease_lost(self, queue_id: str) -> None:
+        raise APIError(
+            f"Lease '{self.lease_id}' on task '{self.task_id}' in queue '{queue_id}' is no "
+            "longer held (expired, finished or unknown task)",
+            tool_name=self.tool_name,
+        )
+
 
 if __name__ == "__main__":
     print("Testing TaskQueueManager...")
@@ -1,10 +1,12 @@
 """Test cases for TaskQueueManager tool."""
 
 import os
+from unittest.mock import patch
 
 import pytest
 
-from shared.errors import ValidationError
+from shared.errors import APIError, ValidationError
+from shared.task_queue import SQLiteTaskQueue
 
 from .task_queue_manager import TaskQueueManager
 
@@ -151,6 +153,111 @@ class TestTaskQueueManager:
         assert result["success"] == True
         assert result["metadata"]["mock_mode"] == True
 
+    def test_complete_without_lease_id(self):
+        """Test complete action without lease ID."""
+        with pytest.raises(ValidationError):
+            tool = TaskQueueManager(action="complete", task_id="task_123")
+            tool._validate_parameters()
+
+    def test_invalid_status_filter(self):
+        """Test list action with an unknown status."""
+        with pytest.raises(ValidationError):
+            tool = TaskQueueManager(action="list", status="done")
+            tool._validate_parameters()
+
+
+class TestTaskQueueManagerPersistent:
+    """Test TaskQueueManager against a real SQLite queue."""
+
+    @pytest.fixture(autouse=True)
+    def queue(self, tmp_path):
+        os.environ["USE_MOCK_APIS"] = "false"
+        os.environ["DISABLE_RATE_LIMITING"] = "true"
+        queue = SQLiteTaskQueue(tmp_path / "queue.db")
+        with patch(f"{TaskQueueManager.__module__}.get_task_queue", return_value=queue):
+            yield queue
+        os.environ["USE_MOCK_APIS"] = "true"
+        os.environ.pop("DISABLE_RATE_LIMITING", None)
+
+    def test_add_and_list_in_priority_order(self):
+        """Test that tasks are stored and listed most urgent first."""
+        low = TaskQueueManager(action="add", task_data={"n": 1}, priority=2).run()
+        high = TaskQueueManager(action="add", task_data={"n": 2}, priority=9).run()
+
+        assert low["result"]["position"] == 0
+        assert high["result"]["position"] == 0
+
+        result = TaskQueueManager(action="list").run()
+        assert [t["data"] for t in result["result"]["tasks"]] == [{"n": 2}, {"n": 1}]
+        assert result["result"]["total_tasks"] == 2
+
+    def test_bulk_add_and_dequeue(self):
+        """Test bulk enqueue and leasing several tasks."""
+        added = TaskQueueManager(action="add", tasks=[{"n": i} for i in range(5)]).run()
+        assert added["result"]["tasks_added"] == 5
+
+        result = TaskQueueManager(action="dequeue", count=3, worker_id="w1").run()
+        tasks = result["result"]["tasks"]
+
+        assert [t["data"]["n"] for t in tasks] == [0, 1, 2]
+        assert all(t["status"] == "in_progress" and t["lease_id"] for t in tasks)
+        assert all(t["worker_id"] == "w1" for t in tasks)
+
+    def test_complete_and_fail(self):
+        """Test finishing leased tasks."""
+        TaskQueueManager(action="add", tasks=[{"n": 1}, {"n": 2}]).run()
+        first, second = TaskQueueManager(action="dequeue", count=2).run()["result"]["tasks"]
+
+        done = TaskQueueManager(
+            action="complete",
+            task_id=first["task_id"],
+            lease_id=first["lease_id"],
+            task_result={"ok": True},
+        ).run()
+        failed = TaskQueueManager(
+            action="fail",
+            task_id=second["task_id"],
+            lease_id=second["lease_id"],
+            error_message="boom",
+            retry=False,
+        ).run()
+
+        assert done["result"]["status"] == "completed"
+        assert failed["result"]["status"] == "failed"
+        stats = TaskQueueManager(action="stats").run()["result"]
+        assert (stats["completed"], stats["failed"], stats["pending"]) == (1, 1, 0)
+        assert stats["throughput_per_minute"] == 1
+
+    def test_stale_lease_rejected(self):
+        """Test that a lease cannot be used after the task was finished."""
+        TaskQueueManager(action="add", task_data={"n": 1}).run()
+        task = TaskQueueManager(action="dequeue").run()["result"]["tasks"][0]
+        args = {"task_id": task["task_id"], "lease_id": task["lease_id"]}
+        TaskQueueManager(action="complete", **args).run()
+
+        with pytest.raises(APIError):
+            TaskQueueManager(action="extend", **args).run()
+
+    def test_prioritize_remove_clear(self):
+        """Test reprioritizing, removing and clearing tasks."""
+        task_id = TaskQueueManager(action="add", task_data={"n": 1}).run()["result"]["task_id"]
+        TaskQueueManager(action="add", task_data={"n": 2}).run()
+
+        result = TaskQueueManager(action="prioritize", task_id=task_id, priority=8).run()
+        assert result["result"]["old_priority"] == 5
+
+        assert TaskQueueManager(action="remove", task_id=task_id).run()["result"]["removed"]
+        with pytest.raises(APIError):
+            TaskQueueManager(action="remove", task_id=task_id).run()
+        assert TaskQueueManager(action="clear").run()["result"]["tasks_removed"] == 1
+
+    def test_queues_are_separate(self):
+        """Test that queue_id selects an independent queue."""
+        TaskQueueManager(action="add", task_data={"n": 1}, queue_id="a").run()
+
+        result = TaskQueueManager(action="dequeue", queue_id="b").run()
+        assert result["result"]["tasks"] == []
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,25 +1,41 @@
 """
-AI Drive cloud storage management (list, upload, download, compress)
+AI Drive cloud storage management (list, upload, download, delete, compress)
 """
 
 import base64
 import gzip
-import io
+import hashlib
 import os
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, Optional
 
 from pydantic import Field
 
 from shared.base import BaseTool
 from shared.errors import APIError, ValidationError
+from tools.infrastructure.storage.aidrive_tool.blob_store import get_blob_store
+
+# Largest download returned inline as base64; bigger reads need file_path or length
+MAX_INLINE_BYTES = 10 * 1024 * 1024
 
 
 class AidriveTool(BaseTool):
     """
-    AI Drive cloud storage management (list, upload, download, compress)
+    AI Drive cloud storage management (list, upload, download, delete, compress)
+
+    Files are stored as deduplicated, content-addressed chunks under
+    AIDRIVE_STORAGE_DIR (default ~/.agentswarm/aidrive) with an SQLite index,
+    so listing never scans directories and downloads can be ranged.
 
     Args:
-        input: Primary input parameter
+        input: Operation: "list [prefix]", "upload [text]", "download <name>",
+            "delete <name>" or "compress <text>"
+        name: Drive file name for uploads (default: file path basename, or a
+            name derived from the content)
+        file_path: Local file to stream an upload from, or a download to
+        offset: First byte to download
+        length: Bytes to download (default: to end of file)
+        compress: Store uploaded chunks compressed (zstd when installed)
 
     Returns:
         Dict containing:
@@ -28,14 +44,21 @@ class AidriveTool(BaseTool):
         - metadata: Additional information
 
     Example:
-        >>> tool = AidriveTool(input="list")
+        >>> tool = AidriveTool(input="download report.pdf", offset=0, length=4096)
         >>> result = tool.run()
     """
 
     tool_name: str = "aidrive_tool"
     tool_category: str = "infrastructure"
 
-    input: str = Field(..., description="Primary input parameter", min_length=1)
+    input: str = Field(..., description="Operation and its argument", min_length=1)
+    name: Optional[str] = Field(None, description="Drive file name for uploads")
+    file_path: Optional[str] = Field(
+        None, description="Local file to upload from, or to download to"
+    )
+    offset: int = Field(0, description="First byte to download", ge=0)
+    length: Optional[int] = Field(None, description="Bytes to download", ge=0)
+    compress: bool = Field(False, description="Store uploaded chunks compressed")
 
     def _execute(self) -> Dict[str, Any]:
         """
@@ -61,6 +84,8 @@ class AidriveTool(BaseTool):
                 "result": result,
                 "metadata": {"tool_name": self.tool_name, "operation": self.input},
             }
+        except ValidationError:
+            raise
         except Exception as e:
             self._logger.error(f"Error in {self.tool_name}: {str(e)}", exc_info=True)
             raise APIError(f"Failed: {e}", tool_name=self.tool_name)
@@ -79,7 +104,7 @@ class AidriveTool(BaseTool):
                 details={"input": self.input},
             )
 
-        valid_ops = ["list", "upload", "download", "compress"]
+        valid_ops = ["list", "upload", "download", "delete", "compress"]
         if not any(self.input.startswith(op) for op in valid_ops):
             raise ValidationError(
                 f"Invalid operation. Must start with one of {valid_ops}",
@@ -99,6 +124,7 @@ class AidriveTool(BaseTool):
             "list": ["file1.txt", "file2.png", "archive.gz"],
             "upload": "mock_upload_success",
             "download": base64.b64encode(b"mock file content").decode("utf-8"),
+            "delete": {"deleted": "file1.txt"},
             "compress": base64.b64encode(b"mock compressed data").decode("utf-8"),
         }
 
@@ -113,9 +139,10 @@ class AidriveTool(BaseTool):
         Main processing logic.
 
         Supports:
-        - list
-        - upload <filepath>
+        - list [prefix]
+        - upload <text> (or upload with file_path)
         - download <filename>
+        - delete <filename>
         - compress <text>
         """
         parts = self.input.split(maxsplit=1)
@@ -123,11 +150,13 @@ class AidriveTool(BaseTool):
         argument = parts[1] if len(parts) > 1 else None
 
         if operation == "list":
-            return self._list_files()
+            return self._list_files(argument or "")
 
         if operation == "upload":
-            if not argument:
-                raise ValidationError("Upload requires file data string", tool_name=self.tool_name)
+            if not argument and not self.file_path:
+                raise ValidationError(
+                    "Upload requires file data string or file_path", tool_name=self.tool_name
+                )
             return self._upload(argument)
 
         if operation == "download":
@@ -135,6 +164,11 @@ class AidriveTool(BaseTool):
                 raise ValidationError("Download requires filename", tool_name=self.tool_name)
             return self._download(argument)
 
+        if operation == "delete":
+            if not argument:
+                raise ValidationError("Delete requires filename", tool_name=self.tool_name)
+            return self._delete(argument)
+
         if operation == "compress":
             if not argument:
                 raise ValidationError("Compress requires text content", tool_name=self.tool_name)
@@ -142,63 +176,89 @@ class AidriveTool(BaseTool):
 
         raise APIError("Unknown operation", tool_name=self.tool_name)
 
-    def _list_files(self) -> Any:
-        """List files in AI Drive (local mock logic)."""
-        storage_dir = "aidrive_storage"
-        if not os.path.exists(storage_dir):
-            return []
-        return os.listdir(storage_dir)
-
-    def _upload(self, data: str) -> Any:
-        """Upload base64-encoded text as a file."""
-        try:
-            storage_dir = "aidrive_storage"
-            os.makedirs(storage_dir, exist_ok=True)
-
+    def _list_files(self, prefix: str) -> Any:
+        """List files from the index."""
+        return [
+            {"name": f["name"], "size": f["size"], "updated_at": f["updated_at"]}
+            for f in get_blob_store().list(prefix)
+        ]
+
+    def _upload(self, data: Optional[str]) -> Any:
+        """Upload text, or stream a local file, into the chunk store."""
+        store = get_blob_store()
+        if self.file_path:
+            path = Path(self.file_path)
+            if not path.is_file():
+                raise ValidationError(
+                    "File not found",
+                    tool_name=self.tool_name,
+                    details={"file_path": self.file_path},
+                )
+            with open(path, "rb") as f:
+                info = store.put(self.name or path.name, f, self.compress)
+        else:
             content = data.encode("utf-8")
-            filename = f"file_{len(os.listdir(storage_dir)) + 1}.txt"
-            path = os.path.join(storage_dir, filename)
-
-            with open(path, "wb") as f:
-                f.write(content)
+            # Named by content, so concurrent uploads never race for a name
+            name = self.name or f"file_{hashlib.sha256(content).hexdigest()[:16]}.txt"
+            info = store.put_bytes(name, content, self.compress)
 
-            return {"uploaded": filename}
-
-        except Exception as e:
-            self._logger.error(f"Error in {self.tool_name}: {str(e)}", exc_info=True)
-            raise APIError(f"Upload failed: {e}", tool_name=self.tool_name)
+        return {
+            "uploaded": info["name"],
+            "size": info["size"],
+            "sha256": info["sha256"],
+            "chunks": info["chunks"],
+            "new_chunks": info["new_chunks"],
+            "stored_bytes": info["stored_bytes"],
+        }
 
     def _download(self, filename: str) -> Any:
-        """Download a file by name and return base64 data."""
-        storage_dir = "aidrive_storage"
-        path = os.path.join(storage_dir, filename)
-
-        if not os.path.exists(path):
+        """Return a file or range as base64, or stream it to file_path."""
+        store = get_blob_store()
+        info = store.stat(filename)
+        if info is None:
             raise ValidationError(
                 "File not found",
                 tool_name=self.tool_name,
                 details={"filename": filename},
             )
 
-        try:
-            with open(path, "rb") as f:
-                data = f.read()
-            return base64.b64encode(data).decode("utf-8")
-        except Exception as e:
-            self._logger.error(f"Error in {self.tool_name}: {str(e)}", exc_info=True)
-            raise APIError(f"Download failed: {e}", tool_name=self.tool_name)
+        end = info["size"] if self.length is None else min(info["size"], self.offset + self.length)
+        size = max(end - self.offset, 0)
+
+        if self.file_path:
+            target = Path(self.file_path)
+            temp = target.with_name(f".{target.name}.{os.getpid()}.part")
+            try:
+                with open(temp, "wb") as f:
+                    for block in store.read(filename, self.offset, size):
+                        f.write(block)
+                os.replace(temp, target)
+            finally:
+                temp.unlink(missing_ok=True)
+            return {"downloaded": filename, "path": str(target), "bytes": size}
+
+        if size > MAX_INLINE_BYTES:
+            raise ValidationError(
+                f"Download of {size} bytes exceeds the {MAX_INLINE_BYTES} byte inline limit; "
+                "set file_path or length",
+                tool_name=self.tool_name,
+                details={"filename": filename, "size": size},
+            )
+        return base64.b64encode(store.read_bytes(filename, self.offset, size)).decode("utf-8")
+
+    def _delete(self, filename: str) -> Any:
+        """Delete a file; chunks no other file uses are removed with it."""
+        if not get_blob_store().delete(filename):
+            raise ValidationError(
+                "File not found",
+                tool_name=self.tool_name,
+                details={"filename": filename},
+            )
+        return {"deleted": filename}
 
     def _compress(self, text: str) -> Any:
-        """Compress text using gzip and return base64 encoded result."""
-        try:
-            buf = io.BytesIO()
-            with gzip.GzipFile(fileobj=buf, mode="wb") as gz:
-                gz.write(text.encode("utf-8"))
-            compressed = buf.getvalue()
-            return base64.b64encode(compressed).decode("utf-8")
-        except Exception as e:
-            self._logger.error(f"Error in {self.tool_name}: {str(e)}", exc_info=True)
-            raise APIError(f"Compression failed: {e}", tool_name=self.tool_name)
+        """Gzip text and return it base64 encoded."""
+        return base64.b64encode(gzip.compress(text.encode("utf-8"))).decode("utf-8")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,452 @@
+"""
+Content-addressed chunk store behind AidriveTool.
+
+Files are split into fixed-size chunks (1 MiB by default) named by the
+SHA-256 of their content, so a chunk shared by several files, or repeated
+within one, is stored once. Chunk files live under <root>/chunks/<ab>/<hash>
+and start with one codec byte (raw, zstd or zlib), so compression is
+transparent to readers and decided per chunk: a chunk is only kept
+compressed if that saves space.
+
+An SQLite index (<root>/index.db, WAL mode) maps each file name to its size,
+digest and ordered chunk list, and counts references to each chunk. Listing
+reads the index instead of the filesystem, and a chunk file is deleted with
+the last file that uses it. Uploads and downloads stream a chunk at a time,
+and ranged reads only open the chunks that overlap the range.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+ZSTD_LEVEL = 3
+ZLIB_LEVEL = 6
+
+# A compressed chunk is kept only if it is at most this fraction of the raw size
+MAX_COMPRESSED_RATIO = 0.95
+
+# First byte of every chunk file
+CODEC_RAW = 0
+CODEC_ZSTD = 1
+CODEC_ZLIB = 2
+
+
+def default_storage_dir() -> Path:
+    """Storage root: AIDRIVE_STORAGE_DIR, or ~/.agentswarm/aidrive."""
+    configured = os.getenv("AIDRIVE_STORAGE_DIR")
+    return Path(configured) if configured else Path.home() / ".agentswarm" / "aidrive"
+
+
+def _encode_chunk(data: bytes, compress: bool) -> bytes:
+    if compress:
+        if ZSTD_AVAILABLE:
+            codec, packed = CODEC_ZSTD, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+        else:
+            codec, packed = CODEC_ZLIB, zlib.compress(data, ZLIB_LEVEL)
+        if len(packed) <= len(data) * MAX_COMPRESSED_RATIO:
+            return bytes([codec]) + packed
+    return bytes([CODEC_RAW]) + data
+
+
+def _decode_chunk(codec: int, packed: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise IOError("Chunk is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(packed)
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(packed)
+    raise IOError(f"Unknown chunk codec {codec}")
+
+
+def _read_full(stream: IO[bytes], size: int) -> bytes:
+    """Read size bytes, or fewer only at end of stream."""
+    data = stream.read(size)
+    if not data or len(data) == size:
+        return data
+    parts = [data]
+    remaining = size - len(data)
+    while remaining:
+        more = stream.read(remaining)
+        if not more:
+            break
+        parts.append(more)
+        remaining -= len(more)
+    return b"".join(parts)
+
+
+class BlobStore:
+    """
+    Named files stored as deduplicated chunks.
+
+    Example:
+        >>> store = get_blob_store()
+        >>> with open("dataset.csv", "rb") as f:
+        ...     store.put("datasets/q3.csv", f, compress=True)
+        >>> head = store.read_bytes("datasets/q3.csv", 0, 4096)
+    """
+
+    def __init__(self, root: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize store.
+
+        Args:
+            root: Storage directory (created if needed)
+            chunk_size: Chunk size for new uploads; each file records its own
+        """
+        self.root = Path(root)
+        self.chunk_dir = self.root / "chunks"
+        self.index_path = self.root / "index.db"
+        self.chunk_size = chunk_size
+        self._local = threading.local()
+        self._init_db()
+
+    def _conn(self) -> sqlite3.Connection:
+        """This thread's connection (in autocommit mode)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.index_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """A write transaction, taking the write lock up front."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _init_db(self) -> None:
+        self.chunk_dir.mkdir(parents=True, exist_ok=True)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                name TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                chunk_size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS file_chunks (
+                name TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                chunk TEXT NOT NULL,
+                PRIMARY KEY (name, seq)
+            ) WITHOUT ROWID
+        """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS chunks (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                refs INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """
+        )
+
+    def _chunk_path(self, chunk_hash: str) -> Path:
+        return self.chunk_dir / chunk_hash[:2] / chunk_hash
+
+    def _write_chunk(self, chunk_hash: str, data: bytes, compress: bool) -> int:
+        """Write a chunk file atomically; returns its size on disk."""
+        path = self._chunk_path(chunk_hash)
+        path.parent.mkdir(exist_ok=True)
+        encoded = _encode_chunk(data, compress)
+        temp = path.with_name(f".{chunk_hash}.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+        with open(temp, "wb") as f:
+            f.write(encoded)
+        os.replace(temp, path)
+        return len(encoded)
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def put(self, name: str, stream: IO[bytes], compress: bool = False) -> Dict[str, Any]:
+        """
+        Store a file from a binary stream, replacing any file of that name.
+
+        Args:
+            name: File name (any non-empty string; "/" has no special meaning)
+            stream: Source, read one chunk at a time
+            compress: Compress new chunks (zstd, or zlib without zstandard)
+
+        Returns:
+            Dict with name, size, sha256, chunks, new_chunks (chunks that were
+            not stored yet) and stored_bytes (disk space they took)
+
+        Raises:
+            ValueError: If name is empty
+            RuntimeError: If a concurrent delete removed a chunk this upload
+                references before it was committed; the upload can be retried
+        """
+        if not name or "\0" in name:
+            raise ValueError("File name must be non-empty and must not contain NUL")
+
+        written: Set[str] = set()
+        try:
+            return self._put(name, stream, compress, written)
+        except BaseException:
+            self._discard(written)
+            raise
+
+    def _put(
+        self, name: str, stream: IO[bytes], compress: bool, written: Set[str]
+    ) -> Dict[str, Any]:
+        digest = hashlib.sha256()
+        chunks: List[Tuple[str, int]] = []
+        stored_bytes = 0
+        while True:
+            data = _read_full(stream, self.chunk_size)
+            if not data:
+                break
+            digest.update(data)
+            chunk_hash = hashlib.sha256(data).hexdigest()
+            if chunk_hash not in written and not self._chunk_path(chunk_hash).exists():
+                stored_bytes += self._write_chunk(chunk_hash, data, compress)
+                written.add(chunk_hash)
+            chunks.append((chunk_hash, len(data)))
+
+        size = sum(chunk_size for _, chunk_size in chunks)
+        now = time.time()
+        with self._transaction() as conn:
+            # Every chunk, including ones written above (another upload may have
+            # written the same chunk and a delete released it), must still exist
+            referenced = {chunk_hash for chunk_hash, _ in chunks}
+            if any(not self._chunk_path(chunk_hash).exists() for chunk_hash in referenced):
+                raise RuntimeError(f"Chunks of '{name}' were deleted concurrently; retry")
+
+            old = [
+                row[0]
+                for row in conn.execute("SELECT chunk FROM file_chunks WHERE name = ?", (name,))
+            ]
+            created = conn.execute(
+                "SELECT created_at FROM files WHERE name = ?", (name,)
+            ).fetchone()
+            conn.execute("DELETE FROM file_chunks WHERE name = ?", (name,))
+            conn.execute(
+                "INSERT OR REPLACE INTO files "
+                "(name, size, sha256, chunk_size, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    name,
+                    size,
+                    digest.hexdigest(),
+                    self.chunk_size,
+                    created[0] if created else now,
+                    now,
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO file_chunks (name, seq, chunk) VALUES (?, ?, ?)",
+                [(name, seq, chunk_hash) for seq, (chunk_hash, _) in enumerate(chunks)],
+            )
+            conn.executemany(
+                "INSERT INTO chunks (hash, size, refs) VALUES (?, ?, 1) "
+                "ON CONFLICT (hash) DO UPDATE SET refs = refs + 1",
+                chunks,
+            )
+            self._release(conn, old)
+
+        return {
+            "name": name,
+            "size": size,
+            "sha256": digest.hexdigest(),
+            "chunks": len(chunks),
+            "new_chunks": len(written),
+            "stored_bytes": stored_bytes,
+        }
+
+    def _discard(self, chunk_hashes: Set[str]) -> None:
+        """
+        Delete chunk files a failed upload wrote, unless a file references them.
+
+        Runs in a write transaction: an upload that reused one of these chunks
+        either committed first (and the chunk is kept) or finds it missing in
+        its own transaction and fails with RuntimeError.
+        """
+        if not chunk_hashes:
+            return
+        with self._transaction() as conn:
+            for chunk_hash in chunk_hashes:
+                if conn.execute("SELECT 1 FROM chunks WHERE hash = ?", (chunk_hash,)).fetchone():
+                    continue
+                try:
+                    self._chunk_path(chunk_hash).unlink()
+                except FileNotFoundError:
+                    pass
+
+    def put_bytes(self, name: str, data: bytes, compress: bool = False) -> Dict[str, Any]:
+        """Store a file from memory."""
+        return self.put(name, io.BytesIO(data), compress)
+
+    def _release(self, conn: sqlite3.Connection, chunk_hashes: Iterable[str]) -> None:
+        """
+        Drop one reference per listed chunk and delete unreferenced chunks.
+
+        Runs inside the write transaction, so an upload cannot reuse a chunk
+        between its row and its file being deleted.
+        """
+        counts: Dict[str, int] = {}
+        for chunk_hash in chunk_hashes:
+            counts[chunk_hash] = counts.get(chunk_hash, 0) + 1
+        for chunk_hash, count in counts.items():
+            conn.execute("UPDATE chunks SET refs = refs - ? WHERE hash = ?", (count, chunk_hash))
+            row = conn.execute("SELECT refs FROM chunks WHERE hash = ?", (chunk_hash,)).fetchone()
+            if row is not None and row[0] <= 0:
+                conn.execute("DELETE FROM chunks WHERE hash = ?", (chunk_hash,))
+                try:
+                    self._chunk_path(chunk_hash).unlink()
+                except FileNotFoundError:
+                    pass
+
+    def stat(self, name: str) -> Optional[Dict[str, Any]]:
+        """A file's name, size, sha256, chunk_size, created_at and updated_at, or None."""
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT name, size, sha256, chunk_size, created_at, updated_at "
+            "FROM files WHERE name = ?",
+            (name,),
+        ).fetchone()
+        return self._row_to_file(row) if row else None
+
+    def list(self, prefix: str = "") -> List[Dict[str, Any]]:
+        """Files whose names start with prefix, by name (an index range scan)."""
+        conn = self._conn()
+        rows = conn.execute(
+            "SELECT name, size, sha256, chunk_size, created_at, updated_at FROM files "
+            "WHERE name >= ? AND name < ? ORDER BY name",
+            (prefix, prefix + "\U0010ffff"),
+        ).fetchall()
+        return [self._row_to_file(row) for row in rows]
+
+    def read(self, name: str, offset: int = 0, length: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Stream a file, or the range [offset, offset + length), a chunk at a time.
+
+        Raises:
+            FileNotFoundError: If there is no such file
+        """
+        conn = self._conn()
+        conn.execute("BEGIN")  # size and chunk list from one snapshot
+        try:
+            row = conn.execute(
+                "SELECT size, chunk_size FROM files WHERE name = ?", (name,)
+            ).fetchone()
+            if row is None:
+                raise FileNotFoundError(name)
+            size, chunk_size = row
+            end = size if length is None else min(size, offset + length)
+            rows = []
+            if offset < end:
+                rows = conn.execute(
+                    "SELECT seq, chunk FROM file_chunks WHERE name = ? AND seq BETWEEN ? AND ? "
+                    "ORDER BY seq",
+                    (name, offset // chunk_size, (end - 1) // chunk_size),
+                ).fetchall()
+        finally:
+            conn.execute("COMMIT")
+        for seq, chunk_hash in rows:
+            start = seq * chunk_size
+            yield self._read_chunk(chunk_hash, max(offset - start, 0), min(end - start, chunk_size))
+
+    def read_bytes(self, name: str, offset: int = 0, length: Optional[int] = None) -> bytes:
+        """Read a file, or a range of it, into memory."""
+        return b"".join(self.read(name, offset, length))
+
+    def _read_chunk(self, chunk_hash: str, start: int, end: int) -> bytes:
+        try:
+            with open(self._chunk_path(chunk_hash), "rb") as f:
+                codec = f.read(1)[0]
+                if codec == CODEC_RAW:
+                    f.seek(1 + start)
+                    return f.read(end - start)
+                return _decode_chunk(codec, f.read())[start:end]
+        except FileNotFoundError:
+            raise IOError(f"Chunk {chunk_hash} is missing from {self.chunk_dir}")
+
+    def delete(self, name: str) -> bool:
+        """Delete a file and any chunks no other file uses; False if it did not exist."""
+        with self._transaction() as conn:
+            if conn.execute("DELETE FROM files WHERE name = ?", (name,)).rowcount == 0:
+                return False
+            chunks = [
+                row[0]
+                for row in conn.execute("SELECT chunk FROM file_chunks WHERE name = ?", (name,))
+            ]
+            conn.execute("DELETE FROM file_chunks WHERE name = ?", (name,))
+            self._release(conn, chunks)
+        return True
+
+    def usage(self) -> Dict[str, int]:
+        """Files, their total size, and the size of the distinct chunks they use."""
+        conn = self._conn()
+        files, logical = conn.execute("SELECT COUNT(*), SUM(size) FROM files").fetchone()
+        chunks, unique = conn.execute("SELECT COUNT(*), SUM(size) FROM chunks").fetchone()
+        return {
+            "files": files,
+            "logical_bytes": logical or 0,
+            "chunks": chunks,
+            "unique_bytes": unique or 0,
+        }
+
+    @staticmethod
+    def _row_to_file(row: Tuple) -> Dict[str, Any]:
+        name, size, sha256, chunk_size, created_at, updated_at = row
+        return {
+            "name": name,
+            "size": size,
+            "sha256": sha256,
+            "chunk_size": chunk_size,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
+
+
+_stores: Dict[str, BlobStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_blob_store(root: Optional[Union[str, Path]] = None) -> BlobStore:
+    """Shared BlobStore for a storage root (default: default_storage_dir())."""
+    key = str(Path(root or default_storage_dir()).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = BlobStore(key)
+        return store
@@ -1,15 +1,32 @@
 """Tests for aidrive_tool tool."""
 
 import base64
+import gzip
+import hashlib
 import io
 import os
-from unittest.mock import MagicMock, mock_open, patch
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError as PydanticValidationError
 
 from shared.errors import APIError, ValidationError
-from tools.storage.aidrive_tool import AidriveTool
+from tools.infrastructure.storage.aidrive_tool import AidriveTool
+from tools.infrastructure.storage.aidrive_tool.blob_store import BlobStore
+
+REAL_MODE = {"USE_MOCK_APIS": "false", "DISABLE_RATE_LIMITING": "true"}
+
+
+@pytest.fixture
+def drive(tmp_path):
+    """Point the tool at an empty drive in real mode."""
+    env = dict(REAL_MODE, AIDRIVE_STORAGE_DIR=str(tmp_path / "drive"))
+    with patch.dict(os.environ, env):
+        yield tmp_path / "drive"
 
 
 class TestAidriveTool:
@@ -22,30 +39,17 @@ class TestAidriveTool:
         """Tool instance for listing files."""
         return AidriveTool(input="list")
 
-    @pytest.fixture
-    def upload_tool(self) -> AidriveTool:
-        """Tool instance for upload."""
-        return AidriveTool(input="upload testdata")
-
-    @pytest.fixture
-    def download_tool(self) -> AidriveTool:
-        """Tool instance for download."""
-        return AidriveTool(input="download filename.txt")
-
-    @pytest.fixture
-    def compress_tool(self) -> AidriveTool:
-        """Tool instance for compress."""
-        return AidriveTool(input="compress some text")
-
     # ========== HAPPY PATH ==========
 
     def test_metadata_correct(self, list_tool: AidriveTool):
         """Test tool metadata values."""
         assert list_tool.tool_name == "aidrive_tool"
-        assert list_tool.tool_category == "storage"
+        assert list_tool.tool_category == "infrastructure"
 
     @patch.dict("os.environ", {"USE_MOCK_APIS": "true"})
-    @pytest.mark.parametrize("operation", ["list", "upload test", "download file", "compress text"])
+    @pytest.mark.parametrize(
+        "operation", ["list", "upload test", "download file", "delete file", "compress text"]
+    )
     def test_mock_mode(self, operation: str):
         """Mock mode should return mock data for all operations."""
         tool = AidriveTool(input=operation)
@@ -53,62 +57,59 @@ class TestAidriveTool:
         assert result["success"] is True
         assert result["metadata"]["mock_mode"] is True
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    def test_list_operation_success(self, list_tool: AidriveTool, tmp_path):
-        """Test list mode lists files."""
-        storage = tmp_path / "aidrive_storage"
-        storage.mkdir()
-        (storage / "a.txt").write_text("x")
-        (storage / "b.txt").write_text("y")
+    def test_upload_list_download(self, drive):
+        """Uploaded text is listed from the index and downloads intact."""
+        uploaded = AidriveTool(input="upload hello world").run()["result"]
+        AidriveTool(input="upload other", name="notes/b.txt").run()
 
-        with (
-            patch("os.path.exists", return_value=True),
-            patch("os.listdir", return_value=["a.txt", "b.txt"]),
-        ):
-            result = list_tool.run()
+        listed = AidriveTool(input="list").run()["result"]
+        assert [f["name"] for f in listed] == sorted([uploaded["uploaded"], "notes/b.txt"])
+        assert [f["name"] for f in AidriveTool(input="list notes/").run()["result"]] == [
+            "notes/b.txt"
+        ]
 
-        assert result["success"] is True
-        assert result["result"] == ["a.txt", "b.txt"]
-
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    def test_upload_operation_success(self, upload_tool: AidriveTool, tmp_path):
-        """Test upload writes file."""
-        storage = tmp_path / "aidrive_storage"
-        with (
-            patch("os.makedirs"),
-            patch("os.listdir", return_value=[]),
-            patch("builtins.open", create=True),
-        ):
-            result = upload_tool.run()
+        result = AidriveTool(input=f"download {uploaded['uploaded']}").run()
+        assert base64.b64decode(result["result"]) == b"hello world"
 
-        assert result["success"] is True
-        assert "uploaded" in result["result"]
+    def test_upload_name_is_content_derived(self, drive):
+        """Default names come from the content, not a directory count."""
+        first = AidriveTool(input="upload same").run()["result"]
+        second = AidriveTool(input="upload same").run()["result"]
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    def test_download_operation_success(self, download_tool: AidriveTool):
-        """Test file download returns base64."""
-        mock_data = b"hello"
+        assert first["uploaded"] == second["uploaded"]
+        assert second["new_chunks"] == 0
 
-        with (
-            patch("shared.base.get_rate_limiter") as mock_limiter,
-            patch("os.path.exists", return_value=True),
-            patch("builtins.open", mock_open(read_data=mock_data)),
-        ):
+    def test_ranged_download(self, drive):
+        AidriveTool(input="upload 0123456789", name="digits").run()
 
-            mock_limiter.return_value.check_rate_limit.return_value = None
-            result = download_tool.run()
+        result = AidriveTool(input="download digits", offset=3, length=4).run()
 
-        assert result["success"] is True
-        decoded = base64.b64decode(result["result"])
-        assert decoded == mock_data
+        assert base64.b64decode(result["result"]) == b"3456"
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    def test_compress_operation_success(self, compress_tool: AidriveTool):
-        """Test gzip compression returns base64."""
-        result = compress_tool.run()
-        assert result["success"] is True
-        decoded = base64.b64decode(result["result"])
-        assert decoded.startswith(b"\x1f\x8b")  # gzip signature
+    def test_stream_file_round_trip(self, drive, tmp_path):
+        source = tmp_path / "source.bin"
+        source.write_bytes(os.urandom(3000) * 1000)
+
+        uploaded = AidriveTool(input="upload", file_path=str(source), compress=True).run()
+        target = tmp_path / "copy.bin"
+        result = AidriveTool(input="download source.bin", file_path=str(target)).run()
+
+        assert uploaded["result"]["uploaded"] == "source.bin"
+        assert uploaded["result"]["stored_bytes"] < source.stat().st_size
+        assert result["result"]["bytes"] == source.stat().st_size
+        assert target.read_bytes() == source.read_bytes()
+
+    def test_delete(self, drive):
+        AidriveTool(input="upload bye", name="gone.txt").run()
+
+        assert AidriveTool(input="delete gone.txt").run()["result"] == {"deleted": "gone.txt"}
+        assert AidriveTool(input="list").run()["result"] == []
+
+    @patch.dict("os.environ", REAL_MODE)
+    def test_compress_operation_success(self):
+        """Compression returns base64 gzip whether or not zstandard is installed."""
+        result = AidriveTool(input="compress some text").run()
+        assert gzip.decompress(base64.b64decode(result["result"])) == b"some text"
 
     # ========== ERROR CASES ==========
 
@@ -118,45 +119,33 @@ class TestAidriveTool:
         with pytest.raises(PydanticValidationError):
             AidriveTool(input=bad_input)
 
-    @pytest.mark.parametrize("bad_input", ["", "   "])
-    def test_validation_invalid_inputs_empty(self, bad_input):
-        """Empty input values should return error dict."""
-        tool = AidriveTool(input=bad_input)
-        result = tool.run()
-        assert result["success"] is False
-
     def test_validation_invalid_operation(self):
-        """Non-recognized operation should return error dict."""
-        tool = AidriveTool(input="invalidop something")
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(ValidationError):
+            AidriveTool(input="invalidop something").run()
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    def test_upload_missing_argument(self):
-        result = AidriveTool(input="upload").run()
-        assert result["success"] is False
+    @pytest.mark.parametrize("operation", ["upload", "download", "delete", "compress"])
+    def test_missing_argument(self, drive, operation):
+        with pytest.raises(ValidationError):
+            AidriveTool(input=operation).run()
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    def test_download_missing_argument(self):
-        result = AidriveTool(input="download").run()
-        assert result["success"] is False
+    def test_download_file_not_found(self, drive):
+        with pytest.raises(ValidationError, match="File not found"):
+            AidriveTool(input="download missing.txt").run()
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    def test_compress_missing_argument(self):
-        result = AidriveTool(input="compress").run()
-        assert result["success"] is False
+    def test_download_over_inline_limit(self, drive):
+        AidriveTool(input="upload abcdef", name="big").run()
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    def test_api_error_propagates(self, list_tool: AidriveTool):
-        with patch.object(list_tool, "_process", side_effect=Exception("boom")):
-            result = list_tool.run()
-            assert result["success"] is False
+        with patch("tools.infrastructure.storage.aidrive_tool.aidrive_tool.MAX_INLINE_BYTES", 4):
+            with pytest.raises(ValidationError, match="inline limit"):
+                AidriveTool(input="download big").run()
+            result = AidriveTool(input="download big", length=4).run()
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    def test_download_file_not_found(self, download_tool: AidriveTool):
-        with patch("os.path.exists", return_value=False):
-            result = download_tool.run()
-            assert result["success"] is False
+        assert base64.b64decode(result["result"]) == b"abcd"
+
+    def test_api_error_propagates(self, drive, list_tool: AidriveTool):
+        with patch.object(list_tool, "_process", side_effect=Exception("boom")):
+            with pytest.raises(APIError):
+                list_tool.run()
 
     # ========== EDGE CASES ==========
 
@@ -166,47 +155,141 @@ class TestAidriveTool:
         result = tool.run()
         assert result["success"] is True
 
-    # ========== PARAMETRIZED ==========
-
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    @pytest.mark.parametrize(
-        "operation,arg,should_pass",
-        [
-            ("list", None, True),
-            ("upload", "abc", True),
-            ("upload", None, False),
-            ("download", "file.txt", True),
-            ("download", None, False),
-            ("compress", "text", True),
-            ("compress", None, False),
-        ],
-    )
-    def test_operation_parameter_validation(self, operation, arg, should_pass):
-        input_value = operation if arg is None else f"{operation} {arg}"
-
-        if should_pass:
-            tool = AidriveTool(input=input_value)
-            assert isinstance(tool, AidriveTool)
-        else:
-            tool = AidriveTool(input=input_value)
-            result = tool.run()
-            assert result["success"] is False
-
 
-# ========== INTEGRATION TESTS ==========
+class TestBlobStore:
+    """Test the chunk store behind the tool."""
 
+    @pytest.fixture
+    def store(self, tmp_path) -> BlobStore:
+        return BlobStore(tmp_path / "store", chunk_size=16)
 
-class TestAidriveToolIntegration:
-    """Integration-level tests."""
+    def chunk_files(self, store: BlobStore):
+        return sorted(p.name for p in store.chunk_dir.rglob("*") if p.is_file())
 
-    def test_run_integration_smoke(self):
-        tool = AidriveTool(input="list")
-        result = tool.run()
-        assert "success" in result
+    def test_chunks_are_deduplicated(self, store):
+        block = b"A" * 16
+        first = store.put_bytes("a", block * 3 + b"tail")
+        second = store.put_bytes("b", block + b"other tail")
 
-    def test_error_formatting_integration(self):
-        tool = AidriveTool(input="list")
+        assert (first["chunks"], first["new_chunks"]) == (4, 2)
+        assert second["new_chunks"] == 1
+        assert len(self.chunk_files(store)) == 3
+        assert store.read_bytes("a") == block * 3 + b"tail"
+        assert store.usage()["unique_bytes"] == 16 + 4 + 10
 
-        with patch.object(tool, "_execute", side_effect=ValueError("X")):
-            result = tool.run()
-            assert "error" in result or result.get("success") is False
+    @pytest.mark.parametrize(
+        "offset,length", [(0, None), (5, 3), (14, 4), (15, 17), (40, 100), (60, 5), (3, 0)]
+    )
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_ranged_reads(self, store, offset, length, compress):
+        data = bytes(range(50)) + b"x" * 10
+        store.put_bytes("f", data, compress=compress)
+
+        expected = data[offset:] if length is None else data[offset : offset + length]
+        assert store.read_bytes("f", offset, length) == expected
+
+    def test_compression_is_transparent(self, tmp_path):
+        store = BlobStore(tmp_path / "store")
+        data = b"compressible line\n" * 10000
+
+        info = store.put_bytes("log", data, compress=True)
+        random_info = store.put_bytes("noise", os.urandom(4096), compress=True)
+
+        assert info["stored_bytes"] < len(data) // 10
+        assert random_info["stored_bytes"] == 4096 + 1  # stored raw plus codec byte
+        assert store.read_bytes("log") == data
+        assert store.read_bytes("log", 100, 50) == data[100:150]
+
+    def test_overwrite_and_delete_release_chunks(self, store):
+        store.put_bytes("f", b"1" * 16 + b"2" * 16)
+        store.put_bytes("g", b"2" * 16)
+        store.put_bytes("f", b"3" * 16)
+
+        assert len(self.chunk_files(store)) == 2
+        assert store.read_bytes("f") == b"3" * 16
+
+        assert store.delete("f")
+        assert not store.delete("f")
+        assert store.delete("g")
+        assert self.chunk_files(store) == []
+        assert store.usage() == {"files": 0, "logical_bytes": 0, "chunks": 0, "unique_bytes": 0}
+
+    def test_stat_and_list(self, store):
+        store.put_bytes("dir/a", b"abc")
+        store.put_bytes("dir/b", b"")
+        store.put_bytes("other", b"x")
+
+        info = store.stat("dir/a")
+        assert (info["size"], info["sha256"]) == (3, hashlib.sha256(b"abc").hexdigest())
+        assert store.stat("missing") is None
+        assert [f["name"] for f in store.list("dir/")] == ["dir/a", "dir/b"]
+        assert store.read_bytes("dir/b") == b""
+        with pytest.raises(FileNotFoundError):
+            store.read_bytes("missing")
+
+    def test_concurrent_uploads(self, store):
+        def upload(n):
+            store.put_bytes(f"f{n}", b"shared chunk...." * 4 + str(n).encode())
+
+        threads = [threading.Thread(target=upload, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(store.list()) == 8
+        assert all(store.read_bytes(f"f{n}").endswith(str(n).encode()) for n in range(8))
+
+    def test_failed_upload_removes_its_chunks(self, store):
+        store.put_bytes("a", b"A" * 16)
+
+        class Broken(io.BytesIO):
+            def read(self, size=-1):
+                data = super().read(size)
+                if not data:
+                    raise IOError("connection reset")
+                return data
+
+        with pytest.raises(IOError):
+            store.put("b", Broken(b"A" * 16 + b"B" * 16 + b"C" * 16))
+
+        assert store.stat("b") is None
+        assert self.chunk_files(store) == [hashlib.sha256(b"A" * 16).hexdigest()]
+
+    def test_written_chunk_deleted_before_commit(self, store):
+        class Racing(io.BytesIO):
+            def read(self, size=-1):
+                data = super().read(size)
+                if not data:
+                    # Another upload reuses the chunk written above, then is deleted
+                    store.put_bytes("other", b"B" * 16)
+                    store.delete("other")
+                return data
+
+        with pytest.raises(RuntimeError):
+            store.put("f", Racing(b"B" * 16))
+
+        assert store.stat("f") is None
+        assert self.chunk_files(store) == []
+        store.put_bytes("f", b"B" * 16)  # a retry succeeds
+        assert store.read_bytes("f") == b"B" * 16
+
+
+def test_loads_through_registry(tmp_path):
+    """A fresh interpreter loads the tool through the tool index."""
+    root = Path(__file__).resolve().parents[4]
+    code = (
+        "from shared.registry import tool_registry\n"
+        f"tool_registry.discover_tools(index_path={str(tmp_path / 'index.json')!r})\n"
+        "print(tool_registry.get_tool('aidrive_tool').__name__)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root,
+        env={**os.environ, "PYTHONPATH": str(root)},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "AidriveTool"
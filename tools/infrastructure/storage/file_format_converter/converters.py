@@ -0,0 +1,828 @@
+"""
+Streaming converter registry for FileFormatConverter
+
+Each converter turns a source file into a target file and is registered for
+a (source, target) format pair. Tabular formats (csv, tsv, json, jsonl,
+parquet, xlsx, and markdown tables as output) are streamed in batches of
+rows: Arrow record batches when pyarrow is installed, lists of row dicts
+otherwise, so memory is bounded by the batch size rather than the file.
+Document conversions (docx, md, html, txt) go paragraph by paragraph where
+the libraries allow it.
+
+Outputs are written to a temporary file and renamed into place, so a failed
+conversion never leaves a partial file. convert_files() converts several
+files in parallel with a process pool.
+"""
+
+import csv
+import json
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+try:
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.parquet
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+try:
+    import openpyxl
+
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+try:
+    import docx
+
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
+
+try:
+    import markdown
+
+    MARKDOWN_AVAILABLE = True
+except ImportError:
+    MARKDOWN_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Rows per batch read from a tabular source
+DEFAULT_BATCH_ROWS = 65536
+
+# Bytes per block read by Arrow's CSV reader
+ARROW_CSV_BLOCK_BYTES = 4 * 1024 * 1024
+
+# Characters read at a time when streaming a JSON array
+JSON_BLOCK_CHARS = 64 * 1024
+
+FORMAT_ALIASES = {
+    "ndjson": "jsonl",
+    "markdown": "md",
+    "htm": "html",
+    "text": "txt",
+    "pq": "parquet",
+}
+
+# pip package for each optional dependency, and whether it is importable
+DEPENDENCIES = {
+    "pyarrow": ARROW_AVAILABLE,
+    "openpyxl": OPENPYXL_AVAILABLE,
+    "python-docx": DOCX_AVAILABLE,
+    "markdown": MARKDOWN_AVAILABLE,
+}
+
+Rows = List[Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Converter:
+    """A registered conversion and the optional packages it needs."""
+
+    source: str
+    target: str
+    func: Callable[..., int]
+    requires: Tuple[str, ...] = ()
+
+    def missing_dependencies(self) -> List[str]:
+        return [name for name in self.requires if not DEPENDENCIES[name]]
+
+
+_REGISTRY: Dict[Tuple[str, str], Converter] = {}
+
+
+def register(source: str, target: str, requires: Tuple[str, ...] = ()):
+    """
+    Register func(source_path, target_path, batch_size) -> units converted.
+
+    Units are rows for tabular targets and paragraphs or lines for documents.
+    """
+
+    def decorator(func: Callable[..., int]) -> Callable[..., int]:
+        _REGISTRY[(source, target)] = Converter(source, target, func, requires)
+        return func
+
+    return decorator
+
+
+def normalize_format(name: str) -> str:
+    """Lowercase a format name or extension and resolve aliases."""
+    name = name.strip().lower().lstrip(".")
+    return FORMAT_ALIASES.get(name, name)
+
+
+def get_converter(source: str, target: str) -> Optional[Converter]:
+    return _REGISTRY.get((normalize_format(source), normalize_format(target)))
+
+
+def supported_conversions() -> List[Tuple[str, str]]:
+    """Every registered (source, target) pair, whether or not its packages are installed."""
+    return sorted(_REGISTRY)
+
+
+# ========== JSON ==========
+
+if ORJSON_AVAILABLE:
+
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+else:
+
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def iter_json_array(stream: TextIO, block_size: int = JSON_BLOCK_CHARS) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array without loading the whole array.
+
+    Raises:
+        ValueError: If the document is not a JSON array
+    """
+    decoder = json.JSONDecoder()
+    buf = stream.read(block_size)
+    pos = 0
+    eof = not buf
+
+    def more() -> bool:
+        # Read at least as much as is buffered, so a huge element is parsed O(n) times overall
+        nonlocal buf, pos, eof
+        data = "" if eof else stream.read(max(block_size, len(buf) - pos))
+        if not data:
+            eof = True
+            return False
+        buf = buf[pos:] + data
+        pos = 0
+        return True
+
+    def skip_whitespace() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf) or not more():
+                return
+
+    skip_whitespace()
+    if pos >= len(buf) or buf[pos] != "[":
+        raise ValueError("JSON input must be an array of records")
+    pos += 1
+    skip_whitespace()
+    if pos < len(buf) and buf[pos] == "]":
+        return
+
+    while True:
+        skip_whitespace()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if more():
+                    continue
+                raise
+            # A number ending at the buffer edge may continue in the next block
+            if end == len(buf) and more():
+                continue
+            break
+        yield value
+        pos = end
+        skip_whitespace()
+        if pos >= len(buf):
+            raise ValueError("Unterminated JSON array")
+        if buf[pos] == "]":
+            return
+        if buf[pos] != ",":
+            raise ValueError(f"Expected ',' or ']' in JSON array, found {buf[pos]!r}")
+        pos += 1
+
+
+# ========== Row readers and writers ==========
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    items = iter(items)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _records(values: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+    for value in values:
+        yield value if isinstance(value, dict) else {"value": value}
+
+
+_NESTED = (dict, list)
+
+
+def _cell(value: Any) -> Any:
+    """Flatten nested values for formats that only hold scalars."""
+    if isinstance(value, _NESTED):
+        return _dumps(value)
+    return value
+
+
+def _read_csv(path: Path, batch_size: int, delimiter: str = ",") -> Iterator[Rows]:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+        yield from _batched((dict(zip(header, row)) for row in reader if row), batch_size)
+
+
+def _read_json(path: Path, batch_size: int) -> Iterator[Rows]:
+    with open(path, encoding="utf-8-sig") as f:
+        yield from _batched(_records(iter_json_array(f)), batch_size)
+
+
+def _read_jsonl(path: Path, batch_size: int) -> Iterator[Rows]:
+    with open(path, encoding="utf-8-sig") as f:
+        values = (json.loads(line) for line in f if line.strip())
+        yield from _batched(_records(values), batch_size)
+
+
+def _read_xlsx(path: Path, batch_size: int) -> Iterator[Rows]:
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        names = [str(v) if v is not None else f"column_{i + 1}" for i, v in enumerate(header)]
+        yield from _batched((dict(zip(names, row)) for row in rows), batch_size)
+    finally:
+        workbook.close()
+
+
+def _columns(first: Rows) -> List[str]:
+    """Columns of a tabular output: keys of the first batch, in first-seen order."""
+    return list(dict.fromkeys(key for row in first for key in row))
+
+
+class _SchemaChanged(Exception):
+    """A later batch has columns or value types the first batch did not."""
+
+
+def _check_columns(batches: Iterator[Rows]) -> Iterator[Rows]:
+    """Pass batches through; raise _SchemaChanged on keys the first batch lacked."""
+    known = None
+    for rows in batches:
+        if known is None:
+            known = set(_columns(rows))
+        elif not all(map(known.issuperset, rows)):
+            raise _SchemaChanged()
+        yield rows
+
+
+def _write_csv(
+    batches: Iterator[Rows],
+    path: Path,
+    delimiter: str = ",",
+    columns: Optional[List[str]] = None,
+) -> int:
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, delimiter=delimiter)
+        header_written = False
+        for rows in batches:
+            if not header_written:
+                columns = columns or _columns(rows)
+                writer.writerow(columns)
+                header_written = True
+            writer.writerows(
+                [v if type(v) not in _NESTED else _dumps(v) for v in map(row.get, columns)]
+                for row in rows
+            )
+            count += len(rows)
+    return count
+
+
+def _write_json(batches: Iterator[Rows], path: Path) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for rows in batches:
+            f.write(("," if count else "") + "\n" + ",\n".join(_dumps(row) for row in rows))
+            count += len(rows)
+        f.write("\n]\n" if count else "]\n")
+    return count
+
+
+def _write_jsonl(batches: Iterator[Rows], path: Path) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for rows in batches:
+            f.write("".join(_dumps(row) + "\n" for row in rows))
+            count += len(rows)
+    return count
+
+
+def _write_xlsx(batches: Iterator[Rows], path: Path, columns: Optional[List[str]] = None) -> int:
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    header_written = False
+    count = 0
+    for rows in batches:
+        if not header_written:
+            columns = columns or _columns(rows)
+            sheet.append(columns)
+            header_written = True
+        for row in rows:
+            sheet.append([_cell(row.get(column)) for column in columns])
+        count += len(rows)
+    workbook.save(path)
+    return count
+
+
+def _markdown_cell(value: Any) -> str:
+    text = "" if value is None else str(_cell(value))
+    return text.replace("\\", "\\\\").replace("|", "\\|").replace("\r", "").replace("\n", "<br>")
+
+
+def _write_markdown_table(
+    batches: Iterator[Rows], path: Path, columns: Optional[List[str]] = None
+) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        header_written = False
+        for rows in batches:
+            if not header_written:
+                columns = columns or _columns(rows)
+                f.write("| " + " | ".join(_markdown_cell(c) for c in columns) + " |\n")
+                f.write("|" + " --- |" * len(columns) + "\n")
+                header_written = True
+            f.write(
+                "".join(
+                    "| " + " | ".join(_markdown_cell(row.get(c)) for c in columns) + " |\n"
+                    for row in rows
+                )
+            )
+            count += len(rows)
+    return count
+
+
+ROW_READERS: Dict[str, Callable[[Path, int], Iterator[Rows]]] = {
+    "csv": _read_csv,
+    "tsv": partial(_read_csv, delimiter="\t"),
+    "json": _read_json,
+    "jsonl": _read_jsonl,
+    "xlsx": _read_xlsx,
+}
+
+ROW_WRITERS: Dict[str, Callable[[Iterator[Rows], Path], int]] = {
+    "csv": _write_csv,
+    "tsv": partial(_write_csv, delimiter="\t"),
+    "json": _write_json,
+    "jsonl": _write_jsonl,
+    "xlsx": _write_xlsx,
+    "md": _write_markdown_table,
+}
+
+# Row writers with a fixed header, which take the full column list when known
+COLUMN_WRITERS = frozenset({"csv", "tsv", "xlsx", "md"})
+
+
+# ========== Arrow readers and writers ==========
+
+
+def _read_csv_arrow(path: Path, batch_size: int, delimiter: str = ",") -> Iterator[Any]:
+    reader = pyarrow.csv.open_csv(
+        path,
+        read_options=pyarrow.csv.ReadOptions(block_size=ARROW_CSV_BLOCK_BYTES),
+        parse_options=pyarrow.csv.ParseOptions(delimiter=delimiter),
+    )
+    for batch in reader:
+        for start in range(0, batch.num_rows, batch_size):
+            yield batch.slice(start, batch_size)
+
+
+def _read_parquet(path: Path, batch_size: int) -> Iterator[Any]:
+    yield from pyarrow.parquet.ParquetFile(path).iter_batches(batch_size=batch_size)
+
+
+def _rows_to_arrow(batches: Iterator[Rows], layout: Optional["_RowLayout"] = None) -> Iterator[Any]:
+    """
+    Record batches from row batches.
+
+    Without a layout the first batch fixes the schema, and a later batch with
+    new keys or values that do not fit it raises _SchemaChanged.
+    """
+    schema = layout.schema if layout is not None else None
+    known = None
+    for rows in batches:
+        if layout is None:
+            if known is not None and not all(map(known.issuperset, rows)):
+                raise _SchemaChanged()
+        elif layout.text_columns:
+            for row in rows:
+                for column in layout.text_columns.intersection(row):
+                    row[column] = _text(row[column])
+        try:
+            batch = pyarrow.RecordBatch.from_pylist(rows, schema=schema)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+            if layout is not None:
+                raise
+            raise _SchemaChanged() from e
+        if schema is None:
+            schema, known = batch.schema, set(batch.schema.names)
+        yield batch
+
+
+def _text(value: Any) -> Optional[str]:
+    """A value of a column with mixed types, as text."""
+    if value is None or isinstance(value, str):
+        return value
+    return _dumps(value) if isinstance(value, _NESTED) else str(value)
+
+
+def _arrow_type(values: List[Any]) -> Optional[Any]:
+    """Arrow type of one column's values, or None if they have no common type."""
+    try:
+        return pyarrow.array(values).type
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return None
+
+
+def _merge_types(a: Optional[Any], b: Optional[Any]) -> Optional[Any]:
+    """Widest type holding both (int64 + double -> double), or None if there is none."""
+    if a is None or b is None:
+        return None
+    try:
+        merged = pyarrow.unify_schemas(
+            [pyarrow.schema([("v", a)]), pyarrow.schema([("v", b)])], promote_options="permissive"
+        )
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return None
+    return merged.field("v").type
+
+
+def _write_csv_arrow(batches: Iterator[Any], path: Path, delimiter: str = ",") -> int:
+    writer = None
+    count = 0
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = pyarrow.csv.CSVWriter(
+                    str(path),
+                    batch.schema,
+                    write_options=pyarrow.csv.WriteOptions(delimiter=delimiter),
+                )
+            writer.write_batch(batch)
+            count += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        Path(path).touch()
+    return count
+
+
+def _write_parquet(batches: Iterator[Any], path: Path) -> int:
+    writer = None
+    count = 0
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(str(path), batch.schema)
+            writer.write_batch(batch)
+            count += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        pyarrow.parquet.write_table(pyarrow.table({}), str(path))
+    return count
+
+
+ARROW_READERS: Dict[str, Callable[[Path, int], Iterator[Any]]] = {
+    "csv": _read_csv_arrow,
+    "tsv": partial(_read_csv_arrow, delimiter="\t"),
+    "parquet": _read_parquet,
+}
+
+ARROW_WRITERS: Dict[str, Callable[[Iterator[Any], Path], int]] = {
+    "csv": _write_csv_arrow,
+    "tsv": partial(_write_csv_arrow, delimiter="\t"),
+    "parquet": _write_parquet,
+}
+
+
+@dataclass
+class _RowLayout:
+    """Columns (and Arrow schema) of a whole row source, from a scan of every batch."""
+
+    columns: List[str]
+    schema: Any = None
+    # Columns whose values have no common Arrow type, converted as text
+    text_columns: frozenset = frozenset()
+
+
+def _scan_layout(batches: Iterator[Rows], arrow: bool) -> _RowLayout:
+    if not arrow:
+        return _RowLayout(list(dict.fromkeys(key for rows in batches for key in _columns(rows))))
+
+    types: Dict[str, Optional[Any]] = {}
+    for rows in batches:
+        for column in _columns(rows):
+            found = _arrow_type([row.get(column) for row in rows])
+            types[column] = _merge_types(types[column], found) if column in types else found
+    return _RowLayout(
+        columns=list(types),
+        schema=pyarrow.schema(
+            [(c, pyarrow.string() if t is None else t) for c, t in types.items()]
+        ),
+        text_columns=frozenset(c for c, t in types.items() if t is None),
+    )
+
+
+def convert_tabular(source: str, target: str, src: Path, dst: Path, batch_size: int) -> int:
+    """
+    Stream rows from src to dst; returns rows written.
+
+    With pyarrow, Arrow sources (csv, tsv, parquet) are read as record batches
+    (CSV values are typed by Arrow's inference) and row sources become record
+    batches for Parquet output. Everything else streams row dicts, in which
+    CSV values stay strings.
+
+    Row sources (json, jsonl, xlsx) are converted in one pass while every batch
+    fits the columns and types of the first. When a later batch adds a key or
+    changes a column's type, the source is scanned for its full layout and
+    converted again: columns are the union of all keys, types are widened
+    (int64 -> double), and columns with no common type are written as text.
+    """
+    arrow = ARROW_AVAILABLE and (source in ARROW_READERS or target not in ROW_WRITERS)
+    try:
+        return _convert_tabular(source, target, src, dst, batch_size, arrow)
+    except _SchemaChanged:
+        layout = _scan_layout(ROW_READERS[source](src, batch_size), arrow)
+        return _convert_tabular(source, target, src, dst, batch_size, arrow, layout)
+
+
+def _convert_tabular(
+    source: str,
+    target: str,
+    src: Path,
+    dst: Path,
+    batch_size: int,
+    arrow: bool,
+    layout: Optional[_RowLayout] = None,
+) -> int:
+    if not arrow:
+        rows = ROW_READERS[source](src, batch_size)
+        if target not in COLUMN_WRITERS:
+            return ROW_WRITERS[target](rows, dst)
+        if layout is not None:
+            return ROW_WRITERS[target](rows, dst, columns=layout.columns)
+        return ROW_WRITERS[target](_check_columns(rows), dst)
+
+    if source in ARROW_READERS:
+        batches = ARROW_READERS[source](src, batch_size)
+    else:
+        batches = _rows_to_arrow(ROW_READERS[source](src, batch_size), layout)
+    if target in ARROW_WRITERS:
+        return ARROW_WRITERS[target](batches, dst)
+    return ROW_WRITERS[target]((batch.to_pylist() for batch in batches), dst)
+
+
+def _tabular_requires(*formats: str) -> Tuple[str, ...]:
+    needs = {"parquet": "pyarrow", "xlsx": "openpyxl"}
+    return tuple(dict.fromkeys(needs[f] for f in formats if f in needs))
+
+
+for _source in sorted(set(ROW_READERS) | set(ARROW_READERS)):
+    for _target in sorted(set(ROW_WRITERS) | set(ARROW_WRITERS)):
+        if _source != _target:
+            register(_source, _target, _tabular_requires(_source, _target))(
+                partial(convert_tabular, _source, _target)
+            )
+
+
+# ========== Documents ==========
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_BULLET = re.compile(r"^\s*[-*+]\s+(.*)$")
+_NUMBERED = re.compile(r"^\s*\d+[.)]\s+(.*)$")
+
+
+def _docx_blocks(document: Any) -> Iterator[Any]:
+    """Paragraphs and tables in document order."""
+    yield from document.iter_inner_content()
+
+
+def _docx_paragraph_to_markdown(paragraph: Any) -> str:
+    style = paragraph.style.name if paragraph.style is not None else ""
+    text = paragraph.text
+    if style == "Title":
+        return f"# {text}"
+    if style.startswith("Heading"):
+        level = style.rsplit(" ", 1)[-1]
+        return "#" * min(int(level), 6) + f" {text}" if level.isdigit() else f"# {text}"
+    if style.startswith("List Bullet"):
+        return f"- {text}"
+    if style.startswith("List Number"):
+        return f"1. {text}"
+    return text
+
+
+@register("docx", "md", requires=("python-docx",))
+def _docx_to_markdown(src: Path, dst: Path, batch_size: int) -> int:
+    count = 0
+    with open(dst, "w", encoding="utf-8") as f:
+        for block in _docx_blocks(docx.Document(str(src))):
+            if hasattr(block, "rows"):
+                rows = [[_markdown_cell(cell.text) for cell in row.cells] for row in block.rows]
+                if not rows:
+                    continue
+                f.write("| " + " | ".join(rows[0]) + " |\n")
+                f.write("|" + " --- |" * len(rows[0]) + "\n")
+                f.write("".join("| " + " | ".join(row) + " |\n" for row in rows[1:]))
+                f.write("\n")
+            elif block.text.strip():
+                f.write(_docx_paragraph_to_markdown(block) + "\n\n")
+            else:
+                continue
+            count += 1
+    return count
+
+
+@register("docx", "txt", requires=("python-docx",))
+def _docx_to_text(src: Path, dst: Path, batch_size: int) -> int:
+    count = 0
+    with open(dst, "w", encoding="utf-8") as f:
+        for block in _docx_blocks(docx.Document(str(src))):
+            if hasattr(block, "rows"):
+                f.write("".join("\t".join(c.text for c in row.cells) + "\n" for row in block.rows))
+            else:
+                f.write(block.text + "\n")
+            count += 1
+    return count
+
+
+@register("md", "docx", requires=("python-docx",))
+def _markdown_to_docx(src: Path, dst: Path, batch_size: int) -> int:
+    """Headings, bullet and numbered lists and paragraphs; other markup stays as text."""
+    document = docx.Document()
+    paragraph: List[str] = []
+    count = 0
+
+    def flush() -> None:
+        nonlocal count
+        if paragraph:
+            document.add_paragraph(" ".join(paragraph))
+            paragraph.clear()
+            count += 1
+
+    with open(src, encoding="utf-8-sig") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            heading = _HEADING.match(line)
+            bullet = _BULLET.match(line)
+            numbered = _NUMBERED.match(line)
+            if heading:
+                flush()
+                document.add_heading(heading.group(2), level=len(heading.group(1)))
+            elif bullet or numbered:
+                flush()
+                style = "List Bullet" if bullet else "List Number"
+                document.add_paragraph((bullet or numbered).group(1), style=style)
+            elif line.strip():
+                paragraph.append(line.strip())
+                continue
+            else:
+                flush()
+                continue
+            count += 1
+    flush()
+    document.save(str(dst))
+    return count
+
+
+@register("md", "html", requires=("markdown",))
+def _markdown_to_html(src: Path, dst: Path, batch_size: int) -> int:
+    """Render with the markdown package (tables and fenced code enabled)."""
+    converter = markdown.Markdown(extensions=["tables", "fenced_code"])
+    with open(src, encoding="utf-8-sig") as f:
+        text = f.read()
+    html = converter.convert(text)
+    with open(dst, "w", encoding="utf-8") as f:
+        f.write(html + "\n")
+    return text.count("\n") + 1
+
+
+# ========== Running conversions ==========
+
+
+@dataclass
+class ConversionJob:
+    """One file to convert."""
+
+    source_path: str
+    target_path: str
+    source_format: str
+    target_format: str
+    batch_size: int = DEFAULT_BATCH_ROWS
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of a ConversionJob; error is set instead of raising in convert_files()."""
+
+    source_path: str
+    target_path: str
+    units: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = field(default=None)
+
+
+def convert_file(job: ConversionJob) -> ConversionResult:
+    """
+    Convert one file, writing the target atomically.
+
+    Raises:
+        ValueError: If the conversion is not registered or the source is malformed
+        ImportError: If the conversion needs a package that is not installed
+    """
+    converter = get_converter(job.source_format, job.target_format)
+    if converter is None:
+        raise ValueError(f"Unsupported conversion: {job.source_format} -> {job.target_format}")
+    missing = converter.missing_dependencies()
+    if missing:
+        raise ImportError(f"{converter.source} -> {converter.target} requires {', '.join(missing)}")
+
+    start = time.perf_counter()
+    target = Path(job.target_path)
+    temp = target.with_name(f".{target.name}.{os.getpid()}.part")
+    try:
+        units = converter.func(Path(job.source_path), temp, job.batch_size)
+        os.replace(temp, target)
+    finally:
+        temp.unlink(missing_ok=True)
+
+    return ConversionResult(
+        source_path=job.source_path,
+        target_path=str(target),
+        units=units,
+        bytes_in=os.path.getsize(job.source_path),
+        bytes_out=target.stat().st_size,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _convert_or_report(job: ConversionJob) -> ConversionResult:
+    try:
+        return convert_file(job)
+    except Exception as e:
+        return ConversionResult(job.source_path, job.target_path, error=f"{type(e).__name__}: {e}")
+
+
+def default_workers() -> int:
+    """Default number of conversion processes."""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    """Fork workers only from a single-threaded process; forkserver/spawn otherwise."""
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and threading.active_count() == 1:
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def convert_files(
+    jobs: List[ConversionJob], workers: Optional[int] = None
+) -> List[ConversionResult]:
+    """
+    Convert several files, in parallel processes when there is more than one.
+
+    Failures are reported in each result's error rather than raised.
+    Results are in job order.
+    """
+    workers = min(workers or default_workers(), len(jobs))
+    if workers <= 1:
+        return [_convert_or_report(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context()) as executor:
+        return list(executor.map(_convert_or_report, jobs))
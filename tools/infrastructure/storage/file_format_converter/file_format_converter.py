@@ -3,35 +3,59 @@ Convert files between different formats
 """
 
 import base64
+import glob
 import os
-from typing import Any, Dict, Optional
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import Field
 
 from shared.base import BaseTool
-from shared.errors import APIError, ValidationError
+from shared.errors import APIError, ConfigurationError, ValidationError
+from tools.infrastructure.storage.file_format_converter.converters import (
+    DEFAULT_BATCH_ROWS,
+    ConversionJob,
+    convert_file,
+    convert_files,
+    get_converter,
+    normalize_format,
+    supported_conversions,
+)
 
 
 class FileFormatConverter(BaseTool):
     """
     Convert files between different formats.
 
-    This tool accepts an input string containing:
-    - source_format: The current format of the file
-    - target_format: The desired output format
-    - file_data: Base64-encoded file contents
+    The input string is "source_format|target_format", and the files to
+    convert are given in input_paths. The legacy form
+    "source_format|target_format|base64_data" converts inline data and
+    returns it base64 encoded.
+
+    Tabular formats (csv, tsv, json, jsonl, parquet, xlsx, and md tables as
+    output) are streamed in row batches, through Arrow when pyarrow is
+    installed. Documents convert docx -> md/txt and md -> docx/html. Several
+    input files are converted in parallel processes.
 
     Args:
-        input: Primary input parameter containing conversion instructions
+        input: "source_format|target_format" or "source_format|target_format|base64_data"
+        input_paths: Files (or glob patterns) to convert
+        output_path: Output file when converting a single file
+        output_dir: Directory for outputs (default: next to each input)
+        batch_size: Rows per batch for tabular conversions
+        max_workers: Parallel conversions (default: CPU count, up to 8)
 
     Returns:
         Dict containing:
         - success: Boolean indicating success
-        - result: Converted file data (base64 encoded)
+        - result: Per-file results, or converted data (base64) for inline input
         - metadata: Information about the conversion
 
     Example:
-        >>> tool = FileFormatConverter(input="example")
+        >>> tool = FileFormatConverter(input="csv|parquet", input_paths=["exports/*.csv"])
         >>> result = tool.run()
     """
 
@@ -39,7 +63,26 @@ class FileFormatConverter(BaseTool):
     tool_category: str = "infrastructure"
     tool_description: str = "Convert files between different formats"
 
-    input: str = Field(..., description="Primary input parameter", min_length=1)
+    input: str = Field(
+        ...,
+        description="source_format|target_format, or source_format|target_format|base64_data",
+        min_length=1,
+    )
+    input_paths: List[str] = Field(
+        default_factory=list, description="Files or glob patterns to convert"
+    )
+    output_path: Optional[str] = Field(
+        None, description="Output file when converting a single file"
+    )
+    output_dir: Optional[str] = Field(
+        None, description="Directory for outputs (default: next to each input)"
+    )
+    batch_size: int = Field(
+        DEFAULT_BATCH_ROWS, description="Rows per batch for tabular conversions", ge=1
+    )
+    max_workers: Optional[int] = Field(
+        None, description="Parallel conversions (default: CPU count, up to 8)", ge=1, le=32
+    )
 
     def _execute(self) -> Dict[str, Any]:
         """
@@ -49,7 +92,7 @@ class FileFormatConverter(BaseTool):
             Dict with results
         """
 
-        self._logger.info(f"Executing {self.tool_name} with input={self.input}")
+        self._logger.info(f"Executing {self.tool_name} with input={self.input[:100]}")
         self._validate_parameters()
 
         if self._should_use_mock():
@@ -70,10 +113,16 @@ class FileFormatConverter(BaseTool):
                 },
             }
 
+        except (ValidationError, ConfigurationError):
+            raise
         except Exception as e:
             self._logger.error(f"Error in {self.tool_name}: {str(e)}", exc_info=True)
             raise APIError(f"Failed: {e}", tool_name=self.tool_name)
 
+    def _formats(self) -> Tuple[str, str]:
+        parts = self.input.split("|", 2)
+        return normalize_format(parts[0]), normalize_format(parts[1])
+
     def _validate_parameters(self) -> None:
         """
         Validate input parameters.
@@ -90,20 +139,21 @@ class FileFormatConverter(BaseTool):
 
         if "|" not in self.input:
             raise ValidationError(
-                "Input must contain source_format|target_format|base64_data",
+                "Input must contain source_format|target_format",
                 tool_name=self.tool_name,
                 details={"input": self.input},
             )
 
         parts = self.input.split("|")
-        if len(parts) != 3:
+        if len(parts) not in (2, 3):
             raise ValidationError(
-                "Input must have exactly 3 parts: source_format|target_format|file_data",
+                "Input must be source_format|target_format or "
+                "source_format|target_format|file_data",
                 tool_name=self.tool_name,
-                details={"input_parts": parts},
+                details={"input_parts": len(parts)},
             )
 
-        src, tgt, data = parts
+        src, tgt = parts[0].strip(), parts[1].strip()
 
         if not src or not tgt:
             raise ValidationError(
@@ -112,6 +162,24 @@ class FileFormatConverter(BaseTool):
                 details={"src": src, "tgt": tgt},
             )
 
+        if len(parts) == 2:
+            if not self.input_paths:
+                raise ValidationError(
+                    "input_paths is required when no inline file data is given",
+                    tool_name=self.tool_name,
+                )
+            if self.output_path and self.output_dir:
+                raise ValidationError(
+                    "Set output_path or output_dir, not both", tool_name=self.tool_name
+                )
+            return
+
+        data = parts[2]
+        if self.input_paths:
+            raise ValidationError(
+                "Give inline file data or input_paths, not both", tool_name=self.tool_name
+            )
+
         if not data:
             raise ValidationError(
                 "File data cannot be empty.",
@@ -143,28 +211,135 @@ class FileFormatConverter(BaseTool):
         """
         Main processing logic.
 
-        The real implementation performs a placeholder 'conversion':
-        - decodes the input
-        - performs no real format transformation
-        - re-encodes the data
+        Converts the files in input_paths (in parallel when there are
+        several), or the inline base64 data for the legacy input form.
 
         Returns:
-            dict with converted file data
+            dict with per-file results, or converted file data
         """
-        src, tgt, data = self.input.split("|")
+        src, tgt = self._formats()
+        converter = get_converter(src, tgt)
+        if converter is None:
+            targets = sorted(t for s, t in supported_conversions() if s == src)
+            raise ValidationError(
+                f"Unsupported conversion: {src} -> {tgt}",
+                tool_name=self.tool_name,
+                details={"src": src, "tgt": tgt, "supported_targets": targets},
+            )
+        missing = converter.missing_dependencies()
+        if missing:
+            raise ConfigurationError(
+                f"{src} -> {tgt} conversion requires {', '.join(missing)}. "
+                f"Install with: pip install {' '.join(missing)}",
+                tool_name=self.tool_name,
+            )
+
+        if self.input.count("|") == 2:
+            return self._convert_inline(src, tgt, self.input.split("|")[2])
+
+        jobs = self._jobs(src, tgt)
+        start = time.perf_counter()
+        if len(jobs) == 1:
+            results = [self._convert_one(jobs[0])]
+        else:
+            results = convert_files(jobs, self.max_workers)
+
+        failed = [r for r in results if r.error]
+        if len(failed) == len(results):
+            raise APIError(
+                f"All {len(results)} conversions failed; first error: {failed[0].error}",
+                tool_name=self.tool_name,
+            )
 
+        return {
+            "source_format": src,
+            "target_format": tgt,
+            "files": [asdict(r) for r in results],
+            "converted": len(results) - len(failed),
+            "failed": len(failed),
+            "seconds": time.perf_counter() - start,
+        }
+
+    def _jobs(self, src: str, tgt: str) -> List[ConversionJob]:
+        """Expand input_paths and pick an output path for each file."""
+        sources: List[str] = []
+        for pattern in self.input_paths:
+            if glob.has_magic(pattern):
+                matches = sorted(glob.glob(pattern, recursive=True))
+                if not matches:
+                    raise ValidationError(
+                        "No files match pattern",
+                        tool_name=self.tool_name,
+                        details={"pattern": pattern},
+                    )
+                sources.extend(matches)
+            elif not os.path.isfile(pattern):
+                raise ValidationError(
+                    "File not found", tool_name=self.tool_name, details={"path": pattern}
+                )
+            else:
+                sources.append(pattern)
+
+        if self.output_path and len(sources) > 1:
+            raise ValidationError(
+                "output_path needs exactly one input file; use output_dir",
+                tool_name=self.tool_name,
+                details={"input_files": len(sources)},
+            )
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+
+        jobs = []
+        seen = set()
+        for source in sources:
+            if self.output_path:
+                target = Path(self.output_path)
+            else:
+                directory = Path(self.output_dir) if self.output_dir else Path(source).parent
+                target = directory / f"{Path(source).stem}.{tgt}"
+            key = os.path.abspath(target)
+            if key in seen or key == os.path.abspath(source):
+                raise ValidationError(
+                    "Output path collides with another input or output",
+                    tool_name=self.tool_name,
+                    details={"source": source, "output": str(target)},
+                )
+            seen.add(key)
+            jobs.append(ConversionJob(source, str(target), src, tgt, self.batch_size))
+        return jobs
+
+    def _convert_one(self, job: ConversionJob) -> Any:
+        """Convert a single file, surfacing malformed input as a ValidationError."""
+        try:
+            return convert_file(job)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValidationError(
+                f"Could not convert {job.source_path}: {e}",
+                tool_name=self.tool_name,
+                details={"source": job.source_path},
+            )
+
+    def _convert_inline(self, src: str, tgt: str, data: str) -> Dict[str, Any]:
+        """Convert base64 data through temporary files."""
         try:
             file_bytes = base64.b64decode(data)
         except Exception:
             raise ValidationError("Invalid Base64 in file data.", tool_name=self.tool_name)
 
-        converted_bytes = file_bytes  # Placeholder for real conversion logic
-        converted_base64 = base64.b64encode(converted_bytes).decode()
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / f"input.{src}"
+            source.write_bytes(file_bytes)
+            target = Path(tmp) / f"output.{tgt}"
+            result = self._convert_one(
+                ConversionJob(str(source), str(target), src, tgt, self.batch_size)
+            )
+            converted_base64 = base64.b64encode(target.read_bytes()).decode()
 
         return {
             "source_format": src,
             "target_format": tgt,
             "converted_data": converted_base64,
+            "units": result.units,
         }
 
 
@@ -177,7 +352,7 @@ if __name__ == "__main__":
     os.environ["USE_MOCK_APIS"] = "true"
 
     # Test with mock input
-    tool = FileFormatConverter(input="pdf|docx|SGVsbG8gV29ybGQ=")
+    tool = FileFormatConverter(input="csv|json|YSxiCjEsMgo=")
     result = tool.run()
 
     print(f"Success: {result.get('success')}")
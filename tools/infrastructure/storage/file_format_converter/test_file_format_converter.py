@@ -1,13 +1,48 @@
 """Tests for file_format_converter tool."""
 
 import base64
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError as PydanticValidationError
 
-from shared.errors import APIError, ValidationError
-from tools.storage.file_format_converter import FileFormatConverter
+from shared.errors import APIError, ConfigurationError, ValidationError
+from tools.infrastructure.storage.file_format_converter import FileFormatConverter, converters
+from tools.infrastructure.storage.file_format_converter.converters import (
+    ARROW_AVAILABLE,
+    ConversionJob,
+    convert_file,
+    convert_files,
+    iter_json_array,
+)
+
+REAL_MODE = {"USE_MOCK_APIS": "false", "DISABLE_RATE_LIMITING": "true"}
+
+ROWS = [
+    {"id": "1", "name": "Ada", "note": "likes, commas"},
+    {"id": "2", "name": "Grace", "note": 'says "hi"'},
+    {"id": "3", "name": "Linus", "note": ""},
+]
+
+
+def write_csv(path, rows=ROWS):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def as_strings(rows):
+    return [{k: "" if v is None else str(v) for k, v in row.items()} for row in rows]
 
 
 class TestFileFormatConverter:
@@ -17,11 +52,11 @@ class TestFileFormatConverter:
 
     @pytest.fixture
     def valid_base64(self):
-        return base64.b64encode(b"hello").decode()
+        return base64.b64encode(b"a,b\n1,2\n").decode()
 
     @pytest.fixture
     def valid_input(self, valid_base64):
-        return f"txt|pdf|{valid_base64}"
+        return f"csv|json|{valid_base64}"
 
     @pytest.fixture
     def tool(self, valid_input) -> FileFormatConverter:
@@ -33,26 +68,87 @@ class TestFileFormatConverter:
         tool = FileFormatConverter(input=valid_input)
         assert tool.input == valid_input
         assert tool.tool_name == "file_format_converter"
-        assert tool.tool_category == "storage"
+        assert tool.tool_category == "infrastructure"
         assert tool.tool_description == "Convert files between different formats"
 
     # ========== HAPPY PATH ==========
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    def test_execute_success(self, tool: FileFormatConverter):
+    @patch.dict("os.environ", REAL_MODE)
+    def test_inline_conversion(self, tool: FileFormatConverter):
         result = tool.run()
-        assert result["success"] is True
-        assert "result" in result
-        assert result["result"]["source_format"] == "txt"
-        assert result["result"]["target_format"] == "pdf"
-        assert "converted_data" in result["result"]
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    def test_metadata_correct(self, tool: FileFormatConverter):
-        result = tool.run()
+        assert result["success"] is True
+        assert result["result"]["source_format"] == "csv"
+        assert result["result"]["target_format"] == "json"
+        converted = json.loads(base64.b64decode(result["result"]["converted_data"]))
+        assert as_strings(converted) == [{"a": "1", "b": "2"}]
         assert result["metadata"]["tool_name"] == "file_format_converter"
         assert result["metadata"]["conversion"] == "file_format_conversion"
 
+    @patch.dict("os.environ", REAL_MODE)
+    def test_convert_path(self, tmp_path):
+        source = write_csv(tmp_path / "people.csv")
+        target = tmp_path / "out" / "people.jsonl"
+        target.parent.mkdir()
+
+        result = FileFormatConverter(
+            input="csv|ndjson", input_paths=[str(source)], output_path=str(target)
+        ).run()
+
+        (file_result,) = result["result"]["files"]
+        assert file_result["units"] == 3
+        assert file_result["target_path"] == str(target)
+        assert file_result["error"] is None
+        lines = target.read_text().splitlines()
+        assert as_strings([json.loads(line) for line in lines]) == ROWS
+
+    @patch.dict("os.environ", REAL_MODE)
+    def test_parallel_multi_file(self, tmp_path):
+        for n in range(4):
+            write_csv(tmp_path / f"part{n}.csv", [{**ROWS[0], "id": str(n)}])
+        out = tmp_path / "json"
+
+        result = FileFormatConverter(
+            input="csv|json",
+            input_paths=[str(tmp_path / "*.csv")],
+            output_dir=str(out),
+            max_workers=2,
+        ).run()["result"]
+
+        assert (result["converted"], result["failed"]) == (4, 0)
+        for n in range(4):
+            (row,) = json.loads((out / f"part{n}.json").read_text())
+            assert str(row["id"]) == str(n)
+
+    @patch.dict("os.environ", REAL_MODE)
+    def test_partial_failure_is_reported(self, tmp_path):
+        (tmp_path / "good.json").write_text('[{"a": 1}]')
+        (tmp_path / "bad.json").write_text('{"not": "an array"}')
+
+        result = FileFormatConverter(
+            input="json|csv",
+            input_paths=[str(tmp_path / "good.json"), str(tmp_path / "bad.json")],
+        ).run()["result"]
+
+        assert (result["converted"], result["failed"]) == (1, 1)
+        assert "array" in result["files"][1]["error"]
+        assert (tmp_path / "good.csv").read_text().splitlines() == ["a", "1"]
+        assert not (tmp_path / "bad.csv").exists()
+
+    @patch.dict("os.environ", REAL_MODE)
+    def test_markdown_table(self, tmp_path):
+        source = tmp_path / "rows.jsonl"
+        source.write_text('{"a": "x|y", "b": 2}\n{"a": "line\\nbreak"}\n')
+
+        FileFormatConverter(input="jsonl|markdown", input_paths=[str(source)]).run()
+
+        assert (tmp_path / "rows.md").read_text().splitlines() == [
+            "| a | b |",
+            "| --- | --- |",
+            "| x\\|y | 2 |",
+            "| line<br>break |  |",
+        ]
+
     # ========== MOCK MODE ==========
 
     @patch.dict("os.environ", {"USE_MOCK_APIS": "true"})
@@ -62,11 +158,6 @@ class TestFileFormatConverter:
         assert result["metadata"]["mock_mode"] is True
         assert result["result"]["mock"] is True
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    def test_real_mode(self, tool):
-        result = tool.run()
-        assert result["success"] is True
-
     # ========== VALIDATION TESTS ==========
 
     @pytest.mark.parametrize(
@@ -75,90 +166,257 @@ class TestFileFormatConverter:
             "",
             "   ",
             "missing_parts",
-            "only|two",
-            "txt||abcd",
-            "|pdf|abcd",
-            "txt|pdf|",
+            "a|b|c|d",
+            "csv||abcd",
+            "|json|abcd",
+            "csv|json|",
+            "csv|json",
         ],
     )
     def test_invalid_inputs(self, bad_input):
-        tool = FileFormatConverter(input=bad_input)
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises((ValidationError, PydanticValidationError)):
+            FileFormatConverter(input=bad_input).run()
 
     def test_invalid_base64(self):
-        bad = "txt|pdf|not_base64!!"
-        tool = FileFormatConverter(input=bad)
-        result = tool.run()
-        assert result["success"] is False
+        with pytest.raises(ValidationError):
+            FileFormatConverter(input="csv|json|not_base64!!").run()
+
+    @patch.dict("os.environ", REAL_MODE)
+    @pytest.mark.parametrize("bad_input", ["txt|pdf|YWJj", "csv|pdf"])
+    def test_unsupported_pair(self, bad_input):
+        with pytest.raises(ValidationError) as exc:
+            FileFormatConverter(
+                input=bad_input, input_paths=[] if bad_input.count("|") == 2 else ["x.csv"]
+            ).run()
+        assert "Unsupported conversion" in exc.value.message
+
+    @patch.dict("os.environ", REAL_MODE)
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(ValidationError, match="File not found"):
+            FileFormatConverter(input="csv|json", input_paths=[str(tmp_path / "x.csv")]).run()
+
+    @patch.dict("os.environ", REAL_MODE)
+    def test_output_path_needs_single_file(self, tmp_path):
+        write_csv(tmp_path / "a.csv")
+        write_csv(tmp_path / "b.csv")
+        with pytest.raises(ValidationError, match="exactly one"):
+            FileFormatConverter(
+                input="csv|json",
+                input_paths=[str(tmp_path / "*.csv")],
+                output_path=str(tmp_path / "out.json"),
+            ).run()
+
+    @patch.dict("os.environ", REAL_MODE)
+    def test_malformed_single_file(self, tmp_path):
+        source = tmp_path / "broken.json"
+        source.write_text('[{"a": 1}, {"a": ')
+        with pytest.raises(ValidationError):
+            FileFormatConverter(input="json|csv", input_paths=[str(source)]).run()
+        assert not (tmp_path / "broken.csv").exists()
+
+    @pytest.mark.skipif(ARROW_AVAILABLE, reason="pyarrow is installed")
+    @patch.dict("os.environ", REAL_MODE)
+    def test_parquet_requires_pyarrow(self, tmp_path):
+        with pytest.raises(ConfigurationError, match="pyarrow"):
+            FileFormatConverter(
+                input="csv|parquet", input_paths=[str(write_csv(tmp_path / "a.csv"))]
+            ).run()
 
     # ========== ERROR CASES ==========
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
+    @patch.dict("os.environ", REAL_MODE)
     def test_api_error(self, tool):
         with patch.object(tool, "_process", side_effect=Exception("boom")):
-            result = tool.run()
-            assert result["success"] is False
+            with pytest.raises(APIError):
+                tool.run()
 
-    # ========== PROCESS TESTS ==========
 
-    def test_process_decoding_encoding(self, tool, valid_base64):
-        result = tool._process()
-        assert result["converted_data"] == valid_base64
+class TestConverters:
+    """Test the streaming converters."""
 
-    # ========== EDGE CASES ==========
-
-    def test_unicode_in_data(self):
-        encoded = base64.b64encode("ñöç".encode()).decode()
-        tool = FileFormatConverter(input=f"txt|bin|{encoded}")
-        result = tool.run()
-        assert result["success"] is True
+    @pytest.mark.parametrize("block_size", [1, 3, 64, 65536])
+    def test_iter_json_array_across_blocks(self, block_size):
+        values = [1, -2.5e10, 'a,]\\"', {"k": [1, {"n": None}]}, [], True, 1234567890123]
+        text = "  [ " + " ,\n".join(json.dumps(v) for v in values) + " ] "
 
-    def test_large_base64(self):
-        data = base64.b64encode(b"a" * 5000).decode()
-        tool = FileFormatConverter(input=f"bin|zip|{data}")
-        result = tool.run()
-        assert result["success"] is True
+        assert list(iter_json_array(io.StringIO(text), block_size)) == values
 
-    # ========== PARAMETRIZED TESTS ==========
+    @pytest.mark.parametrize("text", ["[]", " [ ] ", "[1]"])
+    def test_iter_json_array_small(self, text):
+        assert list(iter_json_array(io.StringIO(text))) == json.loads(text)
 
-    @patch.dict("os.environ", {"USE_MOCK_APIS": "false"})
-    @pytest.mark.parametrize(
-        "src,tgt",
-        [
-            ("txt", "pdf"),
-            ("png", "jpg"),
-            ("csv", "json"),
-            ("xml", "yaml"),
-        ],
-    )
-    def test_various_format_pairs(self, src, tgt):
-        encoded = base64.b64encode(b"abc123").decode()
-        tool = FileFormatConverter(input=f"{src}|{tgt}|{encoded}")
-        result = tool.run()
-        assert result["result"]["source_format"] == src
-        assert result["result"]["target_format"] == tgt
+    @pytest.mark.parametrize("text", ["", "{}", "[1 2]", "[1,", "[1, 2"])
+    def test_iter_json_array_rejects(self, text):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO(text), block_size=2))
 
     @pytest.mark.parametrize(
-        "base",
-        [
-            base64.b64encode(b"1").decode(),
-            base64.b64encode(b"hello world").decode(),
-            base64.b64encode(b"\x00\x01\x02").decode(),
-        ],
+        "chain", [["csv", "json", "jsonl", "tsv", "csv"], ["csv", "parquet", "json", "csv"]]
     )
-    def test_various_base64_payloads(self, base):
-        tool = FileFormatConverter(input=f"txt|bin|{base}")
-        result = tool.run()
-        assert result["success"] is True
-
-    # ========== INTEGRATION TESTS ==========
-
-    def test_integration_run(self, tool):
-        result = tool.run()
-        assert result["success"] is True
-
-    def test_error_formatting_integration(self, tool):
-        with patch.object(tool, "_execute", side_effect=ValueError("bad error")):
-            response = tool.run()
-            assert "error" in response or response.get("success") is False
+    def test_round_trips(self, tmp_path, chain):
+        if "parquet" in chain:
+            pytest.importorskip("pyarrow")
+        path = write_csv(tmp_path / "data.csv")
+        for n, (src, tgt) in enumerate(zip(chain, chain[1:])):
+            target = tmp_path / f"step{n}.{tgt}"
+            convert_file(ConversionJob(str(path), str(target), src, tgt, batch_size=2))
+            path = target
+
+        with open(path, newline="") as f:
+            assert as_strings(list(csv.DictReader(f))) == ROWS
+
+    def test_batches_preserve_order(self, tmp_path):
+        rows = [{"n": str(n)} for n in range(1000)]
+        source = write_csv(tmp_path / "many.csv", rows)
+        target = tmp_path / "many.json"
+
+        result = convert_file(ConversionJob(str(source), str(target), "csv", "json", batch_size=7))
+
+        assert result.units == 1000
+        assert [str(r["n"]) for r in json.loads(target.read_text())] == [r["n"] for r in rows]
+
+    def test_convert_files_reports_errors_in_order(self, tmp_path):
+        jobs = [
+            ConversionJob(
+                str(write_csv(tmp_path / "a.csv")), str(tmp_path / "a.json"), "csv", "json"
+            ),
+            ConversionJob(str(tmp_path / "missing.csv"), str(tmp_path / "m.json"), "csv", "json"),
+            ConversionJob(
+                str(write_csv(tmp_path / "b.csv")), str(tmp_path / "b.json"), "csv", "json"
+            ),
+        ]
+
+        results = convert_files(jobs, workers=2)
+
+        assert [r.error is None for r in results] == [True, False, True]
+        assert results[0].bytes_out == (tmp_path / "a.json").stat().st_size
+
+    def test_convert_files_does_not_fork_with_other_threads(self, tmp_path):
+        jobs = [
+            ConversionJob(
+                str(write_csv(tmp_path / f"{n}.csv")), str(tmp_path / f"{n}.json"), "csv", "json"
+            )
+            for n in range(2)
+        ]
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait)
+        thread.start()
+        try:
+            assert converters._mp_context().get_start_method() != "fork"
+            results = convert_files(jobs, workers=2)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert [r.error for r in results] == [None, None]
+        assert as_strings(json.loads((tmp_path / "1.json").read_text())) == ROWS
+
+    @pytest.mark.parametrize("arrow", [False, True])
+    @pytest.mark.parametrize("target", ["csv", "md"])
+    def test_keys_after_first_batch_are_kept(self, tmp_path, monkeypatch, arrow, target):
+        if arrow:
+            pytest.importorskip("pyarrow")
+        monkeypatch.setattr(converters, "ARROW_AVAILABLE", arrow)
+        source = tmp_path / "rows.jsonl"
+        source.write_text('{"a": 1}\n{"a": 2}\n{"a": 3, "extra": "kept"}\n')
+        target_path = tmp_path / f"rows.{target}"
+
+        result = convert_file(
+            ConversionJob(str(source), str(target_path), "jsonl", target, batch_size=2)
+        )
+
+        lines = target_path.read_text().splitlines()
+        assert result.units == 3
+        assert lines[0] in ("a,extra", "| a | extra |")
+        assert lines[-1] in ("3,kept", "| 3 | kept |")
+
+    def test_type_drift_is_promoted(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet
+
+        rows = [
+            {"n": 1, "mixed": 1},
+            {"n": 2, "mixed": None},
+            {"n": 2.5, "mixed": "str", "extra": "kept"},
+            {"n": None, "mixed": {"k": 1}},
+        ]
+        source = tmp_path / "rows.jsonl"
+        source.write_text("\n".join(json.dumps(row) for row in rows))
+        target = tmp_path / "rows.parquet"
+
+        result = convert_file(ConversionJob(str(source), str(target), "jsonl", "parquet", 2))
+
+        table = pyarrow.parquet.read_table(target)
+        assert result.units == 4
+        assert str(table.schema.field("n").type) == "double"
+        assert table.column("n").to_pylist() == [1.0, 2.0, 2.5, None]
+        assert table.column("mixed").to_pylist() == ["1", None, "str", converters._dumps({"k": 1})]
+        assert table.column("extra").to_pylist() == [None, None, "kept", None]
+
+    def test_xlsx_round_trip(self, tmp_path):
+        pytest.importorskip("openpyxl")
+        source = write_csv(tmp_path / "data.csv")
+        convert_file(ConversionJob(str(source), str(tmp_path / "d.xlsx"), "csv", "xlsx"))
+        convert_file(
+            ConversionJob(str(tmp_path / "d.xlsx"), str(tmp_path / "d.json"), "xlsx", "json")
+        )
+
+        assert as_strings(json.loads((tmp_path / "d.json").read_text())) == ROWS
+
+    def test_markdown_docx_round_trip(self, tmp_path):
+        pytest.importorskip("docx")
+        source = tmp_path / "doc.md"
+        source.write_text("# Title\n\nFirst line\ncontinued.\n\n- one\n- two\n")
+
+        convert_file(ConversionJob(str(source), str(tmp_path / "doc.docx"), "md", "docx"))
+        convert_file(
+            ConversionJob(str(tmp_path / "doc.docx"), str(tmp_path / "out.md"), "docx", "md")
+        )
+
+        assert (tmp_path / "out.md").read_text().split("\n\n")[:4] == [
+            "# Title",
+            "First line continued.",
+            "- one",
+            "- two",
+        ]
+
+    def test_markdown_to_html(self, tmp_path):
+        pytest.importorskip("markdown")
+        source = tmp_path / "doc.md"
+        source.write_text("# Title\n\n| a |\n| --- |\n| 1 |\n")
+
+        convert_file(ConversionJob(str(source), str(tmp_path / "doc.html"), "md", "html"))
+
+        html = (tmp_path / "doc.html").read_text()
+        assert "<h1>Title</h1>" in html and "<table>" in html
+
+
+class TestLoading:
+    """The tool imports its converters module; it must load the ways callers load it."""
+
+    ROOT = Path(__file__).resolve().parents[4]
+
+    def run_python(self, *args):
+        return subprocess.run(
+            [sys.executable, *args],
+            cwd=self.ROOT,
+            env={**os.environ, "PYTHONPATH": str(self.ROOT), **REAL_MODE},
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+    def test_loads_through_registry(self, tmp_path):
+        code = (
+            "from shared.registry import tool_registry\n"
+            f"tool_registry.discover_tools(index_path={str(tmp_path / 'index.json')!r})\n"
+            "print(tool_registry.get_tool('file_format_converter').__name__)\n"
+        )
+        result = self.run_python("-c", code)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "FileFormatConverter"
+
+    def test_runs_as_script(self):
+        result = self.run_python(str(Path(__file__).with_name("file_format_converter.py")))
+        assert result.returncode == 0, result.stderr
+        assert "All tests passed" in result.stdout